@@ -0,0 +1,164 @@
+"""Local HTTP stand-in for the London Data Store file host.
+
+Serves in-memory payloads over ``http.server`` with optional ``Range`` support
+and a per-connection bandwidth cap, so benchmarks can reproduce the
+"one connection only gets a fraction of the link" behaviour locally.
+"""
+
+import argparse
+import contextlib
+import random
+import re
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_RANGE_RE = re.compile(r"bytes=(\d+)-(\d*)")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "StandInServer"
+
+    def log_message(self, format, *args):  # noqa: A002 - signature from BaseHTTPRequestHandler
+        pass
+
+    def _payload(self) -> bytes | None:
+        return self.server.files.get(self.path.split("?")[0])
+
+    def do_HEAD(self):
+        payload = self._payload()
+        if payload is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self._send_common_headers(len(payload))
+        self.end_headers()
+
+    def do_GET(self):
+        payload = self._payload()
+        if payload is None:
+            self.send_error(404)
+            return
+
+        start, end = 0, len(payload) - 1
+        match = _RANGE_RE.fullmatch(self.headers.get("Range", ""))
+        if match and self.server.ranges:
+            start = int(match.group(1))
+            end = min(int(match.group(2) or end), end)
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(payload)}")
+        else:
+            self.send_response(200)
+        self._send_common_headers(end - start + 1)
+        self.end_headers()
+        self._send_body(memoryview(payload)[start : end + 1])
+
+    def _send_common_headers(self, length: int) -> None:
+        self.send_header("Content-Length", str(length))
+        self.send_header("Content-Type", "application/octet-stream")
+        if self.server.ranges:
+            self.send_header("Accept-Ranges", "bytes")
+
+    def _send_body(self, body: memoryview) -> None:
+        rate = self.server.per_connection_rate
+        block = 64 * 1024
+        started = time.perf_counter()
+        sent = 0
+        with contextlib.suppress(BrokenPipeError, ConnectionResetError):
+            while sent < len(body):
+                self.wfile.write(body[sent : sent + block])
+                sent += min(block, len(body) - sent)
+                if rate:
+                    ahead = sent / rate - (time.perf_counter() - started)
+                    if ahead > 0:
+                        time.sleep(ahead)
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Threaded local file server.
+
+    Args:
+        files: Mapping of URL path (e.g. ``"/download/x/y/file.csv"``) to payload bytes.
+        ranges: Whether to honour ``Range`` requests and advertise ``Accept-Ranges``.
+        per_connection_rate: Bandwidth cap per connection in bytes/second (``None`` = unlimited).
+    """
+
+    daemon_threads = True
+
+    def __init__(self, files: dict[str, bytes], *, ranges: bool = True, per_connection_rate: float | None = None):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.files = files
+        self.ranges = ranges
+        self.per_connection_rate = per_connection_rate
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StandInServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def make_payload(path: str, size: int) -> bytes:
+    """Deterministic pseudo-random payload, identical in parent and child processes."""
+    rng = random.Random(path)
+    block = 1024 * 1024
+    return b"".join(rng.randbytes(min(block, size - i)) for i in range(0, size, block))
+
+
+@contextlib.contextmanager
+def standin_process(
+    sizes: dict[str, int], *, ranges: bool = True, per_connection_rate: float | None = None
+) -> Iterator[str]:
+    """Run a StandInServer in a child process and yield its base URL.
+
+    Keeps the server's CPU time and GIL out of the benchmarked process, which matters
+    for CPU-per-GB measurements. Payloads are generated with :func:`make_payload`.
+    """
+    cmd = [sys.executable, "-m", "benchmarks._standin"]
+    cmd += [f"--file={path}={size}" for path, size in sizes.items()]
+    if not ranges:
+        cmd.append("--no-ranges")
+    if per_connection_rate:
+        cmd.append(f"--rate={per_connection_rate}")
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    try:
+        base_url = proc.stdout.readline().strip()
+        if not base_url:
+            raise RuntimeError("stand-in server failed to start")
+        yield base_url
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def _main() -> None:
+    parser = argparse.ArgumentParser(description="Serve generated payloads until terminated")
+    parser.add_argument("--file", action="append", default=[], help="PATH=SIZE_IN_BYTES")
+    parser.add_argument("--no-ranges", action="store_true")
+    parser.add_argument("--rate", type=float, default=None)
+    args = parser.parse_args()
+
+    files = {}
+    for spec in args.file:
+        path, size = spec.rsplit("=", 1)
+        files[path] = make_payload(path, int(size))
+
+    with StandInServer(files, ranges=not args.no_ranges, per_connection_rate=args.rate) as server:
+        print(server.base_url, flush=True)
+        threading.Event().wait()
+
+
+if __name__ == "__main__":
+    _main()
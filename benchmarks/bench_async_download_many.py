@@ -0,0 +1,75 @@
+"""Benchmark AsyncLondonDataStore.download_many as its concurrency varies.
+
+A stand-in in a child process serves ``--files`` payloads, each connection capped
+at ``--rate`` MB/s like a host that throttles per connection, so aggregate
+throughput should grow with concurrency until the per-host limit or the local
+disk becomes the bottleneck. The stand-in speaks HTTP/1.1 only, so ``--http2``
+exercises the negotiation fallback rather than multiplexing.
+
+Usage:
+    python -m benchmarks.bench_async_download_many --files 32 --size-mb 4 --rate 8 --concurrency 1 2 4 8 16
+"""
+
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+
+from london_data_store.async_client import AsyncLondonDataStore
+
+from ._standin import standin_process
+
+
+def _catalogue(base_url: str, count: int) -> list[dict]:
+    return [
+        {
+            "slug": f"bench-{i}",
+            "title": f"Bench {i}",
+            "resources": {"res": {"format": "bin", "url": f"{base_url}/files/payload-{i}.bin"}},
+        }
+        for i in range(count)
+    ]
+
+
+async def _run_once(base_url: str, count: int, concurrency: int, per_host: int, http2: bool) -> float:
+    lds = AsyncLondonDataStore(json_url=f"{base_url}/api/v2/datasets/export.json", cache=False, http2=http2)
+    lds._raw_response_json = _catalogue(base_url, count)
+    async with lds:
+        with tempfile.TemporaryDirectory() as tmp:
+            started = time.perf_counter()
+            outcomes = await lds.download_many(
+                [f"bench-{i}" for i in range(count)], tmp, concurrency=concurrency, per_host=per_host
+            )
+            elapsed = time.perf_counter() - started
+    failed = [outcome for outcome in outcomes if not outcome.ok]
+    if failed:
+        raise RuntimeError(f"{len(failed)} downloads failed, first: {failed[0].error}")
+    return elapsed
+
+
+def run(count: int, size_mb: int, rate_mb: float, levels: list[int], http2: bool) -> None:
+    sizes = {f"/download/bench-{i}/res/payload-{i}.bin": size_mb * 1024 * 1024 for i in range(count)}
+    total_mb = count * size_mb
+    with standin_process(sizes, per_connection_rate=rate_mb * 1024 * 1024) as base_url:
+        print(f"{count} files x {size_mb} MB, per-connection cap: {rate_mb} MB/s, http2: {http2}")
+        print(f"{'concurrency':>11}  {'seconds':>8}  {'MB/s':>8}")
+        for concurrency in levels:
+            elapsed = asyncio.run(_run_once(base_url, count, concurrency, concurrency, http2))
+            print(f"{concurrency:>11}  {elapsed:>8.2f}  {total_mb / elapsed:>8.1f}")
+
+
+def main() -> None:
+    logging.getLogger("ASYNC_LDS").setLevel(logging.WARNING)
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=32)
+    parser.add_argument("--size-mb", type=int, default=4)
+    parser.add_argument("--rate", type=float, default=8.0, help="Per-connection cap in MB/s")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--http2", action="store_true")
+    args = parser.parse_args()
+    run(args.files, args.size_mb, args.rate, args.concurrency, args.http2)
+
+
+if __name__ == "__main__":
+    main()
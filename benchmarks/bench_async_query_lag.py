@@ -0,0 +1,140 @@
+"""Benchmark event-loop lag while AsyncLondonDataStore answers concurrent queries.
+
+A ticker task sleeps 1 ms at a time and records how late it wakes; the lag
+percentiles show how long the loop was blocked. Each mode runs ``--queries``
+searches and keyword filters concurrently over a synthetic catalogue:
+
+- ``inline``: the query functions called on the event loop, as before queries
+  were offloaded.
+- ``thread``: the default, one query thread shared by all clients.
+- ``pool``: the loop's default thread pool, whose extra threads each compete
+  with the loop for the GIL.
+- ``process``: a ProcessPoolExecutor, which also frees the GIL but pickles the
+  catalogue for every query.
+
+Usage:
+    python -m benchmarks.bench_async_query_lag --datasets 5000 --queries 8
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from london_data_store.async_client import AsyncLondonDataStore
+from london_data_store.queries import filter_for_keyword, score_strings
+
+_WORDS = [
+    "population",
+    "housing",
+    "transport",
+    "cycling",
+    "borough",
+    "crime",
+    "health",
+    "education",
+    "income",
+    "employment",
+    "air",
+    "quality",
+    "planning",
+    "energy",
+    "waste",
+    "rents",
+    "schools",
+    "travel",
+    "journeys",
+    "collisions",
+    "parks",
+    "libraries",
+    "census",
+    "wards",
+]
+
+
+def _catalogue(count: int) -> list[dict]:
+    rng = random.Random(0)
+    return [
+        {
+            "slug": "-".join(rng.sample(_WORDS, 3)) + f"-{i}",
+            "title": " ".join(rng.sample(_WORDS, 4)).title() + f" {i}",
+            "tags": rng.sample(_WORDS, 5),
+            "resources": {},
+        }
+        for i in range(count)
+    ]
+
+
+class _InlineClient(AsyncLondonDataStore):
+    """Runs queries on the event loop, as the client did before they were offloaded."""
+
+    async def _query(self, fn, *args):
+        return fn(*args)
+
+
+async def _ticker(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        before = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - before - 0.001)
+
+
+async def _run(client: AsyncLondonDataStore, queries: int) -> tuple[float, list[float]]:
+    await client.get_data_from_url()
+    lags: list[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(lags, stop))
+    await asyncio.sleep(0.01)
+    started = time.perf_counter()
+    work = []
+    for i in range(queries):
+        word = _WORDS[i % len(_WORDS)]
+        work += [client.search(word, limit=10), client.filter_slugs_for_keyword(word)]
+    await asyncio.gather(*work)
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await ticker
+    return elapsed, lags
+
+
+def _report(mode: str, elapsed: float, lags: list[float]) -> None:
+    lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+    p99 = lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))]
+    print(f"{mode:<8}  {elapsed:>8.2f}  {statistics.median(lags_ms):>10.2f}  {p99:>10.2f}  {lags_ms[-1]:>10.2f}")
+
+
+def run(datasets: int, queries: int, modes: list[str]) -> None:
+    catalogue = _catalogue(datasets)
+    # Warm the stemmer's import and cache so every mode starts alike
+    filter_for_keyword(catalogue[:10], "slug", "cycling")
+    score_strings(["a"], "a", 1)
+    print(f"{datasets} datasets, {queries} searches + {queries} keyword filters at once")
+    print(f"{'mode':<8}  {'seconds':>8}  {'lag p50 ms':>10}  {'lag p99 ms':>10}  {'lag max ms':>10}")
+    for mode in modes:
+        executor = {"process": ProcessPoolExecutor, "pool": ThreadPoolExecutor}.get(mode, lambda: None)()
+        client_class = _InlineClient if mode == "inline" else AsyncLondonDataStore
+        client = client_class(cache=False, query_executor=executor)
+        client._raw_response_json = catalogue
+        try:
+            elapsed, lags = asyncio.run(_run(client, queries))
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        _report(mode, elapsed, lags)
+
+
+def main() -> None:
+    logging.getLogger("ASYNC_LDS").setLevel(logging.WARNING)
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--datasets", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=8)
+    parser.add_argument("--modes", nargs="+", default=["inline", "thread", "pool", "process"])
+    args = parser.parse_args()
+    run(args.datasets, args.queries, args.modes)
+
+
+if __name__ == "__main__":
+    main()
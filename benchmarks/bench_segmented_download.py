@@ -0,0 +1,53 @@
+"""Benchmark segmented (multi-connection) downloads against a range-capable stand-in.
+
+Each connection to the stand-in is capped at ``--rate`` MB/s, mimicking a remote
+host that throttles per connection, so throughput should scale with segments.
+
+Usage:
+    python -m benchmarks.bench_segmented_download --size-mb 64 --rate 16 --segments 1 2 4 8
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import requests
+
+from london_data_store.download import DownloadManager
+
+from ._standin import StandInServer
+
+
+def run(size_mb: int, rate_mb: float, segment_counts: list[int]) -> None:
+    payload = os.urandom(size_mb * 1024 * 1024)
+    files = {"/download/bench/res/payload.bin": payload}
+
+    with StandInServer(files, per_connection_rate=rate_mb * 1024 * 1024) as server, requests.Session() as session:
+        url = f"{server.base_url}/download/bench/res/payload.bin"
+        print(f"payload: {size_mb} MB, per-connection cap: {rate_mb} MB/s")
+        print(f"{'segments':>8}  {'seconds':>8}  {'MB/s':>8}")
+        for segments in segment_counts:
+            manager = DownloadManager(session, segments=segments, min_segment_size=1024 * 1024)
+            with tempfile.TemporaryDirectory() as tmp:
+                started = time.perf_counter()
+                path = manager.download_file(url, Path(tmp), expected_size=len(payload))
+                elapsed = time.perf_counter() - started
+                assert path.stat().st_size == len(payload)
+            print(f"{segments:>8}  {elapsed:>8.2f}  {size_mb / elapsed:>8.1f}")
+
+
+def main() -> None:
+    logging.getLogger("DOWNLOAD").setLevel(logging.WARNING)
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument("--rate", type=float, default=16.0, help="Per-connection cap in MB/s")
+    parser.add_argument("--segments", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+    run(args.size_mb, args.rate, args.segments)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark the DownloadManager receive/write path against the legacy 8 KB loop.
+
+The stand-in server runs in a child process, so the reported CPU time is the
+client's alone. "legacy" reproduces the old ``iter_content(chunk_size=8192)`` loop
+(new bytes per chunk, MD5 and a progress call for each); "buffered" is the current
+DownloadManager path (``readinto`` a reused buffer, memoryview slices).
+
+With ``--digests``, both paths also compute those digests: the legacy loop inline,
+the buffered path on its hashing worker thread.
+
+Usage:
+    python -m benchmarks.bench_write_path --size-mb 512 --chunk-kb 256 1024 4096
+    python -m benchmarks.bench_write_path --size-mb 1024 --digests md5 sha256 blake2b
+"""
+
+import argparse
+import hashlib
+import logging
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+import requests
+
+from london_data_store.download import DownloadManager
+
+from ._standin import standin_process
+
+
+def _cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _legacy_download(session: requests.Session, url: str, destination: Path, progress, digests: list[str]) -> None:
+    response = session.get(url, stream=True, timeout=30)
+    response.raise_for_status()
+    total = int(response.headers.get("content-length", 0)) or None
+    hashers = [hashlib.new(name) for name in digests]
+    downloaded = 0
+    with open(destination, "wb") as f:
+        for chunk in response.iter_content(chunk_size=8192):
+            f.write(chunk)
+            downloaded += len(chunk)
+            for hasher in hashers:
+                hasher.update(chunk)
+            progress(downloaded, total)
+
+
+def _measure(label: str, size_mb: int, fn) -> None:
+    wall, cpu = time.perf_counter(), _cpu_seconds()
+    fn()
+    wall, cpu = time.perf_counter() - wall, _cpu_seconds() - cpu
+    print(f"{label:<18}  {size_mb / wall:>8.1f}  {cpu / (size_mb / 1024):>10.2f}")
+
+
+def run(size_mb: int, chunk_sizes_kb: list[int], repeat: int, digests: list[str]) -> None:
+    path = "/download/bench/res/payload.bin"
+    with standin_process({path: size_mb * 1024 * 1024}) as base_url, requests.Session() as session:
+        url = base_url + path
+        manager = DownloadManager(session)
+        print(f"payload: {size_mb} MB, digests: {', '.join(digests) or 'none'}")
+        print(f"{'path':<18}  {'MB/s':>8}  {'CPU s/GB':>10}")
+        with tempfile.TemporaryDirectory() as tmp:
+            dest = Path(tmp) / "payload.bin"
+            for _ in range(repeat):
+                _measure("legacy 8 KB", size_mb, lambda: _legacy_download(session, url, dest, lambda *a: None, digests))
+            for kb in chunk_sizes_kb:
+                for _ in range(repeat):
+                    _measure(
+                        f"buffered {kb} KB",
+                        size_mb,
+                        lambda kb=kb: manager.download_file(
+                            url, dest, chunk_size=kb * 1024, hash_algorithms=digests, progress_callback=lambda *a: None
+                        ),
+                    )
+
+
+def main() -> None:
+    logging.getLogger("DOWNLOAD").setLevel(logging.ERROR)
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=512)
+    parser.add_argument("--chunk-kb", type=int, nargs="+", default=[256, 1024, 4096])
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--digests", nargs="*", default=["md5"], help="Digests computed by both paths")
+    args = parser.parse_args()
+    run(args.size_mb, args.chunk_kb, args.repeat, args.digests)
+
+
+if __name__ == "__main__":
+    main()
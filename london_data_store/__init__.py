@@ -1,22 +1,65 @@
 from .api import LondonDataStore
+from .convert import ConversionResult, convert_csv, convert_resources
+from .download import DownloadBuffer, DownloadOutcome, DownloadResult, DownloadStatus, SinkResult
 from .exceptions import (
     CacheError,
+    ConversionError,
     DatasetNotFoundError,
     DownloadError,
     FormatNotAvailableError,
+    InsufficientSpaceError,
     LondonDataStoreError,
 )
+from .mirror import MirrorPlan, MirrorResult, mirror, plan_mirror
 from .models import Dataset, Resource
+from .planner import DownloadPlan, plan_downloads
+from .progress import ProgressAggregator, ThrottledProgress
+from .ratelimit import Priority, RateLimiter, rate_limit_priority
+from .scan import ResourceCheck, ScanReport
+from .scheduler import DownloadScheduler, Job, JobState
+from .sinks import CallableSink, FileSink, MemorySink, Sink
+from .store import ResourceStore
 
 __all__ = [
     "LondonDataStore",
     "Resource",
     "Dataset",
+    "ResourceStore",
+    "DownloadResult",
+    "DownloadBuffer",
+    "DownloadOutcome",
+    "Sink",
+    "FileSink",
+    "MemorySink",
+    "CallableSink",
+    "SinkResult",
+    "DownloadStatus",
+    "ProgressAggregator",
+    "ThrottledProgress",
+    "RateLimiter",
+    "Priority",
+    "rate_limit_priority",
+    "DownloadScheduler",
+    "DownloadPlan",
+    "plan_downloads",
+    "ScanReport",
+    "ResourceCheck",
+    "mirror",
+    "plan_mirror",
+    "MirrorPlan",
+    "MirrorResult",
+    "ConversionResult",
+    "convert_csv",
+    "convert_resources",
+    "Job",
+    "JobState",
     "LondonDataStoreError",
     "DatasetNotFoundError",
     "FormatNotAvailableError",
     "DownloadError",
+    "InsufficientSpaceError",
     "CacheError",
+    "ConversionError",
 ]
 
 # Conditionally export AsyncLondonDataStore if httpx is available
@@ -1,9 +1,11 @@
-import datetime
+import contextlib
+import csv
+import io
 import os
-import re
+import tempfile
 import warnings
-from collections.abc import Callable
-from itertools import chain
+import zipfile
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
 from urllib.parse import urlsplit
 
@@ -11,40 +13,34 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-from .cache import CatalogueCache
-from .download import DownloadManager
-from .exceptions import DatasetNotFoundError, FormatNotAvailableError
-from .models import Dataset
+from .archive import ArchiveMember, HTTPRangeFile, MemberStream, extract_members, probe_ranges
+from .cache import ArchiveListingCache, CatalogueCache, PreviewCache, RedirectCache, ValidatorCache
+from .convert import ConversionResult, convert_csv, output_path
+from .download import DEFAULT_SPOOL_SIZE, DownloadBuffer, DownloadManager, DownloadResult, SinkResult
+from .exceptions import CacheError, DatasetNotFoundError, DownloadError, FormatNotAvailableError
+from .models import Dataset, Resource
+from .preview import DEFAULT_PREVIEW_BYTES, Preview, fetch_prefix, parse_preview
+from .queries import (
+    all_formats,
+    download_urls_for_slug,
+    filter_for_keyword,
+    score_strings,
+    slugs_for_format,
+    slugs_for_titles,
+)
+from .queries import search_list_for_string as _search_list_for_string
+from .ratelimit import Priority, RateLimitedAdapter, RateLimiter, rate_limit_priority
+from .singleflight import SingleFlight
+from .sinks import Sink
+from .store import ResourceStore
+from .streaming import DEFAULT_STREAM_CHUNK_SIZE, batched
 from .utils.logging_helper import BasicLogger
 from .utils.response import Response
-from .utils.strings_and_lists import ListOperations
 
 _bl = BasicLogger(verbose=False, log_directory=None, logger_name="LONDON_DATA_STORE")
 
-_stemmer = None
-
-
-def _get_stemmer():
-    global _stemmer
-    if _stemmer is None:
-        from nltk.stem.snowball import SnowballStemmer
-
-        _stemmer = SnowballStemmer("english")
-    return _stemmer
-
-
-def _search_list_for_string(search_list: list[str], search_string: str) -> list[str] | None:
-    list_ops = ListOperations(search_list, search_string=search_string)
-
-    filtered = list_ops.search_list_by_snowball()
-    if filtered:
-        return filtered
-    else:
-        filtered = list_ops.search_list_by_string_for_metric(0.5)
-        if filtered:
-            return filtered
-        else:
-            return None
+# Catalogue loads in flight, keyed on json_url and shared across instances
+_catalogue_loads = SingleFlight()
 
 
 def _validate_string(value: object, param_name: str = "parameter") -> str:
@@ -64,6 +60,12 @@ class LondonDataStore:
     Args:
         json_url (str, optional): The URL of the JSON dataset to retrieve.
                                  Defaults to "https://data.london.gov.uk/api/datasets/export.json".
+        store (bool, optional): Keep a content-addressed copy of every verified download
+                                and serve repeat downloads of unchanged resources from it.
+        store_dir (Path, optional): Directory for the resource store.
+        rate_limiter (RateLimiter, optional): Per-host request and bandwidth limits shared
+                                 with other clients. Catalogue fetches use the high-priority
+                                 lane, so bulk downloads cannot starve them.
     """
 
     def __init__(
@@ -72,21 +74,35 @@ class LondonDataStore:
         cache: bool = True,
         cache_ttl: int = 86400,
         cache_dir: Path | None = None,
+        store: bool = False,
+        store_dir: Path | None = None,
+        rate_limiter: RateLimiter | None = None,
     ):
         self.json_url = json_url
         self._raw_response_json = None
         self._all_d_types = None
         self._base_url = None
         self._cache = CatalogueCache(cache_dir=cache_dir, ttl_seconds=cache_ttl) if cache else None
+        self._store = ResourceStore(store_dir=store_dir) if store else None
+        self._validators = ValidatorCache(cache_dir=cache_dir)
+        self._redirects = RedirectCache(cache_dir=cache_dir) if cache else None
+        self._archive_listings = ArchiveListingCache(cache_dir=cache_dir) if cache else None
+        self._previews = PreviewCache(cache_dir=cache_dir) if cache else None
+        self._rate_limiter = rate_limiter
 
         # Shared session with automatic retries
         self._session = requests.Session()
-        retry = Retry(
-            total=3,
-            backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry)
+        if rate_limiter is None:
+            retry = Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+            )
+            adapter = HTTPAdapter(max_retries=retry)
+        else:
+            # 429s are retried by the adapter through the shared limiter instead
+            retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504])
+            adapter = RateLimitedAdapter(rate_limiter, max_retries=retry)
         self._session.mount("https://", adapter)
         self._session.mount("http://", adapter)
 
@@ -112,29 +128,34 @@ class LondonDataStore:
         """Retrieves JSON data from a specified URL.
 
         Checks disk cache first (if caching is enabled). On cache miss,
-        fetches from the network and caches the result.
+        fetches from the network and caches the result. Concurrent calls for the
+        same URL, from any thread or instance, share a single load.
 
         Returns:
             dict: The JSON data retrieved from the URL, or None on error.
 
         """
         if self._raw_response_json is None:
-            # Try cache first
-            if self._cache is not None:
-                cached = self._cache.get(self.json_url)
-                if cached is not None:
-                    self._raw_response_json = cached
-                    return self._raw_response_json
+            data = _catalogue_loads.do(self.json_url, self._load_catalogue)
+            if data:
+                self._raw_response_json = data
+        return self._raw_response_json
 
+    def _load_catalogue(self) -> list[dict] | None:
+        """Read the catalogue from the disk cache, or fetch and cache it."""
+        if self._cache is not None:
+            cached = self._cache.get(self.json_url)
+            if cached is not None:
+                return cached
+
+        with rate_limit_priority(Priority.HIGH):
             response_dict = Response(self.json_url, session=self._session).get_json_from_response()
-            if not response_dict:
-                return
-            self._raw_response_json = response_dict
+        if not response_dict:
+            return None
 
-            # Store in cache
-            if self._cache is not None:
-                self._cache.put(self.json_url, response_dict)
-        return self._raw_response_json
+        if self._cache is not None:
+            self._cache.put(self.json_url, response_dict)
+        return response_dict
 
     def clear_cache(self) -> None:
         """Invalidate the cached catalogue for this instance's URL."""
@@ -205,16 +226,7 @@ class LondonDataStore:
         matched_titles = self.filter_title_for_string(string)
         if not matched_titles:
             return None
-        title_to_info = {
-            x.get("title", "").strip(): (x.get("slug"), x.get("updatedAt") or x.get("createdAt") or "")
-            for x in self.get_data_from_url()
-        }
-        results = []
-        for title in matched_titles:
-            if title in title_to_info:
-                slug, date = title_to_info[title]
-                results.append((title, slug, date))
-        return results or None
+        return slugs_for_titles(self.get_data_from_url(), matched_titles)
 
     def get_all_d_types(self) -> list[str]:
         """Retrieves a unique list of data types from a collection of resources.
@@ -223,14 +235,7 @@ class LondonDataStore:
             list: A list of unique data type strings. Empty list on error.
         """
         if self._all_d_types is None:
-            try:
-                dtypes = [
-                    [value.get("format") for key, value in x.get("resources").items()] for x in self.get_data_from_url()
-                ]
-                dtypes = list(set(list(chain.from_iterable(dtypes))))
-                self._all_d_types = dtypes
-            except (AttributeError, TypeError):
-                self._all_d_types = []
+            self._all_d_types = all_formats(self.get_data_from_url())
         return self._all_d_types
 
     def filter_slug_for_d_type(self, req_format: str) -> list[str]:
@@ -252,11 +257,7 @@ class LondonDataStore:
 
         if req_format not in self.get_all_d_types():
             raise FormatNotAvailableError(f"Available Data types: {', '.join(self.get_all_d_types())}")
-        filtered = [
-            y.get("slug")
-            for y in self.get_data_from_url()
-            if req_format in [x.get("format") for x in [value for key, value in y.get("resources").items()]]
-        ]
+        filtered = slugs_for_format(self.get_data_from_url(), req_format)
         if not filtered:
             raise FormatNotAvailableError("No slugs was found for the required data type")
         else:
@@ -273,45 +274,11 @@ class LondonDataStore:
             A list of download URL strings. Empty list if no matching slug.
         """
         _validate_string(slug, "slug")
-        urls = []
-        for y in self.get_data_from_url():
-            if y.get("slug") == slug:
-                date = datetime.datetime.strftime(datetime.datetime.fromisoformat(y.get("updatedAt")), "%d %B %Y")
-                data_time = datetime.datetime.fromisoformat(y.get("updatedAt"))
-                tzinfo = data_time.tzinfo
-                diff = datetime.datetime.now(tz=tzinfo) - data_time
-                days = diff.days
-                months = days // 30
-                years = days // 365
-
-                updated_at = []
-                if days <= 30:
-                    updated_at.append(f"{days} days")
-                elif months <= 12:
-                    updated_at.append(f"{months} months")
-                else:
-                    updated_at.append(f"{years} years")
-                _bl.info(f"The data was last updated '{updated_at[0]}' ago on '{date}'")
-
-                if get_description:
-                    _bl.info(y.get("description"))
-                for key, value in y.get("resources").items():
-                    urls.append(
-                        f"{self.base_url}/download/{y.get('slug')}/{key}/{urlsplit(value.get('url')).path.split('/')[-1]}"
-                    )
-        _bl.info(f"{len(urls)} urls have been found. Choose relevant url.")
-        return urls
+        return download_urls_for_slug(self.get_data_from_url(), self.base_url, slug, get_description)
 
     def _filter_for_keyword(self, required: str, keyword: str) -> list[str]:
         _validate_string(keyword, "keyword")
-        stemmer = _get_stemmer()
-        search_terms = [stemmer.stem(x) for x in re.sub("[-_]", " ", keyword.strip().lower()).split(" ")]
-        selected = [
-            x.get(required)
-            for x in self.get_data_from_url()
-            if any(word in y for y in [stemmer.stem(z) for z in x.get("tags")] for word in search_terms)
-        ]
-        return selected
+        return filter_for_keyword(self.get_data_from_url(), required, keyword)
 
     def filter_slugs_for_keyword(self, keyword: str) -> list[str]:
         """Filters a list of slugs based on a keyword, using stemming for improved matching.
@@ -402,9 +369,7 @@ class LondonDataStore:
             A list of (title, score) tuples sorted by score descending.
         """
         _validate_string(term, "term")
-        list_ops = ListOperations(self.get_all_titles(), search_string=term)
-        scored = list_ops.search_list_with_scores()
-        return scored[:limit]
+        return score_strings(self.get_all_titles(), term, limit)
 
     def get_dataset(self, slug: str) -> Dataset:
         """Return a fully-populated Dataset model for the given slug.
@@ -497,6 +462,53 @@ class LondonDataStore:
             if keyword_lower in (x.get("licence", {}).get("title") or "").lower()
         ]
 
+    def get_resource(self, slug: str, format: str | None = None, *, resource_key: str | None = None) -> Resource:
+        """Return one resource of a dataset.
+
+        If resource_key is specified, returns that exact resource. Otherwise, if
+        format is specified, returns the first resource in that format, else the
+        dataset's first resource.
+
+        Args:
+            slug: The dataset slug.
+            format: File format to match (e.g., 'csv', 'geojson').
+            resource_key: Specific resource key.
+
+        Returns:
+            The matching Resource.
+
+        Raises:
+            DatasetNotFoundError: If the slug, resource key or any resource is not found.
+            FormatNotAvailableError: If format not found for slug.
+        """
+        _validate_string(slug, "slug")
+        dataset = self.get_dataset(slug)
+
+        if resource_key:
+            for r in dataset.resources:
+                if r.key == resource_key:
+                    return r
+            raise DatasetNotFoundError(f"Resource key '{resource_key}' not found in dataset '{slug}'")
+        if format:
+            fmt = format.lower()
+            if fmt == "gpkg":
+                fmt = "geopackage"
+            for r in dataset.resources:
+                if r.format.lower() == fmt:
+                    return r
+            available = [r.format for r in dataset.resources]
+            raise FormatNotAvailableError(
+                f"Format '{format}' not found for slug '{slug}'. Available: {', '.join(available)}"
+            )
+        if not dataset.resources:
+            raise DatasetNotFoundError(f"No resources found for slug '{slug}'")
+        return dataset.resources[0]
+
+    def get_resource_download_url(self, slug: str, resource: Resource) -> str:
+        """Build the portal download URL for a resource of the given dataset."""
+        url_path = urlsplit(resource.url).path.split("/")[-1]
+        return f"{self.base_url}/download/{slug}/{resource.key}/{url_path}"
+
     def download_file(
         self,
         slug: str,
@@ -506,6 +518,9 @@ class LondonDataStore:
         resource_key: str | None = None,
         progress_callback: Callable[[int, int | None], None] | None = None,
         verify_integrity: bool = True,
+        segments: int = 1,
+        if_changed: bool = False,
+        extract: bool | str | Iterable[str] = False,
     ) -> Path:
         """Download a resource file for the given dataset slug.
 
@@ -513,6 +528,10 @@ class LondonDataStore:
         If resource_key is specified, downloads that exact resource.
         Destination can be a directory (filename inferred) or a full path.
 
+        With ``extract``, the resource is treated as a zip archive and the selected
+        members are extracted into ``destination`` instead (see :meth:`extract_archive`);
+        the archive itself is not kept.
+
         Args:
             slug: The dataset slug.
             format: File format to match (e.g., 'csv', 'geojson'). Downloads first match.
@@ -520,58 +539,544 @@ class LondonDataStore:
             resource_key: Specific resource key to download.
             progress_callback: Called with (bytes_downloaded, total_bytes) after each chunk.
             verify_integrity: If True, verify hash and size from resource metadata.
+            segments: Number of concurrent byte-range connections for large files, at most
+                10. Falls back to a single stream when the server does not support ranges.
+            if_changed: Keep an existing destination file when the resource has not
+                changed since it was last downloaded (see :meth:`download`).
+            extract: ``True`` to extract every member of a zip resource, or member
+                names / glob patterns to extract. ``format`` defaults to 'zip'.
 
         Returns:
-            The final file path.
+            The final file path, or the destination directory when extracting.
 
         Raises:
             DatasetNotFoundError: If slug not found.
             FormatNotAvailableError: If format not found for slug.
             DownloadError: On download or integrity failure.
         """
-        _validate_string(slug, "slug")
-        dataset = self.get_dataset(slug)
+        if extract is not False:
+            self.extract_archive(
+                slug,
+                None if extract is True else extract,
+                destination,
+                resource_key=resource_key,
+                format=format or "zip",
+                verify_integrity=verify_integrity,
+            )
+            return Path(destination)
+        manager, kwargs = self._prepare_download(
+            slug, format, destination, resource_key, progress_callback, verify_integrity, segments, if_changed
+        )
+        return manager.download_file(**kwargs)
 
-        # Find the matching resource
-        resource = None
-        if resource_key:
-            for r in dataset.resources:
-                if r.key == resource_key:
-                    resource = r
-                    break
-            if resource is None:
-                raise DatasetNotFoundError(f"Resource key '{resource_key}' not found in dataset '{slug}'")
-        elif format:
-            fmt = format.lower()
-            if fmt == "gpkg":
-                fmt = "geopackage"
-            for r in dataset.resources:
-                if r.format.lower() == fmt:
-                    resource = r
-                    break
-            if resource is None:
-                available = [r.format for r in dataset.resources]
-                raise FormatNotAvailableError(
-                    f"Format '{format}' not found for slug '{slug}'. Available: {', '.join(available)}"
-                )
+    def download(
+        self,
+        slug: str,
+        format: str | None = None,
+        destination: str | Path = ".",
+        *,
+        resource_key: str | None = None,
+        progress_callback: Callable[[int, int | None], None] | None = None,
+        verify_integrity: bool = True,
+        segments: int = 1,
+        if_changed: bool = False,
+        hash_algorithms: Iterable[str] = (),
+    ) -> DownloadResult:
+        """Download a resource file and report whether it was actually transferred.
+
+        Takes the same arguments as :meth:`download_file`. With ``if_changed=True``
+        the catalogue ``check_timestamp`` and the ETag/Last-Modified from the previous
+        download are used to skip unchanged resources, so the result's ``status`` tells
+        orchestrators whether downstream work is needed.
+
+        ``hash_algorithms`` (e.g. ``["sha256", "blake2b"]``) are computed in the same
+        pass as the catalogue MD5 check and returned in the result's ``digests``.
+
+        Returns:
+            A DownloadResult whose status is ``downloaded``, ``not_modified`` or ``store``.
+
+        Raises:
+            DatasetNotFoundError: If slug not found.
+            FormatNotAvailableError: If format not found for slug.
+            DownloadError: On download or integrity failure.
+        """
+        manager, kwargs = self._prepare_download(
+            slug, format, destination, resource_key, progress_callback, verify_integrity, segments, if_changed
+        )
+        return manager.download(**kwargs, hash_algorithms=hash_algorithms)
+
+    def download_to_sink(
+        self,
+        slug: str,
+        sink: Sink,
+        format: str | None = None,
+        *,
+        resource_key: str | None = None,
+        progress_callback: Callable[[int, int | None], None] | None = None,
+        verify_integrity: bool = True,
+        hash_algorithms: Iterable[str] = (),
+    ) -> SinkResult:
+        """Stream a resource into ``sink`` without staging it on local disk.
+
+        ``sink`` receives the body chunk by chunk and is committed only once the
+        catalogue size and hash checks pass, or aborted otherwise:
+
+            lds.download_to_sink("population-projections", CallableSink(upload.write, commit=upload.finish))
+
+        Returns:
+            A SinkResult whose ``value`` is what the sink's ``commit`` returned.
+
+        Raises:
+            DatasetNotFoundError: If slug not found.
+            FormatNotAvailableError: If format not found for slug.
+            DownloadError: On download or integrity failure, or if the sink fails.
+        """
+        resource = self.get_resource(slug, format, resource_key=resource_key)
+        manager = DownloadManager(
+            self._session, store=self._store, rate_limiter=self._rate_limiter, redirects=self._redirects
+        )
+        return manager.download_to_sink(
+            self.get_resource_download_url(slug, resource),
+            sink,
+            progress_callback=progress_callback,
+            expected_hash=resource.check_hash if verify_integrity else None,
+            expected_size=resource.check_size if verify_integrity else None,
+            check_timestamp=resource.check_timestamp,
+            hash_algorithms=hash_algorithms,
+        )
+
+    def download_to_buffer(
+        self,
+        slug: str,
+        format: str | None = None,
+        *,
+        resource_key: str | None = None,
+        max_memory: int = DEFAULT_SPOOL_SIZE,
+        progress_callback: Callable[[int, int | None], None] | None = None,
+        verify_integrity: bool = True,
+    ) -> DownloadBuffer:
+        """Download a resource into a readable buffer rather than a file.
+
+        The body stays in memory up to ``max_memory`` bytes and spills to an anonymous
+        temporary file beyond that, so small files never touch the filesystem. The
+        buffer can be passed directly to ``pandas.read_csv`` or ``geopandas.read_file``:
+
+            with lds.download_to_buffer("population-projections", "csv") as buffer:
+                df = pd.read_csv(buffer)
+
+        Raises:
+            DatasetNotFoundError: If slug not found.
+            FormatNotAvailableError: If format not found for slug.
+            DownloadError: On download or integrity failure.
+        """
+        resource = self.get_resource(slug, format, resource_key=resource_key)
+        manager = DownloadManager(
+            self._session, store=self._store, rate_limiter=self._rate_limiter, redirects=self._redirects
+        )
+        return manager.download_to_buffer(
+            self.get_resource_download_url(slug, resource),
+            max_memory=max_memory,
+            progress_callback=progress_callback,
+            expected_hash=resource.check_hash if verify_integrity else None,
+            expected_size=resource.check_size if verify_integrity else None,
+            check_timestamp=resource.check_timestamp,
+        )
+
+    def download_bytes(
+        self,
+        slug: str,
+        format: str | None = None,
+        *,
+        resource_key: str | None = None,
+        progress_callback: Callable[[int, int | None], None] | None = None,
+        verify_integrity: bool = True,
+    ) -> bytes:
+        """Download a resource into memory and return its body (see :meth:`download_to_buffer`)."""
+        with self.download_to_buffer(
+            slug,
+            format,
+            resource_key=resource_key,
+            max_memory=0,
+            progress_callback=progress_callback,
+            verify_integrity=verify_integrity,
+        ) as buffer:
+            return buffer.read()
+
+    def preview(
+        self,
+        slug: str,
+        format: str | None = None,
+        rows: int = 10,
+        *,
+        resource_key: str | None = None,
+        max_bytes: int = DEFAULT_PREVIEW_BYTES,
+        encoding: str = "utf-8-sig",
+    ) -> Preview:
+        """Peek at a resource by fetching only its first ``max_bytes``.
+
+        A Range request is used where the server supports it; otherwise the stream
+        is closed once enough has arrived. CSV resources are parsed into a header
+        and the first ``rows`` rows, JSON and GeoJSON into the first items or
+        features, and plain-text formats into their first lines. Prefixes are
+        cached on disk by the resource's catalogue hash.
+
+        Args:
+            slug: The dataset slug.
+            format: File format to match (e.g., 'csv'). Previews the first match.
+            rows: Number of rows to return.
+            resource_key: Specific resource key to preview.
+            max_bytes: Most bytes fetched. Rows not complete within them are left out.
+            encoding: Text encoding. The default drops a UTF-8 BOM.
+
+        Raises:
+            DatasetNotFoundError: If slug not found.
+            FormatNotAvailableError: If format not found for slug.
+            DownloadError: On HTTP errors.
+        """
+        if rows < 1 or max_bytes < 1:
+            raise ValueError("'rows' and 'max_bytes' must be at least 1")
+        resource = self.get_resource(slug, format, resource_key=resource_key)
+        url = self.get_resource_download_url(slug, resource)
+
+        cached = None
+        if self._previews is not None and resource.check_hash:
+            cached = self._previews.get(resource.check_hash, max_bytes)
+        if cached is not None:
+            data, complete = cached
         else:
-            if not dataset.resources:
-                raise DatasetNotFoundError(f"No resources found for slug '{slug}'")
-            resource = dataset.resources[0]
+            data, complete = fetch_prefix(self._session, url, max_bytes)
+            if self._previews is not None and resource.check_hash:
+                try:
+                    self._previews.put(resource.check_hash, data, complete)
+                except CacheError as e:
+                    _bl.warning(str(e))
+
+        columns, records, text = parse_preview(data, resource.format, complete=complete, rows=rows, encoding=encoding)
+        return Preview(
+            slug=slug,
+            resource_key=resource.key,
+            format=resource.format,
+            url=url,
+            bytes_read=len(data),
+            complete=complete,
+            columns=columns,
+            rows=records,
+            text=text,
+            from_cache=cached is not None,
+        )
 
-        # Build download URL
-        url_path = urlsplit(resource.url).path.split("/")[-1]
-        download_url = f"{self.base_url}/download/{slug}/{resource.key}/{url_path}"
+    def open_resource(
+        self,
+        slug: str,
+        format: str | None = None,
+        *,
+        resource_key: str | None = None,
+        mode: str = "rb",
+        encoding: str = "utf-8-sig",
+        verify_integrity: bool = True,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        member: str | None = None,
+    ) -> io.BufferedReader | io.TextIOWrapper:
+        """Open a resource as a file-like object streaming from the HTTP response.
+
+        Nothing is written to disk and at most about ``chunk_size`` bytes are held
+        in memory. With ``verify_integrity`` the catalogue size and hash are checked
+        as the body is read; a truncated body raises when the end is reached.
+
+        With ``member``, the resource must be a zip archive and the named file inside
+        it is opened instead, decompressed as it is read (see :meth:`open_archive`).
+
+        Args:
+            slug: The dataset slug.
+            format: File format to match (e.g., 'csv'). Opens the first match.
+            resource_key: Specific resource key to open.
+            mode: ``"rb"`` for bytes or ``"r"`` for text.
+            encoding: Text encoding for ``mode="r"``. The default drops a UTF-8 BOM.
+            verify_integrity: If True, verify hash and size from resource metadata.
+            chunk_size: Bytes read from the connection at a time.
+            member: Name of a file inside a zip resource to open.
+
+        Returns:
+            A binary or text stream; close it (or use ``with``) to release the connection.
+
+        Raises:
+            DatasetNotFoundError: If slug not found.
+            FormatNotAvailableError: If format not found for slug.
+            DownloadError: On HTTP errors, or while reading on a size mismatch.
+            KeyError: If ``member`` is not in the archive.
+        """
+        if mode not in ("rb", "r"):
+            raise ValueError(f"'mode' must be 'rb' or 'r', got: {mode!r}")
+        resource = self.get_resource(slug, format, resource_key=resource_key)
+        if member is not None:
+            resources = contextlib.ExitStack()
+            try:
+                archive = resources.enter_context(self._open_archive(slug, resource, verify_integrity))
+                stream = MemberStream(archive.open(archive.getinfo(member)), resources)
+            except BaseException:
+                resources.close()
+                raise
+        else:
+            stream = self._open_stream(slug, resource, verify_integrity, chunk_size)
+        reader = io.BufferedReader(stream, buffer_size=chunk_size)
+        if mode == "rb":
+            return reader
+        return io.TextIOWrapper(reader, encoding=encoding, newline="")
+
+    def _open_stream(self, slug: str, resource: Resource, verify_integrity: bool, chunk_size: int):
+        manager = DownloadManager(self._session, rate_limiter=self._rate_limiter, redirects=self._redirects)
+        return manager.open(
+            self.get_resource_download_url(slug, resource),
+            expected_hash=resource.check_hash if verify_integrity else None,
+            expected_size=resource.check_size if verify_integrity else None,
+            chunk_size=chunk_size,
+            check_timestamp=resource.check_timestamp,
+        )
+
+    def open_archive(
+        self,
+        slug: str,
+        format: str | None = "zip",
+        *,
+        resource_key: str | None = None,
+        verify_integrity: bool = True,
+    ) -> contextlib.AbstractContextManager[zipfile.ZipFile]:
+        """Open a zip resource for reading without downloading all of it, where possible.
+
+        When the server supports byte ranges the archive is read remotely: the
+        central directory comes from the end of the file and each member is fetched
+        only when it is read, so unwanted members cost no transfer or disk I/O.
+        Otherwise the archive is downloaded to a temporary directory, removed again
+        when the context exits.
+
+        Members' CRCs are checked as they are decompressed. With ``verify_integrity``
+        the archive size is checked against the catalogue up front; the catalogue
+        MD5 can only be checked when the whole archive is downloaded.
+
+        Use as ``with lds.open_archive(slug) as archive:``.
+
+        Raises:
+            DatasetNotFoundError: If slug not found.
+            FormatNotAvailableError: If format not found for slug.
+            DownloadError: On HTTP errors, a size mismatch, or if the resource is not a zip.
+        """
+        resource = self.get_resource(slug, format, resource_key=resource_key)
+        return self._open_archive(slug, resource, verify_integrity)
+
+    @contextlib.contextmanager
+    def _open_archive(self, slug: str, resource: Resource, verify_integrity: bool) -> Iterator[zipfile.ZipFile]:
+        url = self.get_resource_download_url(slug, resource)
+        with contextlib.ExitStack() as stack:
+            probe = probe_ranges(self._session, url)
+            if probe is not None:
+                final_url, size = probe
+                if verify_integrity and resource.check_size is not None and size != resource.check_size:
+                    raise DownloadError(f"Size mismatch: expected {resource.check_size} bytes, server has {size}")
+                source = stack.enter_context(
+                    HTTPRangeFile(self._session, final_url, size, rate_limiter=self._rate_limiter)
+                )
+            else:
+                _bl.info(f"{url} does not support byte ranges, downloading the whole archive")
+                tmp = stack.enter_context(tempfile.TemporaryDirectory(prefix="lds-archive-"))
+                manager, kwargs = self._prepare_download(
+                    slug, None, tmp, resource.key, None, verify_integrity, 1, False
+                )
+                source = manager.download_file(**kwargs)
+            try:
+                archive = stack.enter_context(zipfile.ZipFile(source))
+            except zipfile.BadZipFile as e:
+                raise DownloadError(f"{url} is not a readable zip archive: {e}") from e
+            yield archive
+
+    def list_archive(
+        self,
+        slug: str,
+        resource_key: str | None = None,
+        *,
+        format: str | None = "zip",
+        verify_integrity: bool = True,
+    ) -> list[ArchiveMember]:
+        """List the members of a zip resource without downloading it.
+
+        Only the end-of-central-directory record and the central directory are
+        fetched, with a few small Range requests. Listings are cached by the
+        resource's catalogue hash, so an unchanged archive is only listed once.
+        Servers without range support fall back to downloading the archive.
+
+        Args:
+            slug: The dataset slug.
+            resource_key: Specific resource key. Defaults to the first zip resource.
+            format: Format of the resource to list.
+            verify_integrity: If True, check the archive size against the catalogue.
+
+        Returns:
+            The archive's entries, with names, sizes and CRCs.
+
+        Raises:
+            DatasetNotFoundError: If slug not found.
+            FormatNotAvailableError: If format not found for slug.
+            DownloadError: On HTTP errors, a size mismatch, or if the resource is not a zip.
+        """
+        resource = self.get_resource(slug, format, resource_key=resource_key)
+        if self._archive_listings is not None and resource.check_hash:
+            cached = self._archive_listings.get(resource.check_hash)
+            if cached is not None:
+                return [ArchiveMember(**member) for member in cached]
+
+        with self._open_archive(slug, resource, verify_integrity) as archive:
+            members = [ArchiveMember.from_zipinfo(info) for info in archive.infolist()]
+
+        if self._archive_listings is not None and resource.check_hash:
+            try:
+                self._archive_listings.put(resource.check_hash, [member.to_dict() for member in members])
+            except CacheError as e:
+                _bl.warning(str(e))
+        return members
+
+    def extract_archive(
+        self,
+        slug: str,
+        members: str | Iterable[str] | None = None,
+        destination: str | Path = ".",
+        *,
+        resource_key: str | None = None,
+        format: str | None = "zip",
+        verify_integrity: bool = True,
+    ) -> list[Path]:
+        """Extract files from a zip resource, fetching only the wanted members when possible.
+
+        Args:
+            slug: The dataset slug.
+            members: Member names or glob patterns (e.g. ``"*.shp"``). None extracts everything.
+            destination: Directory to extract into.
+            resource_key: Specific resource key. Defaults to the first zip resource.
+            format: Format of the resource to open.
+            verify_integrity: If True, check the archive size against the catalogue.
+
+        Returns:
+            The extracted file paths.
+
+        Raises:
+            DatasetNotFoundError: If slug not found.
+            FormatNotAvailableError: If format not found for slug.
+            DownloadError: On HTTP errors, a size mismatch or a corrupt archive.
+            KeyError: If a pattern in ``members`` matches nothing.
+        """
+        with self.open_archive(slug, format, resource_key=resource_key, verify_integrity=verify_integrity) as archive:
+            return extract_members(archive, destination, members)
+
+    def iter_rows(
+        self,
+        slug: str,
+        format: str = "csv",
+        *,
+        resource_key: str | None = None,
+        batch_size: int | None = None,
+        encoding: str = "utf-8-sig",
+        delimiter: str = ",",
+        verify_integrity: bool = True,
+    ) -> Iterator[dict] | Iterator[list[dict]]:
+        """Yield the rows of a CSV resource as they arrive, without touching disk.
+
+        Rows are dicts keyed by the header row, as from :class:`csv.DictReader`.
+        Integrity is checked on the fly, so a :class:`DownloadError` can be raised
+        after rows have been yielded; treat rows as provisional until iteration ends.
+
+        Args:
+            slug: The dataset slug.
+            format: File format to match. Defaults to 'csv'.
+            resource_key: Specific resource key to read.
+            batch_size: Yield lists of up to this many rows instead of single rows.
+            encoding: Text encoding. The default drops a UTF-8 BOM.
+            delimiter: Field delimiter.
+            verify_integrity: If True, verify hash and size from resource metadata.
+
+        Raises:
+            DatasetNotFoundError: If slug not found.
+            FormatNotAvailableError: If format not found for slug.
+            DownloadError: On HTTP errors or a size mismatch.
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"'batch_size' must be at least 1, got: {batch_size!r}")
+        with self.open_resource(
+            slug, format, resource_key=resource_key, mode="r", encoding=encoding, verify_integrity=verify_integrity
+        ) as f:
+            rows = csv.DictReader(f, delimiter=delimiter)
+            if batch_size is None:
+                yield from rows
+            else:
+                yield from batched(rows, batch_size)
+
+    def convert_resource(
+        self,
+        slug: str,
+        destination: str | Path = ".",
+        *,
+        resource_key: str | None = None,
+        format: str = "parquet",
+        verify_integrity: bool = True,
+        **kwargs,
+    ) -> ConversionResult:
+        """Stream a CSV resource straight into a Parquet or Arrow IPC file.
+
+        The resource is read with :meth:`open_resource` and converted in fixed-size
+        record batches, so neither the CSV nor the whole table is held on disk or
+        in memory. Requires pyarrow (``pip install london-data-store[arrow]``).
+
+        Args:
+            slug: The dataset slug.
+            destination: Target path (directory or file). Defaults to current directory.
+            resource_key: Specific resource key. Defaults to the first CSV resource.
+            format: ``"parquet"`` or ``"arrow"``.
+            verify_integrity: If True, verify hash and size from resource metadata.
+            **kwargs: Passed to :func:`london_data_store.convert.convert_csv`
+                (``batch_size``, ``sample_rows``, ``column_types``, ...).
+
+        Raises:
+            DatasetNotFoundError: If slug not found.
+            FormatNotAvailableError: If the dataset has no CSV resource.
+            DownloadError: On download or integrity failure.
+            ConversionError: If the CSV does not parse or fit the inferred schema.
+        """
+        resource = self.get_resource(slug, None if resource_key else "csv", resource_key=resource_key)
+        destination = output_path(resource.url, destination, format)
+        with self.open_resource(slug, resource_key=resource.key, verify_integrity=verify_integrity) as source:
+            return convert_csv(source, destination, format=format, **kwargs)
+
+    def _prepare_download(
+        self,
+        slug: str,
+        format: str | None,
+        destination: str | Path,
+        resource_key: str | None,
+        progress_callback: Callable[[int, int | None], None] | None,
+        verify_integrity: bool,
+        segments: int,
+        if_changed: bool,
+    ) -> tuple[DownloadManager, dict]:
+        """Resolve the resource and build the DownloadManager call for it."""
+        resource = self.get_resource(slug, format, resource_key=resource_key)
+        download_url = self.get_resource_download_url(slug, resource)
 
         # Prepare integrity check params
         expected_hash = resource.check_hash if verify_integrity else None
         expected_size = resource.check_size if verify_integrity else None
 
-        manager = DownloadManager(self._session)
-        return manager.download_file(
-            url=download_url,
-            destination=Path(destination),
-            progress_callback=progress_callback,
-            expected_hash=expected_hash,
-            expected_size=expected_size,
+        manager = DownloadManager(
+            self._session,
+            segments=segments,
+            store=self._store,
+            validators=self._validators,
+            rate_limiter=self._rate_limiter,
+            redirects=self._redirects,
         )
+        kwargs = {
+            "url": download_url,
+            "destination": Path(destination),
+            "progress_callback": progress_callback,
+            "expected_hash": expected_hash,
+            "expected_size": expected_size,
+            "if_changed": if_changed,
+            "check_timestamp": resource.check_timestamp,
+        }
+        return manager, kwargs
@@ -0,0 +1,284 @@
+"""Random access to remote files over HTTP Range requests, and zip member extraction."""
+
+import contextlib
+import fnmatch
+import io
+import os
+import shutil
+import zipfile
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+
+from .exceptions import DownloadError
+from .ratelimit import RateLimiter
+from .utils.logging_helper import BasicLogger
+
+_bl = BasicLogger(verbose=False, log_directory=None, logger_name="ARCHIVE")
+
+# Range offsets refer to the stored bytes, so ask for them unencoded
+_RANGE_HEADERS = {"Accept-Encoding": "identity"}
+
+
+def probe_ranges(session: requests.Session, url: str, *, timeout: float = 30) -> tuple[str, int] | None:
+    """Return ``(final_url, size)`` if ``url`` can be read with byte ranges, else None."""
+    try:
+        response = session.head(url, headers=_RANGE_HEADERS, allow_redirects=True, timeout=timeout)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        _bl.warning(f"Range probe failed for {url}: {e}")
+        return None
+    size = int(response.headers.get("content-length", 0) or 0)
+    if "bytes" not in response.headers.get("accept-ranges", "").lower() or size <= 0:
+        return None
+    final_url = response.url if isinstance(response.url, str) else url
+    return final_url, size
+
+
+class HTTPRangeFile(io.RawIOBase):
+    """A seekable, read-only file over HTTP Range requests.
+
+    Sequential reads continue on one streamed response; the window fetched per
+    request starts at ``block_size`` and doubles while reads stay sequential, up to
+    ``max_block_size``. A seek elsewhere drops the response and the next read opens
+    a new window there. This suits :mod:`zipfile`, which reads the central directory
+    at the end and then each wanted member front to back.
+
+    Args:
+        session: The requests.Session to fetch with.
+        url: The file's URL (already redirected, see :func:`probe_ranges`).
+        size: The file's size in bytes.
+        block_size: Bytes fetched by the first request after a seek.
+        max_block_size: Largest window fetched by one request.
+        rate_limiter: Limiter the fetched bytes are drawn from.
+        timeout: Per-request timeout in seconds.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session,
+        url: str,
+        size: int,
+        *,
+        block_size: int = 64 * 1024,
+        max_block_size: int = 16 * 1024 * 1024,
+        rate_limiter: RateLimiter | None = None,
+        timeout: float = 30,
+    ):
+        super().__init__()
+        self._session = session
+        self.url = url
+        self.size = size
+        self._block_size = block_size
+        self._max_block_size = max_block_size
+        self._rate_limiter = rate_limiter
+        self._host = urlsplit(url).netloc
+        self._timeout = timeout
+        self._pos = 0
+        self._response: requests.Response | None = None
+        self._stream_pos = 0
+        self._stream_end = 0
+        self._window = block_size
+        self.requests = 0
+        self.bytes_fetched = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_SET:
+            pos = offset
+        elif whence == os.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == os.SEEK_END:
+            pos = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence!r}")
+        if pos < 0:
+            raise OSError(f"Negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def _open(self, want: int) -> None:
+        """Start a ranged response at the current position covering at least ``want`` bytes."""
+        sequential = self._response is not None and self._pos == self._stream_end
+        self._drop()
+        self._window = min(self._window * 2, self._max_block_size) if sequential else self._block_size
+        end = min(self.size, self._pos + max(want, self._window)) - 1
+        try:
+            response = self._session.get(
+                self.url,
+                headers={**_RANGE_HEADERS, "Range": f"bytes={self._pos}-{end}"},
+                stream=True,
+                timeout=self._timeout,
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise DownloadError(f"Failed to read {self.url} bytes {self._pos}-{end}: {e}") from e
+        content_range = response.headers.get("content-range", "")
+        if response.status_code != 206 or not content_range.startswith(f"bytes {self._pos}-{end}/"):
+            response.close()
+            raise DownloadError(f"{self.url} answered range {self._pos}-{end} with {response.status_code}")
+        self.requests += 1
+        self._response = response
+        self._stream_pos = self._pos
+        self._stream_end = end + 1
+
+    def _drop(self) -> None:
+        if self._response is not None:
+            self._response.close()
+            self._response = None
+
+    def readinto(self, buffer) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+        want = min(len(buffer), self.size - self._pos)
+        if want <= 0:
+            return 0
+        if self._response is None or self._stream_pos != self._pos or self._stream_pos >= self._stream_end:
+            self._open(want)
+        data = self._response.raw.read(min(want, self._stream_end - self._stream_pos))
+        if not data:
+            raise DownloadError(f"{self.url} ended early at byte {self._pos}")
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire_bytes(self._host, len(data))
+        n = len(data)
+        buffer[:n] = data
+        self._pos += n
+        self._stream_pos += n
+        self.bytes_fetched += n
+        return n
+
+    def close(self) -> None:
+        self._drop()
+        super().close()
+
+
+@dataclass
+class ArchiveMember:
+    """One entry of a zip archive's central directory."""
+
+    name: str
+    size: int
+    compressed_size: int
+    crc: int
+    modified: str
+    is_dir: bool = False
+
+    @classmethod
+    def from_zipinfo(cls, info: zipfile.ZipInfo) -> "ArchiveMember":
+        year, month, day, hour, minute, second = info.date_time
+        return cls(
+            name=info.filename,
+            size=info.file_size,
+            compressed_size=info.compress_size,
+            crc=info.CRC,
+            modified=f"{year:04d}-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}:{second:02d}",
+            is_dir=info.is_dir(),
+        )
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class MemberStream(io.RawIOBase):
+    """A zip member opened for reading that also releases the archive it came from on close."""
+
+    def __init__(self, member: io.BufferedIOBase, resources: contextlib.ExitStack):
+        super().__init__()
+        self._member = member
+        self._resources = resources
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        try:
+            return self._member.readinto(buffer)
+        except zipfile.BadZipFile as e:
+            raise DownloadError(f"Corrupt archive member: {e}") from e
+
+    def close(self) -> None:
+        if not self.closed:
+            self._member.close()
+            self._resources.close()
+        super().close()
+
+
+def select_members(archive: zipfile.ZipFile, members: str | Iterable[str] | None = None) -> list[zipfile.ZipInfo]:
+    """Pick the files of ``archive`` matching ``members`` (names or glob patterns; None for all).
+
+    Raises:
+        KeyError: If a pattern matches nothing.
+    """
+    files = [info for info in archive.infolist() if not info.is_dir()]
+    if members is None:
+        return files
+    patterns = [members] if isinstance(members, str) else list(members)
+    selected = []
+    for pattern in patterns:
+        matches = [info for info in files if fnmatch.fnmatchcase(info.filename, pattern)]
+        if not matches:
+            raise KeyError(f"No member of the archive matches {pattern!r}")
+        for info in matches:
+            if info not in selected:
+                selected.append(info)
+    return selected
+
+
+def _member_path(name: str, destination: Path) -> Path | None:
+    """Where ``name`` extracts to, dropping drive letters, ``.`` and ``..`` as zipfile does."""
+    name = name.replace("/", os.path.sep)
+    if os.path.altsep:
+        name = name.replace(os.path.altsep, os.path.sep)
+    name = os.path.splitdrive(name)[1]
+    parts = [part for part in name.split(os.path.sep) if part not in ("", os.path.curdir, os.path.pardir)]
+    return destination.joinpath(*parts) if parts else None
+
+
+def extract_members(
+    archive: zipfile.ZipFile, destination: str | Path, members: str | Iterable[str] | None = None
+) -> list[Path]:
+    """Extract the selected members of ``archive`` under ``destination``.
+
+    Member paths are sanitised as by :meth:`zipfile.ZipFile.extract`, and each file
+    is written to a ``.part`` file first so an interrupted extraction leaves nothing
+    half-written. CRCs are checked as the data is decompressed.
+
+    Returns:
+        The extracted file paths.
+
+    Raises:
+        KeyError: If a pattern matches nothing.
+        DownloadError: If a member is corrupt.
+    """
+    destination = Path(destination)
+    paths = []
+    for info in select_members(archive, members):
+        target = _member_path(info.filename, destination)
+        if target is None:
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        part_path = target.with_name(target.name + ".part")
+        try:
+            with archive.open(info) as src, open(part_path, "wb") as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+        except zipfile.BadZipFile as e:
+            part_path.unlink(missing_ok=True)
+            raise DownloadError(f"Corrupt archive member {info.filename}: {e}") from e
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+        os.replace(part_path, target)
+        paths.append(target)
+    _bl.info(f"Extracted {len(paths)} members to {destination}")
+    return paths
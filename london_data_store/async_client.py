@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-import re
-from collections.abc import Callable
+import asyncio
+import contextlib
+import functools
+import time
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urlsplit
 
@@ -15,23 +19,49 @@ except ImportError:
     ) from None
 
 from .cache import CatalogueCache
-from .exceptions import DatasetNotFoundError, FormatNotAvailableError
-from .models import Dataset
+from .download import DEFAULT_SPOOL_SIZE, BufferSink, DownloadBuffer, DownloadOutcome, DownloadStatus, SinkResult
+from .exceptions import DatasetNotFoundError, DownloadError, FormatNotAvailableError
+from .models import Dataset, Resource
+from .progress import ThrottledProgress, throttle
+from .queries import (
+    all_formats,
+    download_urls_for_slug,
+    filter_for_keyword,
+    score_strings,
+    search_list_for_string,
+    slugs_for_format,
+    slugs_for_titles,
+)
+from .ratelimit import Priority, RateLimiter, parse_retry_after, rate_limit_priority
+from .scan import ScanReport, scan_catalogue
+from .singleflight import AsyncSingleFlight
+from .sinks import FileSink, Sink
+from .streaming import DEFAULT_STREAM_CHUNK_SIZE, CsvRowParser, StreamVerifier
 from .utils.logging_helper import BasicLogger
-from .utils.strings_and_lists import ListOperations
 
 _bl = BasicLogger(verbose=False, log_directory=None, logger_name="ASYNC_LDS")
 
-_stemmer = None
+# Catalogue loads and downloads in flight, shared across instances
+_catalogue_loads = AsyncSingleFlight()
+_downloads = AsyncSingleFlight()
 
+# Catalogues loaded by caching instances in this process: URL -> (monotonic fetch time, data)
+_catalogues: dict[str, tuple[float, list[dict]]] = {}
 
-def _get_stemmer():
-    global _stemmer
-    if _stemmer is None:
-        from nltk.stem.snowball import SnowballStemmer
+# Chunks a download may have waiting for its disk writer
+_WRITE_QUEUE_SIZE = 16
 
-        _stemmer = SnowballStemmer("english")
-    return _stemmer
+# Default executor for CPU-heavy queries, created on first use
+_query_pool: ThreadPoolExecutor | None = None
+
+
+def _default_query_executor() -> ThreadPoolExecutor:
+    global _query_pool
+    if _query_pool is None:
+        # Queries hold the GIL, so more threads would not run them faster; each extra
+        # thread is one more contender the event loop queues behind for the GIL
+        _query_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lds-query")
+    return _query_pool
 
 
 def _validate_string(value: object, param_name: str = "parameter") -> str:
@@ -40,14 +70,305 @@ def _validate_string(value: object, param_name: str = "parameter") -> str:
     return value.strip()
 
 
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """An httpx transport that draws a request token per request and retries 429s through the limiter.
+
+    Args:
+        limiter: The shared RateLimiter.
+        transport: The transport to wrap. Defaults to httpx.AsyncHTTPTransport().
+        throttle_retries: Times to retry a request answered with 429.
+    """
+
+    def __init__(
+        self, limiter: RateLimiter, transport: httpx.AsyncBaseTransport | None = None, *, throttle_retries: int = 5
+    ):
+        self._limiter = limiter
+        self._transport = transport or httpx.AsyncHTTPTransport()
+        self._throttle_retries = throttle_retries
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.netloc.decode("ascii")
+        for attempt in range(self._throttle_retries + 1):
+            await self._limiter.aacquire_request(host)
+            response = await self._transport.handle_async_request(request)
+            paused = self._limiter.observe(host, response.status_code, response.headers)
+            if paused is None or response.status_code != 429 or attempt == self._throttle_retries:
+                return response
+            await response.aclose()
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class RetryTransport(httpx.AsyncBaseTransport):
+    """An httpx transport that retries failed connections and retryable statuses with backoff.
+
+    The async counterpart of the sync client's urllib3 ``Retry``: a request is
+    retried up to ``retries`` times, waiting ``backoff_factor * 2**n`` seconds
+    before the n-th retry (capped at ``max_backoff``), or as long as a
+    ``Retry-After`` header asks. Connection failures are retried for any method;
+    read failures and retryable statuses only for idempotent methods.
+
+    Args:
+        transport: The transport to wrap.
+        retries: Retries per request.
+        backoff_factor: Base of the exponential backoff, in seconds.
+        status_forcelist: Statuses to retry.
+        max_backoff: Longest wait between attempts, in seconds.
+    """
+
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        *,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        status_forcelist: tuple[int, ...] = (429, 500, 502, 503, 504),
+        max_backoff: float = 120.0,
+    ):
+        self._transport = transport
+        self._retries = retries
+        self._backoff_factor = backoff_factor
+        self._status_forcelist = frozenset(status_forcelist)
+        self._max_backoff = max_backoff
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        idempotent = request.method in self.IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError as e:
+                connect_failed = isinstance(e, httpx.ConnectError | httpx.ConnectTimeout)
+                if attempt == self._retries or not (connect_failed or idempotent):
+                    raise
+                delay = self.delay(attempt)
+                _bl.warning(f"Request to {request.url} failed ({type(e).__name__}), retrying in {delay:.1f}s")
+            else:
+                if attempt == self._retries or not idempotent or response.status_code not in self._status_forcelist:
+                    return response
+                await response.aclose()
+                delay = self.delay(attempt, response)
+                _bl.warning(f"{request.url} answered {response.status_code}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """Seconds to wait before retrying after the ``attempt``-th try (from 0) failed."""
+        retry_after = parse_retry_after(response.headers.get("retry-after")) if response is not None else None
+        if retry_after is None:
+            retry_after = self._backoff_factor * 2**attempt
+        return min(retry_after, self._max_backoff)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class AsyncResourceStream:
+    """An async iterator over the verified chunks of a streamed response body.
+
+    Returned by :meth:`AsyncLondonDataStore.open_resource`. The size and hash are
+    checked as chunks are yielded; a truncated body raises DownloadError at the end.
+    """
+
+    def __init__(
+        self,
+        response: httpx.Response,
+        verifier: StreamVerifier,
+        *,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        rate_limiter: RateLimiter | None = None,
+    ):
+        self._response = response
+        self._chunk_size = chunk_size
+        self._rate_limiter = rate_limiter
+        self.verifier = verifier
+        self.total = int(response.headers.get("content-length", 0) or 0) or None
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._chunks(digest=True)
+
+    async def _chunks(self, *, digest: bool) -> AsyncIterator[bytes]:
+        """Yield the body's chunks, size-checked as they arrive.
+
+        Without ``digest`` the chunks are not hashed and the end-of-body checks are
+        left to the caller, which must feed every chunk to ``verifier.digest`` and
+        then call ``verifier.finish``.
+        """
+        host = self._response.url.netloc.decode("ascii")
+        try:
+            async for chunk in self._response.aiter_bytes(self._chunk_size):
+                if self._rate_limiter is not None:
+                    await self._rate_limiter.aacquire_bytes(host, len(chunk))
+                if digest:
+                    self.verifier.update(chunk)
+                else:
+                    self.verifier.count(chunk)
+                yield chunk
+        except httpx.HTTPError as e:
+            raise DownloadError(f"Failed to read {self.verifier.url}: {e}") from e
+        if digest:
+            self.verifier.finish()
+
+
+class _WriteBehind:
+    """Hash and write chunks to a sink in a worker thread while the next ones download.
+
+    Chunks wait in a queue of at most ``max_chunks``, so a slow disk holds the
+    download back instead of piling the body up in memory. Whatever has queued
+    up by the time the worker is free goes to the thread in one call.
+    """
+
+    def __init__(self, sink: Sink, verifier: StreamVerifier, max_chunks: int):
+        self._sink = sink
+        self._verifier = verifier
+        self._queue: asyncio.Queue[bytes | None] = asyncio.Queue(max_chunks)
+        self._stopping = False
+        self.error: Exception | None = None
+        self._task = asyncio.create_task(self._run())
+
+    async def put(self, chunk: bytes) -> None:
+        """Queue ``chunk``, raising the error of an earlier write if there was one."""
+        if self.error is None:
+            await self._queue.put(chunk)
+        if self.error is not None:
+            raise self.error
+
+    async def close(self) -> None:
+        """Wait until every queued chunk is written."""
+        await self._queue.put(None)
+        await self._task
+        if self.error is not None:
+            raise self.error
+
+    async def stop(self) -> None:
+        """Drop the queued chunks and wait for a write in progress, so the sink can be aborted."""
+        self._stopping = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+        with contextlib.suppress(Exception):
+            await self._task
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            chunks = [chunk for chunk in batch if chunk is not None]
+            if chunks and self.error is None and not self._stopping:
+                try:
+                    await asyncio.to_thread(self._write, chunks)
+                except Exception as e:
+                    # Keep draining so a put blocked on a full queue wakes up and sees the error
+                    self.error = e
+            if batch[-1] is None:
+                return
+
+    def _write(self, chunks: list[bytes]) -> None:
+        for chunk in chunks:
+            self._verifier.digest(chunk)
+            self._sink.write(chunk)
+
+
+async def _abort(sink: Sink) -> None:
+    """Abort ``sink``, in a worker thread unless it is in memory.
+
+    Shielded, so a second cancellation cannot leave a partial file behind.
+    """
+    if sink.in_memory:
+        sink.abort()
+    else:
+        await asyncio.shield(asyncio.to_thread(sink.abort))
+
+
+async def _fill_sink(
+    stream: AsyncResourceStream,
+    sink: Sink,
+    progress_callback: Callable[[int, int | None], None] | None,
+    *,
+    queue_size: int = _WRITE_QUEUE_SIZE,
+) -> SinkResult:
+    """Write ``stream`` into ``sink`` and commit it, or abort the sink on failure.
+
+    Sinks that are not ``in_memory`` are opened, written and committed in worker
+    threads, with the body hashed there too; see :class:`_WriteBehind`. A sink
+    that stops being ``in_memory`` partway, like a spooled buffer rolling over to
+    disk, is handed to a writer from that chunk on.
+    """
+    verifier = stream.verifier
+    writer = None
+    try:
+        if sink.in_memory:
+            sink.open(verifier.url, verifier.expected_size)
+        else:
+            await asyncio.to_thread(sink.open, verifier.url, verifier.expected_size)
+        try:
+            async for chunk in stream._chunks(digest=False):
+                if writer is None and sink.in_memory:
+                    verifier.digest(chunk)
+                    sink.write(chunk)
+                else:
+                    if writer is None:
+                        writer = _WriteBehind(sink, verifier, queue_size)
+                    await writer.put(chunk)
+                if progress_callback:
+                    progress_callback(verifier.bytes_read, stream.total)
+            if writer is not None:
+                await writer.close()
+        except BaseException:
+            if writer is not None:
+                await writer.stop()
+            raise
+        verifier.finish()
+        if isinstance(progress_callback, ThrottledProgress):
+            progress_callback.flush()
+        value = sink.commit() if sink.in_memory else await asyncio.to_thread(sink.commit)
+    except DownloadError:
+        await _abort(sink)
+        raise
+    except Exception as e:
+        await _abort(sink)
+        raise DownloadError(f"Failed to write {verifier.url} to {type(sink).__name__}: {e}") from e
+    except BaseException:
+        await _abort(sink)
+        raise
+    return SinkResult(
+        value=value,
+        url=verifier.url,
+        status=DownloadStatus.DOWNLOADED,
+        bytes_downloaded=verifier.bytes_read,
+        hash_verified=bool(verifier.hash_verified),
+    )
+
+
 class AsyncLondonDataStore:
     """Async version of LondonDataStore using httpx.
 
     Args:
         json_url: The URL of the JSON dataset catalogue.
         cache: Whether to use disk caching.
-        cache_ttl: Cache time-to-live in seconds.
+        cache_ttl: Cache time-to-live in seconds, on disk and in memory.
         cache_dir: Custom cache directory.
+        rate_limiter: Per-host request and bandwidth limits, shareable with sync clients.
+            Catalogue fetches use the high-priority lane.
+        max_connections: Connections the client keeps open at most, across all hosts.
+        http2: Multiplex requests to a host over one HTTP/2 connection where the server
+            supports it. Needs the ``h2`` package (``pip install httpx[http2]``).
+        connect_timeout: Seconds to wait for a connection to open.
+        read_timeout: Seconds to wait for each read (and write) on an open connection.
+        max_keepalive_connections: Idle connections kept open for reuse.
+        keepalive_expiry: Seconds an idle connection is kept open.
+        retries: Retries of a request that failed to connect or was answered with
+            429 or 5xx, as by the sync client (see :class:`RetryTransport`).
+        backoff_factor: Base of the exponential backoff between retries, in seconds.
+        query_executor: Executor for CPU-heavy queries (fuzzy search, stemmed keyword
+            matching), which would otherwise block the event loop for the length of a
+            pass over the catalogue. Defaults to one thread shared by all clients. A
+            ProcessPoolExecutor also frees the GIL but pickles the catalogue per query.
     """
 
     def __init__(
@@ -56,17 +377,54 @@ class AsyncLondonDataStore:
         cache: bool = True,
         cache_ttl: int = 86400,
         cache_dir: Path | None = None,
+        rate_limiter: RateLimiter | None = None,
+        max_connections: int = 100,
+        http2: bool = False,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 30.0,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        query_executor: Executor | None = None,
     ):
         self.json_url = json_url
         self._raw_response_json: list[dict] | None = None
         self._client: httpx.AsyncClient | None = None
         self._cache = CatalogueCache(cache_dir=cache_dir, ttl_seconds=cache_ttl) if cache else None
+        self._cache_ttl = cache_ttl
+        self._rate_limiter = rate_limiter
+        self._http2 = http2
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        # No pool timeout: callers such as download_many bound their own concurrency
+        self._timeout = httpx.Timeout(connect=connect_timeout, read=read_timeout, write=read_timeout, pool=None)
+        self._retries = retries
+        self._backoff_factor = backoff_factor
+        self._query_executor = query_executor
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None:
+            # A transport passed to AsyncClient ignores its http2 and limits, so set them here
+            transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(http2=self._http2, limits=self._limits)
+            if self._rate_limiter is None:
+                transport = RetryTransport(transport, retries=self._retries, backoff_factor=self._backoff_factor)
+            else:
+                # 429s are retried through the shared limiter instead
+                transport = RetryTransport(
+                    transport,
+                    retries=self._retries,
+                    backoff_factor=self._backoff_factor,
+                    status_forcelist=(500, 502, 503, 504),
+                )
+                transport = RateLimitedTransport(self._rate_limiter, transport)
             self._client = httpx.AsyncClient(
-                timeout=30.0,
+                timeout=self._timeout,
                 headers={"User-Agent": "london-data-store-async/0.2.0"},
+                transport=transport,
             )
         return self._client
 
@@ -87,34 +445,78 @@ class AsyncLondonDataStore:
         return f"{parts.scheme}://{parts.netloc}"
 
     async def get_data_from_url(self) -> list[dict]:
-        """Fetch and cache the full catalogue JSON."""
+        """Fetch and cache the full catalogue JSON.
+
+        With caching enabled, a catalogue loaded by any instance in the process is
+        reused until ``cache_ttl`` runs out, so treat it as read-only. Concurrent
+        calls for the same URL, from any task or instance on the event loop, share
+        a single load. Reading, parsing and writing the catalogue run in worker
+        threads.
+        """
         if self._raw_response_json is None:
-            if self._cache is not None:
-                cached = self._cache.get(self.json_url)
-                if cached is not None:
-                    self._raw_response_json = cached
-                    return self._raw_response_json
+            shared = _catalogues.get(self.json_url) if self._cache is not None else None
+            if shared is not None and time.monotonic() - shared[0] < self._cache_ttl:
+                self._raw_response_json = shared[1]
+            else:
+                self._raw_response_json = await _catalogue_loads.do(self.json_url, self._load_catalogue)
+        return self._raw_response_json
+
+    async def _load_catalogue(self) -> list[dict]:
+        """Read the catalogue from the disk cache, or fetch and cache it.
 
+        The shared entry is dated from when the catalogue was fetched, so a disk
+        cache entry near its expiry is not served for another full ``cache_ttl``.
+        """
+        entry = await self._cache.aget_with_age(self.json_url) if self._cache is not None else None
+        if entry is not None:
+            data, age = entry
+            fetched_at = time.monotonic() - age
+        else:
             client = await self._get_client()
-            response = await client.get(self.json_url)
+            with rate_limit_priority(Priority.HIGH):
+                response = await client.get(self.json_url)
             response.raise_for_status()
-            self._raw_response_json = response.json()
-
+            data = await asyncio.to_thread(response.json)
             if self._cache is not None:
-                self._cache.put(self.json_url, self._raw_response_json)
-        return self._raw_response_json
+                await self._cache.aput(self.json_url, data)
+            fetched_at = time.monotonic()
+
+        if self._cache is not None:
+            _catalogues[self.json_url] = (fetched_at, data)
+        return data
+
+    async def _query(self, fn: Callable, *args):
+        """Run ``fn(*args)`` in the query executor."""
+        loop = asyncio.get_running_loop()
+        executor = self._query_executor or _default_query_executor()
+        return await loop.run_in_executor(executor, functools.partial(fn, *args))
 
     async def get_all_slugs(self) -> list[str]:
         data = await self.get_data_from_url()
         slugs = sorted(set(x.get("slug") for x in data))
         return slugs
 
+    async def get_all_titles(self) -> list[str]:
+        data = await self.get_data_from_url()
+        return sorted(set(x.get("title", "").strip() for x in data))
+
     async def search(self, term: str, limit: int = 20) -> list[tuple[str, float]]:
+        """Score slugs against ``term``, returning (slug, score) pairs best first; runs in the query executor."""
         _validate_string(term, "term")
         slugs = await self.get_all_slugs()
-        list_ops = ListOperations(slugs, search_string=term)
-        scored = list_ops.search_list_with_scores()
-        return scored[:limit]
+        return await self._query(score_strings, slugs, term, limit)
+
+    async def filter_title_for_string(self, string: str) -> list[str] | None:
+        """See :meth:`LondonDataStore.filter_title_for_string`; runs in the query executor."""
+        _validate_string(string, "string")
+        return await self._query(search_list_for_string, await self.get_all_titles(), string)
+
+    async def get_slugs_for_string_in_title(self, string: str) -> list[tuple[str, str, str]] | None:
+        """See :meth:`LondonDataStore.get_slugs_for_string_in_title`; runs in the query executor."""
+        matched_titles = await self.filter_title_for_string(string)
+        if not matched_titles:
+            return None
+        return await self._query(slugs_for_titles, await self.get_data_from_url(), matched_titles)
 
     async def get_dataset(self, slug: str) -> Dataset:
         _validate_string(slug, "slug")
@@ -132,88 +534,419 @@ class AsyncLondonDataStore:
                 topics.add(topic)
         return sorted(topics)
 
+    async def get_all_d_types(self) -> list[str]:
+        return all_formats(await self.get_data_from_url())
+
+    async def filter_slug_for_d_type(self, req_format: str) -> list[str]:
+        """See :meth:`LondonDataStore.filter_slug_for_d_type`."""
+        if req_format == "gpkg":
+            req_format = "geopackage"
+        formats = await self.get_all_d_types()
+        if req_format not in formats:
+            raise FormatNotAvailableError(f"Available Data types: {', '.join(formats)}")
+        filtered = slugs_for_format(await self.get_data_from_url(), req_format)
+        if not filtered:
+            raise FormatNotAvailableError("No slugs was found for the required data type")
+        return filtered
+
+    async def get_download_url_for_slug(self, slug: str, get_description: bool = False) -> list[str]:
+        """See :meth:`LondonDataStore.get_download_url_for_slug`."""
+        _validate_string(slug, "slug")
+        return download_urls_for_slug(await self.get_data_from_url(), self.base_url, slug, get_description)
+
     async def filter_by_topic(self, topic: str) -> list[str]:
         _validate_string(topic, "topic")
         data = await self.get_data_from_url()
         return [x.get("slug") for x in data if topic in x.get("topics", [])]
 
-    async def filter_slugs_for_keyword(self, keyword: str) -> list[str]:
-        _validate_string(keyword, "keyword")
-        stemmer = _get_stemmer()
-        search_terms = [stemmer.stem(x) for x in re.sub("[-_]", " ", keyword.strip().lower()).split(" ")]
+    async def filter_by_publisher(self, publisher: str) -> list[str]:
+        _validate_string(publisher, "publisher")
+        publisher_lower = publisher.lower()
+        data = await self.get_data_from_url()
+        return [x.get("slug") for x in data if publisher_lower in (x.get("publisher") or "").lower()]
+
+    async def filter_by_update_frequency(self, frequency: str) -> list[str]:
+        _validate_string(frequency, "frequency")
+        frequency_lower = frequency.lower()
         data = await self.get_data_from_url()
         return [
             x.get("slug")
             for x in data
-            if any(word in y for y in [stemmer.stem(z) for z in x.get("tags")] for word in search_terms)
+            if frequency_lower == (x.get("custom", {}).get("update_frequency") or "").lower()
         ]
 
-    async def download_file(
-        self,
-        slug: str,
-        format: str | None = None,
-        destination: str | Path = ".",
-        *,
-        resource_key: str | None = None,
-        progress_callback: Callable[[int, int | None], None] | None = None,
-        verify_integrity: bool = True,
-    ) -> Path:
-        """Download a resource file asynchronously."""
+    async def filter_by_licence(self, licence_keyword: str) -> list[str]:
+        _validate_string(licence_keyword, "licence_keyword")
+        keyword_lower = licence_keyword.lower()
+        data = await self.get_data_from_url()
+        return [x.get("slug") for x in data if keyword_lower in (x.get("licence", {}).get("title") or "").lower()]
+
+    async def filter_slugs_for_keyword(self, keyword: str) -> list[str]:
+        """Slugs of datasets whose stemmed tags match ``keyword``; runs in the query executor."""
+        _validate_string(keyword, "keyword")
+        return await self._query(filter_for_keyword, await self.get_data_from_url(), "slug", keyword)
+
+    async def filter_titles_for_keyword(self, keyword: str) -> list[str]:
+        """Titles of datasets whose stemmed tags match ``keyword``; runs in the query executor."""
+        _validate_string(keyword, "keyword")
+        return await self._query(filter_for_keyword, await self.get_data_from_url(), "title", keyword)
+
+    async def get_resource(self, slug: str, format: str | None = None, *, resource_key: str | None = None) -> Resource:
+        """Return one resource of a dataset (see :meth:`LondonDataStore.get_resource`)."""
         _validate_string(slug, "slug")
         dataset = await self.get_dataset(slug)
 
-        resource = None
         if resource_key:
             for r in dataset.resources:
                 if r.key == resource_key:
-                    resource = r
-                    break
-            if resource is None:
-                raise DatasetNotFoundError(f"Resource key '{resource_key}' not found in dataset '{slug}'")
-        elif format:
+                    return r
+            raise DatasetNotFoundError(f"Resource key '{resource_key}' not found in dataset '{slug}'")
+        if format:
             fmt = format.lower()
             if fmt == "gpkg":
                 fmt = "geopackage"
             for r in dataset.resources:
                 if r.format.lower() == fmt:
-                    resource = r
-                    break
-            if resource is None:
-                available = [r.format for r in dataset.resources]
-                raise FormatNotAvailableError(
-                    f"Format '{format}' not found for slug '{slug}'. Available: {', '.join(available)}"
-                )
-        else:
-            if not dataset.resources:
-                raise DatasetNotFoundError(f"No resources found for slug '{slug}'")
-            resource = dataset.resources[0]
+                    return r
+            available = [r.format for r in dataset.resources]
+            raise FormatNotAvailableError(
+                f"Format '{format}' not found for slug '{slug}'. Available: {', '.join(available)}"
+            )
+        if not dataset.resources:
+            raise DatasetNotFoundError(f"No resources found for slug '{slug}'")
+        return dataset.resources[0]
 
+    def get_resource_download_url(self, slug: str, resource: Resource) -> str:
+        """Build the portal download URL for a resource of the given dataset."""
+        url_path = urlsplit(resource.url).path.split("/")[-1]
+        return f"{self.base_url}/download/{slug}/{resource.key}/{url_path}"
+
+    @contextlib.asynccontextmanager
+    async def open_resource(
+        self,
+        slug: str,
+        format: str | None = None,
+        *,
+        resource_key: str | None = None,
+        verify_integrity: bool = True,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[AsyncResourceStream]:
+        """Stream a resource's body without writing it to disk.
+
+        Use as ``async with lds.open_resource(slug, "csv") as stream:`` and iterate
+        ``async for chunk in stream``. See :meth:`LondonDataStore.open_resource`.
+
+        Raises:
+            DatasetNotFoundError: If slug not found.
+            FormatNotAvailableError: If format not found for slug.
+            DownloadError: On HTTP or connection errors, or while iterating on a size mismatch.
+        """
+        resource = await self.get_resource(slug, format, resource_key=resource_key)
+        download_url = self.get_resource_download_url(slug, resource)
+        verifier = StreamVerifier(
+            download_url,
+            resource.check_hash if verify_integrity else None,
+            resource.check_size if verify_integrity else None,
+        )
+        client = await self._get_client()
+        async with contextlib.AsyncExitStack() as stack:
+            try:
+                response = await stack.enter_async_context(client.stream("GET", download_url))
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                raise DownloadError(f"Failed to open {download_url}: {e}") from e
+            yield AsyncResourceStream(response, verifier, chunk_size=chunk_size, rate_limiter=self._rate_limiter)
+
+    async def iter_rows(
+        self,
+        slug: str,
+        format: str = "csv",
+        *,
+        resource_key: str | None = None,
+        batch_size: int | None = None,
+        encoding: str = "utf-8-sig",
+        delimiter: str = ",",
+        verify_integrity: bool = True,
+    ) -> AsyncIterator[dict] | AsyncIterator[list[dict]]:
+        """Yield the rows of a CSV resource as they arrive (see :meth:`LondonDataStore.iter_rows`)."""
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"'batch_size' must be at least 1, got: {batch_size!r}")
+        rows = self._csv_rows(slug, format, resource_key, encoding, delimiter, verify_integrity)
+        if batch_size is None:
+            async for row in rows:
+                yield row
+            return
+        batch: list[dict] = []
+        async for row in rows:
+            batch.append(row)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def _csv_rows(
+        self,
+        slug: str,
+        format: str,
+        resource_key: str | None,
+        encoding: str,
+        delimiter: str,
+        verify_integrity: bool,
+    ) -> AsyncIterator[dict]:
+        parser = CsvRowParser(encoding=encoding, delimiter=delimiter)
+        async with self.open_resource(
+            slug, format, resource_key=resource_key, verify_integrity=verify_integrity
+        ) as stream:
+            async for chunk in stream:
+                for row in parser.feed(chunk):
+                    yield row
+        for row in parser.close():
+            yield row
+
+    async def download_to_sink(
+        self,
+        slug: str,
+        sink: Sink,
+        format: str | None = None,
+        *,
+        resource_key: str | None = None,
+        progress_callback: Callable[[int, int | None], None] | None = None,
+        verify_integrity: bool = True,
+        progress_interval: float = 0.1,
+    ) -> SinkResult:
+        """Stream a resource into ``sink`` (see :meth:`DownloadManager.download_to_sink`).
+
+        Sink calls run in a worker thread unless the sink is ``in_memory``, so a
+        sink that writes to disk or a network store does not block the event loop.
+        """
+        progress_callback = throttle(progress_callback, progress_interval)
+        async with self.open_resource(
+            slug, format, resource_key=resource_key, verify_integrity=verify_integrity
+        ) as stream:
+            return await _fill_sink(stream, sink, progress_callback)
+
+    async def download_to_buffer(
+        self,
+        slug: str,
+        format: str | None = None,
+        *,
+        resource_key: str | None = None,
+        max_memory: int = DEFAULT_SPOOL_SIZE,
+        progress_callback: Callable[[int, int | None], None] | None = None,
+        verify_integrity: bool = True,
+        progress_interval: float = 0.1,
+    ) -> DownloadBuffer:
+        """Download a resource into a readable buffer (see :meth:`LondonDataStore.download_to_buffer`).
+
+        Writes that go to the spilled temporary file run in a worker thread, so a
+        body larger than ``max_memory`` does not block the event loop.
+        """
+        resource = await self.get_resource(slug, format, resource_key=resource_key)
+        buffer = DownloadBuffer(self.get_resource_download_url(slug, resource), max_size=max_memory)
+        result = await self.download_to_sink(
+            slug,
+            BufferSink(buffer),
+            resource_key=resource.key,
+            progress_callback=progress_callback,
+            verify_integrity=verify_integrity,
+            progress_interval=progress_interval,
+        )
+        buffer.bytes_downloaded = result.bytes_downloaded
+        buffer.hash_verified = result.hash_verified
+        return buffer
+
+    async def download_bytes(
+        self,
+        slug: str,
+        format: str | None = None,
+        *,
+        resource_key: str | None = None,
+        progress_callback: Callable[[int, int | None], None] | None = None,
+        verify_integrity: bool = True,
+    ) -> bytes:
+        """Download a resource into memory and return its body."""
+        buffer = await self.download_to_buffer(
+            slug,
+            format,
+            resource_key=resource_key,
+            max_memory=0,
+            progress_callback=progress_callback,
+            verify_integrity=verify_integrity,
+        )
+        with buffer:
+            return buffer.read()
+
+    async def download_file(
+        self,
+        slug: str,
+        format: str | None = None,
+        destination: str | Path = ".",
+        *,
+        resource_key: str | None = None,
+        progress_callback: Callable[[int, int | None], None] | None = None,
+        verify_integrity: bool = True,
+        progress_interval: float = 0.1,
+    ) -> Path:
+        """Download a resource file asynchronously.
+
+        The body is written to a temporary file beside the destination and moved
+        into place only once it is complete and, with ``verify_integrity``, its size
+        matches the catalogue (a hash mismatch is logged), as for
+        :meth:`LondonDataStore.download`. Disk writes and hashing run in a worker
+        thread, so concurrent downloads do not stall the event loop or each other.
+
+        ``progress_callback`` is called at most once per ``progress_interval`` seconds,
+        plus once when the download completes. Concurrent calls for the same file and
+        destination share one transfer.
+
+        Raises:
+            DatasetNotFoundError: If slug not found.
+            FormatNotAvailableError: If format not found for slug.
+            DownloadError: On HTTP errors, a size mismatch or a failed write.
+        """
+        _validate_string(slug, "slug")
+        progress_callback = throttle(progress_callback, progress_interval)
+        resource = await self.get_resource(slug, format, resource_key=resource_key)
+        download_url = self.get_resource_download_url(slug, resource)
         url_path = urlsplit(resource.url).path.split("/")[-1]
-        download_url = f"{self.base_url}/download/{slug}/{resource.key}/{url_path}"
 
         destination = Path(destination)
         if destination.is_dir():
             filename = url_path or "download"
             destination = destination / filename
 
-        destination.parent.mkdir(parents=True, exist_ok=True)
-
+        verifier = StreamVerifier(
+            download_url,
+            resource.check_hash if verify_integrity else None,
+            resource.check_size if verify_integrity else None,
+        )
+        # Concurrent requests for the same file share one transfer and its outcome
+        result = await _downloads.do(
+            (download_url, destination.resolve()), self._download_to, verifier, destination, progress_callback
+        )
+        return result.value
+
+    async def _download_to(
+        self,
+        verifier: StreamVerifier,
+        destination: Path,
+        progress_callback: Callable[[int, int | None], None] | None,
+    ) -> SinkResult:
         client = await self._get_client()
-        async with client.stream("GET", download_url) as response:
-            response.raise_for_status()
-            total = int(response.headers.get("content-length", 0)) or None
-            bytes_downloaded = 0
-
-            with open(destination, "wb") as f:
-                async for chunk in response.aiter_bytes(8192):
-                    f.write(chunk)
-                    bytes_downloaded += len(chunk)
+        async with contextlib.AsyncExitStack() as stack:
+            try:
+                response = await stack.enter_async_context(client.stream("GET", verifier.url))
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                raise DownloadError(f"Failed to download {verifier.url}: {e}") from e
+            stream = AsyncResourceStream(response, verifier, rate_limiter=self._rate_limiter)
+            result = await _fill_sink(stream, FileSink(destination), progress_callback)
+
+        _bl.info(f"Downloaded {verifier.url} to {destination} ({result.bytes_downloaded} bytes)")
+        return result
+
+    async def download_many(
+        self,
+        items: Iterable[str | tuple[str, str | None]],
+        destination: str | Path = ".",
+        *,
+        concurrency: int = 8,
+        per_host: int | None = None,
+        verify_integrity: bool = True,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> list[DownloadOutcome]:
+        """Download many resources concurrently, each to ``destination/<slug>/<filename>``.
+
+        At most ``concurrency`` downloads run at once, and at most ``per_host`` of
+        them against any one host. The portal serves every resource from one host,
+        so a ``per_host`` below ``concurrency`` is the effective limit. Each item
+        succeeds or fails on its own: a failed item records its error in its outcome
+        and the others carry on. Downloads run in the rate limiter's bulk lane.
+
+        Args:
+            items: Slugs (for a dataset's first resource) or ``(slug, format)`` pairs.
+            destination: Directory to download into.
+            concurrency: Downloads in flight at once.
+            per_host: Downloads in flight at once against one host; defaults to ``concurrency``.
+            verify_integrity: Check each file against its catalogue size and hash.
+            progress_callback: Called with ``(finished, total)`` after each item.
+
+        Returns:
+            One DownloadOutcome per item, in the order given.
+        """
+        if concurrency < 1:
+            raise ValueError(f"'concurrency' must be at least 1, got: {concurrency!r}")
+        if per_host is None:
+            per_host = concurrency
+        if per_host < 1:
+            raise ValueError(f"'per_host' must be at least 1, got: {per_host!r}")
+        outcomes = [
+            DownloadOutcome(slug=item, format=None) if isinstance(item, str) else DownloadOutcome(*item)
+            for item in items
+        ]
+        destination = Path(destination)
+        host_slots: dict[str, asyncio.Semaphore] = {}
+        pending = iter(outcomes)
+        done = 0
+
+        async def fetch(outcome: DownloadOutcome) -> None:
+            start = time.monotonic()
+            try:
+                resource = await self.get_resource(outcome.slug, outcome.format)
+                host = urlsplit(self.get_resource_download_url(outcome.slug, resource)).netloc
+                filename = urlsplit(resource.url).path.split("/")[-1] or "download"
+                async with host_slots.setdefault(host, asyncio.Semaphore(per_host)):
+                    outcome.path = await self.download_file(
+                        outcome.slug,
+                        destination=destination / outcome.slug / filename,
+                        resource_key=resource.key,
+                        verify_integrity=verify_integrity,
+                    )
+                outcome.bytes_downloaded = outcome.path.stat().st_size
+            except Exception as e:
+                outcome.error = e
+                _bl.warning(f"Failed to download {outcome.slug}: {e}")
+            outcome.elapsed = time.monotonic() - start
+
+        async def worker() -> None:
+            nonlocal done
+            with rate_limit_priority(Priority.BULK):
+                for outcome in pending:
+                    await fetch(outcome)
+                    done += 1
                     if progress_callback:
-                        progress_callback(bytes_downloaded, total)
+                        progress_callback(done, len(outcomes))
+
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, len(outcomes)))))
+        failed = sum(1 for outcome in outcomes if not outcome.ok)
+        _bl.info(f"Downloaded {len(outcomes) - failed} of {len(outcomes)} resources to {destination}")
+        return outcomes
 
-        _bl.info(f"Downloaded {download_url} to {destination}")
-        return destination
+    async def scan(
+        self,
+        *,
+        slugs: list[str] | None = None,
+        concurrency: int = 32,
+        method: str = "head",
+        timeout: float = 10.0,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> ScanReport:
+        """Probe every resource URL concurrently and report dead links, size drift and changes.
+
+        See :func:`london_data_store.scan.scan_catalogue`.
+        """
+        return await scan_catalogue(
+            self,
+            slugs=slugs,
+            concurrency=concurrency,
+            method=method,
+            timeout=timeout,
+            progress_callback=progress_callback,
+        )
 
     def clear_cache(self) -> None:
+        """Invalidate the cached catalogue for this instance's URL, on disk and in memory."""
+        _catalogues.pop(self.json_url, None)
         if self._cache is not None:
             self._cache.invalidate(self.json_url)
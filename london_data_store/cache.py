@@ -1,5 +1,7 @@
 """Disk-based catalogue caching with TTL support."""
 
+import asyncio
+import base64
 import contextlib
 import hashlib
 import json
@@ -16,6 +18,23 @@ from .utils.logging_helper import BasicLogger
 _bl = BasicLogger(verbose=False, log_directory=None, logger_name="CACHE")
 
 
+def _default_cache_dir() -> Path:
+    return Path(platformdirs.user_cache_dir("london-data-store"))
+
+
+def _atomic_write_json(path: Path, data: object) -> None:
+    """Write ``data`` as JSON to ``path`` via a temp file and ``os.replace``."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
 class CatalogueCache:
     """Cache the London Data Store catalogue JSON to disk with TTL.
 
@@ -25,7 +44,7 @@ class CatalogueCache:
     """
 
     def __init__(self, cache_dir: Path | None = None, ttl_seconds: int = 86400):
-        self._cache_dir = Path(cache_dir) if cache_dir else Path(platformdirs.user_cache_dir("london-data-store"))
+        self._cache_dir = Path(cache_dir) if cache_dir else _default_cache_dir()
         self._ttl_seconds = ttl_seconds
 
     @property
@@ -43,6 +62,11 @@ class CatalogueCache:
 
     def get(self, url: str) -> list[dict] | None:
         """Return cached catalogue if fresh, else None."""
+        entry = self.get_with_age(url)
+        return entry[0] if entry is not None else None
+
+    def get_with_age(self, url: str) -> tuple[list[dict], float] | None:
+        """Return the cached catalogue and its age in seconds if fresh, else None."""
         cache_path = self._cache_path(url)
         meta_path = self._meta_path(url)
 
@@ -60,7 +84,7 @@ class CatalogueCache:
 
             data = json.loads(cache_path.read_text(encoding="utf-8"))
             _bl.info(f"Cache hit (age: {age:.0f}s)")
-            return data
+            return data, max(age, 0.0)
         except (json.JSONDecodeError, KeyError, OSError) as e:
             _bl.warning(f"Cache read failed, will re-fetch: {e}")
             return None
@@ -76,34 +100,27 @@ class CatalogueCache:
                 "ttl_seconds": self._ttl_seconds,
             }
 
-            # Atomic write for cache data
+            # Atomic write for cache data, then metadata
             cache_path = self._cache_path(url)
-            fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
-            try:
-                with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    json.dump(data, f)
-                os.replace(tmp_path, cache_path)
-            except BaseException:
-                with contextlib.suppress(OSError):
-                    os.unlink(tmp_path)
-                raise
-
-            # Write metadata
-            meta_path = self._meta_path(url)
-            fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
-            try:
-                with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    json.dump(meta, f)
-                os.replace(tmp_path, meta_path)
-            except BaseException:
-                with contextlib.suppress(OSError):
-                    os.unlink(tmp_path)
-                raise
+            _atomic_write_json(cache_path, data)
+            _atomic_write_json(self._meta_path(url), meta)
 
             _bl.info(f"Catalogue cached to {cache_path}")
         except OSError as e:
             raise CacheError(f"Failed to write cache: {e}") from e
 
+    async def aget(self, url: str) -> list[dict] | None:
+        """:meth:`get` in a worker thread, so reading and parsing the file does not block the event loop."""
+        return await asyncio.to_thread(self.get, url)
+
+    async def aget_with_age(self, url: str) -> tuple[list[dict], float] | None:
+        """:meth:`get_with_age` in a worker thread."""
+        return await asyncio.to_thread(self.get_with_age, url)
+
+    async def aput(self, url: str, data: list[dict]) -> None:
+        """:meth:`put` in a worker thread, so serialising and writing the file does not block the event loop."""
+        await asyncio.to_thread(self.put, url, data)
+
     def invalidate(self, url: str | None = None) -> None:
         """Remove cached catalogue. If url is None, clear all cached catalogues."""
         try:
@@ -118,3 +135,197 @@ class CatalogueCache:
                     _bl.info("All caches invalidated")
         except OSError as e:
             raise CacheError(f"Failed to invalidate cache: {e}") from e
+
+
+class ValidatorCache:
+    """Remember HTTP validators for downloaded files, keyed by destination path.
+
+    Each record holds the response's ``ETag`` and ``Last-Modified`` headers, the
+    catalogue ``check_timestamp``, and the size and mtime the file had when it was
+    written, so that a file changed locally is never mistaken for an unchanged one.
+
+    Args:
+        cache_dir: Base cache directory. Records are kept in its ``validators/`` subdirectory.
+    """
+
+    def __init__(self, cache_dir: Path | None = None):
+        self._dir = (Path(cache_dir) if cache_dir else _default_cache_dir()) / "validators"
+
+    def _record_path(self, destination: Path) -> Path:
+        key = hashlib.md5(str(Path(destination).resolve()).encode()).hexdigest()
+        return self._dir / f"{key}.json"
+
+    def get(self, destination: Path) -> dict | None:
+        """Return the record for ``destination`` if the file is unchanged since it was written."""
+        try:
+            record = json.loads(self._record_path(destination).read_text(encoding="utf-8"))
+            st = Path(destination).stat()
+        except (json.JSONDecodeError, OSError):
+            return None
+        if record.get("size") != st.st_size or record.get("mtime_ns") != st.st_mtime_ns:
+            return None
+        return record
+
+    def put(
+        self,
+        destination: Path,
+        *,
+        url: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        check_timestamp: str | None = None,
+    ) -> None:
+        """Record validators for the file now at ``destination``."""
+        try:
+            st = Path(destination).stat()
+            self._dir.mkdir(parents=True, exist_ok=True)
+            record = {
+                "destination": str(Path(destination).resolve()),
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "check_timestamp": check_timestamp,
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+            }
+            _atomic_write_json(self._record_path(destination), record)
+        except OSError as e:
+            raise CacheError(f"Failed to write validators for {destination}: {e}") from e
+
+    def invalidate(self, destination: Path) -> None:
+        """Forget the record for ``destination``."""
+        try:
+            self._record_path(destination).unlink(missing_ok=True)
+        except OSError as e:
+            raise CacheError(f"Failed to invalidate validators for {destination}: {e}") from e
+
+
+class RedirectCache:
+    """Remember where download URLs redirect to, so repeat requests skip the hop.
+
+    A record is used only while the resource's catalogue ``check_timestamp`` is the
+    one it was recorded with and it is younger than ``max_age`` seconds.
+
+    Args:
+        cache_dir: Base cache directory. Records are kept in its ``redirects/`` subdirectory.
+        max_age: Seconds a record stays usable, as a bound on storage URLs that expire.
+    """
+
+    def __init__(self, cache_dir: Path | None = None, max_age: int = 7 * 86400):
+        self._dir = (Path(cache_dir) if cache_dir else _default_cache_dir()) / "redirects"
+        self._max_age = max_age
+
+    def _record_path(self, url: str) -> Path:
+        return self._dir / f"{hashlib.md5(url.encode()).hexdigest()}.json"
+
+    def get(self, url: str, check_timestamp: str | None = None) -> str | None:
+        """Return the cached final location of ``url``, or None if unknown or stale."""
+        try:
+            record = json.loads(self._record_path(url).read_text(encoding="utf-8"))
+            age = (datetime.now(UTC) - datetime.fromisoformat(record["resolved_at"])).total_seconds()
+        except (json.JSONDecodeError, KeyError, ValueError, OSError):
+            return None
+        if record.get("url") != url or record.get("check_timestamp") != check_timestamp or age > self._max_age:
+            return None
+        return record.get("target")
+
+    def put(self, url: str, target: str, check_timestamp: str | None = None) -> None:
+        """Record that ``url`` redirects to ``target``."""
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            record = {
+                "url": url,
+                "target": target,
+                "check_timestamp": check_timestamp,
+                "resolved_at": datetime.now(UTC).isoformat(),
+            }
+            _atomic_write_json(self._record_path(url), record)
+        except OSError as e:
+            raise CacheError(f"Failed to write redirect for {url}: {e}") from e
+
+    def invalidate(self, url: str) -> None:
+        """Forget the redirect recorded for ``url``."""
+        try:
+            self._record_path(url).unlink(missing_ok=True)
+        except OSError as e:
+            raise CacheError(f"Failed to invalidate redirect for {url}: {e}") from e
+
+
+class ArchiveListingCache:
+    """Remember the member listings of remote archives, keyed by the resource's catalogue hash.
+
+    A hash identifies the archive's content, so listings never go stale and have no TTL.
+
+    Args:
+        cache_dir: Base cache directory. Listings are kept in its ``archives/`` subdirectory.
+    """
+
+    def __init__(self, cache_dir: Path | None = None):
+        self._dir = (Path(cache_dir) if cache_dir else _default_cache_dir()) / "archives"
+
+    def _record_path(self, check_hash: str) -> Path:
+        key = hashlib.md5(check_hash.encode()).hexdigest()
+        return self._dir / f"{key}.json"
+
+    def get(self, check_hash: str) -> list[dict] | None:
+        """Return the cached listing for ``check_hash``, or None."""
+        try:
+            record = json.loads(self._record_path(check_hash).read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            return None
+        if record.get("check_hash") != check_hash:
+            return None
+        return record.get("members")
+
+    def put(self, check_hash: str, members: list[dict]) -> None:
+        """Store the listing of the archive with ``check_hash``."""
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            _atomic_write_json(self._record_path(check_hash), {"check_hash": check_hash, "members": members})
+        except OSError as e:
+            raise CacheError(f"Failed to write archive listing for {check_hash}: {e}") from e
+
+    def invalidate(self, check_hash: str) -> None:
+        """Forget the listing for ``check_hash``."""
+        try:
+            self._record_path(check_hash).unlink(missing_ok=True)
+        except OSError as e:
+            raise CacheError(f"Failed to invalidate archive listing for {check_hash}: {e}") from e
+
+
+class PreviewCache:
+    """Keep the leading bytes of resources for previews, keyed by the resource's catalogue hash.
+
+    Args:
+        cache_dir: Base cache directory. Prefixes are kept in its ``previews/`` subdirectory.
+    """
+
+    def __init__(self, cache_dir: Path | None = None):
+        self._dir = (Path(cache_dir) if cache_dir else _default_cache_dir()) / "previews"
+
+    def _record_path(self, check_hash: str) -> Path:
+        key = hashlib.md5(check_hash.encode()).hexdigest()
+        return self._dir / f"{key}.json"
+
+    def get(self, check_hash: str, max_bytes: int) -> tuple[bytes, bool] | None:
+        """Return ``(prefix, complete)`` if at least ``max_bytes`` (or the whole body) is cached."""
+        try:
+            record = json.loads(self._record_path(check_hash).read_text(encoding="utf-8"))
+            data = base64.b64decode(record["data"])
+        except (json.JSONDecodeError, KeyError, ValueError, OSError):
+            return None
+        if record.get("check_hash") != check_hash:
+            return None
+        complete = bool(record.get("complete"))
+        if len(data) < max_bytes and not complete:
+            return None
+        return data[:max_bytes], complete and len(data) <= max_bytes
+
+    def put(self, check_hash: str, data: bytes, complete: bool) -> None:
+        """Store the first bytes of the resource with ``check_hash``; ``complete`` if that is all of it."""
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            record = {"check_hash": check_hash, "complete": complete, "data": base64.b64encode(data).decode("ascii")}
+            _atomic_write_json(self._record_path(check_hash), record)
+        except OSError as e:
+            raise CacheError(f"Failed to write preview for {check_hash}: {e}") from e
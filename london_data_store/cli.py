@@ -1,10 +1,41 @@
 """Command-line interface for the London Data Store client."""
 
 import argparse
+import asyncio
+import contextlib
 import json
 import sys
 
 from .api import LondonDataStore
+from .download import DownloadStatus
+from .mirror import MirrorResult, mirror
+from .planner import ORDERS, DownloadPlan, plan_downloads
+from .progress import ProgressAggregator, ProgressRenderer, format_bytes
+from .ratelimit import RateLimiter
+from .store import ResourceStore
+
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+_AGE_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def _parse_size(value: str) -> int:
+    """Parse a byte size such as '500M' or '2G' (binary units)."""
+    text = value.strip().upper().removesuffix("B")
+    unit = text[-1] if text and text[-1] in _SIZE_UNITS else ""
+    try:
+        return int(float(text.removesuffix(unit)) * _SIZE_UNITS[unit])
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size: {value!r}") from None
+
+
+def _parse_age(value: str) -> float:
+    """Parse a duration such as '30d', '12h' or '3600' into seconds."""
+    text = value.strip().lower()
+    unit = text[-1] if text and text[-1] in _AGE_UNITS else ""
+    try:
+        return float(text.removesuffix(unit)) * _AGE_UNITS[unit]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid age: {value!r}") from None
 
 
 def _format_table(rows: list[list[str]], headers: list[str]) -> str:
@@ -94,21 +125,108 @@ def main(argv=None):
     info_parser = subparsers.add_parser("info", help="Show full metadata for a dataset", parents=[shared])
     info_parser.add_argument("slug", help="Dataset slug")
 
+    # archive
+    archive_parser = subparsers.add_parser(
+        "archive", help="List the files inside a zipped resource without downloading it", parents=[shared]
+    )
+    archive_parser.add_argument("slug", help="Dataset slug")
+    archive_parser.add_argument("--resource-key", default=None, help="Resource key (default: first zip resource)")
+
+    # preview
+    preview_parser = subparsers.add_parser(
+        "preview", help="Show the first rows of a resource without downloading it", parents=[shared]
+    )
+    preview_parser.add_argument("slug", help="Dataset slug")
+    preview_parser.add_argument("--format", dest="preview_format", help="File format (e.g., csv, geojson)")
+    preview_parser.add_argument("--resource-key", default=None, help="Resource key")
+    preview_parser.add_argument("--rows", type=int, default=10, help="Number of rows to show (default: 10)")
+    preview_parser.add_argument(
+        "--bytes", dest="max_bytes", type=_parse_size, default="64K", help="Most bytes to fetch (default: 64K)"
+    )
+
     # topics (v2)
     topics_parser = subparsers.add_parser("topics", help="List all topic categories", parents=[shared])
     topics_parser.add_argument("--filter", dest="topic_filter", help="Filter datasets by topic")
 
     # download (v2)
     dl_parser = subparsers.add_parser("download", help="Download a dataset file", parents=[shared])
-    dl_parser.add_argument("slug", help="Dataset slug")
+    dl_parser.add_argument("slugs", nargs="+", metavar="slug", help="Dataset slug(s)")
     dl_parser.add_argument("--format", dest="dl_format", help="File format (e.g., csv, geojson)")
     dl_parser.add_argument("--dest", default=".", help="Destination directory or file path")
     dl_parser.add_argument("--progress", action="store_true", help="Show download progress")
+    dl_parser.add_argument("--refresh", type=float, default=0.5, help="Seconds between progress redraws (default: 0.5)")
+    dl_parser.add_argument(
+        "--segments",
+        type=int,
+        default=1,
+        help="Concurrent byte-range connections for large files, at most 10 (default: 1)",
+    )
+    dl_parser.add_argument(
+        "--store", action="store_true", help="Serve unchanged files from, and add new ones to, the resource store"
+    )
+    dl_parser.add_argument(
+        "--if-changed", action="store_true", help="Keep the existing file if the resource has not changed"
+    )
+    dl_parser.add_argument(
+        "--dry-run", action="store_true", help="Show the download plan and disk-space check without downloading"
+    )
+    dl_parser.add_argument(
+        "--order", choices=ORDERS, default="interleave", help="Order of multi-resource downloads (default: interleave)"
+    )
+
+    # mirror
+    mirror_parser = subparsers.add_parser(
+        "mirror", help="Keep a local mirror of selected resources up to date", parents=[shared]
+    )
+    mirror_parser.add_argument("target", help="Mirror directory")
+    mirror_parser.add_argument(
+        "--topic", action="append", dest="topics", help="Only datasets in this topic (repeatable)"
+    )
+    mirror_parser.add_argument(
+        "--format", action="append", dest="formats", help="Only resources in this format (repeatable)"
+    )
+    mirror_parser.add_argument(
+        "--publisher", action="append", dest="publishers", help="Only datasets whose publisher contains this"
+    )
+    mirror_parser.add_argument("--workers", type=int, default=4, help="Parallel downloads (default: 4)")
+    mirror_parser.add_argument("--prune", action="store_true", help="Delete mirrored files no longer selected")
+    mirror_parser.add_argument("--dry-run", action="store_true", help="Show what would change without downloading")
+
+    # scan
+    scan_parser = subparsers.add_parser(
+        "scan", help="Probe resource URLs and compare them with the catalogue", parents=[shared]
+    )
+    scan_parser.add_argument("slugs", nargs="*", metavar="slug", help="Datasets to scan (default: all)")
+    scan_parser.add_argument("--concurrency", type=int, default=32, help="Probes in flight at once (default: 32)")
+    scan_parser.add_argument(
+        "--rate", type=float, default=None, help="Requests per second per host (default: no limit)"
+    )
+    scan_parser.add_argument(
+        "--method", choices=["head", "range"], default="head", help="Probe with HEAD or a 1-byte GET"
+    )
+    scan_parser.add_argument("--timeout", type=float, default=10.0, help="Seconds per probe (default: 10)")
+    scan_parser.add_argument("--report", default=None, help="Also write the JSON report to this file")
+    scan_parser.add_argument("--full", action="store_true", help="Include every resource in the JSON report")
+
+    # store
+    store_shared = argparse.ArgumentParser(add_help=False, parents=[shared])
+    store_shared.add_argument("--store-dir", default=None, help="Resource store directory")
+    store_parser = subparsers.add_parser("store", help="Manage the local resource store")
+    store_sub = store_parser.add_subparsers(dest="store_command", required=True)
+    store_sub.add_parser("info", help="Show resource store location and usage", parents=[store_shared])
+    gc_parser = store_sub.add_parser("gc", help="Evict stored resources by total size or age", parents=[store_shared])
+    gc_parser.add_argument("--max-size", type=_parse_size, default=None, help="Keep at most this much (e.g. 5G)")
+    gc_parser.add_argument("--max-age", type=_parse_age, default=None, help="Evict objects unused for (e.g. 30d)")
 
     args = parser.parse_args(argv)
 
+    if args.command == "store":
+        return _store_command(args)
+    if args.command == "scan":
+        return _scan_command(args)
+
     try:
-        with LondonDataStore(cache=not args.no_cache) as lds:
+        with LondonDataStore(cache=not args.no_cache, store=getattr(args, "store", False)) as lds:
             if args.command == "slugs":
                 slugs = lds.get_all_slugs()
                 limit = args.limit
@@ -233,6 +351,37 @@ def main(argv=None):
                         elif value is not None and value != [] and value != "":
                             print(f"{key}: {value}")
 
+            elif args.command == "archive":
+                members = [m.to_dict() for m in lds.list_archive(args.slug, args.resource_key)]
+                if args.json_output:
+                    _output(members, args)
+                else:
+                    rows = [
+                        [m["name"], format_bytes(m["size"]), format_bytes(m["compressed_size"]), f"{m['crc']:08x}"]
+                        for m in members
+                        if not m["is_dir"]
+                    ]
+                    print(_format_table(rows[: args.limit] if args.limit else rows, ["name", "size", "packed", "crc"]))
+
+            elif args.command == "preview":
+                preview = lds.preview(
+                    args.slug,
+                    args.preview_format,
+                    args.rows,
+                    resource_key=args.resource_key,
+                    max_bytes=args.max_bytes,
+                )
+                if args.json_output:
+                    _output(preview.to_dict(), args)
+                elif preview.columns:
+                    rows = [[str(row.get(c, "")) for c in preview.columns] for row in preview.rows]
+                    print(_format_table(rows, preview.columns))
+                elif preview.text is not None:
+                    print(preview.text)
+                else:
+                    print(f"No preview available for {preview.format} resources", file=sys.stderr)
+                    return 1
+
             elif args.command == "topics":
                 if args.topic_filter:
                     slugs = lds.filter_by_topic(args.topic_filter)
@@ -249,25 +398,64 @@ def main(argv=None):
                         for topic in topics:
                             print(topic)
 
-            elif args.command == "download":
+            elif args.command == "mirror":
+                result = mirror(
+                    lds,
+                    args.target,
+                    topics=args.topics,
+                    formats=args.formats,
+                    publishers=args.publishers,
+                    workers=args.workers,
+                    prune=args.prune,
+                    dry_run=args.dry_run,
+                )
+                _print_mirror(result, args)
+                return 1 if result.failed else 0
 
-                def _progress(downloaded, total):
-                    if total:
-                        pct = downloaded / total * 100
-                        print(f"\r  {downloaded}/{total} bytes ({pct:.1f}%)", end="", flush=True)
-                    else:
-                        print(f"\r  {downloaded} bytes", end="", flush=True)
+            elif args.command == "download":
+                if args.dry_run or len(args.slugs) > 1:
+                    plan = plan_downloads(
+                        lds, [(slug, args.dl_format, None) for slug in args.slugs], args.dest, order=args.order
+                    )
+                    if args.dry_run:
+                        _print_plan(plan, args)
+                        return 0 if plan.fits else 1
+                    plan.check()
+                    targets = [(item.slug, None, item.resource_key, item.destination) for item in plan.items]
+                else:
+                    targets = [(args.slugs[0], args.dl_format, None, args.dest)]
 
-                callback = _progress if args.progress else None
-                path = lds.download_file(
-                    args.slug,
-                    format=args.dl_format,
-                    destination=args.dest,
-                    progress_callback=callback,
+                aggregator = ProgressAggregator() if args.progress else None
+                renderer = (
+                    ProgressRenderer(aggregator, refresh=args.refresh) if aggregator else contextlib.nullcontext()
                 )
-                if args.progress:
-                    print()  # newline after progress
-                print(f"Downloaded: {path}")
+                results = []
+                with renderer:
+                    for slug, fmt, resource_key, destination in targets:
+                        results.append(
+                            lds.download(
+                                slug,
+                                format=fmt,
+                                destination=destination,
+                                resource_key=resource_key,
+                                progress_callback=aggregator.track(slug) if aggregator else None,
+                                segments=args.segments,
+                                if_changed=args.if_changed,
+                            )
+                        )
+                        if aggregator:
+                            aggregator.finish(slug)
+                if args.json_output:
+                    summaries = [{"path": str(r.path), "status": str(r.status), "url": r.url} for r in results]
+                    _output(summaries[0] if len(summaries) == 1 else summaries, args)
+                else:
+                    for result in results:
+                        if result.status == DownloadStatus.NOT_MODIFIED:
+                            print(f"Not modified: {result.path}")
+                        elif result.status == DownloadStatus.STORE:
+                            print(f"From store: {result.path}")
+                        else:
+                            print(f"Downloaded: {result.path}")
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -276,5 +464,138 @@ def main(argv=None):
     return 0
 
 
+def _print_plan(plan: DownloadPlan, args) -> None:
+    """Print a download plan as a dry-run report."""
+    if args.json_output:
+        _output(plan.to_dict(), args)
+        return
+    unknown = f", {plan.unknown_sizes} of unknown size" if plan.unknown_sizes else ""
+    print(f"{len(plan.items)} downloads, {format_bytes(plan.total_bytes)}{unknown} (order: {plan.order})")
+    for fs, required in plan.required_bytes.items():
+        free = plan.free_bytes.get(fs, 0)
+        status = "ok" if required <= free else "INSUFFICIENT SPACE"
+        print(f"{fs}: need {format_bytes(required)}, {format_bytes(free)} free - {status}")
+    print()
+    rows = [
+        [
+            item.slug,
+            item.resource_key,
+            item.format,
+            format_bytes(item.expected_size) if item.expected_size is not None else "?",
+            str(item.destination),
+        ]
+        for item in plan.items
+    ]
+    print(_format_table(rows, ["slug", "resource", "format", "size", "destination"]))
+
+
+def _print_mirror(result: MirrorResult, args) -> None:
+    plan = result.plan
+    if args.json_output:
+        _output(plan.to_dict() if args.dry_run else result.to_dict(), args)
+        return
+    summary = plan.summary()
+    print(
+        f"{summary['new']} new, {summary['changed']} changed, {summary['unchanged']} unchanged, "
+        f"{summary['removed']} no longer selected ({format_bytes(summary['bytes_to_fetch'])} to fetch)"
+    )
+    if args.dry_run:
+        rows = [["fetch", e.slug, e.resource_key, e.path] for e in plan.to_fetch]
+        rows += [["remove", e.slug, e.resource_key, e.path] for e in plan.removed]
+        if rows:
+            print(_format_table(rows[: args.limit] if args.limit else rows, ["action", "slug", "resource", "path"]))
+        return
+    print(f"Downloaded {len(result.downloaded)}, pruned {len(result.pruned)} in {result.elapsed:.1f}s")
+    for key, error in result.failed.items():
+        print(f"Failed: {key}: {error}", file=sys.stderr)
+
+
+def _scan_command(args) -> int:
+    try:
+        from .async_client import AsyncLondonDataStore
+    except ImportError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    async def scan():
+        limiter = RateLimiter(requests_per_second=args.rate) if args.rate else None
+        async with AsyncLondonDataStore(cache=not args.no_cache, rate_limiter=limiter) as lds:
+            return await lds.scan(
+                slugs=args.slugs or None, concurrency=args.concurrency, method=args.method, timeout=args.timeout
+            )
+
+    try:
+        report = asyncio.run(scan())
+        if args.report:
+            report.write(args.report, full=args.full)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.json_output:
+        _output(report.to_dict(full=args.full), args)
+        return 0
+    summary = report.summary()
+    print(
+        f"Scanned {summary['resources']} resources in {report.elapsed:.1f}s: {summary['dead']} dead, "
+        f"{summary['size_drift']} size drift, {summary['modified']} modified"
+    )
+    sections = [
+        (
+            "Dead links",
+            ["slug", "resource", "status", "error"],
+            [[c.slug, c.resource_key, c.status or "-", c.error or ""] for c in report.dead],
+        ),
+        (
+            "Size drift",
+            ["slug", "resource", "catalogue", "actual"],
+            [[c.slug, c.resource_key, c.expected_size, c.size] for c in report.size_drift],
+        ),
+        (
+            "Modified since last check",
+            ["slug", "resource", "checked", "last modified"],
+            [[c.slug, c.resource_key, c.expected_timestamp, c.last_modified] for c in report.modified],
+        ),
+    ]
+    for title, headers, rows in sections:
+        if rows:
+            print(f"\n{title}:")
+            print(_format_table(rows[: args.limit] if args.limit else rows, headers))
+    return 0
+
+
+def _store_command(args) -> int:
+    store = ResourceStore(store_dir=args.store_dir)
+    try:
+        if args.store_command == "info":
+            usage = store.usage()
+            _output(
+                {"store_dir": str(store.store_dir), "objects": usage.objects, "total_bytes": usage.total_bytes}, args
+            )
+        elif args.store_command == "gc":
+            if args.max_size is None and args.max_age is None:
+                print("Error: store gc needs --max-size and/or --max-age", file=sys.stderr)
+                return 1
+            removed = store.gc(max_bytes=args.max_size, max_age=args.max_age)
+            remaining = store.usage()
+            if args.json_output:
+                _output(
+                    {
+                        "evicted_objects": removed.objects,
+                        "evicted_bytes": removed.total_bytes,
+                        "objects": remaining.objects,
+                        "total_bytes": remaining.total_bytes,
+                    },
+                    args,
+                )
+            else:
+                print(f"Evicted {removed.objects} objects ({removed.total_bytes} bytes)")
+                print(f"Remaining: {remaining.objects} objects ({remaining.total_bytes} bytes)")
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,289 @@
+"""Chunked CSV to Parquet / Arrow IPC conversion with bounded memory."""
+
+import contextlib
+import io
+import os
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
+from urllib.parse import urlsplit
+
+from .exceptions import ConversionError
+from .planner import layout_paths
+from .utils.logging_helper import BasicLogger
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from .api import LondonDataStore
+
+_bl = BasicLogger(verbose=False, log_directory=None, logger_name="CONVERT")
+
+FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.csv
+        import pyarrow.ipc
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "pyarrow is required for conversion. Install it with: pip install london-data-store[arrow]"
+        ) from None
+    return pyarrow
+
+
+@dataclass
+class ConversionResult:
+    """Outcome of converting one CSV."""
+
+    path: Path
+    format: str
+    rows: int
+    batches: int
+    columns: list[str]
+
+
+class _Prefixed(io.RawIOBase):
+    """A stream that replays ``prefix`` before reading on from ``source``."""
+
+    def __init__(self, prefix: bytes, source: BinaryIO):
+        super().__init__()
+        self._prefix = memoryview(prefix)
+        self._source = source
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._prefix:
+            n = min(len(buffer), len(self._prefix))
+            buffer[:n] = self._prefix[:n]
+            self._prefix = self._prefix[n:]
+            return n
+        data = self._source.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def _read_sample(source: BinaryIO, rows: int) -> bytes:
+    """Read the header and up to ``rows`` whole records from ``source``."""
+    lines = []
+    quotes = 0
+    records = -1  # the header is not a sample row
+    while records < rows:
+        line = source.readline()
+        if not line:
+            break
+        lines.append(line)
+        quotes += line.count(b'"')
+        # An odd number of quotes means a quoted field continues on the next line
+        if quotes % 2 == 0:
+            records += 1
+            quotes = 0
+    return b"".join(lines)
+
+
+def infer_schema(
+    sample: bytes,
+    *,
+    delimiter: str = ",",
+    encoding: str = "utf-8",
+    column_types: Mapping[str, "pa.DataType"] | None = None,
+) -> "pa.Schema":
+    """Infer a schema from a CSV sample (header plus rows).
+
+    Columns that are empty throughout the sample become strings rather than
+    Arrow's ``null`` type, so later non-empty values still fit.
+    ``column_types`` overrides the inferred type of individual columns.
+    """
+    pa = _require_pyarrow()
+    try:
+        table = pa.csv.read_csv(
+            io.BytesIO(sample),
+            read_options=pa.csv.ReadOptions(encoding=encoding),
+            parse_options=pa.csv.ParseOptions(delimiter=delimiter, newlines_in_values=True),
+        )
+    except pa.ArrowInvalid as e:
+        raise ConversionError(f"Could not infer a schema from the CSV sample: {e}") from e
+    overrides = dict(column_types or {})
+    fields = []
+    for field in table.schema:
+        if field.name in overrides:
+            field = field.with_type(overrides[field.name])
+        elif pa.types.is_null(field.type):
+            field = field.with_type(pa.string())
+        fields.append(field)
+    return pa.schema(fields)
+
+
+def _rebatch(batches: Iterable["pa.RecordBatch"], batch_size: int) -> Iterator["pa.RecordBatch"]:
+    """Regroup record batches into batches of exactly ``batch_size`` rows (the last may be short)."""
+    pa = _require_pyarrow()
+    pending: list[pa.RecordBatch] = []
+    rows = 0
+    for batch in batches:
+        if not batch.num_rows:
+            continue
+        pending.append(batch)
+        rows += batch.num_rows
+        while rows >= batch_size:
+            table = pa.Table.from_batches(pending)
+            yield table.slice(0, batch_size).combine_chunks().to_batches()[0]
+            rest = table.slice(batch_size)
+            pending, rows = rest.to_batches(), rest.num_rows
+    if rows:
+        yield pa.Table.from_batches(pending).combine_chunks().to_batches()[0]
+
+
+def convert_csv(
+    source: str | Path | BinaryIO,
+    destination: str | Path,
+    *,
+    format: str = "parquet",
+    batch_size: int = 65536,
+    sample_rows: int = 10000,
+    delimiter: str = ",",
+    encoding: str = "utf-8",
+    column_types: Mapping[str, "pa.DataType"] | None = None,
+    block_size: int = 1024 * 1024,
+    compression: str = "zstd",
+    newlines_in_values: bool = True,
+) -> ConversionResult:
+    """Convert a CSV file or binary stream to Parquet or Arrow IPC in fixed-size batches.
+
+    The schema is inferred from the first ``sample_rows`` rows and then applied to
+    the whole file, which is read in blocks of ``block_size`` bytes and written as
+    record batches (Parquet row groups) of ``batch_size`` rows. Peak memory is a
+    few batches, whatever the file size. The output is written to a ``.part``
+    file and moved into place once complete.
+
+    Args:
+        source: A CSV path, or a binary stream such as :meth:`LondonDataStore.open_resource`.
+        destination: Output file path.
+        format: ``"parquet"`` or ``"arrow"`` (Arrow IPC file format).
+        batch_size: Rows per record batch / row group.
+        sample_rows: Rows read to infer column types.
+        delimiter: Field delimiter.
+        encoding: Text encoding of the CSV. A UTF-8 BOM is skipped.
+        column_types: Types for columns the sample cannot infer reliably.
+        block_size: Bytes parsed at a time.
+        compression: Parquet compression codec.
+        newlines_in_values: Allow quoted values to span lines. Turn off for a
+            faster parse of files known not to contain any.
+
+    Raises:
+        ConversionError: If the CSV cannot be parsed or a value does not fit the schema.
+        ImportError: If pyarrow is not installed.
+    """
+    pa = _require_pyarrow()
+    if format not in FORMATS:
+        raise ValueError(f"'format' must be one of {sorted(FORMATS)}, got: {format!r}")
+    if batch_size < 1 or sample_rows < 1:
+        raise ValueError("'batch_size' and 'sample_rows' must be at least 1")
+    destination = Path(destination)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    part_path = destination.with_suffix(destination.suffix + ".part")
+
+    with contextlib.ExitStack() as stack:
+        if isinstance(source, (str, Path)):
+            source = stack.enter_context(open(source, "rb"))
+        sample = _read_sample(source, sample_rows)
+        if not sample:
+            raise ConversionError("The CSV is empty")
+        schema = infer_schema(sample, delimiter=delimiter, encoding=encoding, column_types=column_types)
+        rows = batches = 0
+        try:
+            reader = pa.csv.open_csv(
+                _Prefixed(sample, source),
+                read_options=pa.csv.ReadOptions(encoding=encoding, block_size=block_size),
+                parse_options=pa.csv.ParseOptions(delimiter=delimiter, newlines_in_values=newlines_in_values),
+                convert_options=pa.csv.ConvertOptions(column_types=schema),
+            )
+            if format == "parquet":
+                writer = pa.parquet.ParquetWriter(part_path, schema, compression=compression)
+            else:
+                writer = pa.ipc.new_file(str(part_path), schema)
+            with writer:
+                for batch in _rebatch(reader, batch_size):
+                    if format == "parquet":
+                        writer.write_batch(batch, row_group_size=batch_size)
+                    else:
+                        writer.write_batch(batch)
+                    rows += batch.num_rows
+                    batches += 1
+        except pa.ArrowException as e:
+            part_path.unlink(missing_ok=True)
+            raise ConversionError(f"Failed to convert to {format} after {rows} rows: {e}") from e
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+
+    os.replace(part_path, destination)
+    _bl.info(f"Converted {rows} rows in {batches} batches to {destination}")
+    return ConversionResult(path=destination, format=format, rows=rows, batches=batches, columns=schema.names)
+
+
+def convert_resources(
+    lds: "LondonDataStore",
+    resources: Iterable[str | tuple[str, str | None]],
+    destination: str | Path = ".",
+    *,
+    format: str = "parquet",
+    workers: int = 4,
+    **kwargs,
+) -> list[ConversionResult]:
+    """Stream several CSV resources into Parquet or Arrow files in parallel.
+
+    Each resource is read with :meth:`LondonDataStore.open_resource`, so nothing
+    but the output is written to disk. pyarrow parses and encodes outside the
+    GIL, so conversions run concurrently on ``workers`` threads. Outputs are laid
+    out by :func:`~london_data_store.planner.layout_paths`, so resources sharing a
+    file name never write the same file, and a resource listed twice is converted
+    once.
+
+    Args:
+        lds: The client used to open resources.
+        resources: Slugs, or ``(slug, resource_key)`` pairs.
+        destination: Directory the converted files are written into; created if missing.
+        format: ``"parquet"`` or ``"arrow"``.
+        workers: Number of conversions run at once.
+        **kwargs: Passed to :func:`convert_csv`.
+
+    Returns:
+        One ConversionResult per resource, in the order given.
+
+    Raises:
+        DatasetNotFoundError: If a slug or resource key is not found, before any conversion starts.
+    """
+    pairs = [(item, None) if isinstance(item, str) else tuple(item) for item in resources]
+    if workers < 1:
+        raise ValueError(f"'workers' must be at least 1, got: {workers!r}")
+    if format not in FORMATS:
+        raise ValueError(f"'format' must be one of {sorted(FORMATS)}, got: {format!r}")
+    targets = []
+    for slug, key in pairs:
+        resource = lds.get_resource(slug, None if key else "csv", resource_key=key)
+        stem = Path(urlsplit(resource.url).path.split("/")[-1] or "download").stem
+        targets.append((slug, resource.key, stem + FORMATS[format]))
+    paths = layout_paths(destination, targets)
+    Path(destination).mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lds-convert") as pool:
+        futures = {}
+        for (slug, key, _), path in zip(targets, paths, strict=True):
+            if path not in futures:
+                futures[path] = pool.submit(lds.convert_resource, slug, path, resource_key=key, format=format, **kwargs)
+        return [futures[path].result() for path in paths]
+
+
+def output_path(url: str, destination: str | Path, format: str) -> Path:
+    """Where a resource converted to ``format`` goes: a file, or a directory to infer the name in."""
+    destination = Path(destination)
+    if destination.is_dir():
+        stem = Path(urlsplit(url).path.split("/")[-1] or "download").stem
+        destination = destination / (stem + FORMATS[format])
+    return destination
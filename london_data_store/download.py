@@ -1,29 +1,292 @@
 """File download manager with progress and integrity verification."""
 
-import hashlib
+import contextlib
+import contextvars
+import functools
+import io
 import os
 import tempfile
-from collections.abc import Callable
+import threading
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import StrEnum
 from pathlib import Path
 from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import DEFAULT_POOLSIZE
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
 
-from .exceptions import DownloadError
+from .cache import RedirectCache, ValidatorCache
+from .exceptions import CacheError, DownloadError
+from .hashing import HashPipeline, hash_file, validate_algorithms
+from .progress import ThrottledProgress, throttle
+from .ratelimit import RateLimiter
+from .singleflight import SingleFlight
+from .sinks import Sink, write_all
+from .store import ResourceStore, normalize_hash
+from .streaming import DEFAULT_STREAM_CHUNK_SIZE, ResourceStream, StreamVerifier
 from .utils.logging_helper import BasicLogger
 
 _bl = BasicLogger(verbose=False, log_directory=None, logger_name="DOWNLOAD")
 
+# Shared by every DownloadManager: keyed on (url, destination), so concurrent
+# downloads of one file to one place run once even from different clients
+_in_flight = SingleFlight()
+
+
+class _RangesUnsupportedError(Exception):
+    """Raised internally when a server ignores or rejects a Range request."""
+
+
+class _SegmentAbortedError(Exception):
+    """Raised internally to stop a segment after another segment failed."""
+
+
+class _NotModifiedError(Exception):
+    """Raised internally when a conditional request is answered with 304."""
+
+
+class DownloadStatus(StrEnum):
+    """How a download's destination came to be up to date."""
+
+    DOWNLOADED = "downloaded"
+    NOT_MODIFIED = "not_modified"
+    STORE = "store"
+
+
+@dataclass
+class DownloadResult:
+    """Outcome of :meth:`DownloadManager.download`."""
+
+    path: Path
+    status: DownloadStatus
+    url: str
+    bytes_downloaded: int = 0
+    digests: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class DownloadOutcome:
+    """One item of :meth:`AsyncLondonDataStore.download_many`: the file written, or the error that stopped it."""
+
+    slug: str
+    format: str | None
+    path: Path | None = None
+    bytes_downloaded: int = 0
+    error: Exception | None = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class DownloadBuffer(tempfile.SpooledTemporaryFile):
+    """A downloaded body held in memory, spilling to an anonymous temporary file past ``max_size`` bytes.
+
+    Returned by :meth:`DownloadManager.download_to_buffer` positioned at the start,
+    so it can be handed straight to pandas or geopandas. Closing it frees the memory
+    or removes the temporary file.
+    """
+
+    def __init__(self, url: str, max_size: int = 0):
+        super().__init__(max_size=max_size, mode="w+b")
+        self.url = url
+        self.status = DownloadStatus.DOWNLOADED
+        self.bytes_downloaded = 0
+        self.digests: dict[str, str] = {}
+        self.hash_verified = False
+
+    @property
+    def rolled_over(self) -> bool:
+        """Whether the body outgrew ``max_size`` and now lives on disk."""
+        return self._rolled
+
+
+class BufferSink(Sink):
+    """Write into a DownloadBuffer; ``commit`` returns it rewound, ``abort`` closes it."""
+
+    def __init__(self, buffer: DownloadBuffer):
+        self.buffer = buffer
+
+    @property
+    def in_memory(self) -> bool:
+        return not self.buffer.rolled_over
+
+    def write(self, chunk: bytes | memoryview) -> None:
+        self.buffer.write(chunk)
+
+    def commit(self) -> DownloadBuffer:
+        self.buffer.seek(0)
+        return self.buffer
+
+    def abort(self) -> None:
+        self.buffer.close()
+
+
+@dataclass
+class SinkResult:
+    """Outcome of :meth:`DownloadManager.download_to_sink`."""
+
+    value: object
+    url: str
+    status: DownloadStatus
+    bytes_downloaded: int = 0
+    digests: dict[str, str] = field(default_factory=dict)
+    hash_verified: bool = False
+
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# A requests HTTPAdapter keeps this many connections per host; segments beyond it
+# would open connections the pool then discards
+MAX_SEGMENTS = DEFAULT_POOLSIZE
+
+# Bodies up to this size stay in memory in download_to_buffer
+DEFAULT_SPOOL_SIZE = 8 * 1024 * 1024
+
+
+def _receive(
+    response: requests.Response,
+    chunk_size: int,
+    write: Callable[[bytes | memoryview], None],
+    pipeline: HashPipeline | None = None,
+) -> int:
+    """Pass the body of a streamed response to ``write`` in chunks of up to ``chunk_size`` bytes.
+
+    Where the underlying urllib3 stream is available, the body is read with
+    ``readinto`` into preallocated buffers and ``write`` receives memoryview slices
+    of them, so no per-chunk bytes objects are created. The buffers come from
+    ``pipeline`` when one is given, and each chunk is then handed to it for hashing
+    on its worker thread while the next chunk is received.
+
+    Returns:
+        The number of body bytes received.
+    """
+    received = 0
+    raw = getattr(response, "raw", None)
+    if not isinstance(raw, io.IOBase):
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            write(chunk)
+            if pipeline is not None:
+                pipeline.submit(chunk)
+            received += len(chunk)
+        return received
+
+    raw.decode_content = True
+    own_buffer = bytearray(chunk_size) if pipeline is None else None
+    try:
+        while True:
+            buffer = own_buffer if pipeline is None else pipeline.acquire()
+            n = raw.readinto(buffer)
+            if not n:
+                if pipeline is not None:
+                    pipeline.release(buffer)
+                return received
+            view = memoryview(buffer)[:n]
+            write(view)
+            if pipeline is not None:
+                pipeline.submit(view, buffer)
+            received += n
+    except Urllib3HTTPError as e:
+        raise DownloadError(f"Failed to download {response.url}: {e}") from e
+
+
+def _verify(
+    url: str, size: int, digests: Mapping[str, str], expected_size: int | None, expected_hash: str | None
+) -> bool:
+    """Check a received body against the catalogue; returns whether the MD5 matched.
+
+    Raises:
+        DownloadError: On a size mismatch. Hash mismatches are only logged, since the
+            catalogue hash can lag behind the published file.
+    """
+    if expected_size is not None and size != expected_size:
+        raise DownloadError(f"Size mismatch: expected {expected_size} bytes, got {size}")
+    if expected_hash is None:
+        return False
+    # Strip version suffix (e.g., 'abc123-1' -> 'abc123')
+    clean_hash = normalize_hash(expected_hash)
+    actual_hash = digests.get("md5")
+    if actual_hash != clean_hash:
+        _bl.warning(
+            f"Hash mismatch for {url}: expected {clean_hash}, got {actual_hash}. "
+            "The catalogue metadata may be stale — file downloaded anyway."
+        )
+        return False
+    return True
+
+
+def _pwrite(fd: int, data: bytes | memoryview, offset: int, lock: threading.Lock) -> None:
+    """Write all of ``data`` at ``offset`` without moving a shared file position."""
+    view = memoryview(data)
+    if hasattr(os, "pwrite"):
+        while view:
+            written = os.pwrite(fd, view, offset)
+            view = view[written:]
+            offset += written
+    else:  # pragma: no cover - Windows has no pwrite
+        with lock:
+            os.lseek(fd, offset, os.SEEK_SET)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+
+
+def _split_ranges(total: int, segments: int) -> list[tuple[int, int]]:
+    """Split ``total`` bytes into ``segments`` inclusive (start, end) byte ranges."""
+    step = -(-total // segments)
+    return [(start, min(start + step, total) - 1) for start in range(0, total, step)]
+
 
 class DownloadManager:
     """Downloads files with optional progress reporting and integrity checks.
 
     Args:
         session: A requests.Session to use for HTTP requests.
+        segments: Number of concurrent byte-range connections to use for large files.
+            ``1`` (the default) always downloads over a single stream. At most
+            :data:`MAX_SEGMENTS`, the connections a requests adapter pools per host.
+        min_segment_size: Smallest byte range worth a connection of its own. Files too
+            small to give every segment this much are split into fewer segments.
+        store: Content-addressed store consulted before downloading. Downloads whose
+            expected hash is already stored are served from it without network traffic,
+            and verified downloads are added to it.
+        validators: Where ``if_changed`` downloads remember ETag/Last-Modified. Defaults
+            to a ValidatorCache in the platform cache dir.
+        progress_interval: Minimum seconds between progress callbacks. The final update
+            is always delivered. ``0`` reports every chunk.
+        rate_limiter: Shared limiter whose per-host bandwidth budget received bytes are
+            drawn from, in the caller's rate-limit lane.
+        redirects: Where the final locations of redirected download URLs are remembered.
+            Later requests for the same URL and ``check_timestamp`` go straight there,
+            falling back to the original URL if the target answers with a 4xx.
     """
 
-    def __init__(self, session: requests.Session):
+    def __init__(
+        self,
+        session: requests.Session,
+        *,
+        segments: int = 1,
+        min_segment_size: int = 8 * 1024 * 1024,
+        store: ResourceStore | None = None,
+        validators: ValidatorCache | None = None,
+        progress_interval: float = 0.1,
+        rate_limiter: RateLimiter | None = None,
+        redirects: RedirectCache | None = None,
+    ):
+        if not 1 <= segments <= MAX_SEGMENTS:
+            raise ValueError(f"'segments' must be between 1 and {MAX_SEGMENTS}, got: {segments!r}")
         self._session = session
+        self._segments = segments
+        self._min_segment_size = min_segment_size
+        self._store = store
+        self._validators = validators
+        self._progress_interval = progress_interval
+        self._rate_limiter = rate_limiter
+        self._redirects = redirects
 
     def download_file(
         self,
@@ -33,24 +296,88 @@ class DownloadManager:
         progress_callback: Callable[[int, int | None], None] | None = None,
         expected_hash: str | None = None,
         expected_size: int | None = None,
-        chunk_size: int = 8192,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        if_changed: bool = False,
+        check_timestamp: str | None = None,
+        hash_algorithms: Iterable[str] = (),
     ) -> Path:
         """Download a file with optional progress reporting and integrity checks.
 
+        Same as :meth:`download`, but returns only the final file path.
+
+        Returns:
+            The final file path.
+
+        Raises:
+            DownloadError: On HTTP errors, hash mismatch, or size mismatch.
+        """
+        return self.download(
+            url,
+            destination,
+            progress_callback=progress_callback,
+            expected_hash=expected_hash,
+            expected_size=expected_size,
+            chunk_size=chunk_size,
+            if_changed=if_changed,
+            check_timestamp=check_timestamp,
+            hash_algorithms=hash_algorithms,
+        ).path
+
+    def download(
+        self,
+        url: str,
+        destination: Path,
+        *,
+        progress_callback: Callable[[int, int | None], None] | None = None,
+        expected_hash: str | None = None,
+        expected_size: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        if_changed: bool = False,
+        check_timestamp: str | None = None,
+        hash_algorithms: Iterable[str] = (),
+    ) -> DownloadResult:
+        """Download a file with optional progress reporting and integrity checks.
+
+        When the manager was created with ``segments > 1`` and the server advertises
+        ``Accept-Ranges: bytes`` with a ``Content-Length``, the file is fetched as
+        concurrent byte ranges written in place into a preallocated file. Otherwise,
+        or if the server does not honour the ranges, a single stream is used.
+
+        If the manager has a store and ``expected_hash`` is already in it, the stored
+        object is placed at the destination and no request is made.
+
+        Concurrent calls for the same URL and destination, from any thread or manager,
+        share one transfer: later callers wait for it and receive the same result or
+        exception (their own progress callbacks are not called).
+
+        With ``if_changed=True`` an existing destination is kept when the catalogue
+        ``check_timestamp`` matches the one recorded at the last download, or when the
+        server answers ``304 Not Modified`` to ``If-None-Match``/``If-Modified-Since``.
+
         Args:
             url: The URL to download from.
             destination: Target file path. If a directory, filename is inferred from URL.
-            progress_callback: Called with (bytes_downloaded, total_bytes) after each chunk.
+            progress_callback: Called with (bytes_downloaded, total_bytes) as data arrives,
+                at most once per ``progress_interval`` plus once at the end.
             expected_hash: Expected MD5 hash (with optional version suffix like '-1').
             expected_size: Expected file size in bytes.
-            chunk_size: Download chunk size in bytes.
+            chunk_size: Size of the reusable receive buffer in bytes (default 1 MiB).
+            if_changed: Skip the transfer when the destination is already up to date.
+            check_timestamp: The resource's catalogue ``check_timestamp``, remembered
+                alongside the HTTP validators.
+            hash_algorithms: Extra digests to compute in the same pass (e.g. ``"sha256"``,
+                ``"blake2b"``), reported in ``DownloadResult.digests``. MD5 is always
+                computed when ``expected_hash`` is given. Hashing runs on a worker thread.
 
         Returns:
-            The final file path.
+            A DownloadResult describing where the file is and how it got there.
 
         Raises:
             DownloadError: On HTTP errors, hash mismatch, or size mismatch.
         """
+        algorithms = validate_algorithms(("md5",) if expected_hash else ())
+        algorithms = validate_algorithms((*algorithms, *hash_algorithms))
+        progress_callback = throttle(progress_callback, self._progress_interval)
         destination = Path(destination)
 
         # If destination is a directory, infer filename from URL
@@ -58,59 +385,491 @@ class DownloadManager:
             filename = urlsplit(url).path.split("/")[-1] or "download"
             destination = destination / filename
 
-        destination.parent.mkdir(parents=True, exist_ok=True)
-        part_path = destination.with_suffix(destination.suffix + ".part")
+        # Concurrent requests for the same file share one transfer and its outcome
+        return _in_flight.do(
+            (url, destination.resolve()),
+            self._download,
+            url,
+            destination,
+            progress_callback=progress_callback,
+            expected_hash=expected_hash,
+            expected_size=expected_size,
+            chunk_size=chunk_size,
+            if_changed=if_changed,
+            check_timestamp=check_timestamp,
+            algorithms=algorithms,
+        )
+
+    def open(
+        self,
+        url: str,
+        *,
+        expected_hash: str | None = None,
+        expected_size: int | None = None,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        check_timestamp: str | None = None,
+    ) -> ResourceStream:
+        """Open ``url`` as a binary stream without writing it to disk.
+
+        The body is read from the connection as the stream is consumed, verified
+        against ``expected_size`` and ``expected_hash`` on the way, and charged to
+        the rate limiter per chunk.
 
+        Raises:
+            DownloadError: On HTTP errors, or from the stream if the size does not match.
+        """
         try:
-            response = self._session.get(url, stream=True, timeout=30)
+            response = self._request("get", url, check_timestamp, stream=True, timeout=30)
             response.raise_for_status()
         except requests.RequestException as e:
-            raise DownloadError(f"Failed to download {url}: {e}") from e
+            raise DownloadError(f"Failed to open {url}: {e}") from e
 
-        total_size = int(response.headers.get("content-length", 0)) or None
-        bytes_downloaded = 0
-        md5_hash = hashlib.md5()
+        host = urlsplit(response.url if isinstance(response.url, str) else url).netloc
 
-        try:
-            fd, tmp_path = tempfile.mkstemp(dir=destination.parent, suffix=".tmp")
-            try:
-                with os.fdopen(fd, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=chunk_size):
-                        f.write(chunk)
-                        bytes_downloaded += len(chunk)
-                        if expected_hash:
-                            md5_hash.update(chunk)
-                        if progress_callback:
-                            progress_callback(bytes_downloaded, total_size)
-
-                os.replace(tmp_path, part_path)
-            except BaseException:
-                import contextlib
+        def on_chunk(n: int) -> None:
+            self._rate_limiter.acquire_bytes(host, n)
 
-                with contextlib.suppress(OSError):
-                    os.unlink(tmp_path)
-                raise
+        verifier = StreamVerifier(url, expected_hash, expected_size)
+        return ResourceStream(
+            response, verifier, chunk_size=chunk_size, on_chunk=on_chunk if self._rate_limiter is not None else None
+        )
+
+    def download_to_sink(
+        self,
+        url: str,
+        sink: Sink,
+        *,
+        progress_callback: Callable[[int, int | None], None] | None = None,
+        expected_hash: str | None = None,
+        expected_size: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        check_timestamp: str | None = None,
+        hash_algorithms: Iterable[str] = (),
+    ) -> SinkResult:
+        """Stream ``url`` into ``sink`` and commit it once the body has been verified.
+
+        Nothing is staged on local disk unless the sink puts it there, so a sink that
+        uploads or pipes its chunks elsewhere can take bodies of any size. The size
+        and hash are checked as for :meth:`download`; on a size mismatch or any other
+        failure the sink is aborted instead of committed. If the manager has a store
+        holding ``expected_hash`` the sink is fed from the store instead.
+
+        Returns:
+            A SinkResult whose ``value`` is what the sink's ``commit`` returned.
+
+        Raises:
+            DownloadError: On HTTP errors, a size mismatch, or a failing sink.
+        """
+        algorithms = validate_algorithms(("md5",) if expected_hash else ())
+        algorithms = validate_algorithms((*algorithms, *hash_algorithms))
+        progress_callback = throttle(progress_callback, self._progress_interval)
+        stored = self._store.get(expected_hash, expected_size) if self._store and expected_hash else None
+        try:
+            sink.open(url, expected_size)
+            if stored is not None:
+                with open(stored, "rb") as f:
+                    while chunk := f.read(chunk_size):
+                        sink.write(chunk)
+                result = SinkResult(
+                    value=None,
+                    url=url,
+                    status=DownloadStatus.STORE,
+                    digests={"md5": normalize_hash(expected_hash)},
+                    hash_verified=True,
+                )
+            else:
+                size, digests, _ = self._download_single(
+                    url,
+                    sink.write,
+                    progress_callback,
+                    chunk_size,
+                    algorithms=algorithms,
+                    check_timestamp=check_timestamp,
+                )
+                if isinstance(progress_callback, ThrottledProgress):
+                    progress_callback.flush()
+                result = SinkResult(
+                    value=None,
+                    url=url,
+                    status=DownloadStatus.DOWNLOADED,
+                    bytes_downloaded=size,
+                    digests=digests,
+                    hash_verified=_verify(url, size, digests, expected_size, expected_hash),
+                )
+            result.value = sink.commit()
         except DownloadError:
+            sink.abort()
             raise
         except Exception as e:
-            raise DownloadError(f"Failed to write file: {e}") from e
+            sink.abort()
+            raise DownloadError(f"Failed to write {url} to {type(sink).__name__}: {e}") from e
+        except BaseException:
+            sink.abort()
+            raise
+        _bl.info(f"Downloaded {url} to {type(sink).__name__} ({result.bytes_downloaded} bytes)")
+        return result
+
+    def download_to_buffer(
+        self,
+        url: str,
+        *,
+        max_memory: int = DEFAULT_SPOOL_SIZE,
+        progress_callback: Callable[[int, int | None], None] | None = None,
+        expected_hash: str | None = None,
+        expected_size: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        check_timestamp: str | None = None,
+        hash_algorithms: Iterable[str] = (),
+    ) -> DownloadBuffer:
+        """Download ``url`` into a readable buffer instead of a destination file.
+
+        Bodies of up to ``max_memory`` bytes never touch the filesystem; larger ones
+        spill to an anonymous temporary file (``0`` keeps everything in memory). The
+        size and hash are checked as for :meth:`download`, and if the manager has a
+        store holding ``expected_hash`` the body is read from there instead.
+
+        Returns:
+            A DownloadBuffer positioned at the start; close it when done.
+
+        Raises:
+            DownloadError: On HTTP errors or a size mismatch.
+        """
+        result = self.download_to_sink(
+            url,
+            BufferSink(DownloadBuffer(url, max_size=max_memory)),
+            progress_callback=progress_callback,
+            expected_hash=expected_hash,
+            expected_size=expected_size,
+            chunk_size=chunk_size,
+            check_timestamp=check_timestamp,
+            hash_algorithms=hash_algorithms,
+        )
+        buffer = result.value
+        buffer.status = result.status
+        buffer.bytes_downloaded = result.bytes_downloaded
+        buffer.digests = result.digests
+        buffer.hash_verified = result.hash_verified
+        return buffer
 
-        # Verify integrity
-        if expected_size is not None and bytes_downloaded != expected_size:
+    def download_bytes(self, url: str, **kwargs) -> bytes:
+        """Download ``url`` into memory and return its body.
+
+        Takes the keyword arguments of :meth:`download_to_buffer` except ``max_memory``.
+        """
+        with self.download_to_buffer(url, max_memory=0, **kwargs) as buffer:
+            return buffer.read()
+
+    def _download(
+        self,
+        url: str,
+        destination: Path,
+        *,
+        progress_callback: Callable[[int, int | None], None] | None,
+        expected_hash: str | None,
+        expected_size: int | None,
+        chunk_size: int,
+        if_changed: bool,
+        check_timestamp: str | None,
+        algorithms: tuple[str, ...],
+    ) -> DownloadResult:
+        """Perform :meth:`download` for a resolved destination file."""
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        part_path = destination.with_suffix(destination.suffix + ".part")
+
+        if (
+            self._store is not None
+            and expected_hash
+            and self._store.materialize(expected_hash, destination, expected_size) is not None
+        ):
+            if if_changed:
+                self._remember_validators(destination, url, {}, check_timestamp)
+            return DownloadResult(
+                path=destination,
+                status=DownloadStatus.STORE,
+                url=url,
+                digests={"md5": normalize_hash(expected_hash)},
+            )
+
+        request_headers = {}
+        if if_changed:
+            record = self.validators.get(destination)
+            if record is not None:
+                if check_timestamp and record.get("check_timestamp") == check_timestamp:
+                    _bl.info(f"{destination} is current (check_timestamp {check_timestamp})")
+                    return DownloadResult(path=destination, status=DownloadStatus.NOT_MODIFIED, url=url)
+                if record.get("etag"):
+                    request_headers["If-None-Match"] = record["etag"]
+                if record.get("last_modified"):
+                    request_headers["If-Modified-Since"] = record["last_modified"]
+
+        try:
+            plan = self._plan_segments(url, request_headers, check_timestamp) if self._segments > 1 else None
+            try:
+                fd, tmp_path = tempfile.mkstemp(dir=destination.parent, suffix=".tmp")
+                try:
+                    bytes_downloaded = None
+                    digests = {}
+                    if plan is not None:
+                        try:
+                            bytes_downloaded = self._download_segmented(
+                                plan[0], fd, plan[1], plan[2], progress_callback, chunk_size
+                            )
+                        except _RangesUnsupportedError as e:
+                            _bl.warning(f"Falling back to a single stream for {url}: {e}")
+                            os.ftruncate(fd, 0)
+                        else:
+                            response_headers = plan[3]
+                            # Segments arrive out of order, so hash the assembled file
+                            if algorithms:
+                                digests = hash_file(tmp_path, algorithms, buffer_size=chunk_size)
+                    if bytes_downloaded is None:
+                        bytes_downloaded, digests, response_headers = self._download_single(
+                            url,
+                            functools.partial(write_all, fd),
+                            progress_callback,
+                            chunk_size,
+                            algorithms=algorithms,
+                            headers=request_headers,
+                            check_timestamp=check_timestamp,
+                        )
+                    if isinstance(progress_callback, ThrottledProgress):
+                        progress_callback.flush()
+                    os.close(fd)
+                    fd = None
+                    os.replace(tmp_path, part_path)
+                except BaseException:
+                    if fd is not None:
+                        with contextlib.suppress(OSError):
+                            os.close(fd)
+                    with contextlib.suppress(OSError):
+                        os.unlink(tmp_path)
+                    raise
+            except (DownloadError, _NotModifiedError):
+                raise
+            except Exception as e:
+                raise DownloadError(f"Failed to write file: {e}") from e
+        except _NotModifiedError:
+            _bl.info(f"{url} not modified, keeping {destination}")
+            self._remember_validators(destination, url, request_headers, check_timestamp, from_request=True)
+            return DownloadResult(path=destination, status=DownloadStatus.NOT_MODIFIED, url=url)
+
+        try:
+            hash_verified = _verify(url, bytes_downloaded, digests, expected_size, expected_hash)
+        except DownloadError:
             part_path.unlink(missing_ok=True)
-            raise DownloadError(f"Size mismatch: expected {expected_size} bytes, got {bytes_downloaded}")
-
-        if expected_hash is not None:
-            # Strip version suffix (e.g., 'abc123-1' -> 'abc123')
-            clean_hash = expected_hash.split("-")[0] if "-" in expected_hash else expected_hash
-            actual_hash = md5_hash.hexdigest()
-            if actual_hash != clean_hash:
-                _bl.warning(
-                    f"Hash mismatch for {url}: expected {clean_hash}, got {actual_hash}. "
-                    "The catalogue metadata may be stale — file downloaded anyway."
-                )
+            raise
 
         # Move from .part to final destination
         os.replace(part_path, destination)
         _bl.info(f"Downloaded {url} to {destination} ({bytes_downloaded} bytes)")
-        return destination
+
+        # Only content that matched its catalogue hash is addressable by it
+        if self._store is not None and hash_verified:
+            try:
+                self._store.add(expected_hash, destination)
+            except CacheError as e:
+                _bl.warning(str(e))
+        if if_changed:
+            self._remember_validators(destination, url, response_headers, check_timestamp)
+        return DownloadResult(
+            path=destination,
+            status=DownloadStatus.DOWNLOADED,
+            url=url,
+            bytes_downloaded=bytes_downloaded,
+            digests=digests,
+        )
+
+    @property
+    def validators(self) -> ValidatorCache:
+        """Per-destination HTTP validators used by ``if_changed`` downloads."""
+        if self._validators is None:
+            self._validators = ValidatorCache()
+        return self._validators
+
+    def _remember_validators(
+        self,
+        destination: Path,
+        url: str,
+        headers: dict,
+        check_timestamp: str | None,
+        *,
+        from_request: bool = False,
+    ) -> None:
+        """Record validators from response headers, or carry over the request's on a 304."""
+        if from_request:
+            etag, last_modified = headers.get("If-None-Match"), headers.get("If-Modified-Since")
+        else:
+            etag, last_modified = headers.get("etag"), headers.get("last-modified")
+        try:
+            self.validators.put(
+                destination, url=url, etag=etag, last_modified=last_modified, check_timestamp=check_timestamp
+            )
+        except CacheError as e:
+            _bl.warning(str(e))
+
+    def _download_single(
+        self,
+        url: str,
+        output: Callable[[bytes | memoryview], object],
+        progress_callback: Callable[[int, int | None], None] | None,
+        chunk_size: int,
+        *,
+        algorithms: tuple[str, ...] = (),
+        headers: dict | None = None,
+        check_timestamp: str | None = None,
+    ) -> tuple[int, dict[str, str], Mapping[str, str]]:
+        """Stream ``url`` into ``output`` over one connection.
+
+        Returns:
+            The byte count, ``{algorithm: hex digest}`` for ``algorithms``, and the response headers.
+        """
+        try:
+            response = self._request("get", url, check_timestamp, headers=headers or None, stream=True, timeout=30)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise DownloadError(f"Failed to download {url}: {e}") from e
+
+        if response.status_code == 304:
+            response.close()
+            raise _NotModifiedError
+
+        total_size = int(response.headers.get("content-length", 0)) or None
+        bytes_downloaded = 0
+        host = urlsplit(response.url if isinstance(response.url, str) else url).netloc
+
+        def write(chunk: bytes | memoryview) -> None:
+            nonlocal bytes_downloaded
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire_bytes(host, len(chunk))
+            output(chunk)
+            bytes_downloaded += len(chunk)
+            if progress_callback:
+                progress_callback(bytes_downloaded, total_size)
+
+        if not algorithms:
+            with contextlib.closing(response):
+                _receive(response, chunk_size, write)
+            return bytes_downloaded, {}, response.headers
+
+        with contextlib.closing(response), HashPipeline(algorithms, buffer_size=chunk_size) as pipeline:
+            _receive(response, chunk_size, write, pipeline)
+            digests = pipeline.hexdigests()
+        return bytes_downloaded, digests, response.headers
+
+    def _request(self, method: str, url: str, check_timestamp: str | None, **kwargs) -> requests.Response:
+        """Send a request for ``url`` via its cached redirect target, if any.
+
+        A 4xx from the cached target drops it and retries the original URL. When the
+        original URL redirects, the final location is recorded for next time.
+        """
+        send = getattr(self._session, method)
+        target = self._redirects.get(url, check_timestamp) if self._redirects is not None else None
+        if target is not None:
+            response = send(target, **kwargs)
+            if not 400 <= response.status_code < 500:
+                return response
+            _bl.info(f"Cached redirect target for {url} answered {response.status_code}, using the original URL")
+            response.close()
+            self._redirects.invalidate(url)
+
+        response = send(url, **kwargs)
+        if self._redirects is not None and response.history and response.ok and response.url != url:
+            try:
+                self._redirects.put(url, response.url, check_timestamp)
+            except CacheError as e:
+                _bl.warning(str(e))
+        return response
+
+    def _plan_segments(
+        self, url: str, headers: dict | None = None, check_timestamp: str | None = None
+    ) -> tuple[str, int, list[tuple[int, int]], Mapping[str, str]] | None:
+        """Probe ``url`` and return (final_url, total_size, ranges, headers), or None for a single stream."""
+        try:
+            response = self._request(
+                "head", url, check_timestamp, headers=headers or None, allow_redirects=True, timeout=30
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            _bl.warning(f"Range probe failed for {url}, using a single stream: {e}")
+            return None
+
+        if response.status_code == 304:
+            raise _NotModifiedError
+
+        accept_ranges = response.headers.get("accept-ranges", "").lower()
+        total = int(response.headers.get("content-length", 0) or 0)
+        if "bytes" not in accept_ranges or total <= 0:
+            return None
+
+        segments = min(self._segments, total // self._min_segment_size)
+        if segments < 2:
+            return None
+        return getattr(response, "url", None) or url, total, _split_ranges(total, segments), response.headers
+
+    def _download_segmented(
+        self,
+        url: str,
+        fd: int,
+        total: int,
+        ranges: list[tuple[int, int]],
+        progress_callback: Callable[[int, int | None], None] | None,
+        chunk_size: int,
+    ) -> int:
+        """Fetch ``ranges`` of ``url`` concurrently into a preallocated ``fd``. Returns the byte count."""
+        os.ftruncate(fd, total)
+        host = urlsplit(url).netloc
+        lock = threading.Lock()
+        failed = threading.Event()
+        downloaded = 0
+
+        def fetch(byte_range: tuple[int, int]) -> None:
+            nonlocal downloaded
+            start, end = byte_range
+            try:
+                response = self._session.get(url, headers={"Range": f"bytes={start}-{end}"}, stream=True, timeout=30)
+                response.raise_for_status()
+            except requests.RequestException as e:
+                raise DownloadError(f"Failed to download {url} bytes {start}-{end}: {e}") from e
+
+            content_range = response.headers.get("content-range", "")
+            if response.status_code != 206 or not content_range.startswith(f"bytes {start}-{end}/"):
+                response.close()
+                raise _RangesUnsupportedError(f"server answered range {start}-{end} with {response.status_code}")
+
+            offset = start
+
+            def write(chunk: bytes | memoryview) -> None:
+                nonlocal offset, downloaded
+                if failed.is_set():
+                    raise _SegmentAbortedError
+                if offset + len(chunk) > end + 1:
+                    raise DownloadError(f"Server sent more data than requested for bytes {start}-{end}")
+                if self._rate_limiter is not None:
+                    self._rate_limiter.acquire_bytes(host, len(chunk))
+                _pwrite(fd, chunk, offset, lock)
+                offset += len(chunk)
+                with lock:
+                    downloaded += len(chunk)
+                    if progress_callback:
+                        progress_callback(downloaded, total)
+
+            with contextlib.closing(response):
+                try:
+                    _receive(response, chunk_size, write)
+                except _SegmentAbortedError:
+                    return
+            if offset != end + 1:
+                raise DownloadError(f"Incomplete range {start}-{end}: got {offset - start} bytes")
+
+        with ThreadPoolExecutor(max_workers=len(ranges), thread_name_prefix="lds-segment") as pool:
+            # Each segment runs in a copy of the caller's context to keep its rate-limit lane
+            futures = [pool.submit(contextvars.copy_context().run, fetch, r) for r in ranges]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                failed.set()
+                raise
+
+        _bl.info(f"Fetched {url} in {len(ranges)} segments")
+        return downloaded
@@ -19,3 +19,11 @@ class DownloadError(LondonDataStoreError):
 
 class CacheError(LondonDataStoreError):
     """Raised when catalogue caching fails."""
+
+
+class InsufficientSpaceError(DownloadError):
+    """Raised when the destination filesystem cannot hold a planned download."""
+
+
+class ConversionError(LondonDataStoreError):
+    """Raised when a resource cannot be converted to a columnar format."""
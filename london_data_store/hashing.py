@@ -0,0 +1,124 @@
+"""Pipelined digest computation for downloads."""
+
+import hashlib
+import queue
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+
+def validate_algorithms(algorithms: Iterable[str]) -> tuple[str, ...]:
+    """Normalize digest names and check hashlib supports them.
+
+    Raises:
+        ValueError: If an algorithm is unknown.
+    """
+    names = []
+    for name in algorithms:
+        name = name.lower().replace("-", "")
+        try:
+            hashlib.new(name)
+        except ValueError:
+            raise ValueError(f"Unsupported hash algorithm: {name!r}") from None
+        if name not in names:
+            names.append(name)
+    return tuple(names)
+
+
+class HashPipeline:
+    """Compute one or more digests on a worker thread, overlapping with I/O.
+
+    The producer takes a buffer with :meth:`acquire`, fills it, writes it wherever
+    it needs to go and hands it over with :meth:`submit`; the worker hashes it and
+    returns it to the pool. The pool holds at most ``depth`` buffers, so a producer
+    that outruns the hasher blocks instead of buffering without bound. Immutable
+    ``bytes`` chunks can be submitted directly, bounded by the same depth.
+
+    hashlib releases the GIL while digesting large buffers, so receiving and
+    hashing genuinely run in parallel.
+
+    Args:
+        algorithms: hashlib algorithm names, e.g. ``("md5", "sha256", "blake2b")``.
+        buffer_size: Size of each pooled buffer in bytes.
+        depth: Maximum number of chunks queued for hashing.
+    """
+
+    def __init__(self, algorithms: Iterable[str] = ("md5",), *, buffer_size: int = DEFAULT_BUFFER_SIZE, depth: int = 4):
+        self._algorithms = validate_algorithms(algorithms)
+        self._hashers = {name: hashlib.new(name) for name in self._algorithms}
+        self._buffer_size = buffer_size
+        self._depth = depth
+        self._allocated = 0
+        self._free: queue.SimpleQueue[bytearray] = queue.SimpleQueue()
+        self._work: queue.Queue = queue.Queue(maxsize=depth)
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, name="lds-hash", daemon=True)
+        self._thread.start()
+
+    @property
+    def algorithms(self) -> tuple[str, ...]:
+        return self._algorithms
+
+    def __enter__(self) -> "HashPipeline":
+        return self
+
+    def __exit__(self, exc_type, *args) -> None:
+        if self._thread.is_alive():
+            self._stop()
+
+    def _run(self) -> None:
+        while (item := self._work.get()) is not None:
+            data, buffer = item
+            if self._error is None:
+                try:
+                    for hasher in self._hashers.values():
+                        hasher.update(data)
+                except BaseException as e:  # surfaced by hexdigests()
+                    self._error = e
+            if buffer is not None:
+                self._free.put(buffer)
+
+    def acquire(self) -> bytearray:
+        """Return a free buffer, blocking while every buffer is waiting to be hashed."""
+        try:
+            return self._free.get_nowait()
+        except queue.Empty:
+            pass
+        if self._allocated < self._depth + 1:
+            self._allocated += 1
+            return bytearray(self._buffer_size)
+        return self._free.get()
+
+    def release(self, buffer: bytearray) -> None:
+        """Return a buffer obtained from :meth:`acquire` without hashing it."""
+        self._free.put(buffer)
+
+    def submit(self, data: bytes | memoryview, buffer: bytearray | None = None) -> None:
+        """Queue ``data`` for hashing. If it views a pooled ``buffer``, pass that too."""
+        self._work.put((data, buffer))
+
+    def _stop(self) -> None:
+        self._work.put(None)
+        self._thread.join()
+
+    def hexdigests(self) -> dict[str, str]:
+        """Wait for queued data to be hashed and return ``{algorithm: hex digest}``."""
+        self._stop()
+        if self._error is not None:
+            raise self._error
+        return {name: hasher.hexdigest() for name, hasher in self._hashers.items()}
+
+
+def hash_file(path: str | Path, algorithms: Iterable[str], *, buffer_size: int = DEFAULT_BUFFER_SIZE) -> dict[str, str]:
+    """Digest a file with every algorithm in one pass, reading and hashing in parallel."""
+    with open(path, "rb", buffering=0) as f, HashPipeline(algorithms, buffer_size=buffer_size) as pipeline:
+        while True:
+            buffer = pipeline.acquire()
+            n = f.readinto(buffer)
+            if not n:
+                pipeline.release(buffer)
+                break
+            pipeline.submit(memoryview(buffer)[:n], buffer)
+        return pipeline.hexdigests()
@@ -0,0 +1,423 @@
+"""Incremental local mirror of catalogue resources, tracked in a manifest."""
+
+import contextlib
+import json
+import os
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field, replace
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from .cache import _atomic_write_json
+from .exceptions import InsufficientSpaceError, LondonDataStoreError
+from .models import Dataset, Resource
+from .planner import PlannedDownload, _reclaimed_bytes, check_free_space, order_downloads
+from .ratelimit import Priority, rate_limit_priority
+from .utils.logging_helper import BasicLogger
+
+if TYPE_CHECKING:
+    from .api import LondonDataStore
+
+_bl = BasicLogger(verbose=False, log_directory=None, logger_name="MIRROR")
+
+MANIFEST_NAME = ".lds-mirror.json"
+_MANIFEST_VERSION = 1
+
+
+@dataclass
+class MirrorEntry:
+    """One mirrored resource, as recorded in the manifest.
+
+    ``path`` is relative to the mirror directory.
+    """
+
+    slug: str
+    resource_key: str
+    format: str
+    url: str
+    path: str
+    check_hash: str | None = None
+    check_timestamp: str | None = None
+    size: int | None = None
+    mirrored_at: str | None = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.slug}/{self.resource_key}"
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class Manifest:
+    """The record of what a mirror directory holds, kept in ``MANIFEST_NAME`` inside it."""
+
+    def __init__(self, target: str | Path):
+        self.path = Path(target) / MANIFEST_NAME
+        self.entries: dict[str, MirrorEntry] = {}
+        self._lock = threading.Lock()
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            _bl.warning(f"Ignoring unreadable mirror manifest {self.path}: {e}")
+            return
+        if data.get("version") != _MANIFEST_VERSION:
+            _bl.warning(f"Ignoring mirror manifest {self.path} with unknown version {data.get('version')!r}")
+            return
+        for key, entry in data.get("entries", {}).items():
+            self.entries[key] = MirrorEntry(**entry)
+
+    def put(self, entry: MirrorEntry) -> None:
+        with self._lock:
+            self.entries[entry.key] = entry
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            self.entries.pop(key, None)
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        with self._lock:
+            data = {
+                "version": _MANIFEST_VERSION,
+                "entries": {key: entry.to_dict() for key, entry in sorted(self.entries.items())},
+            }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write_json(self.path, data)
+
+
+@dataclass
+class MirrorPlan:
+    """How the selected resources compare with a mirror's manifest."""
+
+    target: Path
+    new: list[MirrorEntry] = field(default_factory=list)
+    changed: list[MirrorEntry] = field(default_factory=list)
+    unchanged: list[MirrorEntry] = field(default_factory=list)
+    removed: list[MirrorEntry] = field(default_factory=list)
+
+    @property
+    def to_fetch(self) -> list[MirrorEntry]:
+        return self.new + self.changed
+
+    def summary(self) -> dict:
+        return {
+            "target": str(self.target),
+            "new": len(self.new),
+            "changed": len(self.changed),
+            "unchanged": len(self.unchanged),
+            "removed": len(self.removed),
+            "bytes_to_fetch": sum(entry.size or 0 for entry in self.to_fetch),
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            **self.summary(),
+            "fetch": [entry.to_dict() for entry in self.to_fetch],
+            "remove": [entry.to_dict() for entry in self.removed],
+        }
+
+
+@dataclass
+class MirrorResult:
+    """Outcome of :func:`mirror`."""
+
+    plan: MirrorPlan
+    downloaded: list[MirrorEntry] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    pruned: list[MirrorEntry] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    def summary(self) -> dict:
+        return {
+            **self.plan.summary(),
+            "downloaded": len(self.downloaded),
+            "failed": len(self.failed),
+            "pruned": len(self.pruned),
+            "elapsed": round(self.elapsed, 3),
+        }
+
+    def to_dict(self) -> dict:
+        return {**self.summary(), "errors": self.failed}
+
+
+def _matches(values: Iterable[str] | None, candidates: Iterable[str], *, substring: bool = False) -> bool:
+    if values is None:
+        return True
+    candidates = [c.lower() for c in candidates if c]
+    for value in values:
+        value = value.lower()
+        if any(value in c if substring else value == c for c in candidates):
+            return True
+    return False
+
+
+def select_resources(
+    lds: "LondonDataStore",
+    *,
+    topics: Iterable[str] | None = None,
+    formats: Iterable[str] | None = None,
+    publishers: Iterable[str] | None = None,
+) -> list[tuple[Dataset, Resource]]:
+    """The catalogue's resources that pass every given filter.
+
+    A dataset passes if it has any of ``topics`` and its publisher contains any of
+    ``publishers`` (case-insensitive); a resource passes if its format is any of
+    ``formats``. Archived datasets are skipped.
+    """
+    topics = list(topics) if topics else None
+    formats = ["geopackage" if f.lower() == "gpkg" else f for f in formats] if formats else None
+    publishers = list(publishers) if publishers else None
+    selected = []
+    for item in lds.get_data_from_url() or []:
+        dataset = Dataset.from_api_dict(item)
+        if dataset.is_archived or not dataset.slug:
+            continue
+        if not _matches(topics, dataset.topics) or not _matches(publishers, [dataset.publisher], substring=True):
+            continue
+        selected.extend((dataset, r) for r in dataset.resources if _matches(formats, [r.format]))
+    return selected
+
+
+def _entries(lds: "LondonDataStore", selected: list[tuple[Dataset, Resource]]) -> list[MirrorEntry]:
+    """Manifest entries for the selected resources, laid out as ``<slug>/<file name>``.
+
+    Resources of one dataset that share a file name go in ``<slug>/<resource key>/``.
+    """
+    names = Counter((dataset.slug, _filename(resource.url)) for dataset, resource in selected)
+    entries = []
+    for dataset, resource in selected:
+        name = _filename(resource.url)
+        parts = [dataset.slug, name] if names[dataset.slug, name] == 1 else [dataset.slug, resource.key, name]
+        entries.append(
+            MirrorEntry(
+                slug=dataset.slug,
+                resource_key=resource.key,
+                format=resource.format,
+                url=lds.get_resource_download_url(dataset.slug, resource),
+                path="/".join(parts),
+                check_hash=resource.check_hash,
+                check_timestamp=resource.check_timestamp,
+                size=resource.check_size,
+            )
+        )
+    return entries
+
+
+def _filename(url: str) -> str:
+    return urlsplit(url).path.split("/")[-1] or "download"
+
+
+def _mirror_path(target: Path, relative: str) -> Path | None:
+    """``target / relative``, or None if it resolves to ``target`` itself or anywhere outside it.
+
+    Catalogue slugs and file names, and manifest paths, are not trusted: an
+    absolute path or ``..`` must not write or delete files beyond the mirror.
+    """
+    path = target / relative
+    resolved, root = path.resolve(), target.resolve()
+    if resolved == root or not resolved.is_relative_to(root):
+        return None
+    return path
+
+
+def _is_current(entry: MirrorEntry, recorded: MirrorEntry, target: Path) -> bool:
+    """Whether the mirrored copy ``recorded`` still matches the catalogue's ``entry``.
+
+    The catalogue hash decides when both sides have one; the check timestamp is
+    used only without a hash, since the catalogue refreshes it on every check.
+    """
+    if entry.path != recorded.path or entry.url != recorded.url:
+        return False
+    if entry.check_hash and recorded.check_hash:
+        if entry.check_hash != recorded.check_hash:
+            return False
+    elif entry.check_timestamp != recorded.check_timestamp:
+        return False
+    path = _mirror_path(target, recorded.path)
+    if path is None:
+        return False
+    try:
+        size = path.stat().st_size
+    except OSError:
+        return False
+    return recorded.size is None or size == recorded.size
+
+
+def plan_mirror(
+    lds: "LondonDataStore",
+    target: str | Path,
+    *,
+    topics: Iterable[str] | None = None,
+    formats: Iterable[str] | None = None,
+    publishers: Iterable[str] | None = None,
+    manifest: Manifest | None = None,
+) -> MirrorPlan:
+    """Diff the selected resources against the mirror's manifest.
+
+    Resources not in the manifest are new; those whose hash (or, without one,
+    check timestamp) or download URL differ, or whose local file is missing or
+    altered, are changed. Manifest entries outside the selection are removed,
+    whether they left the catalogue or no longer pass the filters. Resources whose
+    slug or file name would place them outside ``target`` are skipped.
+    """
+    target = Path(target)
+    manifest = manifest if manifest is not None else Manifest(target)
+    plan = MirrorPlan(target=target)
+    seen = set()
+    for entry in _entries(lds, select_resources(lds, topics=topics, formats=formats, publishers=publishers)):
+        seen.add(entry.key)
+        if _mirror_path(target, entry.path) is None:
+            _bl.warning(f"Skipping {entry.key}: path {entry.path!r} is outside {target}")
+            continue
+        recorded = manifest.entries.get(entry.key)
+        if recorded is None:
+            plan.new.append(entry)
+        elif _is_current(entry, recorded, target):
+            plan.unchanged.append(recorded)
+        else:
+            plan.changed.append(entry)
+    plan.removed = [entry for key, entry in manifest.entries.items() if key not in seen]
+    return plan
+
+
+def _remove_file(target: Path, relative: str) -> None:
+    """Delete a mirrored file and any directories it leaves empty below ``target``.
+
+    Paths that lead outside ``target`` are left alone.
+    """
+    path = _mirror_path(target, relative)
+    if path is None:
+        _bl.warning(f"Not removing {relative!r}: it is outside {target}")
+        return
+    path.unlink(missing_ok=True)
+    parent = path.parent
+    while parent != target and target in parent.parents:
+        try:
+            parent.rmdir()
+        except OSError:
+            break
+        parent = parent.parent
+
+
+def mirror(
+    lds: "LondonDataStore",
+    target: str | Path,
+    *,
+    topics: Iterable[str] | None = None,
+    formats: Iterable[str] | None = None,
+    publishers: Iterable[str] | None = None,
+    workers: int = 4,
+    prune: bool = False,
+    dry_run: bool = False,
+    verify_integrity: bool = True,
+    checkpoint_every: int = 25,
+    progress_callback: Callable[[int, int], None] | None = None,
+) -> MirrorResult:
+    """Bring a local mirror of the selected resources up to date.
+
+    Only new and changed resources (see :func:`plan_mirror`) are downloaded, on
+    ``workers`` threads in the bulk rate-limit lane, largest and smallest
+    interleaved. Each file is verified against the catalogue and moved into place
+    atomically; the manifest is saved every ``checkpoint_every`` downloads and at
+    the end, so an interrupted run resumes where it stopped. Against an unchanged
+    catalogue a run makes no requests beyond the (cached) catalogue itself.
+
+    Args:
+        lds: The client to download with.
+        target: The mirror directory.
+        topics: Keep datasets with any of these topics.
+        formats: Keep resources in any of these formats (e.g. ``["csv", "geojson"]``).
+        publishers: Keep datasets whose publisher contains any of these.
+        workers: Downloads run at once.
+        prune: Delete mirrored files that are no longer selected.
+        dry_run: Only plan; download and delete nothing.
+        verify_integrity: Check each download against the catalogue size and hash.
+        checkpoint_every: Downloads between manifest saves.
+        progress_callback: Called with ``(finished, total)`` after each download.
+
+    Raises:
+        InsufficientSpaceError: If the new and changed files do not fit on disk.
+    """
+    if workers < 1:
+        raise ValueError(f"'workers' must be at least 1, got: {workers!r}")
+    start = time.monotonic()
+    target = Path(target)
+    manifest = Manifest(target)
+    plan = plan_mirror(lds, target, topics=topics, formats=formats, publishers=publishers, manifest=manifest)
+    result = MirrorResult(plan=plan)
+    if dry_run:
+        result.elapsed = time.monotonic() - start
+        return result
+
+    fetch = {entry.key: entry for entry in plan.to_fetch}
+    planned = order_downloads(
+        PlannedDownload(e.slug, e.resource_key, e.format, e.url, target / e.path, e.size) for e in fetch.values()
+    )
+    required, free = check_free_space(
+        {item.destination: max((item.expected_size or 0) - _reclaimed_bytes(item.destination), 0) for item in planned}
+    )
+    for fs, needed in required.items():
+        if needed > free.get(fs, 0):
+            raise InsufficientSpaceError(
+                f"Not enough space on {fs} to mirror {len(planned)} resources: need {needed} bytes, "
+                f"{free.get(fs, 0)} bytes free"
+            )
+
+    def fetch_one(entry: MirrorEntry) -> MirrorEntry:
+        destination = target / entry.path
+        with rate_limit_priority(Priority.BULK):
+            lds.download(
+                entry.slug, destination=destination, resource_key=entry.resource_key, verify_integrity=verify_integrity
+            )
+        return replace(
+            entry, size=destination.stat().st_size, mirrored_at=datetime.now(UTC).isoformat(timespec="seconds")
+        )
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lds-mirror") as pool:
+            futures = {pool.submit(fetch_one, fetch[f"{item.slug}/{item.resource_key}"]): item for item in planned}
+            for done, future in enumerate(as_completed(futures), 1):
+                item = futures[future]
+                key = f"{item.slug}/{item.resource_key}"
+                try:
+                    entry = future.result()
+                except (LondonDataStoreError, OSError) as e:
+                    _bl.warning(f"Failed to mirror {key}: {e}")
+                    result.failed[key] = str(e)
+                else:
+                    previous = manifest.entries.get(key)
+                    if previous is not None and previous.path != entry.path:
+                        _remove_file(target, previous.path)
+                    manifest.put(entry)
+                    result.downloaded.append(entry)
+                    if len(result.downloaded) % checkpoint_every == 0:
+                        manifest.save()
+                if progress_callback:
+                    progress_callback(done, len(planned))
+
+        if prune:
+            for entry in plan.removed:
+                with contextlib.suppress(OSError):
+                    _remove_file(target, entry.path)
+                manifest.remove(entry.key)
+                result.pruned.append(entry)
+    finally:
+        if result.downloaded or result.pruned or not os.path.exists(manifest.path):
+            manifest.save()
+
+    result.elapsed = time.monotonic() - start
+    summary = result.summary()
+    _bl.info(
+        f"Mirrored {target}: {summary['downloaded']} downloaded, {summary['unchanged']} unchanged, "
+        f"{summary['failed']} failed, {summary['pruned']} pruned in {result.elapsed:.1f}s"
+    )
+    return result
@@ -0,0 +1,246 @@
+"""Disk-space preflight and size-aware ordering for multi-resource downloads."""
+
+import shutil
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from .exceptions import InsufficientSpaceError
+from .utils.logging_helper import BasicLogger
+
+if TYPE_CHECKING:
+    from .api import LondonDataStore
+
+_bl = BasicLogger(verbose=False, log_directory=None, logger_name="PLANNER")
+
+ORDERS = ("interleave", "shortest-first", "largest-first", "as-given")
+
+
+@dataclass
+class PlannedDownload:
+    """One resource in a :class:`DownloadPlan`."""
+
+    slug: str
+    resource_key: str
+    format: str
+    url: str
+    destination: Path
+    expected_size: int | None
+
+
+@dataclass
+class DownloadPlan:
+    """The ordered downloads of a bulk run and whether they fit on disk.
+
+    ``required_bytes`` is the known total plus the safety margin, compared with
+    the free space of each destination filesystem in ``free_bytes``.
+    """
+
+    items: list[PlannedDownload]
+    order: str
+    total_bytes: int
+    unknown_sizes: int
+    required_bytes: dict[str, int] = field(default_factory=dict)
+    free_bytes: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def fits(self) -> bool:
+        return all(self.required_bytes[fs] <= self.free_bytes.get(fs, 0) for fs in self.required_bytes)
+
+    def check(self) -> None:
+        """Raise if a destination filesystem is short of space.
+
+        Raises:
+            InsufficientSpaceError: Naming the filesystem, the space needed and available.
+        """
+        for fs, required in self.required_bytes.items():
+            free = self.free_bytes.get(fs, 0)
+            if required > free:
+                raise InsufficientSpaceError(
+                    f"Not enough space on {fs}: need {required} bytes for {len(self.items)} downloads, "
+                    f"{free} bytes free"
+                )
+
+    def to_dict(self) -> dict:
+        return {
+            "order": self.order,
+            "total_bytes": self.total_bytes,
+            "unknown_sizes": self.unknown_sizes,
+            "required_bytes": self.required_bytes,
+            "free_bytes": self.free_bytes,
+            "fits": self.fits,
+            "items": [{**asdict(item), "destination": str(item.destination)} for item in self.items],
+        }
+
+
+def order_downloads(items: Iterable[PlannedDownload], order: str = "interleave") -> list[PlannedDownload]:
+    """Order downloads by expected size.
+
+    ``"interleave"`` alternates largest and smallest, so the long transfers start
+    early and keep the link busy while small files finish steadily alongside them.
+    ``"shortest-first"`` minimises time to first results; ``"largest-first"`` the
+    makespan when running several in parallel. Unknown sizes always go last.
+    """
+    if order not in ORDERS:
+        raise ValueError(f"'order' must be one of {ORDERS}, got: {order!r}")
+    items = list(items)
+    if order == "as-given":
+        return items
+
+    known = [item for item in items if item.expected_size is not None]
+    unknown = [item for item in items if item.expected_size is None]
+    known.sort(key=lambda item: item.expected_size, reverse=order != "shortest-first")
+    if order == "interleave":
+        ordered = []
+        low, high = 0, len(known) - 1
+        while low <= high:
+            ordered.append(known[low])
+            if low != high:
+                ordered.append(known[high])
+            low, high = low + 1, high - 1
+        known = ordered
+    return known + unknown
+
+
+def _existing_ancestor(path: Path) -> Path:
+    path = path.absolute()
+    while not path.exists() and path != path.parent:
+        path = path.parent
+    return path
+
+
+def check_free_space(
+    requirements: Mapping[Path, int], *, margin: float = 0.05
+) -> tuple[dict[str, int], dict[str, int]]:
+    """Total the bytes needed per filesystem and look up the space free on each.
+
+    Args:
+        requirements: Bytes to be written under each destination path.
+        margin: Extra fraction of the total to require as headroom.
+
+    Returns:
+        ``(required_bytes, free_bytes)``, each keyed by the filesystem's mount point.
+    """
+    required: dict[str, int] = {}
+    free: dict[str, int] = {}
+    devices: dict[int, str] = {}
+    for path, size in requirements.items():
+        existing = _existing_ancestor(Path(path))
+        device = existing.stat().st_dev
+        if device not in devices:
+            mount = existing
+            while mount != mount.parent and mount.parent.stat().st_dev == device:
+                mount = mount.parent
+            devices[device] = str(mount)
+            free[str(mount)] = shutil.disk_usage(existing).free
+        fs = devices[device]
+        required[fs] = required.get(fs, 0) + size
+    return {fs: int(total * (1 + margin)) for fs, total in required.items()}, free
+
+
+def layout_paths(destination: str | Path, files: Iterable[tuple[str, str, str]]) -> list[Path]:
+    """Output paths under ``destination`` for ``(slug, resource key, file name)`` triples.
+
+    Each file goes to ``destination/<file name>``. Names shared by several datasets
+    go in ``destination/<slug>/`` instead, and names shared within one dataset in
+    ``destination/<slug>/<resource key>/``, as in a mirror. A resource listed twice
+    gets the same path both times.
+    """
+    destination = Path(destination)
+    files = list(files)
+    distinct = set(files)
+    names = Counter(name for _, _, name in distinct)
+    names_in_slug = Counter((slug, name) for slug, _, name in distinct)
+    paths = []
+    for slug, key, name in files:
+        if names[name] == 1:
+            paths.append(destination / name)
+        elif names_in_slug[slug, name] == 1:
+            paths.append(destination / slug / name)
+        else:
+            paths.append(destination / slug / key / name)
+    return paths
+
+
+def _reclaimed_bytes(destination: Path) -> int:
+    """Bytes freed when an existing destination is replaced."""
+    try:
+        st = destination.stat()
+    except OSError:
+        return 0
+    # A hardlinked copy (e.g. from the resource store) frees nothing
+    return st.st_size if st.st_nlink == 1 else 0
+
+
+def plan_downloads(
+    lds: "LondonDataStore",
+    resources: Iterable[tuple[str, str | None, str | None]],
+    destination: str | Path = ".",
+    *,
+    order: str = "interleave",
+    margin: float = 0.05,
+) -> DownloadPlan:
+    """Resolve a set of downloads, order them and check they fit on disk.
+
+    Files are laid out by :func:`layout_paths`, so resources that share a file
+    name do not overwrite each other.
+
+    Files already at their destination are counted net of the space they free
+    when replaced. The plan is returned even when it does not fit; call
+    :meth:`DownloadPlan.check` to fail fast.
+
+    Args:
+        lds: The client used to resolve resources.
+        resources: ``(slug, format, resource_key)`` triples; format and key may be None.
+        destination: Directory the files are downloaded into.
+        order: One of ``ORDERS`` (see :func:`order_downloads`).
+        margin: Extra fraction of the total required as headroom.
+
+    Raises:
+        DatasetNotFoundError: If a slug or resource key is not found.
+        FormatNotAvailableError: If a format is not found for a slug.
+    """
+    destination = Path(destination)
+    resolved = []
+    for slug, format, resource_key in resources:
+        resource = lds.get_resource(slug, format, resource_key=resource_key)
+        url = lds.get_resource_download_url(slug, resource)
+        resolved.append((slug, resource, url, urlsplit(url).path.split("/")[-1] or "download"))
+
+    paths = layout_paths(destination, [(slug, resource.key, name) for slug, resource, _, name in resolved])
+    items = []
+    for (slug, resource, url, _), path in zip(resolved, paths, strict=True):
+        items.append(
+            PlannedDownload(
+                slug=slug,
+                resource_key=resource.key,
+                format=resource.format,
+                url=url,
+                destination=path,
+                expected_size=resource.check_size,
+            )
+        )
+
+    # Summed per item, so a resource listed twice is not under-counted
+    needed: dict[Path, int] = {}
+    for item in items:
+        needed[item.destination] = needed.get(item.destination, 0) + max(
+            (item.expected_size or 0) - _reclaimed_bytes(item.destination), 0
+        )
+    required, free = check_free_space(needed, margin=margin)
+    plan = DownloadPlan(
+        items=order_downloads(items, order),
+        order=order,
+        total_bytes=sum(item.expected_size or 0 for item in items),
+        unknown_sizes=sum(1 for item in items if item.expected_size is None),
+        required_bytes=required,
+        free_bytes=free,
+    )
+    if plan.unknown_sizes:
+        _bl.warning(f"{plan.unknown_sizes} of {len(items)} resources have no catalogue size; space check is partial")
+    if not plan.fits:
+        _bl.warning(f"Planned downloads do not fit: need {required}, free {free}")
+    return plan
@@ -0,0 +1,157 @@
+"""Previews of resources from the first few kilobytes of their content."""
+
+import json
+import re
+from dataclasses import asdict, dataclass, field
+
+import requests
+
+from .exceptions import DownloadError
+from .streaming import CsvRowParser
+
+DEFAULT_PREVIEW_BYTES = 64 * 1024
+
+_JSON_FORMATS = {"json", "geojson"}
+_TEXT_FORMATS = {"txt", "text", "md", "xml", "html", "tsv"}
+_FEATURES = re.compile(r'"features"\s*:\s*\[')
+
+
+@dataclass
+class Preview:
+    """The header and first rows of a resource, parsed from a prefix of its content.
+
+    ``columns`` and ``rows`` are filled for CSV and JSON/GeoJSON resources (for
+    GeoJSON, rows are feature properties plus the geometry type); other text formats
+    only get ``text``. ``complete`` is True when the prefix was the whole file.
+    """
+
+    slug: str
+    resource_key: str
+    format: str
+    url: str
+    bytes_read: int
+    complete: bool
+    columns: list[str] = field(default_factory=list)
+    rows: list[dict] = field(default_factory=list)
+    text: str | None = None
+    from_cache: bool = False
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def fetch_prefix(
+    session: requests.Session, url: str, max_bytes: int = DEFAULT_PREVIEW_BYTES, *, timeout: float = 30
+) -> tuple[bytes, bool]:
+    """Fetch up to ``max_bytes`` from the start of ``url``.
+
+    A Range request is tried first; a server that ignores it and sends the whole
+    body is read only up to ``max_bytes`` before the connection is dropped.
+
+    Returns:
+        ``(prefix, complete)``, where ``complete`` means the prefix is the whole body.
+
+    Raises:
+        DownloadError: On HTTP errors.
+    """
+    try:
+        response = session.get(url, headers={"Range": f"bytes=0-{max_bytes - 1}"}, stream=True, timeout=timeout)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        raise DownloadError(f"Failed to preview {url}: {e}") from e
+
+    chunks = []
+    received = 0
+    complete = True
+    try:
+        for chunk in response.iter_content(chunk_size=min(max_bytes, 16 * 1024)):
+            chunks.append(chunk)
+            received += len(chunk)
+            if received >= max_bytes:
+                complete = False
+                break
+    except requests.RequestException as e:
+        raise DownloadError(f"Failed to preview {url}: {e}") from e
+    finally:
+        response.close()
+
+    data = b"".join(chunks)[:max_bytes]
+    if response.status_code == 206:
+        total = response.headers.get("content-range", "").rpartition("/")[2]
+        complete = total.isdigit() and int(total) <= len(data)
+    return data, complete
+
+
+def _csv_preview(data: bytes, complete: bool, rows: int, encoding: str) -> tuple[list[str], list[dict]]:
+    parser = CsvRowParser(encoding=encoding)
+    parsed = parser.feed(data)
+    if complete:
+        parsed += parser.close()
+    return parser.fieldnames or [], parsed[:rows]
+
+
+def _json_items(text: str, complete: bool) -> list:
+    """Decode the items of a JSON array or GeoJSON feature list, stopping at the first incomplete one."""
+    if complete:
+        try:
+            document = json.loads(text)
+        except json.JSONDecodeError:
+            document = None
+        if isinstance(document, dict) and isinstance(document.get("features"), list):
+            return document["features"]
+        if document is not None:
+            return document if isinstance(document, list) else [document]
+
+    match = _FEATURES.search(text)
+    if match:
+        pos = match.end()
+    elif text.lstrip().startswith("["):
+        pos = text.index("[") + 1
+    else:
+        return []
+    decoder = json.JSONDecoder()
+    items = []
+    while True:
+        while pos < len(text) and text[pos] in " \t\r\n,":
+            pos += 1
+        if pos >= len(text) or text[pos] == "]":
+            return items
+        try:
+            item, pos = decoder.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            return items
+        items.append(item)
+
+
+def _json_preview(data: bytes, complete: bool, rows: int, encoding: str) -> tuple[list[str], list[dict]]:
+    text = data.decode(encoding, errors="ignore")
+    records = []
+    for item in _json_items(text, complete)[:rows]:
+        if isinstance(item, dict) and item.get("type") == "Feature":
+            geometry = item.get("geometry") or {}
+            item = {**(item.get("properties") or {}), "geometry": geometry.get("type")}
+        records.append(item if isinstance(item, dict) else {"value": item})
+    columns = list(dict.fromkeys(key for record in records for key in record))
+    return columns, records
+
+
+def parse_preview(
+    data: bytes, format: str, *, complete: bool, rows: int = 10, encoding: str = "utf-8-sig"
+) -> tuple[list[str], list[dict], str | None]:
+    """Parse a content prefix into ``(columns, rows, text)`` according to ``format``.
+
+    Only whole records are returned: a row cut off by the end of the prefix is dropped.
+    """
+    format = format.lower()
+    if format == "csv":
+        columns, records = _csv_preview(data, complete, rows, encoding)
+        return columns, records, None
+    if format in _JSON_FORMATS:
+        columns, records = _json_preview(data, complete, rows, encoding)
+        return columns, records, None
+    if format in _TEXT_FORMATS:
+        lines = data.decode(encoding, errors="replace").splitlines()
+        if not complete:
+            lines = lines[:-1]
+        return [], [], "\n".join(lines[:rows])
+    return [], [], None
@@ -0,0 +1,267 @@
+"""Throttled and aggregated download progress reporting."""
+
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TextIO
+
+ProgressCallback = Callable[[int, int | None], None]
+
+
+class ThrottledProgress:
+    """Forward ``(bytes_downloaded, total_bytes)`` updates at most once per interval.
+
+    An update is forwarded when at least ``interval`` seconds or ``min_bytes`` bytes
+    have passed since the last forwarded one, and always when the download reaches
+    its known total. Call :meth:`flush` at the end of a download of unknown size to
+    forward the last update. Safe to call from several threads.
+
+    Args:
+        callback: The callback to forward updates to.
+        interval: Minimum seconds between forwarded updates.
+        min_bytes: Also forward once this many bytes have arrived since the last update.
+        clock: Monotonic time source (for tests).
+    """
+
+    def __init__(
+        self,
+        callback: ProgressCallback,
+        *,
+        interval: float = 0.1,
+        min_bytes: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._callback = callback
+        self._interval = interval
+        self._min_bytes = min_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_time: float | None = None
+        self._last_bytes = 0
+        self._pending: tuple[int, int | None] | None = None
+
+    def __call__(self, downloaded: int, total: int | None) -> None:
+        with self._lock:
+            now = self._clock()
+            due = (
+                self._last_time is None
+                or (total is not None and downloaded >= total)
+                or now - self._last_time >= self._interval
+                or (self._min_bytes is not None and downloaded - self._last_bytes >= self._min_bytes)
+            )
+            if not due:
+                self._pending = (downloaded, total)
+                return
+            self._last_time, self._last_bytes, self._pending = now, downloaded, None
+        self._callback(downloaded, total)
+
+    def flush(self) -> None:
+        """Forward the most recent update if it was held back."""
+        with self._lock:
+            pending, self._pending = self._pending, None
+            if pending is not None:
+                self._last_time, self._last_bytes = self._clock(), pending[0]
+        if pending is not None:
+            self._callback(*pending)
+
+
+def throttle(
+    callback: ProgressCallback | None, interval: float, min_bytes: int | None = None
+) -> ThrottledProgress | None:
+    """Wrap ``callback`` in a ThrottledProgress unless it is None, already throttled, or interval is 0."""
+    if callback is None or isinstance(callback, ThrottledProgress) or (interval <= 0 and min_bytes is None):
+        return callback
+    return ThrottledProgress(callback, interval=interval, min_bytes=min_bytes)
+
+
+@dataclass
+class ItemProgress:
+    """Progress of one download within a :class:`ProgressSnapshot`."""
+
+    name: str
+    bytes_done: int
+    total: int | None
+    rate: float
+    eta: float | None
+    state: str
+
+
+@dataclass
+class ProgressSnapshot:
+    """Point-in-time view of every tracked download and their sum."""
+
+    items: list[ItemProgress] = field(default_factory=list)
+    bytes_done: int = 0
+    total: int | None = None
+    rate: float = 0.0
+    eta: float | None = None
+    elapsed: float = 0.0
+
+    @property
+    def active(self) -> int:
+        return sum(1 for item in self.items if item.state == "active")
+
+    @property
+    def finished(self) -> int:
+        return sum(1 for item in self.items if item.state != "active")
+
+
+class _Tracked:
+    __slots__ = ("name", "bytes_done", "total", "state", "samples")
+
+    def __init__(self, name: str, total: int | None, now: float):
+        self.name = name
+        self.bytes_done = 0
+        self.total = total
+        self.state = "active"
+        self.samples: deque[tuple[float, int]] = deque([(now, 0)])
+
+
+def _windowed_rate(samples: deque[tuple[float, int]], now: float, bytes_done: int) -> float:
+    start_time, start_bytes = samples[0]
+    elapsed = now - start_time
+    return (bytes_done - start_bytes) / elapsed if elapsed > 0 else 0.0
+
+
+class ProgressAggregator:
+    """Combine progress from many concurrent downloads into one snapshot.
+
+    Each download gets its own callback from :meth:`track`; callbacks only record
+    numbers, so they are cheap enough to call per chunk from any thread. Rates are
+    averaged over the last ``rate_window`` seconds.
+
+    Args:
+        rate_window: Seconds of history used for transfer rates.
+        clock: Monotonic time source (for tests).
+    """
+
+    def __init__(self, *, rate_window: float = 5.0, clock: Callable[[], float] = time.monotonic):
+        self._rate_window = rate_window
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._items: dict[str, _Tracked] = {}
+        self._started = clock()
+
+    def track(self, name: str, total: int | None = None) -> ProgressCallback:
+        """Start tracking a download and return its ``(bytes_downloaded, total_bytes)`` callback."""
+        with self._lock:
+            self._items[name] = _Tracked(name, total, self._clock())
+
+        def callback(downloaded: int, total: int | None) -> None:
+            self.update(name, downloaded, total)
+
+        return callback
+
+    def update(self, name: str, downloaded: int, total: int | None = None) -> None:
+        with self._lock:
+            item = self._items.get(name)
+            if item is None:
+                item = self._items[name] = _Tracked(name, total, self._clock())
+            now = self._clock()
+            item.bytes_done = downloaded
+            if total is not None:
+                item.total = total
+            item.samples.append((now, downloaded))
+            while len(item.samples) > 2 and now - item.samples[1][0] >= self._rate_window:
+                item.samples.popleft()
+
+    def finish(self, name: str, state: str = "done") -> None:
+        """Mark a download as no longer active (``state`` is e.g. ``"done"`` or ``"failed"``)."""
+        with self._lock:
+            if name in self._items:
+                self._items[name].state = state
+
+    def snapshot(self) -> ProgressSnapshot:
+        with self._lock:
+            now = self._clock()
+            items = []
+            for tracked in self._items.values():
+                active = tracked.state == "active"
+                rate = _windowed_rate(tracked.samples, now, tracked.bytes_done) if active else 0.0
+                remaining = None if tracked.total is None else max(tracked.total - tracked.bytes_done, 0)
+                eta = remaining / rate if remaining is not None and rate > 0 and active else None
+                items.append(ItemProgress(tracked.name, tracked.bytes_done, tracked.total, rate, eta, tracked.state))
+
+        bytes_done = sum(item.bytes_done for item in items)
+        totals = [item.total for item in items]
+        total = sum(totals) if items and None not in totals else None
+        rate = sum(item.rate for item in items)
+        eta = (total - bytes_done) / rate if total is not None and rate > 0 else None
+        return ProgressSnapshot(
+            items=items, bytes_done=bytes_done, total=total, rate=rate, eta=eta, elapsed=now - self._started
+        )
+
+
+def format_bytes(n: float) -> str:
+    """Format a byte count with a binary unit, e.g. ``'1.5 MB'``."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(n) < 1024 or unit == "GB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GB"
+
+
+def _format_eta(seconds: float | None) -> str:
+    if seconds is None:
+        return "--:--"
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes}:{secs:02d}"
+
+
+def format_snapshot(snapshot: ProgressSnapshot) -> str:
+    """Render a snapshot as one status line."""
+    done = format_bytes(snapshot.bytes_done)
+    if snapshot.total:
+        pct = snapshot.bytes_done / snapshot.total * 100
+        amount = f"{done} / {format_bytes(snapshot.total)} ({pct:.1f}%)"
+    else:
+        amount = done
+    line = f"{amount}  {format_bytes(snapshot.rate)}/s  ETA {_format_eta(snapshot.eta)}"
+    if len(snapshot.items) > 1:
+        line = f"[{snapshot.finished}/{len(snapshot.items)} files]  {line}"
+    return line
+
+
+class ProgressRenderer:
+    """Redraw an aggregator's snapshot on one terminal line every ``refresh`` seconds.
+
+    Rendering happens on a background thread, independent of how often downloads
+    report progress. Use as a context manager; the final state is drawn on exit.
+
+    Args:
+        aggregator: The aggregator to render.
+        refresh: Seconds between redraws.
+        stream: Where to draw. Defaults to stdout.
+    """
+
+    def __init__(self, aggregator: ProgressAggregator, *, refresh: float = 0.5, stream: TextIO | None = None):
+        self._aggregator = aggregator
+        self._refresh = refresh
+        self._stream = stream
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="lds-progress", daemon=True)
+        self._width = 0
+
+    def __enter__(self) -> "ProgressRenderer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.render()
+        print(file=self._stream or sys.stdout, flush=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._refresh):
+            self.render()
+
+    def render(self) -> None:
+        line = format_snapshot(self._aggregator.snapshot())
+        padding = " " * max(self._width - len(line), 0)
+        self._width = len(line)
+        print(f"\r  {line}{padding}", end="", file=self._stream or sys.stdout, flush=True)
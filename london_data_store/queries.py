@@ -0,0 +1,119 @@
+"""Catalogue queries shared by the sync and async clients.
+
+Plain functions of the catalogue JSON with no client state, so the async client
+can run the CPU-heavy ones (fuzzy scoring, stemming) in an executor.
+"""
+
+import datetime
+import functools
+import re
+from itertools import chain
+from urllib.parse import urlsplit
+
+from .utils.logging_helper import BasicLogger
+from .utils.strings_and_lists import ListOperations
+
+_bl = BasicLogger(verbose=False, log_directory=None, logger_name="QUERIES")
+
+_stemmer = None
+
+
+def _get_stemmer():
+    global _stemmer
+    if _stemmer is None:
+        from nltk.stem.snowball import SnowballStemmer
+
+        _stemmer = SnowballStemmer("english")
+    return _stemmer
+
+
+@functools.lru_cache(maxsize=65536)
+def _stem(word: str) -> str:
+    # Tags repeat across thousands of datasets, so each is stemmed once
+    return _get_stemmer().stem(word)
+
+
+def score_strings(candidates: list[str], term: str, limit: int) -> list[tuple[str, float]]:
+    """Score ``candidates`` against ``term`` with SequenceMatcher, best first."""
+    return ListOperations(candidates, search_string=term).search_list_with_scores()[:limit]
+
+
+def search_list_for_string(search_list: list[str], search_string: str) -> list[str] | None:
+    """Entries of ``search_list`` matching by stem, else by similarity of at least 0.5; None if neither."""
+    list_ops = ListOperations(search_list, search_string=search_string)
+
+    filtered = list_ops.search_list_by_snowball()
+    if filtered:
+        return filtered
+    filtered = list_ops.search_list_by_string_for_metric(0.5)
+    return filtered or None
+
+
+def filter_for_keyword(data: list[dict], required: str, keyword: str) -> list:
+    """The ``required`` field of every dataset with a tag containing a stem of ``keyword``."""
+    search_terms = [_stem(x) for x in re.sub("[-_]", " ", keyword.strip().lower()).split(" ")]
+    return [
+        x.get(required)
+        for x in data
+        if any(word in y for y in [_stem(z) for z in x.get("tags")] for word in search_terms)
+    ]
+
+
+def slugs_for_titles(data: list[dict], titles: list[str]) -> list[tuple[str, str, str]] | None:
+    """(title, slug, date) for each of ``titles``, dated by updatedAt or else createdAt."""
+    title_to_info = {
+        x.get("title", "").strip(): (x.get("slug"), x.get("updatedAt") or x.get("createdAt") or "") for x in data
+    }
+    results = []
+    for title in titles:
+        if title in title_to_info:
+            slug, date = title_to_info[title]
+            results.append((title, slug, date))
+    return results or None
+
+
+def download_urls_for_slug(data: list[dict], base_url: str, slug: str, get_description: bool = False) -> list[str]:
+    """Portal download URLs of every resource of ``slug``, logging how long ago it was updated."""
+    urls = []
+    for y in data:
+        if y.get("slug") == slug:
+            date = datetime.datetime.strftime(datetime.datetime.fromisoformat(y.get("updatedAt")), "%d %B %Y")
+            data_time = datetime.datetime.fromisoformat(y.get("updatedAt"))
+            tzinfo = data_time.tzinfo
+            diff = datetime.datetime.now(tz=tzinfo) - data_time
+            days = diff.days
+            months = days // 30
+            years = days // 365
+
+            updated_at = []
+            if days <= 30:
+                updated_at.append(f"{days} days")
+            elif months <= 12:
+                updated_at.append(f"{months} months")
+            else:
+                updated_at.append(f"{years} years")
+            _bl.info(f"The data was last updated '{updated_at[0]}' ago on '{date}'")
+
+            if get_description:
+                _bl.info(y.get("description"))
+            for key, value in y.get("resources").items():
+                urls.append(
+                    f"{base_url}/download/{y.get('slug')}/{key}/{urlsplit(value.get('url')).path.split('/')[-1]}"
+                )
+    _bl.info(f"{len(urls)} urls have been found. Choose relevant url.")
+    return urls
+
+
+def all_formats(data: list[dict]) -> list[str]:
+    """The distinct resource formats in the catalogue; empty if it is malformed."""
+    try:
+        return list(
+            set(chain.from_iterable([value.get("format") for value in x.get("resources").values()] for x in data))
+        )
+    except (AttributeError, TypeError):
+        return []
+
+
+def slugs_for_format(data: list[dict], req_format: str) -> list[str]:
+    """Slugs of the datasets with a resource in ``req_format``."""
+    return [y.get("slug") for y in data if req_format in [x.get("format") for x in y.get("resources").values()]]
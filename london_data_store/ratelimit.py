@@ -0,0 +1,273 @@
+"""Per-host token-bucket rate limiting with priority lanes and Retry-After support."""
+
+import asyncio
+import contextlib
+import contextvars
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .utils.logging_helper import BasicLogger
+
+_bl = BasicLogger(verbose=False, log_directory=None, logger_name="RATELIMIT")
+
+# Statuses whose Retry-After tells every caller to back off, not just this one
+_THROTTLE_STATUSES = (429, 503)
+
+
+class Priority(IntEnum):
+    """Rate-limit lanes. Lower values may use more of each bucket."""
+
+    HIGH = 0  # catalogue fetches
+    NORMAL = 1  # interactive downloads
+    BULK = 2  # queued and mirrored downloads
+
+
+_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar("lds_rate_limit_priority", default=Priority.NORMAL)
+
+
+@contextlib.contextmanager
+def rate_limit_priority(priority: Priority) -> Iterator[None]:
+    """Run the enclosed requests in ``priority``'s lane (per thread or task)."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> Priority:
+    return _priority.get()
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max((when - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+class TokenBucket:
+    """A token bucket that lets callers run into debt for requests larger than the burst.
+
+    Tokens refill at ``rate`` per second up to ``capacity``. A caller may take tokens
+    while the level stays at or above its lane's floor. Requests larger than the
+    bucket wait for it to fill and then leave it in debt, so a 1 MiB chunk against a
+    100 KB/s bucket delays the *next* call rather than never fitting. Lower-priority
+    lanes have a higher floor, which keeps headroom free for higher-priority callers.
+
+    Args:
+        rate: Tokens added per second.
+        capacity: Maximum tokens held. Defaults to one second's worth.
+        reserve: Fraction of ``capacity`` held back per priority step: the floor of
+            lane ``p`` is ``p * reserve * capacity``.
+        clock: Monotonic time source (for tests).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        *,
+        reserve: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError(f"'rate' must be positive, got: {rate!r}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._reserve = reserve
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_take(self, amount: float, priority: Priority = Priority.NORMAL) -> float:
+        """Take ``amount`` tokens if the lane allows it now; else return the seconds to wait.
+
+        Not thread-safe on its own; :class:`RateLimiter` serialises access.
+        """
+        now = self._clock()
+        self._refill(now)
+        floor = min(int(priority) * self._reserve, 0.9) * self.capacity
+        # Oversized requests only wait for a full bucket, then go into debt
+        needed = floor + min(amount, self.capacity - floor)
+        if self._tokens >= needed:
+            self._tokens -= amount
+            return 0.0
+        return (needed - self._tokens) / self.rate
+
+
+class _HostState:
+    __slots__ = ("requests", "bytes", "blocked_until", "strikes")
+
+    def __init__(self, requests_bucket: TokenBucket | None, bytes_bucket: TokenBucket | None):
+        self.requests = requests_bucket
+        self.bytes = bytes_bucket
+        self.blocked_until = 0.0
+        self.strikes = 0
+
+
+class RateLimiter:
+    """Shared request-rate and bandwidth limits, one pair of token buckets per host.
+
+    One limiter can be shared by several clients, threads and event loops; blocking
+    (:meth:`acquire_request`, :meth:`acquire_bytes`) and async (:meth:`aacquire_request`,
+    :meth:`aacquire_bytes`) callers draw from the same buckets. A host that answers
+    ``429`` or ``503`` is paused for everyone for its ``Retry-After`` (or an
+    exponentially growing pause when the header is missing).
+
+    The lane is taken from :func:`rate_limit_priority` unless passed explicitly.
+
+    Args:
+        requests_per_second: Request rate per host. None for unlimited.
+        bytes_per_second: Download bandwidth per host. None for unlimited.
+        burst_seconds: Bucket capacity as seconds of the configured rate.
+        reserve: Fraction of each bucket held back per priority step (see TokenBucket).
+        host_limits: Per-host overrides, e.g. ``{"data.london.gov.uk": {"requests_per_second": 2}}``.
+        max_penalty: Longest pause applied for one throttling response, in seconds.
+        clock: Monotonic time source (for tests).
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_second: float | None = None,
+        bytes_per_second: float | None = None,
+        burst_seconds: float = 1.0,
+        reserve: float = 0.2,
+        host_limits: Mapping[str, Mapping[str, float | None]] | None = None,
+        max_penalty: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._defaults = {"requests_per_second": requests_per_second, "bytes_per_second": bytes_per_second}
+        self._host_limits = {host: dict(limits) for host, limits in (host_limits or {}).items()}
+        self._burst_seconds = burst_seconds
+        self._reserve = reserve
+        self._max_penalty = max_penalty
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._hosts: dict[str, _HostState] = {}
+
+    def _bucket(self, rate: float | None) -> TokenBucket | None:
+        if rate is None:
+            return None
+        return TokenBucket(rate, max(rate * self._burst_seconds, 1.0), reserve=self._reserve, clock=self._clock)
+
+    def _host(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            limits = {**self._defaults, **self._host_limits.get(host, {})}
+            state = self._hosts[host] = _HostState(
+                self._bucket(limits["requests_per_second"]), self._bucket(limits["bytes_per_second"])
+            )
+        return state
+
+    def _try(self, host: str, kind: str, amount: float, priority: Priority | None) -> float:
+        """Take tokens or return how long to wait before trying again."""
+        priority = current_priority() if priority is None else priority
+        with self._lock:
+            state = self._host(host)
+            blocked = state.blocked_until - self._clock()
+            if blocked > 0:
+                return blocked
+            bucket = state.requests if kind == "requests" else state.bytes
+            return 0.0 if bucket is None else bucket.try_take(amount, priority)
+
+    def acquire_request(self, host: str, priority: Priority | None = None) -> None:
+        """Block until ``host`` may be sent another request."""
+        while (delay := self._try(host, "requests", 1, priority)) > 0:
+            time.sleep(delay)
+
+    def acquire_bytes(self, host: str, amount: int, priority: Priority | None = None) -> None:
+        """Account for ``amount`` bytes received from ``host``, blocking to stay under its bandwidth."""
+        while (delay := self._try(host, "bytes", amount, priority)) > 0:
+            time.sleep(delay)
+
+    async def aacquire_request(self, host: str, priority: Priority | None = None) -> None:
+        """Async version of :meth:`acquire_request`."""
+        while (delay := self._try(host, "requests", 1, priority)) > 0:
+            await asyncio.sleep(delay)
+
+    async def aacquire_bytes(self, host: str, amount: int, priority: Priority | None = None) -> None:
+        """Async version of :meth:`acquire_bytes`."""
+        while (delay := self._try(host, "bytes", amount, priority)) > 0:
+            await asyncio.sleep(delay)
+
+    def penalize(self, host: str, retry_after: float | None = None) -> float:
+        """Pause all requests to ``host``. Returns the pause in seconds.
+
+        Without ``retry_after`` the pause starts at one second and doubles with each
+        consecutive throttling response, until :meth:`observe` sees a success.
+        """
+        with self._lock:
+            state = self._host(host)
+            state.strikes += 1
+            pause = retry_after if retry_after is not None else 2.0 ** (state.strikes - 1)
+            pause = min(pause, self._max_penalty)
+            state.blocked_until = max(state.blocked_until, self._clock() + pause)
+        _bl.warning(f"Throttled by {host}, pausing requests for {pause:.1f}s")
+        return pause
+
+    def observe(self, host: str, status_code: int, headers: Mapping[str, str]) -> float | None:
+        """Adapt to a response: pause on throttling statuses, reset the backoff on success.
+
+        Returns:
+            The pause applied, or None if the response was not a throttling signal.
+        """
+        retry_after = parse_retry_after(headers.get("retry-after"))
+        if status_code == 429 or (status_code in _THROTTLE_STATUSES and retry_after is not None):
+            return self.penalize(host, retry_after)
+        if status_code < 400:
+            with self._lock:
+                self._host(host).strikes = 0
+        return None
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """An HTTPAdapter that draws a request token per request and retries 429s through the limiter.
+
+    Throttling responses pause the host for every caller sharing the limiter, then
+    the request is retried up to ``throttle_retries`` times. Pass a urllib3 ``Retry``
+    without 429 in its ``status_forcelist`` as ``max_retries`` so the two do not
+    both back off.
+
+    Args:
+        limiter: The shared RateLimiter.
+        throttle_retries: Times to retry a request answered with 429.
+        **kwargs: Passed to HTTPAdapter.
+    """
+
+    def __init__(self, limiter: RateLimiter, *, throttle_retries: int = 5, **kwargs):
+        self._limiter = limiter
+        self._throttle_retries = throttle_retries
+        super().__init__(**kwargs)
+
+    def send(self, request: requests.PreparedRequest, *args, **kwargs) -> requests.Response:
+        host = requests.utils.urlparse(request.url).netloc
+        for attempt in range(self._throttle_retries + 1):
+            self._limiter.acquire_request(host)
+            response = super().send(request, *args, **kwargs)
+            paused = self._limiter.observe(host, response.status_code, response.headers)
+            if paused is None or response.status_code != 429 or attempt == self._throttle_retries:
+                return response
+            response.close()
+        return response
@@ -0,0 +1,268 @@
+"""Concurrent health scan of every resource URL against the catalogue's check metadata."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .models import Dataset
+from .ratelimit import Priority, rate_limit_priority
+from .utils.logging_helper import BasicLogger
+
+if TYPE_CHECKING:
+    import httpx
+
+    from .async_client import AsyncLondonDataStore
+
+_bl = BasicLogger(verbose=False, log_directory=None, logger_name="SCAN")
+
+METHODS = ("head", "range")
+
+# Statuses that can mean "HEAD not allowed here" (signed storage URLs answer 403)
+_HEAD_REFUSED = (403, 405, 501)
+
+# Sizes are read from the stored bytes, so ask for them unencoded
+_PROBE_HEADERS = {"Accept-Encoding": "identity"}
+
+
+def _parse_timestamp(value: str | None) -> datetime | None:
+    """Parse an ISO 8601 or HTTP date into an aware datetime."""
+    if not value:
+        return None
+    try:
+        when = datetime.fromisoformat(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    return when if when.tzinfo is not None else when.replace(tzinfo=UTC)
+
+
+@dataclass
+class ResourceCheck:
+    """The probe of one resource URL next to what the catalogue recorded for it."""
+
+    slug: str
+    resource_key: str
+    format: str
+    url: str
+    expected_status: int | None = None
+    expected_size: int | None = None
+    expected_timestamp: str | None = None
+    status: int | None = None
+    size: int | None = None
+    last_modified: str | None = None
+    method: str | None = None
+    error: str | None = None
+    elapsed: float = 0.0
+
+    @property
+    def dead(self) -> bool:
+        """The URL could not be reached or answered with an error status."""
+        return self.error is not None or self.status is None or self.status >= 400
+
+    @property
+    def size_changed(self) -> bool:
+        """Both sizes are known and differ."""
+        return (
+            not self.dead
+            and self.size is not None
+            and self.expected_size is not None
+            and self.size != self.expected_size
+        )
+
+    @property
+    def modified(self) -> bool:
+        """The server's Last-Modified is later than the catalogue's last check."""
+        last_modified = _parse_timestamp(self.last_modified)
+        checked = _parse_timestamp(self.expected_timestamp)
+        return not self.dead and last_modified is not None and checked is not None and last_modified > checked
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class ScanReport:
+    """The outcome of :func:`scan_catalogue`."""
+
+    checks: list[ResourceCheck] = field(default_factory=list)
+    started_at: str | None = None
+    elapsed: float = 0.0
+
+    @property
+    def dead(self) -> list[ResourceCheck]:
+        return [check for check in self.checks if check.dead]
+
+    @property
+    def size_drift(self) -> list[ResourceCheck]:
+        return [check for check in self.checks if check.size_changed]
+
+    @property
+    def modified(self) -> list[ResourceCheck]:
+        return [check for check in self.checks if check.modified]
+
+    def summary(self) -> dict:
+        return {
+            "resources": len(self.checks),
+            "dead": len(self.dead),
+            "size_drift": len(self.size_drift),
+            "modified": len(self.modified),
+            "started_at": self.started_at,
+            "elapsed": round(self.elapsed, 3),
+        }
+
+    def to_dict(self, *, full: bool = False) -> dict:
+        """The summary and the problem resources; with ``full``, every check."""
+
+        def brief(check: ResourceCheck, *fields: str) -> dict:
+            entry = {"slug": check.slug, "resource_key": check.resource_key, "url": check.url}
+            entry.update({name: getattr(check, name) for name in fields})
+            return entry
+
+        report = {
+            "summary": self.summary(),
+            "dead": [brief(c, "status", "expected_status", "error") for c in self.dead],
+            "size_drift": [brief(c, "size", "expected_size") for c in self.size_drift],
+            "modified": [brief(c, "last_modified", "expected_timestamp") for c in self.modified],
+        }
+        if full:
+            report["checks"] = [check.to_dict() for check in self.checks]
+        return report
+
+    def write(self, path: str | Path, *, full: bool = False) -> Path:
+        """Write the report as JSON to ``path``."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(full=full), indent=2))
+        return path
+
+
+async def probe(
+    client: httpx.AsyncClient, check: ResourceCheck, *, method: str = "head", timeout: float = 10.0
+) -> ResourceCheck:
+    """Fill in ``check`` from a HEAD (or a one-byte Range GET) of its URL.
+
+    With ``method="head"``, servers that refuse HEAD are retried with the
+    ranged GET. Network errors are recorded on the check rather than raised.
+    """
+    import httpx
+
+    start = time.monotonic()
+    try:
+        response = None
+        if method == "head":
+            response = await client.head(check.url, headers=_PROBE_HEADERS, follow_redirects=True, timeout=timeout)
+            check.method = "HEAD"
+        if response is None or response.status_code in _HEAD_REFUSED:
+            headers = {**_PROBE_HEADERS, "Range": "bytes=0-0"}
+            # Stream so a server that ignores the range is not read past its headers
+            async with client.stream(
+                "GET", check.url, headers=headers, follow_redirects=True, timeout=timeout
+            ) as response:
+                check.method = "GET"
+        check.status = response.status_code
+        check.size = _response_size(response)
+        last_modified = _parse_timestamp(response.headers.get("last-modified"))
+        check.last_modified = last_modified.isoformat() if last_modified else None
+    except httpx.HTTPError as e:
+        check.error = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+    check.elapsed = time.monotonic() - start
+    return check
+
+
+def _response_size(response: httpx.Response) -> int | None:
+    if response.status_code == 206:
+        total = response.headers.get("content-range", "").rpartition("/")[2]
+        return int(total) if total.isdigit() else None
+    length = response.headers.get("content-length")
+    return int(length) if length and length.isdigit() and response.status_code < 400 else None
+
+
+def catalogue_checks(lds: AsyncLondonDataStore, datasets: Iterable[Dataset]) -> list[ResourceCheck]:
+    """One unprobed ResourceCheck per resource of ``datasets``."""
+    return [
+        ResourceCheck(
+            slug=dataset.slug,
+            resource_key=resource.key,
+            format=resource.format,
+            url=lds.get_resource_download_url(dataset.slug, resource),
+            expected_status=resource.check_http_status,
+            expected_size=resource.check_size,
+            expected_timestamp=resource.check_timestamp,
+        )
+        for dataset in datasets
+        for resource in dataset.resources
+    ]
+
+
+async def scan_catalogue(
+    lds: AsyncLondonDataStore,
+    *,
+    slugs: Iterable[str] | None = None,
+    concurrency: int = 32,
+    method: str = "head",
+    timeout: float = 10.0,
+    progress_callback: Callable[[int, int], None] | None = None,
+) -> ScanReport:
+    """Probe every resource URL of the catalogue concurrently and compare with its metadata.
+
+    ``concurrency`` probes are in flight at once; requests go through the
+    client's rate limiter (if any) in the bulk lane, so a scan yields to
+    interactive use of the same limiter. Each probe is a HEAD, or with
+    ``method="range"`` a one-byte Range GET, so a full catalogue costs one
+    small request per resource.
+
+    Args:
+        lds: The async client to scan with.
+        slugs: Datasets to scan. Defaults to the whole catalogue.
+        concurrency: Probes in flight at once.
+        method: ``"head"`` or ``"range"``.
+        timeout: Per-probe timeout in seconds.
+        progress_callback: Called with ``(probed, total)`` after each probe.
+
+    Returns:
+        A ScanReport with one check per resource, in catalogue order.
+    """
+    if method not in METHODS:
+        raise ValueError(f"'method' must be one of {list(METHODS)}, got: {method!r}")
+    if concurrency < 1:
+        raise ValueError(f"'concurrency' must be at least 1, got: {concurrency!r}")
+
+    if slugs is None:
+        datasets = [Dataset.from_api_dict(item) for item in await lds.get_data_from_url()]
+    else:
+        datasets = [await lds.get_dataset(slug) for slug in slugs]
+    checks = catalogue_checks(lds, datasets)
+    client = await lds._get_client()
+    started_at = datetime.now(UTC).isoformat(timespec="seconds")
+    start = time.monotonic()
+    pending = iter(checks)
+    done = 0
+
+    async def worker() -> None:
+        nonlocal done
+        with rate_limit_priority(Priority.BULK):
+            for check in pending:
+                await probe(client, check, method=method, timeout=timeout)
+                done += 1
+                if progress_callback:
+                    progress_callback(done, len(checks))
+
+    # A fixed pool pulling from one iterator, rather than a task per resource
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, len(checks)))))
+    report = ScanReport(checks=checks, started_at=started_at, elapsed=time.monotonic() - start)
+    summary = report.summary()
+    _bl.info(
+        f"Scanned {summary['resources']} resources in {report.elapsed:.1f}s: {summary['dead']} dead, "
+        f"{summary['size_drift']} size drift, {summary['modified']} modified"
+    )
+    return report
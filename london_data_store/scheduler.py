@@ -0,0 +1,548 @@
+"""Persistent, prioritised download queue with per-host limits and crash recovery."""
+
+import os
+import random
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from .cache import _default_cache_dir
+from .exceptions import CacheError, DownloadError, InsufficientSpaceError
+from .planner import DownloadPlan, check_free_space
+from .progress import ProgressAggregator, ProgressSnapshot
+from .ratelimit import Priority, rate_limit_priority
+from .utils.logging_helper import BasicLogger
+
+if TYPE_CHECKING:
+    from .api import LondonDataStore
+
+_bl = BasicLogger(verbose=False, log_directory=None, logger_name="SCHEDULER")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    slug TEXT NOT NULL,
+    resource_key TEXT NOT NULL,
+    destination TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    host TEXT NOT NULL,
+    total_bytes INTEGER,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0,
+    bytes_downloaded INTEGER NOT NULL DEFAULT 0,
+    path TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    owner TEXT,
+    heartbeat_at REAL,
+    UNIQUE (slug, resource_key, destination)
+);
+CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (state, priority DESC, id);
+"""
+
+# Columns added after the first journal format, with their types
+_MIGRATIONS = {"owner": "TEXT", "heartbeat_at": "REAL"}
+
+# Transfer and filesystem errors are worth retrying; anything else (an unknown slug,
+# a bug) would fail the same way again
+_RETRYABLE_ERRORS = (DownloadError, OSError)
+
+
+def _pid_alive(pid: int) -> bool:
+    """Whether process ``pid`` exists on this host; assumed alive where that cannot be checked."""
+    if os.name != "posix":
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class JobState(StrEnum):
+    """Lifecycle of a scheduled download."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+@dataclass
+class Job:
+    """A download job as recorded in the scheduler journal."""
+
+    id: int
+    slug: str
+    resource_key: str
+    destination: str
+    priority: int
+    host: str
+    state: JobState
+    attempts: int
+    bytes_downloaded: int
+    total_bytes: int | None = None
+    next_attempt_at: float = 0.0
+    path: str | None = None
+    error: str | None = None
+    created_at: float = 0.0
+    started_at: float | None = None
+    finished_at: float | None = None
+
+
+@dataclass
+class SchedulerStats:
+    """Job counts by state and current throughput."""
+
+    pending: int
+    running: int
+    done: int
+    failed: int
+    bytes_downloaded: int
+    rate: float
+    eta: float | None
+
+
+class DownloadScheduler:
+    """Run downloads from a SQLite journal over a pool of worker threads.
+
+    Jobs are added with :meth:`add` and picked highest priority first (oldest first
+    within a priority), never running more than ``per_host`` at once against one
+    host. Downloads run in the bulk rate-limit lane. Failed attempts are retried
+    with exponential backoff and jitter. Every
+    state change is written to the journal, so jobs that were queued or running when
+    the process died are picked up again by the next scheduler opened on it.
+
+    Several schedulers, in one process or many, can share a journal. Each running
+    job records its scheduler as owner, and the owner refreshes a heartbeat on it
+    every ``heartbeat_interval`` seconds. A running job is only requeued once its
+    owner is gone: its process has exited (checked on the same host), or its
+    heartbeat is three intervals old.
+
+    Args:
+        lds: The client used to resolve resources and download them.
+        journal_path: SQLite journal location. Defaults to ``jobs.sqlite3`` in the
+            platform-appropriate cache dir.
+        workers: Number of worker threads.
+        per_host: Maximum concurrent downloads from one host.
+        max_attempts: Attempts before a job is marked failed.
+        backoff_base: Delay in seconds before the first retry; doubles per attempt.
+        backoff_max: Upper bound on the retry delay in seconds.
+        heartbeat_interval: Seconds between heartbeats on this scheduler's running jobs.
+    """
+
+    def __init__(
+        self,
+        lds: "LondonDataStore",
+        *,
+        journal_path: Path | None = None,
+        workers: int = 4,
+        per_host: int = 2,
+        max_attempts: int = 5,
+        backoff_base: float = 1.0,
+        backoff_max: float = 300.0,
+        heartbeat_interval: float = 10.0,
+    ):
+        if workers < 1 or per_host < 1 or max_attempts < 1:
+            raise ValueError("'workers', 'per_host' and 'max_attempts' must be at least 1")
+        self._lds = lds
+        self._journal_path = Path(journal_path) if journal_path else _default_cache_dir() / "jobs.sqlite3"
+        self._workers = workers
+        self._per_host = per_host
+        self._max_attempts = max_attempts
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._heartbeat_interval = heartbeat_interval
+        self._owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex}"
+        self._closed = False
+
+        self._cond = threading.Condition()
+        self._host_active: dict[str, int] = {}
+        self._running = 0
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._progress = ProgressAggregator()
+
+        try:
+            self._journal_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self._journal_path, check_same_thread=False, isolation_level=None)
+            self._db.row_factory = sqlite3.Row
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(_SCHEMA)
+            columns = {row["name"] for row in self._db.execute("PRAGMA table_info(jobs)")}
+            for column, kind in _MIGRATIONS.items():
+                if column not in columns:
+                    self._db.execute(f"ALTER TABLE jobs ADD COLUMN {column} {kind}")
+        except sqlite3.Error as e:
+            raise CacheError(f"Failed to open download journal {self._journal_path}: {e}") from e
+
+        with self._cond:
+            self._recover()
+
+    def _owner_gone(self, owner: str | None, heartbeat_at: float | None) -> bool:
+        """Whether the scheduler that claimed a running job has stopped running it."""
+        if owner is None or heartbeat_at is None:
+            return True
+        if time.time() - heartbeat_at > 3 * self._heartbeat_interval:
+            return True
+        host, pid, _ = owner.rsplit(":", 2)
+        return owner != self._owner and host == socket.gethostname() and not _pid_alive(int(pid))
+
+    def _recover(self) -> None:
+        """Requeue running jobs whose owner is gone. Caller holds the lock."""
+        rows = self._db.execute(
+            "SELECT id, owner, heartbeat_at FROM jobs WHERE state = ?", (JobState.RUNNING,)
+        ).fetchall()
+        orphans = [row["id"] for row in rows if self._owner_gone(row["owner"], row["heartbeat_at"])]
+        for job_id in orphans:
+            self._db.execute(
+                "UPDATE jobs SET state = ?, owner = NULL, heartbeat_at = NULL WHERE id = ? AND state = ?",
+                (JobState.PENDING, job_id, JobState.RUNNING),
+            )
+        if orphans:
+            _bl.info(f"Recovered {len(orphans)} interrupted jobs from {self._journal_path}")
+            self._cond.notify_all()
+
+    def _heartbeat(self) -> None:
+        """Refresh this scheduler's running jobs and requeue orphaned ones while workers run."""
+        while not self._stop.wait(self._heartbeat_interval):
+            if not any(thread.is_alive() for thread in self._threads):
+                return
+            with self._cond:
+                if self._closed:
+                    return
+                self._db.execute(
+                    "UPDATE jobs SET heartbeat_at = ? WHERE owner = ? AND state = ?",
+                    (time.time(), self._owner, JobState.RUNNING),
+                )
+                self._recover()
+
+    @property
+    def journal_path(self) -> Path:
+        return self._journal_path
+
+    def __enter__(self) -> "DownloadScheduler":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the workers after their current jobs and close the journal."""
+        self.stop()
+        self.join()
+        with self._cond:
+            self._closed = True
+            self._db.close()
+
+    def add(
+        self,
+        slug: str,
+        resource_key: str | None = None,
+        destination: str | Path = ".",
+        *,
+        format: str | None = None,
+        priority: int = 0,
+    ) -> int:
+        """Queue a resource for download and return its job id.
+
+        The resource is resolved against the catalogue now, so unknown slugs, keys or
+        formats fail here rather than in a worker. Re-adding a job updates its priority
+        and gives a failed job a fresh set of attempts; finished jobs stay finished, so
+        a crashed run can simply be restarted by adding the same jobs again.
+        ``destination`` is a directory, or the file path to write when it is not one.
+
+        Raises:
+            DatasetNotFoundError: If the slug or resource key is not found.
+            FormatNotAvailableError: If the format is not found for the slug.
+        """
+        resource = self._lds.get_resource(slug, format, resource_key=resource_key)
+        host = urlsplit(self._lds.get_resource_download_url(slug, resource)).netloc
+        destination = str(Path(destination))
+        with self._cond:
+            self._db.execute(
+                """
+                INSERT INTO jobs (slug, resource_key, destination, priority, host, total_bytes, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (slug, resource_key, destination) DO UPDATE SET
+                    priority = excluded.priority,
+                    state = CASE WHEN state = 'failed' THEN 'pending' ELSE state END,
+                    attempts = CASE WHEN state = 'failed' THEN 0 ELSE attempts END,
+                    next_attempt_at = CASE WHEN state = 'failed' THEN 0 ELSE next_attempt_at END
+                """,
+                (slug, resource.key, destination, priority, host, resource.check_size, time.time()),
+            )
+            row = self._db.execute(
+                "SELECT id FROM jobs WHERE slug = ? AND resource_key = ? AND destination = ?",
+                (slug, resource.key, destination),
+            ).fetchone()
+            self._cond.notify_all()
+        return row["id"]
+
+    def add_plan(self, plan: DownloadPlan, *, priority: int = 0) -> list[int]:
+        """Queue every download of a plan, in the plan's order, and return the job ids.
+
+        Jobs of equal priority run oldest first, so the plan's size-aware order holds.
+        Each job writes to its planned file path, even if the plan's directory does
+        not exist yet.
+        """
+        return [self.add(item.slug, item.resource_key, item.destination, priority=priority) for item in plan.items]
+
+    def check_space(self, *, margin: float = 0.05) -> None:
+        """Check the destination filesystems can hold every pending job's catalogue size.
+
+        Raises:
+            InsufficientSpaceError: If a filesystem is short of space.
+        """
+        with self._cond:
+            rows = self._db.execute(
+                "SELECT destination, SUM(total_bytes) AS size, COUNT(*) AS n FROM jobs WHERE state = ?"
+                " GROUP BY destination",
+                (JobState.PENDING,),
+            ).fetchall()
+        required, free = check_free_space({Path(row["destination"]): row["size"] or 0 for row in rows}, margin=margin)
+        pending = sum(row["n"] for row in rows)
+        for fs, needed in required.items():
+            if needed > free.get(fs, 0):
+                raise InsufficientSpaceError(
+                    f"Not enough space on {fs}: need {needed} bytes for {pending} pending jobs, "
+                    f"{free.get(fs, 0)} bytes free"
+                )
+
+    def _full_hosts(self) -> list[str]:
+        """Hosts already running ``per_host`` jobs. Caller holds the lock."""
+        return [host for host, active in self._host_active.items() if active >= self._per_host]
+
+    def _claim(self) -> Job | None:
+        """Mark the best runnable job as running and return it. Caller holds the lock."""
+        full_hosts = self._full_hosts()
+        placeholders = ",".join("?" * len(full_hosts))
+        row = self._db.execute(
+            f"""
+            SELECT * FROM jobs
+            WHERE state = ? AND next_attempt_at <= ? AND host NOT IN ({placeholders})
+            ORDER BY priority DESC, id LIMIT 1
+            """,
+            (JobState.PENDING, time.time(), *full_hosts),
+        ).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        claimed = self._db.execute(
+            "UPDATE jobs SET state = ?, started_at = ?, error = NULL, owner = ?, heartbeat_at = ?"
+            " WHERE id = ? AND state = ?",
+            (JobState.RUNNING, now, self._owner, now, row["id"], JobState.PENDING),
+        )
+        if not claimed.rowcount:
+            # Another scheduler on the journal claimed it first
+            return self._claim()
+        self._host_active[row["host"]] = self._host_active.get(row["host"], 0) + 1
+        self._running += 1
+        return _row_to_job(row)
+
+    def _next_wakeup(self) -> float | None:
+        """Seconds until a backed-off job on a host with a free slot becomes due. Caller holds the lock.
+
+        None if there is no such job: either nothing is pending, or every pending job
+        waits on a full host, which a finishing job will notify.
+        """
+        full_hosts = self._full_hosts()
+        placeholders = ",".join("?" * len(full_hosts))
+        row = self._db.execute(
+            f"SELECT MIN(next_attempt_at) AS due FROM jobs WHERE state = ? AND host NOT IN ({placeholders})",
+            (JobState.PENDING, *full_hosts),
+        ).fetchone()
+        if row["due"] is None:
+            return None
+        return max(row["due"] - time.time(), 0.01)
+
+    def _worker(self) -> None:
+        while not self._stop.is_set():
+            with self._cond:
+                job = self._claim()
+                if job is None:
+                    wait = self._next_wakeup()
+                    # With nothing running no host is full, so no wakeup means nothing is pending
+                    if wait is None and self._running == 0:
+                        self._cond.notify_all()
+                        return
+                    # Sleep until a backed-off job is due, or until a job finishes or is added
+                    self._cond.wait(timeout=wait)
+                    continue
+            self._execute(job)
+
+    def _execute(self, job: Job) -> None:
+        name = str(job.id)
+        callback = self._progress.track(name, job.total_bytes)
+        try:
+            with rate_limit_priority(Priority.BULK):
+                result = self._lds.download(
+                    job.slug, destination=job.destination, resource_key=job.resource_key, progress_callback=callback
+                )
+        except Exception as e:
+            self._progress.finish(name, "failed")
+            self._record_failure(job, e)
+        else:
+            self._progress.finish(name)
+            with self._cond:
+                self._db.execute(
+                    "UPDATE jobs SET state = ?, attempts = attempts + 1, bytes_downloaded = ?, path = ?,"
+                    " finished_at = ? WHERE id = ?",
+                    (JobState.DONE, result.bytes_downloaded, str(result.path), time.time(), job.id),
+                )
+            _bl.info(f"Job {job.id} ({job.slug}/{job.resource_key}) {result.status}: {result.path}")
+        finally:
+            with self._cond:
+                self._host_active[job.host] -= 1
+                self._running -= 1
+                self._cond.notify_all()
+
+    def _record_failure(self, job: Job, error: Exception) -> None:
+        attempts = job.attempts + 1
+        if not isinstance(error, _RETRYABLE_ERRORS) or attempts >= self._max_attempts:
+            state, next_attempt_at = JobState.FAILED, 0.0
+            _bl.error(f"Job {job.id} ({job.slug}/{job.resource_key}) failed after {attempts} attempts: {error}")
+        else:
+            delay = min(self._backoff_base * 2 ** (attempts - 1), self._backoff_max)
+            state, next_attempt_at = JobState.PENDING, time.time() + delay * random.uniform(0.5, 1.0)
+            _bl.warning(f"Job {job.id} attempt {attempts} failed, retrying in up to {delay:.0f}s: {error}")
+        finished_at = time.time() if state == JobState.FAILED else None
+        with self._cond:
+            self._db.execute(
+                "UPDATE jobs SET state = ?, attempts = ?, next_attempt_at = ?, error = ?, finished_at = ? WHERE id = ?",
+                (state, attempts, next_attempt_at, str(error), finished_at, job.id),
+            )
+
+    def start(self, *, check_space: bool = True) -> None:
+        """Start the worker threads. They exit once no job is pending or running.
+
+        Raises:
+            InsufficientSpaceError: If ``check_space`` and the pending jobs will not fit.
+        """
+        if any(thread.is_alive() for thread in self._threads):
+            return
+        if check_space:
+            self.check_space()
+        self._stop.clear()
+        with self._cond:
+            self._recover()
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"lds-scheduler-{i}", daemon=True) for i in range(self._workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+        threading.Thread(target=self._heartbeat, name="lds-scheduler-heartbeat", daemon=True).start()
+
+    def join(self, timeout: float | None = None) -> None:
+        """Wait for the worker threads to exit."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(None if deadline is None else max(deadline - time.monotonic(), 0))
+
+    def run(self, *, check_space: bool = True) -> SchedulerStats:
+        """Process the queue until every job is done or failed, then return the final stats.
+
+        Raises:
+            InsufficientSpaceError: If ``check_space`` and the pending jobs will not fit.
+        """
+        self.start(check_space=check_space)
+        self.join()
+        return self.stats()
+
+    def stop(self) -> None:
+        """Ask workers to exit after their current job; unstarted jobs stay queued in the journal."""
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+
+    def job(self, job_id: int) -> Job:
+        """Return one job, including live progress if it is running.
+
+        Raises:
+            KeyError: If there is no job with that id.
+        """
+        with self._cond:
+            row = self._db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            raise KeyError(job_id)
+        return self._with_progress(_row_to_job(row))
+
+    def jobs(self, state: JobState | str | None = None) -> list[Job]:
+        """Return every job (optionally only those in ``state``) in scheduling order."""
+        query, params = "SELECT * FROM jobs", ()
+        if state is not None:
+            query, params = query + " WHERE state = ?", (JobState(state),)
+        with self._cond:
+            rows = self._db.execute(query + " ORDER BY priority DESC, id", params).fetchall()
+        return [self._with_progress(_row_to_job(row)) for row in rows]
+
+    def _with_progress(self, job: Job) -> Job:
+        if job.state == JobState.RUNNING:
+            for item in self._progress.snapshot().items:
+                if item.name == str(job.id):
+                    job.bytes_downloaded = item.bytes_done
+        return job
+
+    def progress(self) -> ProgressSnapshot:
+        """Live byte counts, rates and ETAs of the jobs run by this scheduler."""
+        return self._progress.snapshot()
+
+    def stats(self) -> SchedulerStats:
+        """Job counts by state, with bytes transferred and the current aggregate rate."""
+        with self._cond:
+            rows = self._db.execute("SELECT state, COUNT(*) AS n FROM jobs GROUP BY state").fetchall()
+        counts = {row["state"]: row["n"] for row in rows}
+        snapshot = self._progress.snapshot()
+        return SchedulerStats(
+            pending=counts.get(JobState.PENDING, 0),
+            running=counts.get(JobState.RUNNING, 0),
+            done=counts.get(JobState.DONE, 0),
+            failed=counts.get(JobState.FAILED, 0),
+            bytes_downloaded=snapshot.bytes_done,
+            rate=snapshot.rate,
+            eta=snapshot.eta,
+        )
+
+    def clear(self, state: JobState | str | None = None) -> int:
+        """Delete jobs that are not running (optionally only those in ``state``). Returns the count."""
+        with self._cond:
+            if state is None:
+                cursor = self._db.execute("DELETE FROM jobs WHERE state != ?", (JobState.RUNNING,))
+            else:
+                cursor = self._db.execute(
+                    "DELETE FROM jobs WHERE state = ? AND state != ?", (JobState(state), JobState.RUNNING)
+                )
+        return cursor.rowcount
+
+
+def _row_to_job(row: sqlite3.Row) -> Job:
+    return Job(
+        id=row["id"],
+        slug=row["slug"],
+        resource_key=row["resource_key"],
+        destination=row["destination"],
+        priority=row["priority"],
+        host=row["host"],
+        state=JobState(row["state"]),
+        attempts=row["attempts"],
+        bytes_downloaded=row["bytes_downloaded"],
+        total_bytes=row["total_bytes"],
+        next_attempt_at=row["next_attempt_at"],
+        path=row["path"],
+        error=row["error"],
+        created_at=row["created_at"],
+        started_at=row["started_at"],
+        finished_at=row["finished_at"],
+    )
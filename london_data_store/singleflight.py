@@ -0,0 +1,91 @@
+"""Coalesce concurrent calls for the same key into one execution."""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Run a function once per key at a time, sharing the outcome with concurrent callers.
+
+    The first caller for a key (the leader) runs the function; callers arriving
+    while it runs wait and receive the same return value or exception. Once the
+    call finishes the key is forgotten, so later callers start a fresh call.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[..., T], *args, **kwargs) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._calls
+
+
+class AsyncSingleFlight:
+    """Asyncio counterpart of :class:`SingleFlight`.
+
+    The shared call runs as its own task, so a caller that is cancelled while
+    waiting does not cancel the call for the others. Calls are tracked per event
+    loop, so one instance can serve several loops.
+    """
+
+    def __init__(self):
+        self._calls: dict[tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
+        loop_key = (asyncio.get_running_loop(), key)
+        task = self._calls.get(loop_key)
+        if task is None:
+            task = self._calls[loop_key] = asyncio.ensure_future(fn(*args, **kwargs))
+            task.add_done_callback(lambda t: self._finished(loop_key, t))
+        return await asyncio.shield(task)
+
+    def _finished(self, loop_key: tuple, task: asyncio.Task) -> None:
+        self._calls.pop(loop_key, None)
+        # Mark the outcome as retrieved even if every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def in_flight(self, key: Hashable) -> bool:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return (loop, key) in self._calls
@@ -0,0 +1,148 @@
+"""Pluggable destinations for downloaded bodies."""
+
+import contextlib
+import io
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from pathlib import Path
+from urllib.parse import urlsplit
+
+
+def write_all(fd: int, data: bytes | memoryview) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+class Sink(ABC):
+    """Where a download's body goes.
+
+    A download calls :meth:`open` once, :meth:`write` for each chunk in order, and
+    then :meth:`commit` once the body has passed its integrity checks, or
+    :meth:`abort` if anything failed. Whatever ``commit`` returns is handed back to
+    the caller. Chunks may be memoryviews of buffers that are reused once ``write``
+    returns, so a sink that keeps them must copy them.
+
+    Subclasses implement :meth:`write` and whichever of the others they need.
+    ``in_memory`` tells async callers that writes never block, so they need not be
+    moved off the event loop; it may turn False partway, as a spooled buffer's does
+    when it spills to disk.
+    """
+
+    in_memory = False
+
+    def open(self, url: str, expected_size: int | None = None) -> None:  # noqa: B027
+        """Prepare to receive the body of ``url``."""
+
+    @abstractmethod
+    def write(self, chunk: bytes | memoryview) -> None:
+        """Receive the next chunk of the body."""
+
+    def commit(self) -> object:
+        """Make the received body final and return the sink's result."""
+        return None
+
+    def abort(self) -> None:  # noqa: B027
+        """Discard whatever was received."""
+
+
+class FileSink(Sink):
+    """Write to a temporary file beside ``destination`` and move it into place on commit.
+
+    Args:
+        destination: Target file, or a directory to infer the file name in from the URL.
+    """
+
+    def __init__(self, destination: str | Path):
+        self.destination = Path(destination)
+        self._fd: int | None = None
+        self._tmp_path: str | None = None
+
+    def open(self, url: str, expected_size: int | None = None) -> None:
+        if self.destination.is_dir():
+            self.destination = self.destination / (urlsplit(url).path.split("/")[-1] or "download")
+        self.destination.parent.mkdir(parents=True, exist_ok=True)
+        self._fd, self._tmp_path = tempfile.mkstemp(dir=self.destination.parent, suffix=".tmp")
+
+    def write(self, chunk: bytes | memoryview) -> None:
+        write_all(self._fd, chunk)
+
+    def commit(self) -> Path:
+        os.close(self._fd)
+        self._fd = None
+        os.replace(self._tmp_path, self.destination)
+        self._tmp_path = None
+        return self.destination
+
+    def abort(self) -> None:
+        if self._fd is not None:
+            with contextlib.suppress(OSError):
+                os.close(self._fd)
+            self._fd = None
+        if self._tmp_path is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(self._tmp_path)
+            self._tmp_path = None
+
+
+class MemorySink(Sink):
+    """Collect the body in memory; ``commit`` returns it as bytes."""
+
+    in_memory = True
+
+    def __init__(self):
+        self._buffer = io.BytesIO()
+
+    def open(self, url: str, expected_size: int | None = None) -> None:
+        self._buffer = io.BytesIO()
+
+    def write(self, chunk: bytes | memoryview) -> None:
+        self._buffer.write(chunk)
+
+    def commit(self) -> bytes:
+        return self._buffer.getvalue()
+
+    def abort(self) -> None:
+        self._buffer = io.BytesIO()
+
+
+class CallableSink(Sink):
+    """Pass each chunk to a function, e.g. an object store upload or a pipe to another process.
+
+    Chunks are copied to ``bytes`` before the call, so ``write`` may keep them.
+
+    Args:
+        write: Called with each chunk.
+        commit: Called once the body is complete and verified; its return value is the result.
+        abort: Called if the download fails, to discard what was sent.
+        open: Called with ``(url, expected_size)`` before the first chunk.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[bytes], object],
+        *,
+        commit: Callable[[], object] | None = None,
+        abort: Callable[[], object] | None = None,
+        open: Callable[[str, int | None], object] | None = None,
+    ):
+        self._write = write
+        self._commit = commit
+        self._abort = abort
+        self._open = open
+
+    def open(self, url: str, expected_size: int | None = None) -> None:
+        if self._open is not None:
+            self._open(url, expected_size)
+
+    def write(self, chunk: bytes | memoryview) -> None:
+        self._write(bytes(chunk))
+
+    def commit(self) -> object:
+        return self._commit() if self._commit is not None else None
+
+    def abort(self) -> None:
+        if self._abort is not None:
+            self._abort()
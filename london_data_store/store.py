@@ -0,0 +1,226 @@
+"""Content-addressed store of downloaded resources, keyed by catalogue hash."""
+
+import contextlib
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import platformdirs
+
+from .exceptions import CacheError
+from .utils.logging_helper import BasicLogger
+
+_bl = BasicLogger(verbose=False, log_directory=None, logger_name="STORE")
+
+_FICLONE = 0x40049409  # Linux ioctl: share extents between two files (btrfs, xfs, ...)
+
+LINK_MODES = ("auto", "reflink", "hardlink", "copy")
+
+_MD5_HEX = re.compile(r"[0-9a-f]{32}")
+
+
+def normalize_hash(check_hash: str) -> str:
+    """Strip the catalogue's version suffix (e.g. ``'abc123-1'`` -> ``'abc123'``)."""
+    return check_hash.split("-")[0].lower()
+
+
+def _reflink(source: Path, destination: Path) -> None:
+    if not sys.platform.startswith("linux"):
+        raise OSError("reflinks are only supported on Linux")
+    import fcntl
+
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+
+
+@dataclass
+class StoreUsage:
+    """Summary of the objects held in a :class:`ResourceStore`."""
+
+    objects: int
+    total_bytes: int
+
+
+class ResourceStore:
+    """Keep one copy of each downloaded resource, addressed by its MD5 hash.
+
+    Objects live under ``<store_dir>/<hash[:2]>/<hash>``. An object's mtime records
+    when it was last used, which drives age- and size-based eviction in :meth:`gc`.
+
+    Args:
+        store_dir: Directory for stored objects. Defaults to ``store/`` in the
+            platform-appropriate cache dir.
+        link_mode: How objects are placed at a destination. ``"auto"`` tries a
+            reflink and falls back to a copy; ``"hardlink"`` shares the inode with the
+            destination (fastest, but editing the destination in place edits the
+            stored object); ``"reflink"`` and ``"copy"`` force one strategy.
+    """
+
+    def __init__(self, store_dir: Path | None = None, link_mode: str = "auto"):
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"'link_mode' must be one of {LINK_MODES}, got: {link_mode!r}")
+        self._store_dir = (
+            Path(store_dir) if store_dir else Path(platformdirs.user_cache_dir("london-data-store")) / "store"
+        )
+        self._link_mode = link_mode
+
+    @property
+    def store_dir(self) -> Path:
+        return self._store_dir
+
+    def _object_path(self, check_hash: str) -> Path:
+        """Where the object for ``check_hash`` lives.
+
+        Raises:
+            CacheError: If the hash is not an MD5 hex digest, and so could name a path
+                outside the store.
+        """
+        digest = normalize_hash(check_hash)
+        if not _MD5_HEX.fullmatch(digest):
+            raise CacheError(f"Not an MD5 hex digest: {check_hash!r}")
+        return self._store_dir / digest[:2] / digest
+
+    def get(self, check_hash: str, expected_size: int | None = None) -> Path | None:
+        """Return the stored object for ``check_hash``, or None if absent, the wrong size or not an MD5 hash."""
+        try:
+            path = self._object_path(check_hash)
+        except CacheError:
+            return None
+        try:
+            size = path.stat().st_size
+        except OSError:
+            return None
+        if expected_size is not None and size != expected_size:
+            _bl.warning(f"Discarding stored object {path.name}: expected {expected_size} bytes, found {size}")
+            path.unlink(missing_ok=True)
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return path
+
+    def add(self, check_hash: str, source: Path) -> Path:
+        """Place ``source`` in the store under ``check_hash``. The caller must have verified the hash.
+
+        Raises:
+            CacheError: If ``check_hash`` is not an MD5 hash, or ``source`` cannot be stored.
+        """
+        path = self._object_path(check_hash)
+        if path.exists():
+            with contextlib.suppress(OSError):
+                os.utime(path)
+            return path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._place(Path(source), path)
+        except OSError as e:
+            raise CacheError(f"Failed to add {source} to resource store: {e}") from e
+        _bl.info(f"Stored {source} as {path.name}")
+        return path
+
+    def materialize(self, check_hash: str, destination: Path, expected_size: int | None = None) -> Path | None:
+        """Place the stored object for ``check_hash`` at ``destination``.
+
+        Returns:
+            The destination path, or None if the store has no usable object.
+        """
+        path = self.get(check_hash, expected_size)
+        if path is None:
+            return None
+        destination = Path(destination)
+        try:
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            self._place(path, destination)
+        except OSError as e:
+            _bl.warning(f"Could not materialize {path.name} at {destination}: {e}")
+            return None
+        _bl.info(f"Served {destination} from resource store")
+        return destination
+
+    def _place(self, source: Path, destination: Path) -> None:
+        """Atomically link or copy ``source`` to ``destination`` using the configured mode."""
+        fd, tmp_name = tempfile.mkstemp(dir=destination.parent, suffix=".tmp")
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        try:
+            self._link_or_copy(source, tmp_path)
+            os.replace(tmp_path, destination)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _link_or_copy(self, source: Path, target: Path) -> None:
+        if self._link_mode == "hardlink":
+            target.unlink()
+            try:
+                os.link(source, target)
+                return
+            except OSError as e:
+                _bl.warning(f"Hardlink failed ({e}), copying instead")
+        elif self._link_mode in ("auto", "reflink"):
+            try:
+                _reflink(source, target)
+                return
+            except OSError:
+                if self._link_mode == "reflink":
+                    raise
+        shutil.copyfile(source, target)
+
+    def _objects(self) -> list[tuple[Path, os.stat_result]]:
+        if not self._store_dir.exists():
+            return []
+        objects = []
+        for path in self._store_dir.glob("??/*"):
+            if path.suffix == ".tmp":
+                continue
+            with contextlib.suppress(OSError):
+                objects.append((path, path.stat()))
+        return objects
+
+    def usage(self) -> StoreUsage:
+        """Return the number of stored objects and their total size."""
+        objects = self._objects()
+        return StoreUsage(objects=len(objects), total_bytes=sum(st.st_size for _, st in objects))
+
+    def gc(self, max_bytes: int | None = None, max_age: float | None = None) -> StoreUsage:
+        """Evict stored objects.
+
+        Objects unused for longer than ``max_age`` seconds are removed first; then the
+        least recently used objects are removed until the store fits in ``max_bytes``.
+
+        Returns:
+            The number and total size of the evicted objects.
+        """
+        objects = sorted(self._objects(), key=lambda item: item[1].st_mtime)
+        now = time.time()
+        total = sum(st.st_size for _, st in objects)
+        removed = StoreUsage(objects=0, total_bytes=0)
+
+        for path, st in objects:
+            too_old = max_age is not None and now - st.st_mtime > max_age
+            too_big = max_bytes is not None and total > max_bytes
+            if not (too_old or too_big):
+                continue
+            try:
+                path.unlink()
+            except OSError as e:
+                _bl.warning(f"Could not evict {path}: {e}")
+                continue
+            total -= st.st_size
+            removed.objects += 1
+            removed.total_bytes += st.st_size
+
+        _bl.info(f"Evicted {removed.objects} objects ({removed.total_bytes} bytes) from {self._store_dir}")
+        return removed
+
+    def clear(self) -> None:
+        """Remove every stored object."""
+        try:
+            if self._store_dir.exists():
+                shutil.rmtree(self._store_dir)
+        except OSError as e:
+            raise CacheError(f"Failed to clear resource store: {e}") from e
@@ -0,0 +1,244 @@
+"""Streaming access to resource bodies, verified as they are read."""
+
+import codecs
+import csv
+import hashlib
+import io
+import re
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from typing import TypeVar
+
+import requests
+
+from .exceptions import DownloadError
+from .store import normalize_hash
+from .utils.logging_helper import BasicLogger
+
+_bl = BasicLogger(verbose=False, log_directory=None, logger_name="STREAMING")
+
+T = TypeVar("T")
+
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Line endings as csv sees them in a file opened with newline=""
+_LINE = re.compile(r"[^\r\n]*(?:\r\n|\r|\n)")
+
+
+class StreamVerifier:
+    """Check a body's size and MD5 against the catalogue as its chunks go past.
+
+    Size mismatches raise; hash mismatches are logged, as for downloads, since the
+    catalogue hash can lag behind the published file.
+    """
+
+    def __init__(self, url: str, expected_hash: str | None = None, expected_size: int | None = None):
+        self.url = url
+        self.expected_hash = normalize_hash(expected_hash) if expected_hash else None
+        self.expected_size = expected_size
+        self.bytes_read = 0
+        self.hash_verified: bool | None = None
+        self._md5 = hashlib.md5() if expected_hash else None
+        self._finished = False
+
+    def update(self, chunk: bytes) -> None:
+        self.count(chunk)
+        self.digest(chunk)
+
+    def count(self, chunk: bytes) -> None:
+        """Apply the size check to ``chunk``; :meth:`update` without the hashing."""
+        self.bytes_read += len(chunk)
+        if self.expected_size is not None and self.bytes_read > self.expected_size:
+            raise DownloadError(f"Size mismatch: expected {self.expected_size} bytes, got more from {self.url}")
+
+    def digest(self, chunk: bytes) -> None:
+        """Feed ``chunk`` to the hash; chunks must arrive in body order."""
+        if self._md5 is not None:
+            self._md5.update(chunk)
+
+    def finish(self) -> None:
+        """Run the end-of-body checks once.
+
+        Raises:
+            DownloadError: If fewer bytes arrived than the catalogue size.
+        """
+        if self._finished:
+            return
+        self._finished = True
+        if self.expected_size is not None and self.bytes_read != self.expected_size:
+            raise DownloadError(f"Size mismatch: expected {self.expected_size} bytes, got {self.bytes_read}")
+        if self._md5 is not None:
+            actual_hash = self._md5.hexdigest()
+            self.hash_verified = actual_hash == self.expected_hash
+            if not self.hash_verified:
+                _bl.warning(
+                    f"Hash mismatch for {self.url}: expected {self.expected_hash}, got {actual_hash}. "
+                    "The catalogue metadata may be stale."
+                )
+
+
+class ResourceStream(io.RawIOBase):
+    """A read-only binary stream over a streamed HTTP response body.
+
+    Memory use is bounded by ``chunk_size``: chunks are pulled from the connection
+    only as the reader asks for them. The size and hash are checked on the fly, and
+    reading to the end raises :class:`DownloadError` if the body was truncated.
+
+    Args:
+        response: A response made with ``stream=True``.
+        verifier: Checks applied to the body as it is read.
+        chunk_size: Bytes requested from the connection at a time.
+        on_chunk: Called with each chunk's length before it is returned, e.g. to
+            draw from a rate limiter.
+    """
+
+    def __init__(
+        self,
+        response: requests.Response,
+        verifier: StreamVerifier,
+        *,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        on_chunk: Callable[[int], None] | None = None,
+    ):
+        super().__init__()
+        self._response = response
+        self._chunks = response.iter_content(chunk_size=chunk_size)
+        self._pending = memoryview(b"")
+        self._on_chunk = on_chunk
+        self.verifier = verifier
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed stream")
+        while not self._pending:
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                self.verifier.finish()
+                return 0
+            except requests.RequestException as e:
+                raise DownloadError(f"Failed to read {self.verifier.url}: {e}") from e
+            if self._on_chunk is not None:
+                self._on_chunk(len(chunk))
+            self.verifier.update(chunk)
+            self._pending = memoryview(chunk)
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            self._response.close()
+        super().close()
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Yield lists of up to ``size`` consecutive items."""
+    if size < 1:
+        raise ValueError(f"'batch_size' must be at least 1, got: {size!r}")
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def row_to_dict(fieldnames: list[str], row: list[str]) -> dict:
+    """Pair a CSV row with the header the way :class:`csv.DictReader` does."""
+    record = dict(zip(fieldnames, row, strict=False))
+    if len(row) > len(fieldnames):
+        record[None] = row[len(fieldnames) :]
+    elif len(row) < len(fieldnames):
+        for name in fieldnames[len(row) :]:
+            record[name] = None
+    return record
+
+
+class _Lines:
+    """An iterator over queued lines that can be refilled after running dry."""
+
+    def __init__(self):
+        self.queue: deque[str] = deque()
+
+    def __iter__(self) -> "_Lines":
+        return self
+
+    def __next__(self) -> str:
+        if not self.queue:
+            raise StopIteration
+        return self.queue.popleft()
+
+
+class CsvRowParser:
+    """Incrementally parse CSV text fed in arbitrary pieces into dict rows.
+
+    For consumers that cannot hand :mod:`csv` a blocking file, such as async
+    iterators. Lines are passed to the reader only once a whole record has
+    arrived, so quoted fields may span lines and chunk boundaries.
+
+    Args:
+        encoding: Encoding of the bytes passed to :meth:`feed`.
+        delimiter: Field delimiter.
+    """
+
+    def __init__(self, encoding: str = "utf-8-sig", delimiter: str = ","):
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._lines = _Lines()
+        self._reader = csv.reader(self._lines, delimiter=delimiter)
+        self._text = ""
+        self._record: list[str] = []
+        self._quotes = 0
+        self._fieldnames: list[str] | None = None
+
+    @property
+    def fieldnames(self) -> list[str] | None:
+        """The header row, once it has been parsed."""
+        return self._fieldnames
+
+    def feed(self, data: bytes) -> list[dict]:
+        """Parse ``data`` and return the rows it completed."""
+        self._text += self._decoder.decode(data)
+        end = self._text.rfind("\n") + 1
+        if end:
+            self._queue_lines(_LINE.findall(self._text, 0, end))
+            self._text = self._text[end:]
+        return self._drain()
+
+    def close(self) -> list[dict]:
+        """Parse whatever is left and return the final rows."""
+        self._text += self._decoder.decode(b"", final=True)
+        if self._text:
+            self._queue_lines([self._text])
+            self._text = ""
+        if self._record:
+            self._lines.queue.extend(self._record)
+            self._record = []
+        return self._drain()
+
+    def _queue_lines(self, lines: list[str]) -> None:
+        for line in lines:
+            self._record.append(line)
+            self._quotes += line.count('"')
+            # An odd number of quotes means a quoted field continues on the next line
+            if self._quotes % 2 == 0:
+                self._lines.queue.extend(self._record)
+                self._record = []
+                self._quotes = 0
+
+    def _drain(self) -> list[dict]:
+        rows = []
+        for row in self._reader:
+            if not row:
+                continue
+            if self._fieldnames is None:
+                self._fieldnames = row
+                continue
+            rows.append(row_to_dict(self._fieldnames, row))
+        return rows
@@ -1,5 +1,7 @@
 """Shared fixtures for london_data_store tests."""
 
+import copy
+
 import pytest
 
 SAMPLE_CATALOGUE = [
@@ -163,8 +165,8 @@ SAMPLE_CATALOGUE = [
 
 @pytest.fixture
 def sample_catalogue():
-    """Return sample catalogue data."""
-    return SAMPLE_CATALOGUE
+    """Return a fresh copy of the sample catalogue data, so tests may modify it."""
+    return copy.deepcopy(SAMPLE_CATALOGUE)
 
 
 @pytest.fixture
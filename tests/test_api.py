@@ -451,3 +451,83 @@ class TestFilterByLicence:
     def test_invalid_raises(self, mock_client):
         with pytest.raises(ValueError):
             mock_client.filter_by_licence("")
+
+
+# ── get_data_from_url ────────────────────────────────────────────
+
+
+class TestGetDataFromUrl:
+    def test_concurrent_loads_share_one_fetch(self, sample_catalogue):
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        fetches = []
+        release = threading.Event()
+
+        def slow_fetch(self):
+            fetches.append(1)
+            release.wait(5)
+            return sample_catalogue
+
+        clients = [LondonDataStore(cache=False) for _ in range(4)]
+        with (
+            patch("london_data_store.api.Response.get_json_from_response", slow_fetch),
+            ThreadPoolExecutor(8) as pool,
+        ):
+            futures = [pool.submit(client.get_data_from_url) for client in clients for _ in range(2)]
+            time.sleep(0.05)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert len(fetches) == 1
+        assert all(result is sample_catalogue for result in results)
+        assert all(client._raw_response_json is sample_catalogue for client in clients)
+
+    def test_failed_load_is_not_stored(self):
+        lds = LondonDataStore(cache=False)
+        with patch("london_data_store.api.Response.get_json_from_response", return_value=None):
+            assert lds.get_data_from_url() is None
+        assert lds._raw_response_json is None
+
+
+class TestStreamingRows:
+    BODY = b"\xef\xbb\xbfborough,population\r\nCamden,210000\r\nHackney,260000\r\nIslington,220000\r\n"
+
+    def _serve(self, client, body: bytes):
+        response = MagicMock()
+        response.url = "https://data.london.gov.uk/download/population-projections/res-001/pop-data.csv"
+        response.history = []
+        response.iter_content.side_effect = lambda chunk_size: iter([body[:10], body[10:]])
+        client._session = MagicMock()
+        client._session.get.return_value = response
+        return response
+
+    def test_open_resource_streams_bytes(self, mock_client):
+        response = self._serve(mock_client, self.BODY)
+        with mock_client.open_resource("population-projections", "csv", verify_integrity=False) as f:
+            assert f.read() == self.BODY
+        assert mock_client._session.get.call_args.kwargs["stream"] is True
+        response.close.assert_called()
+
+    def test_iter_rows_yields_dicts(self, mock_client):
+        self._serve(mock_client, self.BODY)
+        rows = list(mock_client.iter_rows("population-projections", verify_integrity=False))
+        assert rows[0] == {"borough": "Camden", "population": "210000"}
+        assert len(rows) == 3
+
+    def test_iter_rows_batches(self, mock_client):
+        self._serve(mock_client, self.BODY)
+        batches = list(mock_client.iter_rows("population-projections", batch_size=2, verify_integrity=False))
+        assert [len(batch) for batch in batches] == [2, 1]
+
+    def test_iter_rows_checks_size_on_the_fly(self, mock_client):
+        from london_data_store.exceptions import DownloadError
+
+        self._serve(mock_client, self.BODY)  # catalogue says 102400 bytes
+        with pytest.raises(DownloadError, match="Size mismatch"):
+            list(mock_client.iter_rows("population-projections"))
+
+    def test_open_resource_rejects_bad_mode(self, mock_client):
+        with pytest.raises(ValueError):
+            mock_client.open_resource("population-projections", mode="w")
@@ -0,0 +1,221 @@
+"""Tests for london_data_store.archive module."""
+
+import io
+import random
+import zipfile
+import zlib
+from unittest.mock import MagicMock
+
+import pytest
+
+from london_data_store.archive import HTTPRangeFile, extract_members, probe_ranges, select_members
+from london_data_store.exceptions import DownloadError
+
+URL = "https://example.com/boundaries.zip"
+
+
+def make_zip(members: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+class RangeServer:
+    """A fake session serving ``body`` with or without byte-range support."""
+
+    def __init__(self, body: bytes, *, ranges: bool = True):
+        self.body = body
+        self.ranges = ranges
+        self.ranges_served: list[tuple[int, int]] = []
+        self.full_gets = 0
+
+    def _response(self, status: int, data: bytes, headers: dict, url: str):
+        response = MagicMock()
+        response.status_code = status
+        response.ok = True
+        response.url = url
+        response.history = []
+        response.headers = headers
+        response.raw = io.BytesIO(data)
+        response.iter_content.side_effect = lambda chunk_size: iter([data])
+        return response
+
+    def head(self, url, **kwargs):
+        headers = {"content-length": str(len(self.body))}
+        if self.ranges:
+            headers["accept-ranges"] = "bytes"
+        return self._response(200, b"", headers, url)
+
+    def get(self, url, headers=None, **kwargs):
+        range_header = (headers or {}).get("Range")
+        if self.ranges and range_header:
+            start, end = (int(x) for x in range_header.removeprefix("bytes=").split("-"))
+            self.ranges_served.append((start, end))
+            data = self.body[start : end + 1]
+            content_range = f"bytes {start}-{end}/{len(self.body)}"
+            return self._response(206, data, {"content-range": content_range}, url)
+        self.full_gets += 1
+        return self._response(200, self.body, {"content-length": str(len(self.body))}, url)
+
+
+class TestHTTPRangeFile:
+    def test_random_access_reads(self):
+        body = bytes(range(256)) * 100
+        server = RangeServer(body)
+        with HTTPRangeFile(server, URL, len(body), block_size=1000) as f:
+            f.seek(-10, 2)
+            assert f.read(10) == body[-10:]
+            f.seek(5000)
+            assert f.read(3000) == body[5000:8000]
+            assert f.read(0) == b""
+
+    def test_sequential_reads_grow_the_window(self):
+        body = b"x" * 20000
+        server = RangeServer(body)
+        with HTTPRangeFile(server, URL, len(body), block_size=1000) as f:
+            while f.read(500):
+                pass
+        sizes = [end - start + 1 for start, end in server.ranges_served]
+        assert sizes[:4] == [1000, 2000, 4000, 8000]
+        assert sum(sizes) == len(body)
+
+    def test_reads_stop_at_end(self):
+        server = RangeServer(b"abc")
+        with HTTPRangeFile(server, URL, 3) as f:
+            assert f.read() == b"abc"
+            assert f.read(1) == b""
+
+    def test_ignored_range_raises(self):
+        server = RangeServer(b"abc", ranges=False)
+        with HTTPRangeFile(server, URL, 3) as f, pytest.raises(DownloadError):
+            f.read(1)
+
+
+class TestProbeRanges:
+    def test_supported(self):
+        assert probe_ranges(RangeServer(b"abc"), URL) == (URL, 3)
+
+    def test_unsupported(self):
+        assert probe_ranges(RangeServer(b"abc", ranges=False), URL) is None
+
+
+class TestMembers:
+    def test_select_by_pattern(self):
+        archive = zipfile.ZipFile(io.BytesIO(make_zip({"a.shp": b"1", "a.dbf": b"2", "readme.txt": b"3"})))
+        assert [i.filename for i in select_members(archive, ["*.shp", "a.*"])] == ["a.shp", "a.dbf"]
+        with pytest.raises(KeyError):
+            select_members(archive, "*.gpkg")
+
+    def test_extract_sanitises_paths(self, tmp_path):
+        archive = zipfile.ZipFile(io.BytesIO(make_zip({"../evil.txt": b"x", "dir/ok.txt": b"y"})))
+        paths = extract_members(archive, tmp_path / "out")
+        assert sorted(p.relative_to(tmp_path / "out").as_posix() for p in paths) == ["dir/ok.txt", "evil.txt"]
+        assert not (tmp_path / "evil.txt").exists()
+
+    def test_remote_extraction_fetches_only_wanted_member(self, tmp_path):
+        big = random.Random(0).randbytes(200_000)  # incompressible, so it dominates the archive
+        body = make_zip({"big.bin": big, "small.csv": b"a,b\n1,2\n"})
+        server = RangeServer(body)
+        with HTTPRangeFile(server, URL, len(body)) as f, zipfile.ZipFile(f) as archive:
+            paths = extract_members(archive, tmp_path, "small.csv")
+            fetched = f.bytes_fetched
+
+        assert paths[0].read_bytes() == b"a,b\n1,2\n"
+        assert fetched < len(body) / 2
+
+
+class TestClientArchives:
+    MEMBERS = {"boroughs.shp": b"shape", "boroughs.dbf": b"table", "notes/readme.txt": b"hello\n"}
+
+    def _serve(self, client, *, ranges: bool = True) -> RangeServer:
+        client._session = RangeServer(make_zip(self.MEMBERS), ranges=ranges)
+        client._redirects = None
+        return client._session
+
+    def test_extract_archive_over_ranges(self, mock_client, tmp_path):
+        server = self._serve(mock_client)
+        paths = mock_client.extract_archive(
+            "population-projections", "boroughs.*", tmp_path, resource_key="res-002", verify_integrity=False
+        )
+        assert sorted(p.name for p in paths) == ["boroughs.dbf", "boroughs.shp"]
+        assert (tmp_path / "boroughs.shp").read_bytes() == b"shape"
+        assert server.full_gets == 0
+
+    def test_extract_archive_without_ranges_downloads_once(self, mock_client, tmp_path):
+        server = self._serve(mock_client, ranges=False)
+        paths = mock_client.extract_archive(
+            "population-projections", None, tmp_path / "out", resource_key="res-002", verify_integrity=False
+        )
+        assert len(paths) == 3
+        assert server.full_gets == 1
+        assert sorted(p.name for p in (tmp_path / "out").rglob("*") if p.is_file()) == [
+            "boroughs.dbf",
+            "boroughs.shp",
+            "readme.txt",
+        ]
+
+    def test_size_mismatch_is_caught_before_reading(self, mock_client, tmp_path):
+        self._serve(mock_client)  # catalogue says 512000 bytes
+        with pytest.raises(DownloadError, match="Size mismatch"):
+            mock_client.extract_archive("population-projections", None, tmp_path, resource_key="res-002")
+
+    def test_open_resource_member(self, mock_client):
+        self._serve(mock_client)
+        with mock_client.open_resource(
+            "population-projections",
+            resource_key="res-002",
+            member="notes/readme.txt",
+            mode="r",
+            verify_integrity=False,
+        ) as f:
+            assert f.read() == "hello\n"
+
+    def test_open_resource_missing_member(self, mock_client):
+        self._serve(mock_client)
+        with pytest.raises(KeyError):
+            mock_client.open_resource(
+                "population-projections", resource_key="res-002", member="nope.txt", verify_integrity=False
+            )
+
+    def test_download_file_extract(self, mock_client, tmp_path):
+        self._serve(mock_client)
+        result = mock_client.download_file(
+            "population-projections",
+            resource_key="res-002",
+            destination=tmp_path,
+            extract="*.dbf",
+            verify_integrity=False,
+        )
+        assert result == tmp_path
+        assert [p.name for p in tmp_path.iterdir()] == ["boroughs.dbf"]
+
+    def test_list_archive_reads_only_the_directory(self, mock_client, tmp_path):
+        from london_data_store.cache import ArchiveListingCache
+
+        members = {"big.bin": random.Random(0).randbytes(200_000), "small.csv": b"a\n"}
+        body = make_zip(members)
+        mock_client._session = server = RangeServer(body)
+        mock_client._redirects = None
+        mock_client._archive_listings = ArchiveListingCache(tmp_path)
+
+        listing = mock_client.list_archive("population-projections", "res-002", verify_integrity=False)
+
+        assert [(m.name, m.size) for m in listing] == [("big.bin", 200_000), ("small.csv", 2)]
+        assert listing[1].crc == zlib.crc32(b"a\n")
+        assert sum(end - start + 1 for start, end in server.ranges_served) < 1024
+
+        # Served from the cache by catalogue hash on the next call
+        server.ranges_served.clear()
+        mock_client._session = MagicMock()
+        assert mock_client.list_archive("population-projections", "res-002", verify_integrity=False) == listing
+        mock_client._session.head.assert_not_called()
+
+    def test_not_a_zip(self, mock_client, tmp_path):
+        mock_client._session = RangeServer(b"not a zip at all")
+        mock_client._redirects = None
+        with pytest.raises(DownloadError, match="not a readable zip"):
+            mock_client.extract_archive(
+                "population-projections", None, tmp_path, resource_key="res-002", verify_integrity=False
+            )
@@ -1,10 +1,12 @@
 """Tests for london_data_store.async_client module."""
 
+import httpx
 import pytest
 
-from london_data_store.async_client import AsyncLondonDataStore
-from london_data_store.exceptions import DatasetNotFoundError
+from london_data_store.async_client import AsyncLondonDataStore, RateLimitedTransport, RetryTransport
+from london_data_store.exceptions import DatasetNotFoundError, DownloadError, FormatNotAvailableError
 from london_data_store.models import Dataset
+from london_data_store.ratelimit import Priority, RateLimiter, current_priority
 
 pytestmark = pytest.mark.asyncio
 
@@ -63,6 +65,63 @@ class TestAsyncSearch:
         assert len(results) <= 2
 
 
+class TestQueryParity:
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [
+            ("get_all_titles", ()),
+            ("get_all_d_types", ()),
+            ("filter_slug_for_d_type", ("gpkg",)),
+            ("filter_slug_for_d_type", ("csv",)),
+            ("filter_title_for_string", ("population",)),
+            ("get_slugs_for_string_in_title", ("cycling",)),
+            ("get_download_url_for_slug", ("population-projections",)),
+            ("filter_by_publisher", ("transport for london",)),
+            ("filter_by_update_frequency", ("annual",)),
+            ("filter_by_licence", ("open government",)),
+            ("filter_slugs_for_keyword", ("projection",)),
+            ("filter_titles_for_keyword", ("cycle",)),
+        ],
+    )
+    async def test_matches_sync_client(self, async_client, mock_client, method, args):
+        try:
+            expected = getattr(mock_client, method)(*args)
+        except FormatNotAvailableError:
+            with pytest.raises(FormatNotAvailableError):
+                await getattr(async_client, method)(*args)
+            return
+        result = await getattr(async_client, method)(*args)
+        assert sorted(result) == sorted(expected) if method == "get_all_d_types" else result == expected
+
+    async def test_every_sync_query_has_an_async_counterpart(self):
+        from london_data_store.api import LondonDataStore
+
+        queries = [
+            name
+            for name in vars(LondonDataStore)
+            if name.startswith(("get_all_", "filter_", "search", "get_slugs_", "get_download_url"))
+            and name != "filter_slugs_for_string"  # deprecated
+        ]
+        assert [name for name in queries if not hasattr(AsyncLondonDataStore, name)] == []
+
+    async def test_heavy_queries_run_in_executor(self, sample_catalogue):
+        from concurrent.futures import ThreadPoolExecutor
+
+        submitted = []
+
+        class Recording(ThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                submitted.append(fn.func.__name__)
+                return super().submit(fn, *args, **kwargs)
+
+        with Recording(max_workers=1) as executor:
+            client = AsyncLondonDataStore(cache=False, query_executor=executor)
+            client._raw_response_json = sample_catalogue
+            assert (await client.search("cycling"))[0][0] == "cycling-infrastructure"
+            assert await client.filter_slugs_for_keyword("cycle") == ["cycling-infrastructure"]
+        assert submitted == ["score_strings", "filter_for_keyword"]
+
+
 class TestAsyncGetDataset:
     async def test_returns_dataset(self, async_client):
         ds = await async_client.get_dataset("population-projections")
@@ -104,3 +163,535 @@ class TestAsyncFilterByKeyword:
 class TestAsyncClearCache:
     async def test_clear_cache_no_error(self, async_client):
         async_client.clear_cache()  # should not raise even with cache=False
+
+
+class TestSharedCatalogue:
+    def _client(self, url, tmp_path, requests_seen, **kwargs):
+        def handler(request):
+            requests_seen.append(request.url)
+            return httpx.Response(200, json=[{"slug": "a"}])
+
+        client = AsyncLondonDataStore(json_url=url, cache_dir=tmp_path, **kwargs)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+
+    async def test_loaded_catalogue_shared_across_instances(self, tmp_path, request):
+        from london_data_store.cache import CatalogueCache
+
+        url = f"https://shared.example/{request.node.name}.json"
+        seen = []
+        async with self._client(url, tmp_path, seen) as first:
+            assert await first.get_all_slugs() == ["a"]
+        assert len(seen) == 1
+        assert CatalogueCache(cache_dir=tmp_path).get(url) == [{"slug": "a"}]
+
+        # Neither the network nor the disk cache is touched again
+        CatalogueCache(cache_dir=tmp_path)._cache_path(url).unlink()
+        async with self._client(url, tmp_path, seen) as second:
+            assert await second.get_all_slugs() == ["a"]
+        assert len(seen) == 1
+
+        second.clear_cache()
+        async with self._client(url, tmp_path, seen) as third:
+            await third.get_all_slugs()
+        assert len(seen) == 2
+
+    async def test_not_shared_without_cache(self, tmp_path, request):
+        url = f"https://shared.example/{request.node.name}.json"
+        seen = []
+        for _ in range(2):
+            async with self._client(url, tmp_path, seen, cache=False) as client:
+                await client.get_all_slugs()
+        assert len(seen) == 2
+
+    async def test_shared_catalogue_expires(self, tmp_path, request):
+        url = f"https://shared.example/{request.node.name}.json"
+        seen = []
+        for _ in range(2):
+            async with self._client(url, tmp_path, seen, cache_ttl=0) as client:
+                await client.get_all_slugs()
+        assert len(seen) == 2
+
+    async def test_shared_catalogue_keeps_disk_cache_age(self, tmp_path, request):
+        import json
+        import time
+        from datetime import UTC, datetime, timedelta
+
+        from london_data_store import async_client
+        from london_data_store.cache import CatalogueCache
+
+        url = f"https://shared.example/{request.node.name}.json"
+        cache = CatalogueCache(cache_dir=tmp_path, ttl_seconds=3600)
+        cache.put(url, [{"slug": "a"}])
+        meta = json.loads(cache._meta_path(url).read_text())
+        meta["fetched_at"] = (datetime.now(UTC) - timedelta(seconds=3590)).isoformat()
+        cache._meta_path(url).write_text(json.dumps(meta))
+
+        seen = []
+        async with self._client(url, tmp_path, seen, cache_ttl=3600) as client:
+            assert await client.get_all_slugs() == ["a"]
+        assert seen == []
+        assert time.monotonic() - async_client._catalogues[url][0] >= 3590
+
+
+class TestRateLimitedTransport:
+    async def test_retries_429_through_limiter(self):
+        statuses = iter([429, 200])
+        seen = []
+
+        def handler(request):
+            seen.append(request.url.host)
+            return httpx.Response(next(statuses), headers={"Retry-After": "0"})
+
+        transport = RateLimitedTransport(RateLimiter(), httpx.MockTransport(handler))
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await client.get("https://a.example/x")
+
+        assert response.status_code == 200
+        assert seen == ["a.example", "a.example"]
+
+    async def test_catalogue_fetch_uses_high_priority(self):
+        lanes = []
+
+        def handler(request):
+            lanes.append(current_priority())
+            return httpx.Response(200, json=[{"slug": "a"}])
+
+        client = AsyncLondonDataStore(cache=False, rate_limiter=RateLimiter())
+        client._client = httpx.AsyncClient(transport=RateLimitedTransport(RateLimiter(), httpx.MockTransport(handler)))
+        async with client:
+            assert await client.get_all_slugs() == ["a"]
+        assert lanes == [Priority.HIGH]
+
+
+class TestRetryTransport:
+    def _transport(self, handler, **kwargs):
+        return RetryTransport(httpx.MockTransport(handler), backoff_factor=0, **kwargs)
+
+    async def test_retries_server_errors(self):
+        statuses = iter([503, 500, 200])
+
+        async with httpx.AsyncClient(
+            transport=self._transport(lambda request: httpx.Response(next(statuses)))
+        ) as client:
+            response = await client.get("https://a.example/x")
+        assert response.status_code == 200
+
+    async def test_gives_up_after_retries(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(502)
+
+        async with httpx.AsyncClient(transport=self._transport(handler, retries=2)) as client:
+            response = await client.get("https://a.example/x")
+        assert response.status_code == 502
+        assert len(calls) == 3
+
+    async def test_post_not_retried_on_status(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+
+        async with httpx.AsyncClient(transport=self._transport(handler)) as client:
+            await client.post("https://a.example/x")
+        assert len(calls) == 1
+
+    async def test_retries_connect_errors(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(200)
+
+        async with httpx.AsyncClient(transport=self._transport(handler)) as client:
+            assert (await client.get("https://a.example/x")).status_code == 200
+        assert len(calls) == 2
+
+    async def test_delay_honours_retry_after(self):
+        transport = RetryTransport(httpx.MockTransport(lambda request: None), backoff_factor=0.5, max_backoff=60)
+        assert transport.delay(0) == 0.5
+        assert transport.delay(2) == 2.0
+        assert transport.delay(0, httpx.Response(429, headers={"Retry-After": "7"})) == 7.0
+        assert transport.delay(0, httpx.Response(429, headers={"Retry-After": "600"})) == 60
+
+    async def test_client_settings(self):
+        async with AsyncLondonDataStore(cache=False, connect_timeout=2, read_timeout=45, retries=5) as lds:
+            client = await lds._get_client()
+            assert client.timeout.connect == 2
+            assert client.timeout.read == 45
+            assert isinstance(client._transport, RetryTransport)
+            assert client._transport._retries == 5
+
+    async def test_rate_limited_client_leaves_429_to_limiter(self):
+        async with AsyncLondonDataStore(cache=False, rate_limiter=RateLimiter()) as lds:
+            transport = (await lds._get_client())._transport
+            assert isinstance(transport, RateLimitedTransport)
+            assert 429 not in transport._transport._status_forcelist
+
+
+class TestAsyncCoalescing:
+    async def test_concurrent_catalogue_loads_share_one_fetch(self):
+        import asyncio
+
+        requests_seen = []
+
+        async def handler(request):
+            requests_seen.append(request.url)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=[{"slug": "a"}])
+
+        clients = [AsyncLondonDataStore(cache=False) for _ in range(3)]
+        for client in clients:
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        results = await asyncio.gather(*(client.get_all_slugs() for client in clients))
+
+        assert results == [["a"]] * 3
+        assert len(requests_seen) == 1
+        for client in clients:
+            await client.close()
+
+
+def _serving(sample_catalogue, body: bytes) -> AsyncLondonDataStore:
+    """A client whose every request is answered with ``body``."""
+
+    def handler(request):
+        return httpx.Response(200, content=body)
+
+    client = AsyncLondonDataStore(cache=False)
+    client._raw_response_json = sample_catalogue
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestAsyncDownloadToBuffer:
+    async def test_buffer_in_memory(self, sample_catalogue):
+        async with _serving(sample_catalogue, b"a,b\n1,2\n") as client:
+            buffer = await client.download_to_buffer("population-projections", "csv", verify_integrity=False)
+        with buffer:
+            assert not buffer.rolled_over
+            assert buffer.read() == b"a,b\n1,2\n"
+            assert buffer.bytes_downloaded == 8
+
+    async def test_buffer_spills(self, sample_catalogue):
+        body = b"x" * 200_000
+        async with _serving(sample_catalogue, body) as client:
+            buffer = await client.download_to_buffer(
+                "population-projections", "csv", max_memory=1000, verify_integrity=False
+            )
+        with buffer:
+            assert buffer.rolled_over
+            assert buffer.read() == body
+
+    async def test_writes_after_spill_run_off_the_loop(self, sample_catalogue, monkeypatch):
+        import hashlib
+        import threading
+
+        from london_data_store.download import BufferSink
+
+        body = bytes(range(256)) * 12_000
+        resource = sample_catalogue[0]["resources"]["res-001"]
+        resource["check_size"] = len(body)
+        resource["check_hash"] = hashlib.md5(body).hexdigest()
+        spilled_threads = []
+        write = BufferSink.write
+
+        def recording_write(self, chunk):
+            if self.buffer.rolled_over:
+                spilled_threads.append(threading.current_thread())
+            write(self, chunk)
+
+        monkeypatch.setattr(BufferSink, "write", recording_write)
+        async with _serving(sample_catalogue, body) as client:
+            buffer = await client.download_to_buffer("population-projections", "csv", max_memory=1000)
+        with buffer:
+            assert buffer.rolled_over
+            assert buffer.read() == body
+        assert spilled_threads
+        assert threading.main_thread() not in spilled_threads
+
+    async def test_download_bytes_checks_size(self, sample_catalogue):
+        from london_data_store.exceptions import DownloadError
+
+        async with _serving(sample_catalogue, b"short") as client:
+            assert await client.download_bytes("population-projections", "csv", verify_integrity=False) == b"short"
+            with pytest.raises(DownloadError, match="Size mismatch"):
+                await client.download_bytes("population-projections", "csv")
+
+
+class TestAsyncSinks:
+    async def test_download_to_sink(self, sample_catalogue):
+        from london_data_store.sinks import CallableSink
+
+        received = []
+        async with _serving(sample_catalogue, b"a,b\n1,2\n") as client:
+            result = await client.download_to_sink(
+                "population-projections",
+                CallableSink(received.append, commit=lambda: "done"),
+                "csv",
+                verify_integrity=False,
+            )
+        assert result.value == "done"
+        assert b"".join(received) == b"a,b\n1,2\n"
+
+    async def test_size_mismatch_aborts_file_sink(self, sample_catalogue, tmp_path):
+        from london_data_store.exceptions import DownloadError
+        from london_data_store.sinks import FileSink
+
+        async with _serving(sample_catalogue, b"short") as client:
+            with pytest.raises(DownloadError):
+                await client.download_to_sink("population-projections", FileSink(tmp_path / "out.csv"), "csv")
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_download_file_writes_through_file_sink(self, sample_catalogue, tmp_path):
+        async with _serving(sample_catalogue, b"a,b\n") as client:
+            path = await client.download_file("population-projections", "csv", tmp_path, verify_integrity=False)
+        assert path == tmp_path / "pop-data.csv"
+        assert path.read_bytes() == b"a,b\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["pop-data.csv"]
+
+    async def test_writes_and_hashing_run_off_the_loop(self, sample_catalogue):
+        import hashlib
+        import threading
+
+        from london_data_store.sinks import CallableSink
+
+        body = b"x" * 300_000
+        resource = sample_catalogue[0]["resources"]["res-001"]
+        resource["check_size"] = len(body)
+        resource["check_hash"] = hashlib.md5(body).hexdigest()
+        threads = set()
+
+        def write(chunk):
+            threads.add(threading.current_thread())
+            received.append(chunk)
+
+        received = []
+        async with _serving(sample_catalogue, body) as client:
+            result = await client.download_to_sink("population-projections", CallableSink(write), "csv")
+        assert b"".join(received) == body
+        assert result.hash_verified
+        assert threading.main_thread() not in threads
+
+    async def test_connection_errors_raise_download_error(self, sample_catalogue, tmp_path):
+        from london_data_store.exceptions import DownloadError
+
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        client = AsyncLondonDataStore(cache=False)
+        client._raw_response_json = sample_catalogue
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with client:
+            with pytest.raises(DownloadError, match="refused"):
+                await client.download_file("population-projections", "csv", tmp_path)
+            with pytest.raises(DownloadError, match="refused"):
+                async with client.open_resource("population-projections", "csv"):
+                    pass
+
+    async def test_file_sink_aborts_off_the_loop(self, sample_catalogue, tmp_path, monkeypatch):
+        import threading
+
+        from london_data_store.exceptions import DownloadError
+        from london_data_store.sinks import FileSink
+
+        threads = []
+        abort = FileSink.abort
+
+        def recording_abort(self):
+            threads.append(threading.current_thread())
+            abort(self)
+
+        monkeypatch.setattr(FileSink, "abort", recording_abort)
+        async with _serving(sample_catalogue, b"short") as client:
+            with pytest.raises(DownloadError):
+                await client.download_file("population-projections", "csv", tmp_path)
+        assert threads and threading.main_thread() not in threads
+
+    async def test_download_file_verifies_size(self, sample_catalogue, tmp_path):
+        from london_data_store.exceptions import DownloadError
+
+        (tmp_path / "pop-data.csv").write_bytes(b"previous")
+        async with _serving(sample_catalogue, b"short") as client:
+            with pytest.raises(DownloadError, match="Size mismatch"):
+                await client.download_file("population-projections", "csv", tmp_path)
+        assert [p.name for p in tmp_path.iterdir()] == ["pop-data.csv"]
+        assert (tmp_path / "pop-data.csv").read_bytes() == b"previous"
+
+    async def test_failed_write_aborts(self, sample_catalogue):
+        from london_data_store.exceptions import DownloadError
+        from london_data_store.sinks import CallableSink
+
+        aborted = []
+
+        def write(chunk):
+            raise OSError("disk full")
+
+        async with _serving(sample_catalogue, b"x" * 300_000) as client:
+            with pytest.raises(DownloadError, match="disk full"):
+                await client.download_to_sink(
+                    "population-projections",
+                    CallableSink(write, abort=lambda: aborted.append(True)),
+                    "csv",
+                    verify_integrity=False,
+                )
+        assert aborted == [True]
+
+    async def test_download_file_http_error(self, sample_catalogue, tmp_path):
+        from london_data_store.exceptions import DownloadError
+
+        client = AsyncLondonDataStore(cache=False)
+        client._raw_response_json = sample_catalogue
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(404)))
+        async with client:
+            with pytest.raises(DownloadError, match="404"):
+                await client.download_file("population-projections", "csv", tmp_path)
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestDownloadMany:
+    def _client(self, sample_catalogue, handler):
+        client = AsyncLondonDataStore(cache=False)
+        client._raw_response_json = sample_catalogue
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+
+    async def test_per_item_results(self, sample_catalogue, tmp_path):
+        def handler(request):
+            if "routes.geojson" in request.url.path:
+                return httpx.Response(500)
+            return httpx.Response(200, content=request.url.path.encode())
+
+        items = [
+            "population-projections",
+            ("cycling-infrastructure", "geojson"),
+            "no-such-slug",
+            ("london-borough-profiles", "csv"),
+        ]
+        async with self._client(sample_catalogue, handler) as client:
+            outcomes = await client.download_many(items, tmp_path, verify_integrity=False)
+
+        assert [o.slug for o in outcomes] == [
+            "population-projections",
+            "cycling-infrastructure",
+            "no-such-slug",
+            "london-borough-profiles",
+        ]
+        assert [o.ok for o in outcomes] == [True, False, False, True]
+        assert outcomes[0].path == tmp_path / "population-projections" / "pop-data.csv"
+        assert outcomes[0].path.read_bytes().endswith(b"pop-data.csv")
+        assert outcomes[0].bytes_downloaded == outcomes[0].path.stat().st_size
+        assert outcomes[3].path == tmp_path / "london-borough-profiles" / "profiles.csv"
+        assert isinstance(outcomes[1].error, DownloadError)
+        assert isinstance(outcomes[2].error, DatasetNotFoundError)
+        assert not (tmp_path / "cycling-infrastructure").exists()
+
+    async def test_per_host_limit(self, sample_catalogue, tmp_path):
+        import asyncio
+
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, content=b"x")
+
+        items = [(d["slug"], r["format"]) for d in sample_catalogue for r in d["resources"].values()]
+        progress = []
+        async with self._client(sample_catalogue, handler) as client:
+            outcomes = await client.download_many(
+                items,
+                tmp_path,
+                concurrency=8,
+                per_host=2,
+                verify_integrity=False,
+                progress_callback=lambda *a: progress.append(a),
+            )
+        assert all(o.ok for o in outcomes)
+        assert peak == 2
+        assert progress[-1] == (len(items), len(items))
+
+    async def test_unexpected_errors_stay_per_item(self, sample_catalogue, tmp_path, monkeypatch):
+        client = self._client(sample_catalogue, lambda request: httpx.Response(200, content=b"x"))
+        resolve = client.get_resource_download_url
+
+        def broken(slug, resource):
+            if slug == "cycling-infrastructure":
+                raise KeyError("url")
+            return resolve(slug, resource)
+
+        monkeypatch.setattr(client, "get_resource_download_url", broken)
+        async with client:
+            outcomes = await client.download_many(
+                ["population-projections", "cycling-infrastructure", "london-borough-profiles"],
+                tmp_path,
+                verify_integrity=False,
+            )
+        assert [o.ok for o in outcomes] == [True, False, True]
+        assert isinstance(outcomes[1].error, KeyError)
+
+    async def test_rejects_bad_limits(self, async_client):
+        with pytest.raises(ValueError):
+            await async_client.download_many(["population-projections"], concurrency=0)
+
+    async def test_http2_transport(self):
+        async with AsyncLondonDataStore(cache=False, http2=True, max_connections=4) as client:
+            pool = (await client._get_client())._transport._transport._pool
+            assert pool._http2
+            assert pool._max_connections == 4
+
+
+class TestAsyncStreaming:
+    BODY = b'borough,notes\nCamden,"multi\nline"\nHackney,x\n'
+
+    def _client(self, sample_catalogue, body: bytes, status: int = 200):
+        def handler(request):
+            return httpx.Response(status, content=body)
+
+        client = AsyncLondonDataStore(cache=False)
+        client._raw_response_json = sample_catalogue
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+
+    async def test_open_resource_yields_chunks(self, sample_catalogue):
+        client = self._client(sample_catalogue, self.BODY)
+        async with client, client.open_resource("population-projections", "csv", verify_integrity=False) as stream:
+            body = b"".join([chunk async for chunk in stream])
+        assert body == self.BODY
+
+    async def test_iter_rows(self, sample_catalogue):
+        async with self._client(sample_catalogue, self.BODY) as client:
+            rows = [row async for row in client.iter_rows("population-projections", verify_integrity=False)]
+        assert rows == [{"borough": "Camden", "notes": "multi\nline"}, {"borough": "Hackney", "notes": "x"}]
+
+    async def test_iter_rows_batches(self, sample_catalogue):
+        async with self._client(sample_catalogue, self.BODY) as client:
+            batches = [
+                b async for b in client.iter_rows("population-projections", batch_size=1, verify_integrity=False)
+            ]
+        assert [len(b) for b in batches] == [1, 1]
+
+    async def test_size_mismatch_raises(self, sample_catalogue):
+        from london_data_store.exceptions import DownloadError
+
+        async with self._client(sample_catalogue, self.BODY) as client:
+            with pytest.raises(DownloadError, match="Size mismatch"):
+                [row async for row in client.iter_rows("population-projections")]
+
+    async def test_http_error_raises_download_error(self, sample_catalogue):
+        from london_data_store.exceptions import DownloadError
+
+        async with self._client(sample_catalogue, b"", status=404) as client:
+            with pytest.raises(DownloadError):
+                async with client.open_resource("population-projections", "csv"):
+                    pass
@@ -3,7 +3,9 @@
 import json
 from datetime import UTC, datetime, timedelta
 
-from london_data_store.cache import CatalogueCache
+import pytest
+
+from london_data_store.cache import ArchiveListingCache, CatalogueCache, PreviewCache, RedirectCache, ValidatorCache
 
 TEST_URL = "https://data.london.gov.uk/api/v2/datasets/export.json"
 TEST_DATA = [{"slug": "test-dataset", "tags": ["test"]}]
@@ -32,6 +34,22 @@ class TestCatalogueCache:
 
         assert cache.get(TEST_URL) is None
 
+    @pytest.mark.asyncio
+    async def test_aput_and_aget(self, tmp_path):
+        cache = CatalogueCache(cache_dir=tmp_path, ttl_seconds=3600)
+        assert await cache.aget(TEST_URL) is None
+        await cache.aput(TEST_URL, TEST_DATA)
+        assert await cache.aget(TEST_URL) == TEST_DATA
+        assert cache.get(TEST_URL) == TEST_DATA
+
+    def test_get_with_age(self, tmp_path):
+        cache = CatalogueCache(cache_dir=tmp_path, ttl_seconds=3600)
+        assert cache.get_with_age(TEST_URL) is None
+        cache.put(TEST_URL, TEST_DATA)
+        data, age = cache.get_with_age(TEST_URL)
+        assert data == TEST_DATA
+        assert 0 <= age < 60
+
     def test_ttl_not_expired(self, tmp_path):
         cache = CatalogueCache(cache_dir=tmp_path, ttl_seconds=3600)
         cache.put(TEST_URL, TEST_DATA)
@@ -133,3 +151,91 @@ class TestCacheIntegration:
         client.clear_cache()
         assert cache.get(client.json_url) is None
         client.close()
+
+
+class TestValidatorCache:
+    def test_missing_record_returns_none(self, tmp_path):
+        dest = tmp_path / "data.csv"
+        dest.write_bytes(b"data")
+        assert ValidatorCache(tmp_path / "cache").get(dest) is None
+
+    def test_put_and_get(self, tmp_path):
+        dest = tmp_path / "data.csv"
+        dest.write_bytes(b"data")
+        cache = ValidatorCache(tmp_path / "cache")
+        cache.put(dest, url="https://example.com/data.csv", etag='"e1"', check_timestamp="t1")
+
+        record = cache.get(dest)
+        assert record["etag"] == '"e1"'
+        assert record["check_timestamp"] == "t1"
+        assert record["size"] == 4
+
+    def test_modified_file_invalidates_record(self, tmp_path):
+        dest = tmp_path / "data.csv"
+        dest.write_bytes(b"data")
+        cache = ValidatorCache(tmp_path / "cache")
+        cache.put(dest, url="https://example.com/data.csv", etag='"e1"')
+        dest.write_bytes(b"changed data")
+        assert cache.get(dest) is None
+
+    def test_invalidate(self, tmp_path):
+        dest = tmp_path / "data.csv"
+        dest.write_bytes(b"data")
+        cache = ValidatorCache(tmp_path / "cache")
+        cache.put(dest, url="https://example.com/data.csv")
+        cache.invalidate(dest)
+        assert cache.get(dest) is None
+
+
+class TestRedirectCache:
+    URL = "https://data.london.gov.uk/download/x/res/data.csv"
+    TARGET = "https://s3.example.com/bucket/data.csv?sig=1"
+
+    def test_put_and_get(self, tmp_path):
+        cache = RedirectCache(tmp_path)
+        cache.put(self.URL, self.TARGET, check_timestamp="t1")
+        assert cache.get(self.URL, "t1") == self.TARGET
+
+    def test_changed_check_timestamp_misses(self, tmp_path):
+        cache = RedirectCache(tmp_path)
+        cache.put(self.URL, self.TARGET, check_timestamp="t1")
+        assert cache.get(self.URL, "t2") is None
+
+    def test_expired_record_misses(self, tmp_path):
+        cache = RedirectCache(tmp_path, max_age=0)
+        cache.put(self.URL, self.TARGET)
+        assert cache.get(self.URL) is None
+
+    def test_invalidate(self, tmp_path):
+        cache = RedirectCache(tmp_path)
+        cache.put(self.URL, self.TARGET)
+        cache.invalidate(self.URL)
+        assert cache.get(self.URL) is None
+
+
+class TestArchiveListingCache:
+    def test_put_and_get(self, tmp_path):
+        cache = ArchiveListingCache(tmp_path)
+        cache.put("abc-1", [{"name": "a.csv"}])
+        assert cache.get("abc-1") == [{"name": "a.csv"}]
+        assert cache.get("def-1") is None
+
+    def test_invalidate(self, tmp_path):
+        cache = ArchiveListingCache(tmp_path)
+        cache.put("abc-1", [])
+        cache.invalidate("abc-1")
+        assert cache.get("abc-1") is None
+
+
+class TestPreviewCache:
+    def test_serves_shorter_prefixes(self, tmp_path):
+        cache = PreviewCache(tmp_path)
+        cache.put("abc-1", b"0123456789", complete=False)
+        assert cache.get("abc-1", 4) == (b"0123", False)
+        assert cache.get("abc-1", 20) is None
+
+    def test_complete_body_serves_any_size(self, tmp_path):
+        cache = PreviewCache(tmp_path)
+        cache.put("abc-1", b"abc", complete=True)
+        assert cache.get("abc-1", 100) == (b"abc", True)
+        assert cache.get("abc-1", 2) == (b"ab", False)
@@ -21,6 +21,12 @@ def mock_lds(sample_catalogue):
         instance._base_url = None
         instance._session = MagicMock()
         instance._cache = None
+        instance._store = None
+        instance._validators = None
+        instance._rate_limiter = None
+        instance._redirects = None
+        instance._archive_listings = None
+        instance._previews = None
 
         MockCls.return_value.__enter__ = MagicMock(return_value=instance)
         MockCls.return_value.__exit__ = MagicMock(return_value=False)
@@ -139,6 +145,61 @@ class TestInfoCommand:
         assert result == 1
 
 
+class TestArchiveCommand:
+    def _members(self):
+        from london_data_store.archive import ArchiveMember
+
+        return [
+            ArchiveMember("shapes/", 0, 0, 0, "2024-01-01T00:00:00", is_dir=True),
+            ArchiveMember("shapes/boroughs.shp", 2048, 1024, 0xDEADBEEF, "2024-01-01T00:00:00"),
+        ]
+
+    def test_archive_table(self, mock_lds, capsys):
+        with patch.object(type(mock_lds), "list_archive", return_value=self._members()) as listing:
+            result = main(["archive", "population-projections", "--resource-key", "res-002"])
+        assert result == 0
+        listing.assert_called_once_with("population-projections", "res-002")
+        output = capsys.readouterr().out
+        assert "shapes/boroughs.shp" in output
+        assert "deadbeef" in output
+        assert "shapes/\n" not in output
+
+    def test_archive_json(self, mock_lds, capsys):
+        with patch.object(type(mock_lds), "list_archive", return_value=self._members()):
+            result = main(["archive", "population-projections", "--json"])
+        assert result == 0
+        output = json.loads(capsys.readouterr().out)
+        assert output[1]["crc"] == 0xDEADBEEF
+
+
+class TestPreviewCommand:
+    def _preview(self, **kwargs):
+        from london_data_store.preview import Preview
+
+        fields = {"slug": "population-projections", "resource_key": "res-001", "format": "csv", "url": "u"}
+        return Preview(**fields, bytes_read=100, complete=False, **kwargs)
+
+    def test_preview_table(self, mock_lds, capsys):
+        preview = self._preview(columns=["borough", "population"], rows=[{"borough": "Camden", "population": "210000"}])
+        with patch.object(type(mock_lds), "preview", return_value=preview) as method:
+            result = main(["preview", "population-projections", "--rows", "1", "--bytes", "8K"])
+        assert result == 0
+        assert method.call_args.kwargs["max_bytes"] == 8192
+        output = capsys.readouterr().out
+        assert "borough" in output
+        assert "Camden" in output
+
+    def test_preview_json(self, mock_lds, capsys):
+        with patch.object(type(mock_lds), "preview", return_value=self._preview(text="hello")):
+            result = main(["preview", "population-projections", "--json"])
+        assert result == 0
+        assert json.loads(capsys.readouterr().out)["text"] == "hello"
+
+    def test_preview_unavailable(self, mock_lds, capsys):
+        with patch.object(type(mock_lds), "preview", return_value=self._preview()):
+            assert main(["preview", "population-projections"]) == 1
+
+
 class TestTopicsCommand:
     def test_topics_list(self, mock_lds, capsys):
         result = main(["topics"])
@@ -173,11 +234,192 @@ class TestDownloadCommand:
             output = capsys.readouterr().out
             assert "Downloaded:" in output
 
+    def test_download_if_changed_reports_not_modified(self, mock_lds, capsys, tmp_path):
+        from london_data_store.download import DownloadResult, DownloadStatus
+
+        with patch("london_data_store.api.DownloadManager") as MockDM:
+            MockDM.return_value.download.return_value = DownloadResult(
+                path=tmp_path / "pop-data.csv", status=DownloadStatus.NOT_MODIFIED, url="u"
+            )
+            result = main(["download", "population-projections", "--if-changed", "--dest", str(tmp_path)])
+            assert result == 0
+            assert MockDM.return_value.download.call_args.kwargs["if_changed"] is True
+            assert "Not modified:" in capsys.readouterr().out
+
+    def test_download_dry_run(self, mock_lds, capsys, tmp_path):
+        with patch("london_data_store.api.DownloadManager") as MockDM:
+            result = main(
+                ["download", "population-projections", "cycling-infrastructure", "--dry-run", "--dest", str(tmp_path)]
+            )
+            assert result == 0
+            MockDM.assert_not_called()
+        output = capsys.readouterr().out
+        assert "2 downloads" in output
+        assert "ok" in output
+        assert "res-020" in output
+
+    def test_download_dry_run_json(self, mock_lds, capsys, tmp_path):
+        result = main(["download", "population-projections", "--dry-run", "--json", "--dest", str(tmp_path)])
+        assert result == 0
+        plan = json.loads(capsys.readouterr().out)
+        assert plan["total_bytes"] == 102400
+        assert plan["fits"] is True
+
+    def test_download_many_in_plan_order(self, mock_lds, capsys, tmp_path):
+        from london_data_store.download import DownloadResult, DownloadStatus
+
+        with patch("london_data_store.api.DownloadManager") as MockDM:
+            MockDM.return_value.download.return_value = DownloadResult(
+                path=tmp_path / "f", status=DownloadStatus.DOWNLOADED, url="u"
+            )
+            result = main(
+                [
+                    "download",
+                    "population-projections",
+                    "cycling-infrastructure",
+                    "--order",
+                    "largest-first",
+                    "--dest",
+                    str(tmp_path),
+                ]
+            )
+            assert result == 0
+            urls = [c.kwargs["url"] for c in MockDM.return_value.download.call_args_list]
+        assert "/res-020/" in urls[0]
+        assert "/res-001/" in urls[1]
+        assert capsys.readouterr().out.count("Downloaded:") == 2
+
+    def test_download_many_into_missing_dest(self, mock_lds, capsys, tmp_path):
+        from london_data_store.download import DownloadResult, DownloadStatus
+
+        dest = tmp_path / "new"
+        with patch("london_data_store.api.DownloadManager") as MockDM:
+            MockDM.return_value.download.return_value = DownloadResult(
+                path=dest / "f", status=DownloadStatus.DOWNLOADED, url="u"
+            )
+            result = main(
+                [
+                    "download",
+                    "population-projections",
+                    "cycling-infrastructure",
+                    "--order",
+                    "as-given",
+                    "--dest",
+                    str(dest),
+                ]
+            )
+            assert result == 0
+            paths = [c.kwargs["destination"] for c in MockDM.return_value.download.call_args_list]
+        assert paths == [dest / "pop-data.csv", dest / "routes.geojson"]
+
     def test_download_not_found(self, mock_lds, capsys, tmp_path):
         result = main(["download", "nonexistent", "--dest", str(tmp_path)])
         assert result == 1
 
 
+class TestMirrorCommand:
+    def _result(self, failed=None):
+        from london_data_store.mirror import MirrorEntry, MirrorPlan, MirrorResult
+
+        entry = MirrorEntry("population-projections", "res-001", "csv", "u", "population-projections/pop-data.csv")
+        plan = MirrorPlan(target="mirror", new=[entry])
+        return MirrorResult(plan=plan, downloaded=[] if failed else [entry], failed=failed or {})
+
+    def test_mirror_passes_filters(self, mock_lds, capsys):
+        with patch("london_data_store.cli.mirror", return_value=self._result()) as run:
+            result = main(
+                ["mirror", "data", "--topic", "transport", "--format", "csv", "--format", "geojson", "--prune"]
+            )
+        assert result == 0
+        kwargs = run.call_args.kwargs
+        assert run.call_args.args[1] == "data"
+        assert kwargs["topics"] == ["transport"]
+        assert kwargs["formats"] == ["csv", "geojson"]
+        assert kwargs["prune"] is True
+        assert "1 new" in capsys.readouterr().out
+
+    def test_dry_run_lists_plan(self, mock_lds, capsys):
+        with patch("london_data_store.cli.mirror", return_value=self._result()):
+            assert main(["mirror", "data", "--dry-run"]) == 0
+        assert "population-projections/pop-data.csv" in capsys.readouterr().out
+
+    def test_failures_exit_nonzero(self, mock_lds, capsys):
+        with patch("london_data_store.cli.mirror", return_value=self._result({"a/r": "HTTP 503"})):
+            assert main(["mirror", "data", "--json"]) == 1
+        assert json.loads(capsys.readouterr().out)["errors"] == {"a/r": "HTTP 503"}
+
+
+class TestScanCommand:
+    def _report(self):
+        from london_data_store.scan import ResourceCheck, ScanReport
+
+        return ScanReport(
+            checks=[
+                ResourceCheck("a", "r1", "csv", "u1", status=200),
+                ResourceCheck("b", "r2", "csv", "u2", status=404),
+                ResourceCheck("c", "r3", "csv", "u3", expected_size=10, status=200, size=12),
+            ]
+        )
+
+    def test_scan_summary(self, capsys):
+        from unittest.mock import AsyncMock
+
+        scan = AsyncMock(return_value=self._report())
+        with patch("london_data_store.async_client.AsyncLondonDataStore.scan", scan):
+            result = main(["scan", "a", "b", "--concurrency", "8", "--rate", "5", "--no-cache"])
+        assert result == 0
+        assert scan.call_args.kwargs["slugs"] == ["a", "b"]
+        assert scan.call_args.kwargs["concurrency"] == 8
+        output = capsys.readouterr().out
+        assert "3 resources" in output
+        assert "Dead links" in output
+        assert "Size drift" in output
+        assert "Modified" not in output
+
+    def test_scan_json_and_report_file(self, capsys, tmp_path):
+        from unittest.mock import AsyncMock
+
+        report_path = tmp_path / "scan.json"
+        with patch("london_data_store.async_client.AsyncLondonDataStore.scan", AsyncMock(return_value=self._report())):
+            result = main(["scan", "--json", "--report", str(report_path), "--no-cache"])
+        assert result == 0
+        printed = json.loads(capsys.readouterr().out)
+        assert printed["summary"]["dead"] == 1
+        assert json.loads(report_path.read_text()) == printed
+
+
+class TestStoreCommand:
+    def test_store_info(self, tmp_path, capsys):
+        result = main(["store", "info", "--store-dir", str(tmp_path), "--json"])
+        assert result == 0
+        output = json.loads(capsys.readouterr().out)
+        assert output["objects"] == 0
+        assert output["store_dir"] == str(tmp_path)
+
+    def test_store_gc(self, tmp_path, capsys):
+        from london_data_store.store import ResourceStore
+
+        source = tmp_path / "f"
+        source.write_bytes(b"x" * 100)
+        ResourceStore(tmp_path / "store").add("0" * 32, source)
+
+        result = main(["store", "gc", "--store-dir", str(tmp_path / "store"), "--max-size", "0"])
+        assert result == 0
+        assert "Evicted 1 objects" in capsys.readouterr().out
+
+    def test_store_gc_requires_limit(self, tmp_path, capsys):
+        result = main(["store", "gc", "--store-dir", str(tmp_path)])
+        assert result == 1
+
+    def test_parse_size_and_age(self):
+        from london_data_store.cli import _parse_age, _parse_size
+
+        assert _parse_size("2G") == 2 * 1024**3
+        assert _parse_size("500mb") == 500 * 1024**2
+        assert _parse_age("30d") == 30 * 86400
+        assert _parse_age("90") == 90
+
+
 class TestNoCommand:
     def test_no_command_exits(self):
         with pytest.raises(SystemExit):
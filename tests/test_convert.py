@@ -0,0 +1,134 @@
+"""Tests for london_data_store.convert module."""
+
+import io
+from unittest.mock import MagicMock
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from london_data_store.convert import _rebatch, convert_csv, convert_resources, infer_schema  # noqa: E402
+from london_data_store.exceptions import ConversionError  # noqa: E402
+
+CSV = b"\xef\xbb\xbfborough,year,population,note\r\n" + b"".join(
+    f'Borough {i},{2000 + i % 20},{1000 + i},"line\r\n{i}"\r\n'.encode() for i in range(250)
+)
+
+
+class TestInferSchema:
+    def test_infers_types_and_widens_empty_columns(self):
+        schema = infer_schema(b"a,b,c\n1,x,\n2,y,\n")
+        assert schema.field("a").type == pa.int64()
+        assert schema.field("b").type == pa.string()
+        assert schema.field("c").type == pa.string()
+
+    def test_column_type_overrides(self):
+        schema = infer_schema(b"code\n001\n", column_types={"code": pa.string()})
+        assert schema.field("code").type == pa.string()
+
+
+class TestConvertCsv:
+    def test_parquet_in_fixed_size_row_groups(self, tmp_path):
+        out = tmp_path / "pop.parquet"
+        result = convert_csv(io.BytesIO(CSV), out, batch_size=100, sample_rows=10, block_size=512)
+
+        assert result.rows == 250
+        assert result.batches == 3
+        assert result.columns == ["borough", "year", "population", "note"]
+        metadata = pq.ParquetFile(out).metadata
+        assert [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [100, 100, 50]
+        table = pq.read_table(out)
+        assert table.column("population").type == pa.int64()
+        assert table.column("note")[3].as_py() == "line\r\n3"
+        assert not out.with_suffix(".parquet.part").exists()
+
+    def test_arrow_ipc_from_path(self, tmp_path):
+        source = tmp_path / "pop.csv"
+        source.write_bytes(CSV)
+        out = tmp_path / "pop.arrow"
+        result = convert_csv(source, out, format="arrow", batch_size=64)
+
+        reader = pa.ipc.open_file(out)
+        assert reader.num_record_batches == result.batches == 4
+        assert reader.read_all().num_rows == 250
+
+    def test_value_outside_sampled_type_raises(self, tmp_path):
+        data = b"n\n" + b"".join(f"{i}\n".encode() for i in range(20)) + b"not a number\n"
+        out = tmp_path / "n.parquet"
+        with pytest.raises(ConversionError):
+            convert_csv(io.BytesIO(data), out, sample_rows=5, block_size=16)
+        assert not out.exists()
+        assert not out.with_suffix(".parquet.part").exists()
+
+    def test_empty_csv_raises(self, tmp_path):
+        with pytest.raises(ConversionError):
+            convert_csv(io.BytesIO(b""), tmp_path / "x.parquet")
+
+    def test_rejects_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            convert_csv(io.BytesIO(CSV), tmp_path / "x.orc", format="orc")
+
+    def test_rebatch(self):
+        batches = [pa.record_batch({"a": list(range(n))}) for n in (3, 0, 5, 1)]
+        assert [b.num_rows for b in _rebatch(batches, 4)] == [4, 4, 1]
+
+
+class TestConvertResources:
+    def _serve(self, client, body: bytes):
+        def get(url, **kwargs):
+            response = MagicMock()
+            response.url = url
+            response.history = []
+            response.iter_content.side_effect = lambda chunk_size: iter(
+                [body[i : i + 1000] for i in range(0, len(body), 1000)]
+            )
+            return response
+
+        client._session = MagicMock()
+        client._session.get.side_effect = get
+
+    def test_converts_streamed_resource(self, mock_client, tmp_path):
+        self._serve(mock_client, CSV)
+        result = mock_client.convert_resource("population-projections", tmp_path, verify_integrity=False)
+
+        assert result.path == tmp_path / "pop-data.parquet"
+        assert pq.read_table(result.path).num_rows == 250
+
+    def test_integrity_failure_propagates(self, mock_client, tmp_path):
+        from london_data_store.exceptions import DownloadError
+
+        self._serve(mock_client, CSV)  # catalogue says 102400 bytes
+        with pytest.raises(DownloadError):
+            mock_client.convert_resource("population-projections", tmp_path)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_converts_several_in_parallel(self, mock_client, tmp_path):
+        self._serve(mock_client, CSV)
+        results = convert_resources(
+            mock_client,
+            ["population-projections", ("population-projections", "res-001")],
+            tmp_path,
+            format="arrow",
+            verify_integrity=False,
+            workers=2,
+        )
+        assert [r.rows for r in results] == [250, 250]
+
+    def test_shared_names_get_their_own_outputs(self, mock_client, tmp_path):
+        self._serve(mock_client, CSV)
+        datasets = mock_client._raw_response_json
+        datasets[1]["resources"]["res-010"]["url"] = datasets[0]["resources"]["res-001"]["url"]
+        dest = tmp_path / "new"
+        results = convert_resources(
+            mock_client,
+            ["population-projections", "london-borough-profiles"],
+            dest,
+            verify_integrity=False,
+            workers=2,
+        )
+        assert [r.path for r in results] == [
+            dest / "population-projections" / "pop-data.parquet",
+            dest / "london-borough-profiles" / "pop-data.parquet",
+        ]
+        assert all(pq.read_table(r.path).num_rows == 250 for r in results)
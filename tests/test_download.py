@@ -116,6 +116,627 @@ class TestDownloadManager:
         assert part_files == []
 
 
+class TestBufferedWritePath:
+    """Bodies backed by a real urllib3 stream are read with readinto into a reused buffer."""
+
+    def _make_response(self, body: bytes, headers: dict | None = None):
+        import io
+
+        import requests
+        from urllib3 import HTTPResponse
+
+        response = requests.Response()
+        response.status_code = 200
+        response.url = "https://example.com/data.csv"
+        response.headers = requests.structures.CaseInsensitiveDict(headers or {})
+        response.raw = HTTPResponse(
+            body=io.BytesIO(body), headers=headers or {}, status=200, preload_content=False, decode_content=False
+        )
+        return response
+
+    def test_readinto_path_writes_body(self, tmp_path):
+        import hashlib
+
+        content = bytes(range(256)) * 5000
+        session = MagicMock()
+        session.get.return_value = self._make_response(content, {"content-length": str(len(content))})
+        callback = MagicMock()
+
+        manager = DownloadManager(session, progress_interval=0)
+        result = manager.download_file(
+            "https://example.com/data.csv",
+            tmp_path,
+            chunk_size=64 * 1024,
+            progress_callback=callback,
+            expected_hash=hashlib.md5(content).hexdigest(),
+            expected_size=len(content),
+        )
+
+        assert result.read_bytes() == content
+        assert callback.call_count == -(-len(content) // (64 * 1024))
+        assert callback.call_args.args == (len(content), len(content))
+
+    def test_concurrent_downloads_share_one_transfer(self, tmp_path):
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        release = threading.Event()
+        content = b"shared body"
+
+        def slow_get(*args, **kwargs):
+            release.wait(5)
+            return self._make_response(content)
+
+        session = MagicMock()
+        session.get.side_effect = slow_get
+        managers = [DownloadManager(session) for _ in range(2)]
+        with ThreadPoolExecutor(4) as pool:
+            futures = [pool.submit(m.download, "https://example.com/data.csv", tmp_path) for m in managers * 2]
+            time.sleep(0.05)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert session.get.call_count == 1
+        assert all(result is results[0] for result in results)
+        assert results[0].path.read_bytes() == content
+
+    def test_progress_is_throttled(self, tmp_path):
+        content = bytes(range(256)) * 5000
+        session = MagicMock()
+        session.get.return_value = self._make_response(content)
+        callback = MagicMock()
+
+        manager = DownloadManager(session, progress_interval=60)
+        manager.download_file(
+            "https://example.com/data.csv", tmp_path, chunk_size=64 * 1024, progress_callback=callback
+        )
+
+        # First update, then the final one flushed at the end; size unknown in between
+        assert callback.call_count == 2
+        assert callback.call_args.args == (len(content), None)
+
+    def test_readinto_path_decodes_content(self, tmp_path):
+        import gzip
+
+        content = b"borough,population\n" * 1000
+        session = MagicMock()
+        session.get.return_value = self._make_response(gzip.compress(content), {"content-encoding": "gzip"})
+
+        result = DownloadManager(session).download_file("https://example.com/data.csv", tmp_path)
+        assert result.read_bytes() == content
+
+    def test_extra_digests_on_result(self, tmp_path):
+        import hashlib
+
+        content = b"x" * 300_000
+        session = MagicMock()
+        session.get.return_value = self._make_response(content)
+
+        result = DownloadManager(session).download(
+            "https://example.com/data.csv",
+            tmp_path,
+            chunk_size=64 * 1024,
+            expected_hash=hashlib.md5(content).hexdigest(),
+            hash_algorithms=["sha256", "blake2b"],
+        )
+
+        assert result.digests == {
+            "md5": hashlib.md5(content).hexdigest(),
+            "sha256": hashlib.sha256(content).hexdigest(),
+            "blake2b": hashlib.blake2b(content).hexdigest(),
+        }
+
+    def test_no_digests_without_hash_request(self, tmp_path):
+        session = MagicMock()
+        session.get.return_value = self._make_response(b"data")
+
+        result = DownloadManager(session).download("https://example.com/data.csv", tmp_path)
+        assert result.digests == {}
+
+    def test_unknown_algorithm_raises_before_request(self, tmp_path):
+        session = MagicMock()
+        with pytest.raises(ValueError, match="Unsupported hash algorithm"):
+            DownloadManager(session).download("https://example.com/data.csv", tmp_path, hash_algorithms=["nope"])
+        session.get.assert_not_called()
+
+    def test_default_chunk_size_is_large(self):
+        from london_data_store.download import DEFAULT_CHUNK_SIZE
+
+        assert DEFAULT_CHUNK_SIZE >= 1024 * 1024
+
+
+class TestStoreIntegration:
+    def _make_session(self, content: bytes):
+        session = MagicMock()
+        response = MagicMock()
+        response.headers = {}
+        response.iter_content.return_value = [content]
+        response.raise_for_status.return_value = None
+        session.get.return_value = response
+        return session
+
+    def test_verified_download_is_stored(self, tmp_path):
+        import hashlib
+
+        from london_data_store.store import ResourceStore
+
+        content = b"stored content"
+        digest = hashlib.md5(content).hexdigest()
+        store = ResourceStore(tmp_path / "store")
+        manager = DownloadManager(self._make_session(content), store=store)
+        manager.download_file("https://example.com/data.csv", tmp_path / "a.csv", expected_hash=f"{digest}-1")
+
+        assert store.get(digest).read_bytes() == content
+
+    def test_stored_hash_skips_network(self, tmp_path):
+        import hashlib
+
+        from london_data_store.store import ResourceStore
+
+        content = b"stored content"
+        digest = hashlib.md5(content).hexdigest()
+        source = tmp_path / "source"
+        source.write_bytes(content)
+        store = ResourceStore(tmp_path / "store")
+        store.add(digest, source)
+
+        session = self._make_session(b"unused")
+        manager = DownloadManager(session, store=store)
+        result = manager.download_file(
+            "https://example.com/data.csv", tmp_path / "out", expected_hash=f"{digest}-1", expected_size=len(content)
+        )
+
+        session.get.assert_not_called()
+        assert result.read_bytes() == content
+
+    def test_hash_mismatch_not_stored(self, tmp_path):
+        from london_data_store.store import ResourceStore
+
+        store = ResourceStore(tmp_path / "store")
+        manager = DownloadManager(self._make_session(b"content"), store=store)
+        manager.download_file("https://example.com/data.csv", tmp_path / "a.csv", expected_hash="0" * 32)
+
+        assert store.usage().objects == 0
+
+
+class TestConditionalDownload:
+    URL = "https://example.com/data.csv"
+
+    def _make_session(self, content: bytes = b"v1", status_code: int = 200, headers: dict | None = None):
+        session = MagicMock()
+        response = MagicMock()
+        response.status_code = status_code
+        response.headers = headers if headers is not None else {"etag": '"abc"', "last-modified": "Mon, 01 Jan 2024"}
+        response.iter_content.return_value = [content]
+        response.raise_for_status.return_value = None
+        session.get.return_value = response
+        return session
+
+    def _manager(self, session, tmp_path):
+        from london_data_store.cache import ValidatorCache
+
+        return DownloadManager(session, validators=ValidatorCache(tmp_path / "cache"))
+
+    def test_first_download_records_validators(self, tmp_path):
+        from london_data_store.download import DownloadStatus
+
+        manager = self._manager(self._make_session(), tmp_path)
+        result = manager.download(self.URL, tmp_path / "data.csv", if_changed=True, check_timestamp="t1")
+
+        assert result.status == DownloadStatus.DOWNLOADED
+        assert result.bytes_downloaded == 2
+        record = manager.validators.get(tmp_path / "data.csv")
+        assert record["etag"] == '"abc"'
+        assert record["check_timestamp"] == "t1"
+
+    def test_sends_conditional_headers(self, tmp_path):
+        session = self._make_session()
+        manager = self._manager(session, tmp_path)
+        manager.download(self.URL, tmp_path / "data.csv", if_changed=True, check_timestamp="t1")
+        manager.download(self.URL, tmp_path / "data.csv", if_changed=True, check_timestamp="t2")
+
+        headers = session.get.call_args.kwargs["headers"]
+        assert headers == {"If-None-Match": '"abc"', "If-Modified-Since": "Mon, 01 Jan 2024"}
+
+    def test_304_keeps_existing_file(self, tmp_path):
+        from london_data_store.download import DownloadStatus
+
+        session = self._make_session(b"v1")
+        manager = self._manager(session, tmp_path)
+        manager.download(self.URL, tmp_path / "data.csv", if_changed=True, check_timestamp="t1")
+
+        session.get.return_value.status_code = 304
+        session.get.return_value.iter_content.return_value = [b""]
+        result = manager.download(self.URL, tmp_path / "data.csv", if_changed=True, check_timestamp="t2")
+
+        assert result.status == DownloadStatus.NOT_MODIFIED
+        assert (tmp_path / "data.csv").read_bytes() == b"v1"
+        assert manager.validators.get(tmp_path / "data.csv")["check_timestamp"] == "t2"
+        assert [p.name for p in tmp_path.iterdir() if p.is_file()] == ["data.csv"]
+
+    def test_unchanged_check_timestamp_skips_request(self, tmp_path):
+        from london_data_store.download import DownloadStatus
+
+        session = self._make_session()
+        manager = self._manager(session, tmp_path)
+        manager.download(self.URL, tmp_path / "data.csv", if_changed=True, check_timestamp="t1")
+        result = manager.download(self.URL, tmp_path / "data.csv", if_changed=True, check_timestamp="t1")
+
+        assert result.status == DownloadStatus.NOT_MODIFIED
+        assert session.get.call_count == 1
+
+    def test_locally_modified_file_is_redownloaded(self, tmp_path):
+        from london_data_store.download import DownloadStatus
+
+        session = self._make_session(b"v1")
+        manager = self._manager(session, tmp_path)
+        manager.download(self.URL, tmp_path / "data.csv", if_changed=True, check_timestamp="t1")
+        (tmp_path / "data.csv").write_bytes(b"edited locally")
+
+        result = manager.download(self.URL, tmp_path / "data.csv", if_changed=True, check_timestamp="t1")
+        assert result.status == DownloadStatus.DOWNLOADED
+        assert not session.get.call_args.kwargs.get("headers")
+
+    def test_without_if_changed_always_downloads(self, tmp_path):
+        session = self._make_session()
+        manager = self._manager(session, tmp_path)
+        manager.download(self.URL, tmp_path / "data.csv", check_timestamp="t1")
+        manager.download(self.URL, tmp_path / "data.csv", check_timestamp="t1")
+
+        assert session.get.call_count == 2
+
+    def test_store_hit_reports_store_status(self, tmp_path):
+        import hashlib
+
+        from london_data_store.download import DownloadStatus
+        from london_data_store.store import ResourceStore
+
+        source = tmp_path / "source"
+        source.write_bytes(b"v1")
+        store = ResourceStore(tmp_path / "store")
+        store.add(hashlib.md5(b"v1").hexdigest(), source)
+
+        manager = DownloadManager(self._make_session(), store=store)
+        result = manager.download(self.URL, tmp_path / "out.csv", expected_hash=hashlib.md5(b"v1").hexdigest())
+        assert result.status == DownloadStatus.STORE
+
+
+class TestSegmentedDownload:
+    PAYLOAD = bytes(range(256)) * 64  # 16 KiB
+
+    def _make_session(self, *, accept_ranges: str = "bytes", honour_ranges: bool = True):
+        payload = self.PAYLOAD
+        session = MagicMock()
+
+        head = MagicMock()
+        head.headers = {"accept-ranges": accept_ranges, "content-length": str(len(payload))}
+        head.url = "https://example.com/data.csv"
+        head.raise_for_status.return_value = None
+        session.head.return_value = head
+
+        def get(url, headers=None, stream=False, timeout=None):
+            response = MagicMock()
+            response.raise_for_status.return_value = None
+            byte_range = (headers or {}).get("Range")
+            if byte_range and honour_ranges:
+                start, end = (int(x) for x in byte_range.removeprefix("bytes=").split("-"))
+                body = payload[start : end + 1]
+                response.status_code = 206
+                response.headers = {"content-range": f"bytes {start}-{end}/{len(payload)}"}
+            else:
+                body = payload
+                response.status_code = 200
+                response.headers = {"content-length": str(len(payload))}
+            response.iter_content.return_value = [body[i : i + 1000] for i in range(0, len(body), 1000)]
+            return response
+
+        session.get.side_effect = get
+        return session
+
+    def test_segmented_download_assembles_file(self, tmp_path):
+        import hashlib
+
+        session = self._make_session()
+        manager = DownloadManager(session, segments=4, min_segment_size=1024)
+        result = manager.download_file(
+            "https://example.com/data.csv",
+            tmp_path,
+            expected_size=len(self.PAYLOAD),
+            expected_hash=hashlib.md5(self.PAYLOAD).hexdigest(),
+        )
+
+        assert result.read_bytes() == self.PAYLOAD
+        ranges = sorted(c.kwargs["headers"]["Range"] for c in session.get.call_args_list)
+        assert len(ranges) == 4
+        assert ranges[0] == "bytes=0-4095"
+
+    def test_segmented_download_digests(self, tmp_path):
+        import hashlib
+
+        session = self._make_session()
+        manager = DownloadManager(session, segments=4, min_segment_size=1024)
+        result = manager.download("https://example.com/data.csv", tmp_path, hash_algorithms=["sha256"])
+
+        assert result.digests == {"sha256": hashlib.sha256(self.PAYLOAD).hexdigest()}
+
+    def test_segment_count_limited_by_min_segment_size(self, tmp_path):
+        session = self._make_session()
+        manager = DownloadManager(session, segments=8, min_segment_size=8192)
+        manager.download_file("https://example.com/data.csv", tmp_path)
+
+        assert session.get.call_count == 2
+
+    def test_progress_reports_total(self, tmp_path):
+        session = self._make_session()
+        callback = MagicMock()
+        manager = DownloadManager(session, segments=2, min_segment_size=1024)
+        manager.download_file("https://example.com/data.csv", tmp_path, progress_callback=callback)
+
+        assert callback.call_args.args == (len(self.PAYLOAD), len(self.PAYLOAD))
+
+    def test_no_accept_ranges_uses_single_stream(self, tmp_path):
+        session = self._make_session(accept_ranges="none")
+        manager = DownloadManager(session, segments=4, min_segment_size=1024)
+        result = manager.download_file("https://example.com/data.csv", tmp_path)
+
+        assert result.read_bytes() == self.PAYLOAD
+        assert session.get.call_count == 1
+        assert not session.get.call_args.kwargs.get("headers")
+
+    def test_ignored_range_falls_back_to_single_stream(self, tmp_path):
+        session = self._make_session(honour_ranges=False)
+        manager = DownloadManager(session, segments=4, min_segment_size=1024)
+        result = manager.download_file("https://example.com/data.csv", tmp_path, expected_size=len(self.PAYLOAD))
+
+        assert result.read_bytes() == self.PAYLOAD
+
+    def test_failed_probe_uses_single_stream(self, tmp_path):
+        import requests
+
+        session = self._make_session()
+        session.head.side_effect = requests.ConnectionError("no HEAD")
+        manager = DownloadManager(session, segments=4, min_segment_size=1024)
+        result = manager.download_file("https://example.com/data.csv", tmp_path)
+
+        assert result.read_bytes() == self.PAYLOAD
+
+    def test_invalid_segments_raises(self):
+        with pytest.raises(ValueError, match="segments"):
+            DownloadManager(MagicMock(), segments=0)
+        with pytest.raises(ValueError, match="between 1 and 10"):
+            DownloadManager(MagicMock(), segments=11)
+
+    def test_no_temp_files_left_on_segment_error(self, tmp_path):
+        import requests
+
+        session = self._make_session()
+        original = session.get.side_effect
+
+        def flaky(url, headers=None, **kwargs):
+            if headers and headers["Range"].startswith("bytes=8192"):
+                raise requests.ConnectionError("reset")
+            return original(url, headers=headers, **kwargs)
+
+        session.get.side_effect = flaky
+        manager = DownloadManager(session, segments=2, min_segment_size=1024)
+        with pytest.raises(DownloadError, match="bytes 8192-16383"):
+            manager.download_file("https://example.com/data.csv", tmp_path)
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestRedirectCaching:
+    URL = "https://data.london.gov.uk/download/x/res/data.csv"
+    TARGET = "https://s3.example.com/bucket/data.csv"
+
+    def _response(self, status_code: int = 200, url: str = URL, history: list | None = None):
+        response = MagicMock()
+        response.status_code = status_code
+        response.ok = status_code < 400
+        response.url = url
+        response.history = history or []
+        response.headers = {}
+        response.iter_content.return_value = [b"data"]
+        response.raise_for_status.return_value = None
+        return response
+
+    def _manager(self, session, tmp_path):
+        from london_data_store.cache import RedirectCache
+
+        return DownloadManager(session, redirects=RedirectCache(tmp_path / "cache"))
+
+    def test_records_redirect_target(self, tmp_path):
+        session = MagicMock()
+        session.get.return_value = self._response(url=self.TARGET, history=[MagicMock()])
+        manager = self._manager(session, tmp_path)
+        manager.download(self.URL, tmp_path / "data.csv", check_timestamp="t1")
+
+        assert manager._redirects.get(self.URL, "t1") == self.TARGET
+
+    def test_repeat_download_skips_redirect(self, tmp_path):
+        session = MagicMock()
+        session.get.return_value = self._response(url=self.TARGET)
+        manager = self._manager(session, tmp_path)
+        manager._redirects.put(self.URL, self.TARGET, check_timestamp="t1")
+        manager.download(self.URL, tmp_path / "data.csv", check_timestamp="t1")
+
+        assert [c.args[0] for c in session.get.call_args_list] == [self.TARGET]
+
+    def test_new_check_timestamp_uses_original_url(self, tmp_path):
+        session = MagicMock()
+        session.get.return_value = self._response()
+        manager = self._manager(session, tmp_path)
+        manager._redirects.put(self.URL, self.TARGET, check_timestamp="t1")
+        manager.download(self.URL, tmp_path / "data.csv", check_timestamp="t2")
+
+        assert [c.args[0] for c in session.get.call_args_list] == [self.URL]
+
+    def test_stale_target_falls_back_to_original_url(self, tmp_path):
+        session = MagicMock()
+        session.get.side_effect = [self._response(403, url=self.TARGET), self._response()]
+        manager = self._manager(session, tmp_path)
+        manager._redirects.put(self.URL, self.TARGET)
+        result = manager.download(self.URL, tmp_path / "data.csv")
+
+        assert [c.args[0] for c in session.get.call_args_list] == [self.TARGET, self.URL]
+        assert result.bytes_downloaded == 4
+        assert manager._redirects.get(self.URL) is None
+
+    def test_segment_probe_uses_cached_target(self, tmp_path):
+        session = MagicMock()
+        session.head.return_value = self._response(url=self.TARGET)
+        session.head.return_value.headers = {"accept-ranges": "bytes", "content-length": "10"}
+        manager = self._manager(session, tmp_path)
+        manager._redirects.put(self.URL, self.TARGET)
+        manager._plan_segments(self.URL)
+
+        assert session.head.call_args.args[0] == self.TARGET
+
+
+def _chunked_session(chunks: list[bytes]):
+    """A session whose GET streams ``chunks``."""
+    session = MagicMock()
+    response = MagicMock()
+    response.status_code = 200
+    response.headers = {"content-length": str(sum(map(len, chunks)))}
+    response.history = []
+    response.iter_content.return_value = chunks
+    response.raise_for_status.return_value = None
+    session.get.return_value = response
+    return session
+
+
+class TestDownloadToBuffer:
+    def test_small_body_stays_in_memory(self, tmp_path):
+        import hashlib
+
+        content = b"borough,population\nCamden,210000\n"
+        manager = DownloadManager(_chunked_session([content]))
+        with manager.download_to_buffer(
+            "https://example.com/data.csv", expected_hash=hashlib.md5(content).hexdigest(), expected_size=len(content)
+        ) as buffer:
+            assert not buffer.rolled_over
+            assert buffer.read() == content
+            assert buffer.hash_verified
+            assert buffer.bytes_downloaded == len(content)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_large_body_spills_to_disk(self):
+        chunks = [b"x" * 1000] * 5
+        manager = DownloadManager(_chunked_session(chunks), progress_interval=0)
+        progress = MagicMock()
+        with manager.download_to_buffer(
+            "https://example.com/data.csv", max_memory=2500, progress_callback=progress, hash_algorithms=["sha256"]
+        ) as buffer:
+            assert buffer.rolled_over
+            assert buffer.read() == b"x" * 5000
+            assert "sha256" in buffer.digests
+        progress.assert_called_with(5000, 5000)
+
+    def test_size_mismatch_raises(self):
+        manager = DownloadManager(_chunked_session([b"short"]))
+        with pytest.raises(DownloadError, match="Size mismatch"):
+            manager.download_to_buffer("https://example.com/data.csv", expected_size=100)
+
+    def test_served_from_store(self, tmp_path):
+        import hashlib
+
+        from london_data_store.download import DownloadStatus
+        from london_data_store.store import ResourceStore
+
+        content = b"stored content"
+        digest = hashlib.md5(content).hexdigest()
+        source = tmp_path / "source"
+        source.write_bytes(content)
+        store = ResourceStore(tmp_path / "store")
+        store.add(digest, source)
+        session = _chunked_session([b"unused"])
+
+        with DownloadManager(session, store=store).download_to_buffer(
+            "https://example.com/data.csv", expected_hash=f"{digest}-1"
+        ) as buffer:
+            assert buffer.read() == content
+            assert buffer.status == DownloadStatus.STORE
+        session.get.assert_not_called()
+
+    def test_download_bytes(self):
+        manager = DownloadManager(_chunked_session([b"a,b\n", b"1,2\n"]))
+        assert manager.download_bytes("https://example.com/data.csv") == b"a,b\n1,2\n"
+
+    def test_client_passes_catalogue_checks(self, mock_client):
+        with patch.object(DownloadManager, "download_to_buffer") as mock_dl:
+            mock_client.download_to_buffer("population-projections", "csv", max_memory=1024)
+        kwargs = mock_dl.call_args.kwargs
+        assert "pop-data.csv" in mock_dl.call_args.args[0]
+        assert kwargs["max_memory"] == 1024
+        assert kwargs["expected_hash"] == "a361d1622b08e0a6335f489495399247-1"
+        assert kwargs["expected_size"] == 102400
+
+    def test_client_download_bytes(self, mock_client):
+        mock_client._session = _chunked_session([b"a,b\n1,2\n"])
+        body = mock_client.download_bytes("population-projections", "csv", verify_integrity=False)
+        assert body == b"a,b\n1,2\n"
+
+
+class TestDownloadToSink:
+    def test_commits_verified_body(self):
+        import hashlib
+
+        from london_data_store.sinks import MemorySink
+
+        content = b"a,b\n1,2\n"
+        manager = DownloadManager(_chunked_session([content[:4], content[4:]]))
+        result = manager.download_to_sink(
+            "https://example.com/data.csv",
+            MemorySink(),
+            expected_hash=hashlib.md5(content).hexdigest(),
+            expected_size=len(content),
+        )
+        assert result.value == content
+        assert result.bytes_downloaded == len(content)
+        assert result.hash_verified
+
+    def test_size_mismatch_aborts(self):
+        sink = MagicMock()
+        manager = DownloadManager(_chunked_session([b"short"]))
+        with pytest.raises(DownloadError, match="Size mismatch"):
+            manager.download_to_sink("https://example.com/data.csv", sink, expected_size=100)
+        sink.open.assert_called_once_with("https://example.com/data.csv", 100)
+        sink.abort.assert_called_once()
+        sink.commit.assert_not_called()
+
+    def test_sink_errors_become_download_errors(self):
+        from london_data_store.sinks import CallableSink
+
+        aborted = []
+
+        def broken(chunk):
+            raise BrokenPipeError("reader went away")
+
+        manager = DownloadManager(_chunked_session([b"data"]))
+        with pytest.raises(DownloadError, match="reader went away"):
+            manager.download_to_sink(
+                "https://example.com/data.csv", CallableSink(broken, abort=lambda: aborted.append(True))
+            )
+        assert aborted == [True]
+
+    def test_file_sink_never_leaves_partial_files(self, tmp_path):
+        from london_data_store.sinks import FileSink
+
+        manager = DownloadManager(_chunked_session([b"short"]))
+        with pytest.raises(DownloadError):
+            manager.download_to_sink("https://example.com/data.csv", FileSink(tmp_path / "out.csv"), expected_size=9)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_client_download_to_sink(self, mock_client):
+        from london_data_store.sinks import MemorySink
+
+        mock_client._session = _chunked_session([b"a,b\n"])
+        result = mock_client.download_to_sink("population-projections", MemorySink(), "csv", verify_integrity=False)
+        assert result.value == b"a,b\n"
+
+
 class TestApiDownloadFile:
     def test_download_by_format(self, mock_client, tmp_path):
         with patch.object(DownloadManager, "download_file", return_value=tmp_path / "pop-data.csv") as mock_dl:
@@ -160,6 +781,27 @@ class TestApiDownloadFile:
             assert call_kwargs["expected_hash"] == "a361d1622b08e0a6335f489495399247-1"
             assert call_kwargs["expected_size"] == 102400
 
+    def test_segments_passed_to_manager(self, mock_client, tmp_path):
+        with patch("london_data_store.api.DownloadManager") as MockDM:
+            MockDM.return_value.download_file.return_value = tmp_path / "pop-data.csv"
+            mock_client.download_file("population-projections", format="csv", destination=tmp_path, segments=4)
+            assert MockDM.call_args.kwargs["segments"] == 4
+
+    def test_download_passes_check_timestamp(self, mock_client, tmp_path):
+        from london_data_store.download import DownloadResult, DownloadStatus
+
+        expected = DownloadResult(path=tmp_path / "pop-data.csv", status=DownloadStatus.NOT_MODIFIED, url="u")
+        with patch.object(DownloadManager, "download", return_value=expected) as mock_dl:
+            result = mock_client.download("population-projections", format="csv", destination=tmp_path, if_changed=True)
+            assert result is expected
+            call_kwargs = mock_dl.call_args.kwargs
+            assert call_kwargs["if_changed"] is True
+            assert call_kwargs["check_timestamp"] == "2025-06-15T10:00:00+00:00"
+
+    def test_get_resource_by_format(self, mock_client):
+        resource = mock_client.get_resource("population-projections", "geojson")
+        assert resource.key == "res-002"
+
     def test_verify_integrity_disabled(self, mock_client, tmp_path):
         with patch.object(DownloadManager, "download_file", return_value=tmp_path / "pop-data.csv") as mock_dl:
             mock_client.download_file(
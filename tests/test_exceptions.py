@@ -2,9 +2,11 @@
 
 from london_data_store.exceptions import (
     CacheError,
+    ConversionError,
     DatasetNotFoundError,
     DownloadError,
     FormatNotAvailableError,
+    InsufficientSpaceError,
     LondonDataStoreError,
 )
 
@@ -34,6 +36,15 @@ class TestExceptionHierarchy:
         assert isinstance(err, LondonDataStoreError)
         assert not isinstance(err, ValueError)
 
+    def test_insufficient_space_is_download_error(self):
+        err = InsufficientSpaceError("disk full")
+        assert isinstance(err, DownloadError)
+
+    def test_conversion_error_is_base(self):
+        err = ConversionError("bad value")
+        assert isinstance(err, LondonDataStoreError)
+        assert not isinstance(err, DownloadError)
+
     def test_message_preserved(self):
         err = DatasetNotFoundError("slug 'foo' not found")
         assert str(err) == "slug 'foo' not found"
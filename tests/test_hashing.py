@@ -0,0 +1,63 @@
+"""Tests for london_data_store.hashing module."""
+
+import hashlib
+
+import pytest
+
+from london_data_store.hashing import HashPipeline, hash_file, validate_algorithms
+
+DATA = bytes(range(256)) * 4096
+
+
+class TestValidateAlgorithms:
+    def test_normalizes_names(self):
+        assert validate_algorithms(["MD5", "sha-256", "md5"]) == ("md5", "sha256")
+
+    def test_unknown_algorithm_raises(self):
+        with pytest.raises(ValueError, match="Unsupported hash algorithm"):
+            validate_algorithms(["crc64"])
+
+
+class TestHashPipeline:
+    def test_pooled_buffers(self):
+        with HashPipeline(["md5", "sha256", "blake2b"], buffer_size=1000, depth=2) as pipeline:
+            for i in range(0, len(DATA), 1000):
+                buffer = pipeline.acquire()
+                chunk = DATA[i : i + 1000]
+                buffer[: len(chunk)] = chunk
+                pipeline.submit(memoryview(buffer)[: len(chunk)], buffer)
+            digests = pipeline.hexdigests()
+
+        assert digests == {
+            "md5": hashlib.md5(DATA).hexdigest(),
+            "sha256": hashlib.sha256(DATA).hexdigest(),
+            "blake2b": hashlib.blake2b(DATA).hexdigest(),
+        }
+
+    def test_bytes_chunks(self):
+        with HashPipeline(["sha256"]) as pipeline:
+            pipeline.submit(DATA[:100])
+            pipeline.submit(DATA[100:])
+            assert pipeline.hexdigests() == {"sha256": hashlib.sha256(DATA).hexdigest()}
+
+    def test_buffer_pool_is_bounded(self):
+        with HashPipeline(["md5"], buffer_size=10, depth=2) as pipeline:
+            buffers = [pipeline.acquire() for _ in range(3)]
+            assert len({id(b) for b in buffers}) == 3
+            assert pipeline._allocated == 3
+            pipeline.hexdigests()
+
+    def test_worker_error_is_raised(self):
+        with HashPipeline(["md5"]) as pipeline:
+            pipeline.submit("not bytes")
+            with pytest.raises(TypeError):
+                pipeline.hexdigests()
+
+
+class TestHashFile:
+    def test_hash_file(self, tmp_path):
+        path = tmp_path / "data.bin"
+        path.write_bytes(DATA)
+        digests = hash_file(path, ["md5", "sha256"], buffer_size=4096)
+        assert digests["md5"] == hashlib.md5(DATA).hexdigest()
+        assert digests["sha256"] == hashlib.sha256(DATA).hexdigest()
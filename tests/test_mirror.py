@@ -0,0 +1,154 @@
+"""Tests for london_data_store.mirror module."""
+
+import json
+from collections import namedtuple
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from london_data_store.download import DownloadResult, DownloadStatus
+from london_data_store.exceptions import DownloadError, InsufficientSpaceError
+from london_data_store.mirror import MANIFEST_NAME, Manifest, mirror, plan_mirror, select_resources
+
+
+@pytest.fixture
+def lds(mock_client):
+    """A client whose downloads write ``<slug>:<resource key>`` to the destination."""
+    calls = []
+
+    def download(slug, format=None, destination=".", *, resource_key=None, **kwargs):
+        calls.append((slug, resource_key))
+        path = Path(destination)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"{slug}:{resource_key}")
+        return DownloadResult(path=path, status=DownloadStatus.DOWNLOADED, url="u")
+
+    with patch.object(type(mock_client), "download", side_effect=download):
+        mock_client.calls = calls
+        yield mock_client
+
+
+class TestSelectResources:
+    def test_filters(self, mock_client):
+        selected = select_resources(mock_client, topics=["demographics"], formats=["CSV"])
+        assert [(d.slug, r.key) for d, r in selected] == [
+            ("population-projections", "res-001"),
+            ("london-borough-profiles", "res-010"),
+        ]
+
+    def test_publisher_substring(self, mock_client):
+        selected = select_resources(mock_client, publishers=["transport for"])
+        assert {r.key for _, r in selected} == {"res-020", "res-021"}
+
+
+class TestMirror:
+    def test_first_run_fetches_everything_selected(self, lds, tmp_path):
+        result = mirror(lds, tmp_path, formats=["csv", "geojson"])
+
+        assert result.summary()["downloaded"] == 4
+        assert (tmp_path / "population-projections" / "pop-data.csv").read_text() == "population-projections:res-001"
+        manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+        assert set(manifest["entries"]) == {
+            "population-projections/res-001",
+            "population-projections/res-002",
+            "london-borough-profiles/res-010",
+            "cycling-infrastructure/res-020",
+        }
+
+    def test_rerun_against_unchanged_catalogue_downloads_nothing(self, lds, tmp_path):
+        mirror(lds, tmp_path, formats=["csv"])
+        lds.calls.clear()
+
+        result = mirror(lds, tmp_path, formats=["csv"])
+
+        assert lds.calls == []
+        assert len(result.plan.unchanged) == 2
+
+    def test_changed_hash_and_missing_file_are_refetched(self, lds, tmp_path):
+        mirror(lds, tmp_path, formats=["csv"])
+        lds.calls.clear()
+        lds._raw_response_json[0]["resources"]["res-001"]["check_hash"] = "f" * 32
+        (tmp_path / "london-borough-profiles" / "profiles.csv").unlink()
+
+        result = mirror(lds, tmp_path, formats=["csv"])
+
+        assert sorted(lds.calls) == [("london-borough-profiles", "res-010"), ("population-projections", "res-001")]
+        assert len(result.plan.changed) == 2
+        assert Manifest(tmp_path).entries["population-projections/res-001"].check_hash == "f" * 32
+
+    def test_timestamp_only_matters_without_hash(self, lds, tmp_path):
+        mirror(lds, tmp_path, formats=["csv"])
+        lds._raw_response_json[0]["resources"]["res-001"]["check_timestamp"] = "2026-01-01T00:00:00+00:00"
+        assert plan_mirror(lds, tmp_path, formats=["csv"]).changed == []
+
+        lds._raw_response_json[0]["resources"]["res-001"]["check_hash"] = None
+        assert [e.resource_key for e in plan_mirror(lds, tmp_path, formats=["csv"]).changed] == ["res-001"]
+
+    def test_prune_removes_deselected_resources(self, lds, tmp_path):
+        mirror(lds, tmp_path, formats=["csv", "geojson"])
+        del lds._raw_response_json[2]["resources"]["res-020"]
+
+        kept = mirror(lds, tmp_path, formats=["csv", "geojson"])
+        assert [e.key for e in kept.plan.removed] == ["cycling-infrastructure/res-020"]
+        assert (tmp_path / "cycling-infrastructure" / "routes.geojson").exists()
+
+        pruned = mirror(lds, tmp_path, formats=["csv", "geojson"], prune=True)
+        assert [e.key for e in pruned.pruned] == ["cycling-infrastructure/res-020"]
+        assert not (tmp_path / "cycling-infrastructure").exists()
+        assert "cycling-infrastructure/res-020" not in Manifest(tmp_path).entries
+
+    def test_paths_outside_the_mirror_are_refused(self, lds, tmp_path):
+        target = tmp_path / "mirror"
+        outside = tmp_path / "outside.csv"
+        outside.write_text("keep")
+        lds._raw_response_json[1]["slug"] = ".."
+        lds._raw_response_json[1]["resources"]["res-010"]["url"] = "https://x/outside.csv"
+
+        result = mirror(lds, target, formats=["csv"])
+        assert [e.key for e in result.downloaded] == ["population-projections/res-001"]
+        assert outside.read_text() == "keep"
+
+        manifest = Manifest(target)
+        manifest.put(replace(result.downloaded[0], resource_key="hostile", path="../outside.csv"))
+        manifest.put(replace(result.downloaded[0], resource_key="absolute", path=str(outside)))
+        manifest.save()
+        pruned = mirror(lds, target, formats=["csv"], prune=True)
+        assert {e.resource_key for e in pruned.pruned} == {"hostile", "absolute"}
+        assert outside.read_text() == "keep"
+
+    def test_failures_are_reported_and_retried_next_run(self, lds, tmp_path):
+        succeed = type(lds).download.side_effect
+
+        def flaky(slug, *args, **kwargs):
+            if slug == "population-projections":
+                raise DownloadError("HTTP 503")
+            return succeed(slug, *args, **kwargs)
+
+        type(lds).download.side_effect = flaky
+        result = mirror(lds, tmp_path, formats=["csv"])
+        assert result.failed == {"population-projections/res-001": "HTTP 503"}
+        assert len(result.downloaded) == 1
+
+        type(lds).download.side_effect = succeed
+        assert [e.key for e in mirror(lds, tmp_path, formats=["csv"]).downloaded] == ["population-projections/res-001"]
+
+    def test_dry_run_changes_nothing(self, lds, tmp_path):
+        result = mirror(lds, tmp_path, formats=["csv"], dry_run=True)
+        assert len(result.plan.new) == 2
+        assert lds.calls == []
+        assert list(tmp_path.iterdir()) == []
+
+    def test_refuses_when_out_of_space(self, lds, tmp_path):
+        usage = namedtuple("usage", "total used free")(100, 99, 1)
+        with (
+            patch("london_data_store.planner.shutil.disk_usage", return_value=usage),
+            pytest.raises(InsufficientSpaceError),
+        ):
+            mirror(lds, tmp_path, formats=["csv"])
+        assert lds.calls == []
+
+    def test_unreadable_manifest_starts_over(self, lds, tmp_path):
+        (tmp_path / MANIFEST_NAME).write_text("{not json")
+        assert len(plan_mirror(lds, tmp_path, formats=["csv"]).new) == 2
@@ -0,0 +1,105 @@
+"""Tests for london_data_store.planner module."""
+
+from collections import namedtuple
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from london_data_store.exceptions import DatasetNotFoundError, InsufficientSpaceError
+from london_data_store.planner import PlannedDownload, check_free_space, order_downloads, plan_downloads
+
+_Usage = namedtuple("_Usage", "total used free")
+
+
+def _item(name: str, size: int | None) -> PlannedDownload:
+    return PlannedDownload(name, "k", "csv", f"https://x/{name}", Path(name), size)
+
+
+class TestOrderDownloads:
+    ITEMS = [_item("a", 10), _item("b", 500), _item("c", None), _item("d", 1), _item("e", 100)]
+
+    def _names(self, order):
+        return [item.slug for item in order_downloads(self.ITEMS, order)]
+
+    def test_interleave_alternates_largest_and_smallest(self):
+        assert self._names("interleave") == ["b", "d", "e", "a", "c"]
+
+    def test_shortest_first(self):
+        assert self._names("shortest-first") == ["d", "a", "e", "b", "c"]
+
+    def test_largest_first(self):
+        assert self._names("largest-first") == ["b", "e", "a", "d", "c"]
+
+    def test_as_given(self):
+        assert self._names("as-given") == ["a", "b", "c", "d", "e"]
+
+    def test_invalid_order(self):
+        with pytest.raises(ValueError):
+            order_downloads(self.ITEMS, "random")
+
+
+class TestCheckFreeSpace:
+    def test_groups_by_filesystem(self, tmp_path):
+        required, free = check_free_space({tmp_path / "a": 100, tmp_path / "new" / "b": 300}, margin=0.5)
+
+        assert list(required.values()) == [600]
+        assert required.keys() == free.keys()
+        assert all(value > 0 for value in free.values())
+
+
+class TestPlanDownloads:
+    def test_plan_sums_sizes_and_orders(self, mock_client, tmp_path):
+        plan = plan_downloads(
+            mock_client,
+            [("population-projections", "csv", None), ("population-projections", "geojson", None)],
+            tmp_path,
+            order="shortest-first",
+        )
+
+        assert [item.resource_key for item in plan.items] == ["res-001", "res-002"]
+        assert plan.total_bytes == 102400 + 512000
+        assert plan.items[0].destination == tmp_path / "pop-data.csv"
+        assert plan.fits
+        plan.check()
+
+    def test_insufficient_space(self, mock_client, tmp_path):
+        with patch("london_data_store.planner.shutil.disk_usage", return_value=_Usage(1000, 900, 100)):
+            plan = plan_downloads(mock_client, [("population-projections", "csv", None)], tmp_path)
+
+        assert not plan.fits
+        with pytest.raises(InsufficientSpaceError, match="Not enough space"):
+            plan.check()
+
+    def test_existing_files_count_net_of_reclaimed_space(self, mock_client, tmp_path):
+        (tmp_path / "pop-data.csv").write_bytes(b"x" * 102000)
+        plan = plan_downloads(mock_client, [("population-projections", "csv", None)], tmp_path, margin=0)
+
+        assert list(plan.required_bytes.values()) == [400]
+
+    def test_shared_file_names_get_their_own_paths(self, mock_client, tmp_path):
+        datasets = mock_client._raw_response_json
+        datasets[1]["resources"]["res-010"]["url"] = datasets[0]["resources"]["res-001"]["url"]
+        datasets[1]["resources"]["res-010"]["check_size"] = 1000
+        plan = plan_downloads(
+            mock_client,
+            [("population-projections", "csv", None), ("london-borough-profiles", "csv", None)],
+            tmp_path,
+            order="as-given",
+            margin=0,
+        )
+
+        assert [item.destination for item in plan.items] == [
+            tmp_path / "population-projections" / "pop-data.csv",
+            tmp_path / "london-borough-profiles" / "pop-data.csv",
+        ]
+        assert list(plan.required_bytes.values()) == [plan.total_bytes] == [102400 + 1000]
+
+    def test_unknown_slug(self, mock_client, tmp_path):
+        with pytest.raises(DatasetNotFoundError):
+            plan_downloads(mock_client, [("nope", None, None)], tmp_path)
+
+    def test_to_dict(self, mock_client, tmp_path):
+        data = plan_downloads(mock_client, [("population-projections", "csv", None)], tmp_path).to_dict()
+        assert data["fits"] is True
+        assert data["items"][0]["destination"] == str(tmp_path / "pop-data.csv")
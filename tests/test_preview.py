@@ -0,0 +1,131 @@
+"""Tests for london_data_store.preview module."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from london_data_store.exceptions import DownloadError
+from london_data_store.preview import fetch_prefix, parse_preview
+
+CSV = b"\xef\xbb\xbfborough,population\r\n" + b"".join(f"Borough {i},{i * 1000}\r\n".encode() for i in range(500))
+GEOJSON = json.dumps(
+    {
+        "type": "FeatureCollection",
+        "features": [
+            {"type": "Feature", "properties": {"name": f"Area {i}"}, "geometry": {"type": "Polygon", "coordinates": []}}
+            for i in range(100)
+        ],
+    }
+).encode()
+
+
+def _session(body: bytes, *, ranges: bool = True):
+    session = MagicMock()
+    session.responses = []
+
+    def get(url, headers=None, **kwargs):
+        response = MagicMock()
+        start, end = (int(x) for x in headers["Range"].removeprefix("bytes=").split("-"))
+        if ranges:
+            data = body[start : end + 1]
+            response.status_code = 206
+            response.headers = {"content-range": f"bytes {start}-{start + len(data) - 1}/{len(body)}"}
+        else:
+            data = body
+            response.status_code = 200
+            response.headers = {}
+        response.iter_content.side_effect = lambda chunk_size: iter(
+            [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+        )
+        session.responses.append(response)
+        return response
+
+    session.get.side_effect = get
+    return session
+
+
+class TestFetchPrefix:
+    def test_range_request(self):
+        data, complete = fetch_prefix(_session(CSV), "u", 100)
+        assert data == CSV[:100]
+        assert complete is False
+
+    def test_whole_small_file_is_complete(self):
+        data, complete = fetch_prefix(_session(b"a,b\n1,2\n"), "u", 100)
+        assert data == b"a,b\n1,2\n"
+        assert complete is True
+
+    def test_without_ranges_stops_reading_early(self):
+        session = _session(CSV, ranges=False)
+        data, complete = fetch_prefix(session, "u", 1000)
+        assert data == CSV[:1000]
+        assert complete is False
+        session.responses[0].close.assert_called_once()
+
+    def test_http_error(self):
+        import requests
+
+        session = MagicMock()
+        session.get.return_value.raise_for_status.side_effect = requests.HTTPError("404")
+        with pytest.raises(DownloadError):
+            fetch_prefix(session, "u")
+
+
+class TestParsePreview:
+    def test_csv_drops_partial_row(self):
+        columns, rows, text = parse_preview(CSV[:60], "csv", complete=False, rows=10)
+        assert columns == ["borough", "population"]
+        assert rows == [{"borough": "Borough 0", "population": "0"}, {"borough": "Borough 1", "population": "1000"}]
+        assert text is None
+
+    def test_csv_limits_rows(self):
+        _, rows, _ = parse_preview(CSV, "CSV", complete=True, rows=3)
+        assert len(rows) == 3
+
+    def test_partial_geojson(self):
+        columns, rows, _ = parse_preview(GEOJSON[:500], "geojson", complete=False, rows=50)
+        assert columns == ["name", "geometry"]
+        assert 0 < len(rows) < 50
+        assert rows[0] == {"name": "Area 0", "geometry": "Polygon"}
+
+    def test_complete_json_array(self):
+        columns, rows, _ = parse_preview(b'[{"a": 1}, {"b": 2}]', "json", complete=True, rows=10)
+        assert columns == ["a", "b"]
+        assert rows == [{"a": 1}, {"b": 2}]
+
+    def test_text_formats(self):
+        _, _, text = parse_preview(b"line 1\nline 2\nli", "txt", complete=False, rows=10)
+        assert text == "line 1\nline 2"
+
+    def test_binary_formats_have_no_preview(self):
+        assert parse_preview(b"PK\x03\x04", "zip", complete=False) == ([], [], None)
+
+
+class TestClientPreview:
+    def test_preview_and_cache(self, mock_client, tmp_path):
+        from london_data_store.cache import PreviewCache
+
+        mock_client._session = _session(CSV)
+        mock_client._previews = PreviewCache(tmp_path)
+
+        preview = mock_client.preview("population-projections", "csv", rows=5, max_bytes=1024)
+        assert preview.columns == ["borough", "population"]
+        assert len(preview.rows) == 5
+        assert preview.bytes_read == 1024
+        assert not preview.from_cache
+        assert mock_client._session.get.call_args.kwargs["headers"] == {"Range": "bytes=0-1023"}
+
+        mock_client._session = MagicMock()
+        again = mock_client.preview("population-projections", "csv", rows=5, max_bytes=512)
+        assert again.from_cache
+        assert again.rows == preview.rows
+        mock_client._session.get.assert_not_called()
+
+    def test_larger_preview_refetches(self, mock_client, tmp_path):
+        from london_data_store.cache import PreviewCache
+
+        mock_client._previews = PreviewCache(tmp_path)
+        mock_client._session = _session(CSV)
+        mock_client.preview("population-projections", "csv", max_bytes=100)
+        assert not mock_client.preview("population-projections", "csv", max_bytes=200).from_cache
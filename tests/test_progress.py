@@ -0,0 +1,157 @@
+"""Tests for london_data_store.progress module."""
+
+import io
+from unittest.mock import MagicMock
+
+import pytest
+
+from london_data_store.progress import (
+    ProgressAggregator,
+    ProgressRenderer,
+    ProgressSnapshot,
+    ThrottledProgress,
+    format_snapshot,
+    throttle,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestThrottledProgress:
+    def test_forwards_first_update_and_then_once_per_interval(self):
+        clock = FakeClock()
+        callback = MagicMock()
+        throttled = ThrottledProgress(callback, interval=1.0, clock=clock)
+
+        for i in range(1, 11):
+            clock.now = i * 0.25
+            throttled(i * 10, 1000)
+
+        assert [c.args for c in callback.call_args_list] == [(10, 1000), (50, 1000), (90, 1000)]
+
+    def test_final_update_always_forwarded(self):
+        clock = FakeClock()
+        callback = MagicMock()
+        throttled = ThrottledProgress(callback, interval=60, clock=clock)
+
+        throttled(10, 100)
+        throttled(50, 100)
+        throttled(100, 100)
+
+        assert callback.call_args_list[-1].args == (100, 100)
+        assert callback.call_count == 2
+
+    def test_min_bytes(self):
+        clock = FakeClock()
+        callback = MagicMock()
+        throttled = ThrottledProgress(callback, interval=60, min_bytes=100, clock=clock)
+
+        for downloaded in range(10, 310, 10):
+            throttled(downloaded, None)
+
+        assert [c.args[0] for c in callback.call_args_list] == [10, 110, 210]
+
+    def test_flush_forwards_held_update_once(self):
+        clock = FakeClock()
+        callback = MagicMock()
+        throttled = ThrottledProgress(callback, interval=60, clock=clock)
+
+        throttled(10, None)
+        throttled(20, None)
+        throttled.flush()
+        throttled.flush()
+
+        assert [c.args for c in callback.call_args_list] == [(10, None), (20, None)]
+
+    def test_throttle_helper(self):
+        callback = MagicMock()
+        assert throttle(None, 0.1) is None
+        assert throttle(callback, 0) is callback
+        wrapped = throttle(callback, 0.1)
+        assert isinstance(wrapped, ThrottledProgress)
+        assert throttle(wrapped, 0.1) is wrapped
+
+
+class TestProgressAggregator:
+    def test_snapshot_totals_and_rate(self):
+        clock = FakeClock()
+        aggregator = ProgressAggregator(clock=clock)
+        first = aggregator.track("a", total=1000)
+        second = aggregator.track("b", total=3000)
+
+        clock.now = 2.0
+        first(200, 1000)
+        second(600, 3000)
+        snapshot = aggregator.snapshot()
+
+        assert snapshot.bytes_done == 800
+        assert snapshot.total == 4000
+        assert snapshot.rate == pytest.approx(400)
+        assert snapshot.eta == pytest.approx(8)
+        items = {item.name: item for item in snapshot.items}
+        assert items["a"].rate == pytest.approx(100)
+        assert items["a"].eta == pytest.approx(8)
+        assert items["b"].eta == pytest.approx(8)
+
+    def test_unknown_total(self):
+        aggregator = ProgressAggregator(clock=FakeClock())
+        aggregator.track("a", total=100)
+        aggregator.track("b")
+
+        snapshot = aggregator.snapshot()
+        assert snapshot.total is None
+        assert snapshot.eta is None
+
+    def test_total_learned_from_updates(self):
+        aggregator = ProgressAggregator(clock=FakeClock())
+        callback = aggregator.track("a")
+        callback(10, 500)
+
+        assert aggregator.snapshot().total == 500
+
+    def test_rate_uses_recent_window(self):
+        clock = FakeClock()
+        aggregator = ProgressAggregator(rate_window=5.0, clock=clock)
+        callback = aggregator.track("a")
+        for second in range(1, 21):
+            clock.now = second
+            # Fast for the first 10 seconds, then slow
+            callback(second * 1000 if second <= 10 else 10_000 + (second - 10) * 10, None)
+
+        assert aggregator.snapshot().rate == pytest.approx(10)
+
+    def test_finished_items_stop_contributing_rate(self):
+        clock = FakeClock()
+        aggregator = ProgressAggregator(clock=clock)
+        callback = aggregator.track("a", total=100)
+        aggregator.track("b", total=100)
+        clock.now = 1.0
+        callback(100, 100)
+        aggregator.finish("a")
+
+        snapshot = aggregator.snapshot()
+        assert snapshot.rate == 0
+        assert snapshot.finished == 1
+        assert snapshot.active == 1
+
+
+class TestRendering:
+    def test_format_snapshot(self):
+        snapshot = ProgressSnapshot(bytes_done=1024 * 1024, total=4 * 1024 * 1024, rate=512 * 1024, eta=6)
+        assert format_snapshot(snapshot) == "1.0 MB / 4.0 MB (25.0%)  512.0 KB/s  ETA 0:06"
+
+    def test_renderer_draws_final_state(self):
+        aggregator = ProgressAggregator()
+        stream = io.StringIO()
+        with ProgressRenderer(aggregator, refresh=60, stream=stream):
+            aggregator.track("a", total=10)(10, 10)
+
+        output = stream.getvalue()
+        assert output.endswith("\n")
+        assert "10 B / 10 B (100.0%)" in output
@@ -0,0 +1,28 @@
+"""Tests for london_data_store.queries module."""
+
+from london_data_store import queries
+
+
+class TestQueries:
+    def test_filter_for_keyword_stems(self, sample_catalogue):
+        assert queries.filter_for_keyword(sample_catalogue, "slug", "projection") == ["population-projections"]
+        assert queries.filter_for_keyword(sample_catalogue, "title", "cycle") == ["Cycling Infrastructure"]
+
+    def test_stems_are_cached(self, sample_catalogue):
+        queries._stem.cache_clear()
+        queries.filter_for_keyword(sample_catalogue, "slug", "cycling")
+        misses = queries._stem.cache_info().misses
+        queries.filter_for_keyword(sample_catalogue, "slug", "cycling")
+        assert queries._stem.cache_info().misses == misses
+
+    def test_score_strings_limit(self):
+        scored = queries.score_strings(["cycling routes", "bus usage", "cycle hire"], "cycling", 2)
+        assert len(scored) == 2
+        assert scored[0][0] == "cycling routes"
+
+    def test_slugs_for_format(self, sample_catalogue):
+        assert queries.slugs_for_format(sample_catalogue, "geojson") == [
+            "population-projections",
+            "cycling-infrastructure",
+        ]
+        assert sorted(queries.all_formats(sample_catalogue)) == ["csv", "geojson", "shp"]
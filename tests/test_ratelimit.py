@@ -0,0 +1,232 @@
+"""Tests for london_data_store.ratelimit module."""
+
+import asyncio
+import io
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from london_data_store.ratelimit import (
+    Priority,
+    RateLimitedAdapter,
+    RateLimiter,
+    TokenBucket,
+    current_priority,
+    parse_retry_after,
+    rate_limit_priority,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket:
+    def test_takes_until_empty_then_waits_for_refill(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, capacity=10, clock=clock)
+
+        assert all(bucket.try_take(1, Priority.HIGH) == 0 for _ in range(10))
+        assert bucket.try_take(1, Priority.HIGH) == pytest.approx(0.1)
+        clock.now = 0.5
+        assert bucket.try_take(1, Priority.HIGH) == 0
+
+    def test_debt_for_oversized_requests(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=100, capacity=100, clock=clock)
+
+        assert bucket.try_take(1000, Priority.HIGH) == 0
+        # 900 tokens in debt: the next caller waits for them and its own token
+        assert bucket.try_take(1, Priority.HIGH) == pytest.approx(9.01)
+
+    def test_lower_lanes_leave_headroom(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, capacity=10, reserve=0.2, clock=clock)
+
+        taken = 0
+        while bucket.try_take(1, Priority.BULK) == 0:
+            taken += 1
+        # Bulk stops at its floor of 4 tokens; higher lanes still get through
+        assert taken == 6
+        assert bucket.try_take(1, Priority.NORMAL) == 0
+        assert bucket.try_take(1, Priority.HIGH) == 0
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestRateLimiter:
+    def test_hosts_have_separate_buckets(self):
+        limiter = RateLimiter(requests_per_second=1)
+        limiter.acquire_request("a.example")
+        start = time.monotonic()
+        limiter.acquire_request("b.example")
+        assert time.monotonic() - start < 0.1
+
+    def test_acquire_request_blocks_at_rate(self):
+        limiter = RateLimiter(requests_per_second=20, burst_seconds=0.05)
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.acquire_request("a.example", Priority.HIGH)
+        assert time.monotonic() - start >= 0.15
+
+    def test_bandwidth_limit(self):
+        limiter = RateLimiter(bytes_per_second=100_000, burst_seconds=0.1)
+        start = time.monotonic()
+        for _ in range(4):
+            limiter.acquire_bytes("a.example", 10_000, Priority.HIGH)
+        # 40 KB at 100 KB/s with a 10 KB burst
+        assert time.monotonic() - start >= 0.28
+
+    def test_unlimited_by_default(self):
+        limiter = RateLimiter()
+        start = time.monotonic()
+        for _ in range(1000):
+            limiter.acquire_request("a.example")
+            limiter.acquire_bytes("a.example", 1 << 20)
+        assert time.monotonic() - start < 0.5
+
+    def test_host_limits_override_defaults(self):
+        clock = FakeClock()
+        limiter = RateLimiter(
+            requests_per_second=100, host_limits={"slow.example": {"requests_per_second": 1}}, clock=clock
+        )
+        assert limiter._try("slow.example", "requests", 1, Priority.HIGH) == 0
+        assert limiter._try("slow.example", "requests", 1, Priority.HIGH) > 0
+        assert limiter._try("fast.example", "requests", 1, Priority.HIGH) == 0
+
+    def test_penalize_pauses_every_lane(self):
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock)
+        assert limiter.penalize("a.example", 30) == 30
+        assert limiter._try("a.example", "requests", 1, Priority.HIGH) == pytest.approx(30)
+        clock.now = 30
+        assert limiter._try("a.example", "requests", 1, Priority.BULK) == 0
+
+    def test_backoff_without_retry_after_doubles_and_resets(self):
+        limiter = RateLimiter(clock=FakeClock())
+        assert limiter.observe("a.example", 429, {}) == 1
+        assert limiter.observe("a.example", 429, {}) == 2
+        assert limiter.observe("a.example", 429, {}) == 4
+        assert limiter.observe("a.example", 200, {}) is None
+        assert limiter.observe("a.example", 429, {}) == 1
+
+    def test_observe_honours_retry_after(self):
+        limiter = RateLimiter(clock=FakeClock(), max_penalty=60)
+        assert limiter.observe("a.example", 503, {"retry-after": "7"}) == 7
+        assert limiter.observe("a.example", 503, {}) is None
+        assert limiter.observe("a.example", 429, {"retry-after": "3600"}) == 60
+
+    @pytest.mark.asyncio
+    async def test_async_acquire(self):
+        limiter = RateLimiter(requests_per_second=20, burst_seconds=0.05)
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.aacquire_request("a.example", Priority.HIGH) for _ in range(5)))
+        assert time.monotonic() - start >= 0.15
+
+
+class TestPriorityContext:
+    def test_default_and_override(self):
+        assert current_priority() == Priority.NORMAL
+        with rate_limit_priority(Priority.BULK):
+            assert current_priority() == Priority.BULK
+        assert current_priority() == Priority.NORMAL
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after("120") == 120
+
+    def test_http_date_in_past(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+    def test_invalid(self):
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestRateLimitedAdapter:
+    def _response(self, status: int, headers: dict | None = None) -> requests.Response:
+        response = requests.Response()
+        response.raw = io.BytesIO(b"")
+        response.status_code = status
+        response.headers.update(headers or {})
+        return response
+
+    def test_retries_429_after_pause(self):
+        limiter = RateLimiter()
+        adapter = RateLimitedAdapter(limiter)
+        request = requests.Request("GET", "https://a.example/x").prepare()
+        responses = [self._response(429, {"Retry-After": "0"}), self._response(200)]
+
+        with patch.object(HTTPAdapter, "send", side_effect=responses) as send:
+            response = adapter.send(request)
+
+        assert response.status_code == 200
+        assert send.call_count == 2
+
+    def test_gives_up_after_throttle_retries(self):
+        adapter = RateLimitedAdapter(RateLimiter(max_penalty=0), throttle_retries=1)
+        request = requests.Request("GET", "https://a.example/x").prepare()
+
+        with patch.object(HTTPAdapter, "send", side_effect=[self._response(429), self._response(429)]) as send:
+            response = adapter.send(request)
+
+        assert response.status_code == 429
+        assert send.call_count == 2
+
+    def test_draws_request_tokens(self):
+        limiter = MagicMock(wraps=RateLimiter())
+        adapter = RateLimitedAdapter(limiter)
+        request = requests.Request("GET", "https://a.example/x").prepare()
+
+        with patch.object(HTTPAdapter, "send", return_value=self._response(200)):
+            adapter.send(request)
+
+        limiter.acquire_request.assert_called_once_with("a.example")
+
+
+class TestIntegration:
+    def test_client_mounts_rate_limited_adapter(self):
+        from london_data_store.api import LondonDataStore
+
+        lds = LondonDataStore(cache=False, rate_limiter=RateLimiter())
+        assert isinstance(lds._session.get_adapter("https://data.london.gov.uk"), RateLimitedAdapter)
+
+    def test_catalogue_fetch_uses_high_priority(self):
+        from london_data_store.api import LondonDataStore
+
+        lanes = []
+
+        def fake_get_json(self):
+            lanes.append(current_priority())
+            return [{"slug": "a"}]
+
+        lds = LondonDataStore(cache=False, rate_limiter=RateLimiter())
+        with patch("london_data_store.api.Response.get_json_from_response", fake_get_json):
+            lds.get_data_from_url()
+        assert lanes == [Priority.HIGH]
+
+    def test_download_draws_bandwidth(self, tmp_path):
+        from london_data_store.download import DownloadManager
+
+        response = MagicMock()
+        response.status_code = 200
+        response.url = "https://files.example/data.csv"
+        response.headers = {}
+        response.iter_content.return_value = [b"a" * 10, b"b" * 5]
+        session = MagicMock()
+        session.get.return_value = response
+        limiter = MagicMock()
+
+        DownloadManager(session, rate_limiter=limiter).download_file("https://a.example/data.csv", tmp_path)
+
+        assert [c.args for c in limiter.acquire_bytes.call_args_list] == [("files.example", 10), ("files.example", 5)]
@@ -0,0 +1,128 @@
+"""Tests for london_data_store.scan module."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from london_data_store.async_client import AsyncLondonDataStore
+from london_data_store.ratelimit import Priority, current_priority
+from london_data_store.scan import ResourceCheck, ScanReport
+
+OLD = "Wed, 01 Mar 2023 10:00:00 GMT"
+NEW = "Mon, 05 Jan 2026 09:30:00 GMT"
+
+
+def _handler(seen):
+    def handler(request):
+        key = request.url.path.split("/")[3]
+        seen.append((request.method, key, request.headers.get("range"), current_priority()))
+        if key == "res-001":
+            return httpx.Response(200, headers={"content-length": "102400", "last-modified": OLD})
+        if key == "res-002":
+            return httpx.Response(404)
+        if key == "res-010":
+            return httpx.Response(200, headers={"content-length": "300000", "last-modified": OLD})
+        if key == "res-020":
+            if request.method == "HEAD":
+                return httpx.Response(405)
+            return httpx.Response(
+                206, content=b"x", headers={"content-range": "bytes 0-0/1048576", "last-modified": NEW}
+            )
+        raise httpx.ConnectError("connection refused", request=request)
+
+    return handler
+
+
+@pytest.fixture
+def scan_client(sample_catalogue):
+    def make(seen):
+        client = AsyncLondonDataStore(cache=False)
+        client._raw_response_json = sample_catalogue
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(_handler(seen)))
+        return client
+
+    return make
+
+
+@pytest.mark.asyncio
+class TestScan:
+    async def test_classifies_resources(self, scan_client):
+        seen = []
+        async with scan_client(seen) as client:
+            report = await client.scan(concurrency=3)
+
+        assert len(report.checks) == 5
+        assert {c.resource_key for c in report.dead} == {"res-002", "res-021"}
+        assert [c.resource_key for c in report.size_drift] == ["res-010"]
+        assert [c.resource_key for c in report.modified] == ["res-020"]
+        refused = next(c for c in report.checks if c.resource_key == "res-020")
+        assert (refused.method, refused.status, refused.size) == ("GET", 206, 1048576)
+        unreachable = next(c for c in report.checks if c.resource_key == "res-021")
+        assert unreachable.error.startswith("ConnectError")
+        assert ("GET", "res-020", "bytes=0-0", Priority.BULK) in seen
+        assert all(lane == Priority.BULK for *_, lane in seen)
+
+    async def test_range_method_and_slugs(self, scan_client):
+        seen = []
+        async with scan_client(seen) as client:
+            report = await client.scan(slugs=["population-projections"], method="range")
+
+        assert [c.resource_key for c in report.checks] == ["res-001", "res-002"]
+        assert {(method, rng) for method, _, rng, _ in seen} == {("GET", "bytes=0-0")}
+        assert report.checks[0].size == 102400
+
+    async def test_concurrency_is_bounded(self, sample_catalogue):
+        active = peak = 0
+
+        async def handler(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return httpx.Response(200)
+
+        client = AsyncLondonDataStore(cache=False)
+        client._raw_response_json = sample_catalogue
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        progress = []
+        async with client:
+            await client.scan(concurrency=2, progress_callback=lambda done, total: progress.append((done, total)))
+        assert peak == 2
+        assert progress[-1] == (5, 5)
+
+    async def test_rejects_unknown_method(self, scan_client):
+        async with scan_client([]) as client:
+            with pytest.raises(ValueError):
+                await client.scan(method="options")
+
+
+class TestScanReport:
+    def test_compact_report(self, tmp_path):
+        checks = [
+            ResourceCheck("a", "r1", "csv", "u1", expected_size=10, status=200, size=10),
+            ResourceCheck("b", "r2", "csv", "u2", expected_status=200, status=410),
+            ResourceCheck("c", "r3", "csv", "u3", expected_size=10, status=200, size=12),
+        ]
+        path = ScanReport(checks=checks).write(tmp_path / "report.json")
+        data = json.loads(path.read_text())
+
+        assert data["summary"]["resources"] == 3
+        assert data["dead"] == [
+            {"slug": "b", "resource_key": "r2", "url": "u2", "status": 410, "expected_status": 200, "error": None}
+        ]
+        assert [entry["slug"] for entry in data["size_drift"]] == ["c"]
+        assert "checks" not in data
+        assert len(ScanReport(checks=checks).to_dict(full=True)["checks"]) == 3
+
+    def test_dead_resources_are_not_drift(self):
+        check = ResourceCheck("a", "r", "csv", "u", expected_size=10, status=404, size=5)
+        assert check.dead
+        assert not check.size_changed
+        assert not check.modified
+
+    def test_unparseable_timestamps_are_not_changes(self):
+        check = ResourceCheck("a", "r", "csv", "u", expected_timestamp="yesterday", status=200, last_modified=NEW)
+        assert not check.modified
@@ -0,0 +1,353 @@
+"""Tests for london_data_store.scheduler module."""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from london_data_store.download import DownloadResult, DownloadStatus
+from london_data_store.exceptions import DatasetNotFoundError, DownloadError
+from london_data_store.models import Resource
+from london_data_store.scheduler import DownloadScheduler, JobState
+
+
+def _make_lds(hosts: dict[str, str] | None = None):
+    """A client whose resources are named after their slug and live on ``hosts[slug]``."""
+    hosts = hosts or {}
+    lds = MagicMock()
+
+    def get_resource(slug, format=None, *, resource_key=None):
+        if slug == "missing":
+            raise DatasetNotFoundError(slug)
+        return Resource(key=resource_key or f"{slug}-res", url=f"https://x/{slug}.csv", format="csv", check_size=10)
+
+    def download_url(slug, resource):
+        return f"https://{hosts.get(slug, 'data.london.gov.uk')}/download/{slug}/{resource.key}/{slug}.csv"
+
+    def download(slug, destination=".", *, resource_key=None, progress_callback=None, **kwargs):
+        if progress_callback:
+            progress_callback(10, 10)
+        path = Path(destination) / f"{slug}.csv"
+        return DownloadResult(path=path, status=DownloadStatus.DOWNLOADED, url="u", bytes_downloaded=10)
+
+    lds.get_resource.side_effect = get_resource
+    lds.get_resource_download_url.side_effect = download_url
+    lds.download.side_effect = download
+    return lds
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return tmp_path / "jobs.sqlite3"
+
+
+class TestDownloadScheduler:
+    def test_runs_jobs_in_priority_order(self, journal, tmp_path):
+        lds = _make_lds()
+        with DownloadScheduler(lds, journal_path=journal, workers=1) as scheduler:
+            scheduler.add("low", destination=tmp_path, priority=0)
+            scheduler.add("high", destination=tmp_path, priority=10)
+            scheduler.add("mid", destination=tmp_path, priority=5)
+            stats = scheduler.run()
+
+        assert [c.args[0] for c in lds.download.call_args_list] == ["high", "mid", "low"]
+        assert stats.done == 3
+        assert stats.pending == stats.running == stats.failed == 0
+        assert stats.bytes_downloaded == 30
+
+    def test_job_state_is_queryable(self, journal, tmp_path):
+        with DownloadScheduler(_make_lds(), journal_path=journal) as scheduler:
+            job_id = scheduler.add("population-projections", destination=tmp_path)
+            assert scheduler.job(job_id).state == JobState.PENDING
+            scheduler.run()
+            job = scheduler.job(job_id)
+
+        assert job.state == JobState.DONE
+        assert job.attempts == 1
+        assert job.bytes_downloaded == 10
+        assert job.path == str(tmp_path / "population-projections.csv")
+        assert job.resource_key == "population-projections-res"
+
+    def test_add_validates_against_catalogue(self, journal):
+        with DownloadScheduler(_make_lds(), journal_path=journal) as scheduler:
+            with pytest.raises(DatasetNotFoundError):
+                scheduler.add("missing")
+            assert scheduler.jobs() == []
+
+    def test_readding_job_is_idempotent(self, journal, tmp_path):
+        with DownloadScheduler(_make_lds(), journal_path=journal) as scheduler:
+            first = scheduler.add("a", destination=tmp_path)
+            second = scheduler.add("a", destination=tmp_path, priority=3)
+            assert first == second
+            assert scheduler.job(first).priority == 3
+
+    def test_retries_with_backoff_then_succeeds(self, journal, tmp_path):
+        lds = _make_lds()
+        succeed = lds.download.side_effect
+        calls = []
+
+        def flaky(*args, **kwargs):
+            calls.append(time.monotonic())
+            if len(calls) < 3:
+                raise DownloadError("connection reset")
+            return succeed(*args, **kwargs)
+
+        lds.download.side_effect = flaky
+        with DownloadScheduler(lds, journal_path=journal, backoff_base=0.05) as scheduler:
+            job_id = scheduler.add("a", destination=tmp_path)
+            scheduler.run()
+            job = scheduler.job(job_id)
+
+        assert job.state == JobState.DONE
+        assert job.attempts == 3
+        assert calls[1] - calls[0] >= 0.025
+        assert calls[2] - calls[1] >= 0.05
+
+    def test_gives_up_after_max_attempts(self, journal, tmp_path):
+        lds = _make_lds()
+        lds.download.side_effect = DownloadError("HTTP 503")
+        with DownloadScheduler(lds, journal_path=journal, max_attempts=2, backoff_base=0.01) as scheduler:
+            job_id = scheduler.add("a", destination=tmp_path)
+            stats = scheduler.run()
+            job = scheduler.job(job_id)
+
+        assert stats.failed == 1
+        assert job.state == JobState.FAILED
+        assert job.attempts == 2
+        assert "HTTP 503" in job.error
+
+    def test_non_transfer_errors_are_not_retried(self, journal, tmp_path):
+        lds = _make_lds()
+        lds.download.side_effect = DatasetNotFoundError("gone")
+        with DownloadScheduler(lds, journal_path=journal, backoff_base=0.01) as scheduler:
+            job_id = scheduler.add("a", destination=tmp_path)
+            scheduler.run()
+            assert scheduler.job(job_id).attempts == 1
+            assert scheduler.job(job_id).state == JobState.FAILED
+
+    def test_readding_failed_job_requeues_it(self, journal, tmp_path):
+        lds = _make_lds()
+        succeed = lds.download.side_effect
+        lds.download.side_effect = DownloadError("down")
+        with DownloadScheduler(lds, journal_path=journal, max_attempts=1) as scheduler:
+            job_id = scheduler.add("a", destination=tmp_path)
+            scheduler.run()
+            lds.download.side_effect = succeed
+            scheduler.add("a", destination=tmp_path)
+            scheduler.run()
+            assert scheduler.job(job_id).state == JobState.DONE
+
+    def test_per_host_limit(self, journal, tmp_path):
+        hosts = {f"slow-{i}": "slow.example" for i in range(4)}
+        hosts.update({f"fast-{i}": "fast.example" for i in range(4)})
+        lds = _make_lds(hosts)
+        succeed = lds.download.side_effect
+        lock = threading.Lock()
+        active: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        def tracked(slug, *args, **kwargs):
+            host = hosts[slug]
+            with lock:
+                active[host] = active.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), active[host])
+            time.sleep(0.02)
+            with lock:
+                active[host] -= 1
+            return succeed(slug, *args, **kwargs)
+
+        lds.download.side_effect = tracked
+        with DownloadScheduler(lds, journal_path=journal, workers=6, per_host=2) as scheduler:
+            for slug in hosts:
+                scheduler.add(slug, destination=tmp_path)
+            stats = scheduler.run()
+
+        assert stats.done == 8
+        assert peak == {"slow.example": 2, "fast.example": 2}
+
+    def test_host_blocked_workers_wait_without_polling(self, journal, tmp_path):
+        lds = _make_lds()
+        succeed = lds.download.side_effect
+
+        def slow(*args, **kwargs):
+            time.sleep(0.2)
+            return succeed(*args, **kwargs)
+
+        lds.download.side_effect = slow
+        with DownloadScheduler(lds, journal_path=journal, workers=4, per_host=2) as scheduler:
+            for i in range(4):
+                scheduler.add(f"job-{i}", destination=tmp_path)
+            claim = scheduler._claim
+            claims = []
+            scheduler._claim = lambda: claims.append(1) or claim()
+            stats = scheduler.run()
+
+        assert stats.done == 4
+        # Polling every 10 ms would claim dozens of times over the 0.4 s run
+        assert len(claims) < 20
+
+    def test_recovers_interrupted_jobs(self, journal, tmp_path):
+        lds = _make_lds()
+        scheduler = DownloadScheduler(lds, journal_path=journal)
+        job_id = scheduler.add("a", destination=tmp_path)
+        # Simulate a crash mid-download: the journal still says "running"
+        scheduler._db.execute("UPDATE jobs SET state = 'running' WHERE id = ?", (job_id,))
+        scheduler._db.close()
+
+        with DownloadScheduler(lds, journal_path=journal) as resumed:
+            assert resumed.job(job_id).state == JobState.PENDING
+            resumed.run()
+            assert resumed.job(job_id).state == JobState.DONE
+
+    def test_second_scheduler_leaves_live_jobs_running(self, journal, tmp_path):
+        lds = _make_lds()
+        succeed = lds.download.side_effect
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking(*args, **kwargs):
+            started.set()
+            release.wait(5)
+            return succeed(*args, **kwargs)
+
+        lds.download.side_effect = blocking
+        with DownloadScheduler(lds, journal_path=journal, workers=1) as first:
+            job_id = first.add("a", destination=tmp_path)
+            first.start()
+            assert started.wait(5)
+            with DownloadScheduler(lds, journal_path=journal) as second:
+                assert second.job(job_id).state == JobState.RUNNING
+                second.run()
+            release.set()
+            first.join()
+            assert first.job(job_id).state == JobState.DONE
+        assert lds.download.call_count == 1
+
+    def test_recovers_jobs_whose_owner_is_gone(self, journal, tmp_path):
+        import os
+        import socket
+        import subprocess
+        import sys
+
+        exited = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"], capture_output=True, text=True)
+        dead_owner = f"{socket.gethostname()}:{exited.stdout.strip()}:x"
+        live_owner = f"{socket.gethostname()}:{os.getpid()}:y"
+        lds = _make_lds()
+        with DownloadScheduler(lds, journal_path=journal) as scheduler:
+            dead, stale, live = (scheduler.add(slug, destination=tmp_path) for slug in ["a", "b", "c"])
+            now = time.time()
+            for job_id, owner, heartbeat_at in [
+                (dead, dead_owner, now),
+                (stale, live_owner, now - 3600),
+                (live, live_owner, now),
+            ]:
+                scheduler._db.execute(
+                    "UPDATE jobs SET state = 'running', owner = ?, heartbeat_at = ? WHERE id = ?",
+                    (owner, heartbeat_at, job_id),
+                )
+
+        with DownloadScheduler(lds, journal_path=journal) as resumed:
+            assert resumed.job(dead).state == JobState.PENDING
+            assert resumed.job(stale).state == JobState.PENDING
+            assert resumed.job(live).state == JobState.RUNNING
+
+    def test_upgrades_journal_without_owners(self, journal, tmp_path):
+        import sqlite3
+
+        from london_data_store.scheduler import _SCHEMA
+
+        db = sqlite3.connect(journal)
+        db.executescript(_SCHEMA.replace("    owner TEXT,\n    heartbeat_at REAL,\n", ""))
+        db.close()
+        with DownloadScheduler(_make_lds(), journal_path=journal) as scheduler:
+            scheduler.add("a", destination=tmp_path)
+            assert scheduler.run().done == 1
+
+    def test_stop_leaves_unstarted_jobs_queued(self, journal, tmp_path):
+        lds = _make_lds()
+        succeed = lds.download.side_effect
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking(*args, **kwargs):
+            started.set()
+            release.wait(5)
+            return succeed(*args, **kwargs)
+
+        lds.download.side_effect = blocking
+        with DownloadScheduler(lds, journal_path=journal, workers=1) as scheduler:
+            first = scheduler.add("a", destination=tmp_path, priority=1)
+            second = scheduler.add("b", destination=tmp_path)
+            scheduler.start()
+            assert started.wait(5)
+            assert scheduler.stats().running == 1
+            scheduler.stop()
+            release.set()
+            scheduler.join()
+
+            assert scheduler.job(first).state == JobState.DONE
+            assert scheduler.job(second).state == JobState.PENDING
+
+    def test_jobs_filter_and_clear(self, journal, tmp_path):
+        lds = _make_lds()
+        with DownloadScheduler(lds, journal_path=journal) as scheduler:
+            scheduler.add("a", destination=tmp_path)
+            scheduler.run()
+            scheduler.add("b", destination=tmp_path)
+
+            assert [job.slug for job in scheduler.jobs(JobState.PENDING)] == ["b"]
+            assert scheduler.clear("done") == 1
+            assert [job.slug for job in scheduler.jobs()] == ["b"]
+
+    def test_rejects_invalid_settings(self, journal):
+        with pytest.raises(ValueError):
+            DownloadScheduler(_make_lds(), journal_path=journal, workers=0)
+
+
+class TestSchedulerSpaceCheck:
+    def test_run_refuses_when_pending_jobs_do_not_fit(self, journal, tmp_path):
+        from collections import namedtuple
+        from unittest.mock import patch
+
+        from london_data_store.exceptions import InsufficientSpaceError
+
+        lds = _make_lds()
+        usage = namedtuple("usage", "total used free")(100, 95, 5)
+        with DownloadScheduler(lds, journal_path=journal) as scheduler:
+            scheduler.add("a", destination=tmp_path)
+            with (
+                patch("london_data_store.planner.shutil.disk_usage", return_value=usage),
+                pytest.raises(InsufficientSpaceError),
+            ):
+                scheduler.run()
+            lds.download.assert_not_called()
+
+    def test_add_plan_keeps_plan_order(self, journal, tmp_path):
+        from london_data_store.planner import DownloadPlan, PlannedDownload
+
+        items = [
+            PlannedDownload(slug, f"{slug}-res", "csv", "u", tmp_path / f"{slug}.csv", 10) for slug in ["b", "a", "c"]
+        ]
+        lds = _make_lds()
+        with DownloadScheduler(lds, journal_path=journal, workers=1) as scheduler:
+            scheduler.add_plan(DownloadPlan(items=items, order="as-given", total_bytes=30, unknown_sizes=0))
+            scheduler.run()
+
+        assert [c.args[0] for c in lds.download.call_args_list] == ["b", "a", "c"]
+
+    def test_add_plan_keeps_file_paths(self, journal, tmp_path):
+        from london_data_store.planner import DownloadPlan, PlannedDownload
+
+        dest = tmp_path / "missing"
+        items = [PlannedDownload(slug, f"{slug}-res", "csv", "u", dest / f"{slug}.csv", 10) for slug in ["a", "b"]]
+        lds = _make_lds()
+        with DownloadScheduler(lds, journal_path=journal, workers=1) as scheduler:
+            scheduler.add_plan(DownloadPlan(items=items, order="as-given", total_bytes=20, unknown_sizes=0))
+            scheduler.run()
+
+        assert [c.kwargs["destination"] for c in lds.download.call_args_list] == [
+            str(dest / "a.csv"),
+            str(dest / "b.csv"),
+        ]
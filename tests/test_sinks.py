@@ -0,0 +1,72 @@
+"""Tests for london_data_store.sinks module."""
+
+import pytest
+
+from london_data_store.sinks import CallableSink, FileSink, MemorySink, Sink
+
+
+class TestFileSink:
+    def test_commit_moves_into_place(self, tmp_path):
+        sink = FileSink(tmp_path / "out.csv")
+        sink.open("https://example.com/data.csv")
+        sink.write(b"a,b\n")
+        sink.write(memoryview(b"1,2\n"))
+        assert not (tmp_path / "out.csv").exists()
+        assert sink.commit() == tmp_path / "out.csv"
+        assert (tmp_path / "out.csv").read_bytes() == b"a,b\n1,2\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.csv"]
+
+    def test_directory_destination_uses_url_name(self, tmp_path):
+        sink = FileSink(tmp_path)
+        sink.open("https://example.com/download/slug/key/data.csv")
+        sink.write(b"x")
+        assert sink.commit() == tmp_path / "data.csv"
+
+    def test_abort_leaves_nothing(self, tmp_path):
+        (tmp_path / "out.csv").write_bytes(b"previous")
+        sink = FileSink(tmp_path / "out.csv")
+        sink.open("https://example.com/data.csv")
+        sink.write(b"partial")
+        sink.abort()
+        sink.abort()
+        assert [p.name for p in tmp_path.iterdir()] == ["out.csv"]
+        assert (tmp_path / "out.csv").read_bytes() == b"previous"
+
+
+class TestMemorySink:
+    def test_collects_bytes(self):
+        sink = MemorySink()
+        sink.open("u")
+        sink.write(b"ab")
+        sink.write(memoryview(b"cd"))
+        assert sink.commit() == b"abcd"
+
+    def test_reopen_starts_empty(self):
+        sink = MemorySink()
+        sink.write(b"stale")
+        sink.open("u")
+        assert sink.commit() == b""
+
+
+class TestCallableSink:
+    def test_forwards_copies(self):
+        received = []
+        events = []
+        sink = CallableSink(
+            received.append,
+            open=lambda url, size: events.append(("open", url, size)),
+            commit=lambda: "etag-1",
+            abort=lambda: events.append("abort"),
+        )
+        buffer = bytearray(b"abc")
+        sink.open("u", 3)
+        sink.write(memoryview(buffer))
+        buffer[:] = b"xyz"
+        assert received == [b"abc"]
+        assert sink.commit() == "etag-1"
+        sink.abort()
+        assert events == [("open", "u", 3), "abort"]
+
+    def test_base_sink_requires_write(self):
+        with pytest.raises(TypeError):
+            Sink()
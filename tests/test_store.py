@@ -0,0 +1,120 @@
+"""Tests for london_data_store.store module."""
+
+import hashlib
+import os
+import time
+
+import pytest
+
+from london_data_store.exceptions import CacheError
+from london_data_store.store import ResourceStore, normalize_hash
+
+CONTENT = b"borough,population\nCamden,210000\n"
+DIGEST = hashlib.md5(CONTENT).hexdigest()
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "source.csv"
+    path.write_bytes(CONTENT)
+    return path
+
+
+class TestNormalizeHash:
+    def test_strips_version_suffix(self):
+        assert normalize_hash("ABC123-1") == "abc123"
+
+    def test_plain_hash_unchanged(self):
+        assert normalize_hash("abc123") == "abc123"
+
+
+class TestResourceStore:
+    @pytest.mark.parametrize("check_hash", ["../../etc/passwd", "ab/../../x", "abc123", "g" * 32, DIGEST + "0"])
+    def test_rejects_hashes_that_are_not_md5(self, tmp_path, source, check_hash):
+        store = ResourceStore(tmp_path / "store")
+        with pytest.raises(CacheError, match="MD5"):
+            store.add(check_hash, source)
+        assert store.get(check_hash) is None
+        assert store.materialize(check_hash, tmp_path / "out.csv") is None
+        assert not (tmp_path / "store").exists()
+
+    def test_miss_returns_none(self, tmp_path):
+        store = ResourceStore(tmp_path / "store")
+        assert store.get(DIGEST) is None
+        assert store.materialize(DIGEST, tmp_path / "out.csv") is None
+
+    def test_add_and_get(self, tmp_path, source):
+        store = ResourceStore(tmp_path / "store")
+        path = store.add(f"{DIGEST}-1", source)
+        assert path == tmp_path / "store" / DIGEST[:2] / DIGEST
+        assert store.get(DIGEST).read_bytes() == CONTENT
+
+    def test_materialize_copies(self, tmp_path, source):
+        store = ResourceStore(tmp_path / "store", link_mode="copy")
+        store.add(DIGEST, source)
+        dest = store.materialize(DIGEST, tmp_path / "sub" / "out.csv")
+        assert dest.read_bytes() == CONTENT
+        assert not os.path.samefile(dest, store.get(DIGEST))
+
+    def test_materialize_hardlink(self, tmp_path, source):
+        store = ResourceStore(tmp_path / "store", link_mode="hardlink")
+        store.add(DIGEST, source)
+        dest = store.materialize(DIGEST, tmp_path / "out.csv")
+        assert os.path.samefile(dest, store.get(DIGEST))
+
+    def test_materialize_replaces_existing(self, tmp_path, source):
+        store = ResourceStore(tmp_path / "store")
+        store.add(DIGEST, source)
+        dest = tmp_path / "out.csv"
+        dest.write_bytes(b"stale")
+        store.materialize(DIGEST, dest)
+        assert dest.read_bytes() == CONTENT
+
+    def test_size_mismatch_discards_object(self, tmp_path, source):
+        store = ResourceStore(tmp_path / "store")
+        store.add(DIGEST, source)
+        assert store.get(DIGEST, expected_size=len(CONTENT) + 1) is None
+        assert store.usage().objects == 0
+
+    def test_invalid_link_mode(self, tmp_path):
+        with pytest.raises(ValueError, match="link_mode"):
+            ResourceStore(tmp_path, link_mode="symlink")
+
+    def test_usage(self, tmp_path, source):
+        store = ResourceStore(tmp_path / "store")
+        store.add(DIGEST, source)
+        usage = store.usage()
+        assert usage.objects == 1
+        assert usage.total_bytes == len(CONTENT)
+
+    def test_gc_by_age(self, tmp_path, source):
+        store = ResourceStore(tmp_path / "store")
+        old = store.add(DIGEST, source)
+        stale = time.time() - 3600
+        os.utime(old, (stale, stale))
+
+        removed = store.gc(max_age=60)
+        assert removed.objects == 1
+        assert store.get(DIGEST) is None
+
+    def test_gc_by_size_evicts_least_recently_used(self, tmp_path):
+        store = ResourceStore(tmp_path / "store")
+        digests = []
+        for i in range(3):
+            path = tmp_path / f"f{i}"
+            path.write_bytes(bytes([i]) * 100)
+            digest = hashlib.md5(path.read_bytes()).hexdigest()
+            stored = store.add(digest, path)
+            os.utime(stored, (1000 + i, 1000 + i))
+            digests.append(digest)
+
+        removed = store.gc(max_bytes=200)
+        assert removed.objects == 1
+        assert store.get(digests[0]) is None
+        assert store.get(digests[2]) is not None
+
+    def test_clear(self, tmp_path, source):
+        store = ResourceStore(tmp_path / "store")
+        store.add(DIGEST, source)
+        store.clear()
+        assert store.usage().objects == 0
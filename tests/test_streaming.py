@@ -0,0 +1,99 @@
+"""Tests for london_data_store.streaming module."""
+
+import csv
+import hashlib
+import io
+from unittest.mock import MagicMock
+
+import pytest
+
+from london_data_store.exceptions import DownloadError
+from london_data_store.streaming import CsvRowParser, ResourceStream, StreamVerifier, batched
+
+BODY = b'name,notes\r\nCamden,"two\r\nlines"\r\nHackney,"say ""hi"""\r\n'
+
+
+def _stream(chunks: list[bytes], **verifier_kwargs) -> ResourceStream:
+    response = MagicMock()
+    response.iter_content.return_value = iter(chunks)
+    return ResourceStream(response, StreamVerifier("https://example.com/data.csv", **verifier_kwargs))
+
+
+class TestResourceStream:
+    def test_reads_body_across_chunks(self):
+        stream = _stream([b"abc", b"", b"defg"])
+        assert io.BufferedReader(stream, buffer_size=2).read() == b"abcdefg"
+
+    def test_verifies_size_and_hash(self):
+        stream = _stream([b"abc", b"def"], expected_hash=hashlib.md5(b"abcdef").hexdigest() + "-1", expected_size=6)
+        assert stream.read() == b"abcdef"
+        assert stream.verifier.hash_verified is True
+
+    def test_truncated_body_raises_at_end(self):
+        stream = _stream([b"abc"], expected_size=6)
+        with pytest.raises(DownloadError, match="Size mismatch"):
+            stream.read()
+
+    def test_oversized_body_raises_early(self):
+        stream = _stream([b"abcdef", b"never read"], expected_size=4)
+        with pytest.raises(DownloadError, match="Size mismatch"):
+            stream.read(1)
+
+    def test_hash_mismatch_is_reported_not_raised(self):
+        stream = _stream([b"abc"], expected_hash="0" * 32)
+        assert stream.read() == b"abc"
+        assert stream.verifier.hash_verified is False
+
+    def test_close_releases_response(self):
+        stream = _stream([b"abc"])
+        stream.close()
+        stream._response.close.assert_called_once()
+
+    def test_on_chunk_sees_each_chunk(self):
+        response = MagicMock()
+        response.iter_content.return_value = iter([b"ab", b"cde"])
+        seen = []
+        stream = ResourceStream(response, StreamVerifier("u"), on_chunk=seen.append)
+        stream.read()
+        assert seen == [2, 3]
+
+
+class TestCsvRowParser:
+    @pytest.mark.parametrize("step", [1, 2, 7, len(BODY)])
+    def test_matches_dict_reader_for_any_chunking(self, step):
+        expected = list(csv.DictReader(io.StringIO(BODY.decode(), newline="")))
+        parser = CsvRowParser()
+        rows = []
+        for i in range(0, len(BODY), step):
+            rows.extend(parser.feed(BODY[i : i + step]))
+        rows.extend(parser.close())
+        assert rows == expected
+        assert rows[0]["notes"] == "two\r\nlines"
+
+    def test_strips_bom_and_handles_missing_final_newline(self):
+        parser = CsvRowParser()
+        rows = parser.feed("﻿a,b\n1,2".encode())
+        rows += parser.close()
+        assert rows == [{"a": "1", "b": "2"}]
+
+    def test_multibyte_characters_split_across_chunks(self):
+        data = "borough\nBromley–Croydon\n".encode()
+        parser = CsvRowParser()
+        rows = []
+        for i in range(len(data)):
+            rows.extend(parser.feed(data[i : i + 1]))
+        assert rows == [{"borough": "Bromley–Croydon"}]
+
+    def test_ragged_rows(self):
+        parser = CsvRowParser()
+        rows = parser.feed(b"a,b\n1\n1,2,3\n") + parser.close()
+        assert rows == [{"a": "1", "b": None}, {"a": "1", "b": "2", None: ["3"]}]
+
+
+class TestBatched:
+    def test_batches(self):
+        assert list(batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+    def test_rejects_bad_size(self):
+        with pytest.raises(ValueError):
+            list(batched([], 0))